@@ -83,6 +83,7 @@ from litellm.constants import (
     DEFAULT_MAX_TOKENS,
     DEFAULT_SOFT_BUDGET,
     DEFAULT_ALLOWED_FAILS,
+    LOGGING_WORKER_PROCESSES,
 )
 from litellm.integrations.dotprompt import (
     global_prompt_manager,
@@ -207,6 +208,7 @@ pre_call_rules: List[Callable] = []
 post_call_rules: List[Callable] = []
 turn_off_message_logging: Optional[bool] = False
 log_raw_request_response: bool = False
+logging_worker_processes: int = LOGGING_WORKER_PROCESSES  # > 0 runs payload-only logging integrations (datadog, s3_v2, gcs_bucket, ...) in a pool of logging worker processes
 redact_messages_in_exceptions: Optional[bool] = False
 redact_user_api_key_info: Optional[bool] = False
 filter_invalid_headers: Optional[bool] = False
@@ -422,6 +424,10 @@ disable_aiohttp_trust_env: bool = (
 force_ipv4: bool = (
     False  # when True, litellm will force ipv4 for all LLM requests. Some users have seen httpx ConnectionError when using ipv6.
 )
+upstream_connection_pool: bool = False  # when True, async clients share one warm connection pool per upstream origin (scheme://host:port)
+upstream_http2_origins: List[str] = (
+    []
+)  # origins to connect to over HTTP/2 when upstream_connection_pool is True, e.g. ["https://api.openai.com"]. Requires `pip install h2`
 module_level_aclient = AsyncHTTPHandler(
     timeout=request_timeout, client_alias="module level aclient"
 )
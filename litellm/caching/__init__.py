@@ -9,3 +9,4 @@ from .redis_cluster_cache import RedisClusterCache
 from .redis_semantic_cache import RedisSemanticCache
 from .s3_cache import S3Cache
 from .gcs_cache import GCSCache
+from .tiered_cache import TieredCache
@@ -8,6 +8,7 @@
 #  Thank you users! We ❤️ you! - Krrish & Ishaan
 
 import ast
+import asyncio
 import hashlib
 import json
 import time
@@ -27,6 +28,7 @@ from litellm.types.utils import EmbeddingResponse, all_litellm_params
 from .azure_blob_cache import AzureBlobCache
 from .base_cache import BaseCache
 from .disk_cache import DiskCache
+from .embedding_codec import FLOAT32_BASE64_ENCODING, pack_float32_embedding
 from .dual_cache import DualCache  # noqa
 from .gcs_cache import GCSCache
 from .in_memory_cache import InMemoryCache
@@ -35,6 +37,7 @@ from .redis_cache import RedisCache
 from .redis_cluster_cache import RedisClusterCache
 from .redis_semantic_cache import RedisSemanticCache
 from .s3_cache import S3Cache
+from .tiered_cache import CacheTier, TieredCache
 
 
 def print_verbose(print_statement):
@@ -101,6 +104,8 @@ class Cache:
         redis_flush_size: Optional[int] = None,
         redis_startup_nodes: Optional[List] = None,
         disk_cache_dir: Optional[str] = None,
+        disk_cache_size_limit: Optional[int] = None,
+        disk_cache_offload_io: bool = False,
         qdrant_api_base: Optional[str] = None,
         qdrant_api_key: Optional[str] = None,
         qdrant_collection_name: Optional[str] = None,
@@ -109,13 +114,18 @@ class Cache:
         # GCP IAM authentication parameters
         gcp_service_account: Optional[str] = None,
         gcp_ssl_ca_certs: Optional[str] = None,
+        coalesce_requests: bool = False,
+        stale_while_revalidate: Optional[float] = None,
+        pack_cached_embeddings: bool = False,
+        cache_tiers: Optional[List[CacheTierConfig]] = None,
+        tiered_cache_write_behind: bool = True,
         **kwargs,
     ):
         """
         Initializes the cache based on the given type.
 
         Args:
-            type (str, optional): The type of cache to initialize. Can be "local", "redis", "redis-semantic", "qdrant-semantic", "s3" or "disk". Defaults to "local".
+            type (str, optional): The type of cache to initialize. Can be "local", "redis", "redis-semantic", "qdrant-semantic", "s3", "disk" or "tiered". Defaults to "local".
 
             # Redis Cache Args
             host (str, optional): The host address for the Redis cache. Required if type is "redis".
@@ -134,6 +144,12 @@ class Cache:
 
             # Disk Cache Args
             disk_cache_dir (str, optional): The directory for the disk cache. Defaults to None.
+            disk_cache_size_limit (int, optional): Byte budget for the disk cache, enforced with LRU eviction. Defaults to None (diskcache default of 1GB, least-recently-stored eviction).
+            disk_cache_offload_io (bool, optional): Run disk I/O in a dedicated thread pool, store values as JSON bytes and memory-map large values on read. Defaults to False.
+
+            # Tiered Cache Args
+            cache_tiers (list, optional): Ordered list of tier configs, fastest first - e.g. [{"type": "local", "ttl": 60}, {"type": "disk"}, {"type": "redis", "host": ...}]. Required if type is "tiered".
+            tiered_cache_write_behind (bool, optional): Write the top tier inline and lower tiers in the background. Defaults to True.
 
             # S3 Cache Args
             s3_bucket_name (str, optional): The bucket name for the s3 cache. Defaults to None.
@@ -154,6 +170,9 @@ class Cache:
 
             # Common Cache Args
             supported_call_types (list, optional): List of call types to cache for. Defaults to cache == on for all call types.
+            coalesce_requests (bool, optional): If True, identical concurrent requests that miss the cache wait for the first in-flight request instead of each calling the provider. Defaults to False.
+            stale_while_revalidate (float, optional): Seconds after `ttl` during which an expired entry is still served, while a single background request refreshes it. Requires `ttl`. Defaults to None.
+            pack_cached_embeddings (bool, optional): Store cached embedding vectors as base64 of packed float32 values instead of JSON lists of floats. Defaults to False.
             **kwargs: Additional keyword arguments for redis.Redis() cache
 
         Raises:
@@ -235,7 +254,15 @@ class Cache:
                 container=azure_blob_container,
             )
         elif type == LiteLLMCacheType.DISK:
-            self.cache = DiskCache(disk_cache_dir=disk_cache_dir)
+            self.cache = DiskCache(
+                disk_cache_dir=disk_cache_dir,
+                disk_cache_size_limit=disk_cache_size_limit,
+                disk_cache_offload_io=disk_cache_offload_io,
+            )
+        elif type == LiteLLMCacheType.TIERED:
+            self.cache = self._init_tiered_cache(
+                cache_tiers=cache_tiers, write_behind=tiered_cache_write_behind
+            )
         if "cache" not in litellm.input_callback:
             litellm.input_callback.append("cache")
         if "cache" not in litellm.success_callback:
@@ -248,6 +275,9 @@ class Cache:
         self.redis_flush_size = redis_flush_size
         self.ttl = ttl
         self.mode: CacheMode = mode or CacheMode.default_on
+        self.coalesce_requests = coalesce_requests
+        self.stale_while_revalidate = stale_while_revalidate
+        self.pack_cached_embeddings = pack_cached_embeddings
 
         if self.type == LiteLLMCacheType.LOCAL and default_in_memory_ttl is not None:
             self.ttl = default_in_memory_ttl
@@ -261,6 +291,35 @@ class Cache:
         if self.namespace is not None and isinstance(self.cache, RedisCache):
             self.cache.namespace = self.namespace
 
+    @staticmethod
+    def _init_tiered_cache(
+        cache_tiers: Optional[List[CacheTierConfig]], write_behind: bool
+    ) -> TieredCache:
+        if not cache_tiers:
+            raise ValueError("`cache_tiers` is required for `type: tiered` caching")
+        tiers: List[CacheTier] = []
+        for tier_idx, tier_config in enumerate(cache_tiers):
+            tier_params: Dict[str, Any] = dict(tier_config)
+            tier_type = LiteLLMCacheType(tier_params.pop("type"))
+            tier_ttl = tier_params.pop("ttl", None)
+            if tier_type == LiteLLMCacheType.TIERED:
+                raise ValueError("cache tiers cannot be of `type: tiered`")
+            if tier_type == LiteLLMCacheType.LOCAL:
+                tier_cache: BaseCache = InMemoryCache(
+                    max_size_in_memory=tier_params.get("max_size_in_memory"),
+                    max_size_per_item=tier_params.get("max_size_per_item"),
+                )
+            else:
+                tier_cache = Cache(type=tier_type, **tier_params).cache
+            tiers.append(
+                CacheTier(
+                    name=f"{tier_idx}:{tier_type.value}",
+                    cache=tier_cache,
+                    ttl=tier_ttl,
+                )
+            )
+        return TieredCache(tiers=tiers, write_behind=write_behind)
+
     def get_cache_key(self, **kwargs) -> str:
         """
         Get the cache key for the given arguments.
@@ -528,10 +587,22 @@ class Cache:
 
         Used for embedding calls in async wrapper
         """
+        cached_result, _ = await self.async_get_cache_with_staleness(
+            dynamic_cache_object=dynamic_cache_object, **kwargs
+        )
+        return cached_result
+
+    async def async_get_cache_with_staleness(
+        self, dynamic_cache_object: Optional[BaseCache] = None, **kwargs
+    ) -> Tuple[Optional[Any], bool]:
+        """
+        Same as `async_get_cache`, but also returns whether the cached result is past its ttl
+        and is being served from the `stale_while_revalidate` window.
+        """
 
         try:  # never block execution
             if self.should_use_cache(**kwargs) is not True:
-                return
+                return None, False
 
             kwargs.get("messages", [])
             if "cache_key" in kwargs:
@@ -551,12 +622,72 @@ class Cache:
                     cached_result = await self.cache.async_get_cache(
                         cache_key, **kwargs
                     )
-                return self._get_cache_logic(
+                response = self._get_cache_logic(
                     cached_result=cached_result, max_age=max_age
                 )
+                return response, (
+                    response is not None and self._is_stale_cached_result(cached_result)
+                )
         except Exception:
             print_verbose(f"An exception occurred: {traceback.format_exc()}")
-            return None
+        return None, False
+
+    async def async_batch_get_cache(
+        self,
+        cache_keys: List[str],
+        dynamic_cache_object: Optional[BaseCache] = None,
+        **kwargs,
+    ) -> List[Optional[Any]]:
+        """
+        Async batch get implementation.
+
+        Reads all keys with a single backend call (e.g. redis `MGET`) when the backend supports it.
+
+        Used for per-item embedding caching in async wrapper
+
+        Returns:
+            List of cached results, in the same order as `cache_keys` (None for a miss)
+        """
+        try:  # never block execution
+            if self.should_use_cache(**kwargs) is not True:
+                return [None] * len(cache_keys)
+
+            cache_control_args = kwargs.get("cache", {})
+            max_age = cache_control_args.get(
+                "s-max-age", cache_control_args.get("s-maxage", float("inf"))
+            )
+            cache_obj = dynamic_cache_object or self.cache
+            cached_results: List[Optional[Any]]
+            if isinstance(cache_obj, RedisCache):
+                key_value_dict = await cache_obj.async_batch_get_cache(
+                    key_list=cache_keys,
+                    parent_otel_span=kwargs.get("parent_otel_span"),
+                )
+                cached_results = [key_value_dict.get(key) for key in cache_keys]
+            elif hasattr(cache_obj, "async_batch_get_cache"):
+                cached_results = await cache_obj.async_batch_get_cache(  # type: ignore
+                    cache_keys
+                ) or [None] * len(cache_keys)
+            else:  # fallback for caches without batch reads
+                cached_results = await asyncio.gather(
+                    *[cache_obj.async_get_cache(key) for key in cache_keys]
+                )
+            return [
+                self._get_cache_logic(cached_result=cached_result, max_age=max_age)
+                for cached_result in cached_results
+            ]
+        except Exception:
+            print_verbose(f"An exception occurred: {traceback.format_exc()}")
+            return [None] * len(cache_keys)
+
+    @staticmethod
+    def _is_stale_cached_result(cached_result: Optional[Any]) -> bool:
+        """
+        Returns True if the cached result is past its ttl, and only kept for `stale_while_revalidate`
+        """
+        if isinstance(cached_result, dict) and "stale_at" in cached_result:
+            return time.time() > cached_result["stale_at"]
+        return False
 
     def _add_cache_logic(self, result, **kwargs):
         """
@@ -582,6 +713,16 @@ class Cache:
                             kwargs["ttl"] = v
 
                 cached_data = {"timestamp": time.time(), "response": result}
+
+                ## STALE-WHILE-REVALIDATE - keep entry for `ttl + stale_while_revalidate`, mark it stale after `ttl`
+                if (
+                    self.stale_while_revalidate is not None
+                    and kwargs.get("ttl") is not None
+                ):
+                    cached_data["stale_at"] = cached_data["timestamp"] + float(
+                        kwargs["ttl"]
+                    )
+                    kwargs["ttl"] = float(kwargs["ttl"]) + self.stale_while_revalidate
                 return cache_key, cached_data, kwargs
             else:
                 raise Exception("cache key is None")
@@ -636,6 +777,21 @@ class Cache:
 
     def _convert_to_cached_embedding(
         self, embedding_response: Any, model: Optional[str]
+    ) -> CachedEmbedding:
+        cached_embedding = self._get_cached_embedding_fields(
+            embedding_response=embedding_response, model=model
+        )
+        if self.pack_cached_embeddings is True and isinstance(
+            cached_embedding["embedding"], list
+        ):
+            cached_embedding["embedding"] = pack_float32_embedding(
+                cached_embedding["embedding"]
+            )
+            cached_embedding["embedding_encoding"] = FLOAT32_BASE64_ENCODING
+        return cached_embedding
+
+    def _get_cached_embedding_fields(
+        self, embedding_response: Any, model: Optional[str]
     ) -> CachedEmbedding:
         """
         Convert any embedding response into the standardized CachedEmbedding TypedDict format.
@@ -17,6 +17,7 @@ In each method it will call the appropriate method from caching.py
 import asyncio
 import datetime
 import inspect
+import json
 import time
 from typing import (
     TYPE_CHECKING,
@@ -37,6 +38,11 @@ import litellm
 from litellm._logging import print_verbose, verbose_logger
 from litellm.caching import InMemoryCache
 from litellm.caching.caching import S3Cache
+from litellm.caching.embedding_codec import (
+    FLOAT32_BASE64_ENCODING,
+    unpack_float32_embedding,
+)
+from litellm.caching.request_coalescer import InFlightRequestCoalescer
 from litellm.litellm_core_utils.llm_response_utils.response_metadata import (
     update_response_metadata,
 )
@@ -83,6 +89,7 @@ class CachingHandlerResponse(BaseModel):
 
 
 in_memory_cache_obj = InMemoryCache()
+in_flight_request_coalescer = InFlightRequestCoalescer()
 
 
 class LLMCachingHandler:
@@ -99,6 +106,9 @@ class LLMCachingHandler:
         self.request_kwargs = request_kwargs
         self.original_function = original_function
         self.start_time = start_time
+        self.in_flight_cache_key: Optional[str] = (
+            None  # set when this request is the leader for coalesced identical requests
+        )
         if litellm.cache is not None and isinstance(litellm.cache.cache, RedisCache):
             self.dual_cache: Optional[DualCache] = DualCache(
                 redis_cache=litellm.cache.cache,
@@ -413,11 +423,19 @@ class LLMCachingHandler:
             )
             final_embedding_cached_response._hidden_params["cache_hit"] = True
 
+            return_base64 = kwargs.get("encoding_format") == "base64"
             prompt_tokens = 0
             for val in non_null_list:
                 idx, cr = val  # (idx, cr) tuple
                 if cr is not None:
                     embedding_data = cr.get("embedding")
+                    if (
+                        isinstance(embedding_data, str)
+                        and cr.get("embedding_encoding") == FLOAT32_BASE64_ENCODING
+                        and not return_base64
+                    ):
+                        # packed float32 vector - already in the openai base64 format if that was requested
+                        embedding_data = unpack_float32_embedding(embedding_data)
                     if embedding_data is not None:
                         final_embedding_cached_response.data[idx] = Embedding(
                             embedding=embedding_data,
@@ -504,9 +522,17 @@ class LLMCachingHandler:
 
         idx = 0
         final_data_list = []
-        for item in _caching_handler_response.final_embedding_cached_response.data:
+        for final_idx, item in enumerate(
+            _caching_handler_response.final_embedding_cached_response.data
+        ):
             if item is None and embedding_response.data is not None:
-                final_data_list.append(embedding_response.data[idx])
+                api_item = embedding_response.data[idx]
+                # api result is indexed within the cache misses - re-index to the position in the original input
+                if isinstance(api_item, Embedding):
+                    api_item.index = final_idx
+                elif isinstance(api_item, dict):
+                    api_item["index"] = final_idx
+                final_data_list.append(api_item)
                 idx += 1
             else:
                 final_data_list.append(item)
@@ -554,7 +580,8 @@ class LLMCachingHandler:
         GLOBAL_LOGGING_WORKER.ensure_initialized_and_enqueue(
             async_coroutine=logging_obj.async_success_handler(
                 result=cached_result, start_time=start_time, end_time=end_time, cache_hit=cache_hit
-            )
+            ),
+            droppable=not logging_obj.has_critical_async_success_callbacks(),
         )
 
         logging_obj.handle_sync_success_callbacks_for_async_calls(
@@ -597,25 +624,38 @@ class LLMCachingHandler:
                 new_kwargs["input"] = [new_kwargs["input"]]
             elif not isinstance(new_kwargs["input"], list):
                 raise ValueError("input must be a string or a list")
-            tasks = []
-            for idx, i in enumerate(new_kwargs["input"]):
-                preset_cache_key = litellm.cache.get_cache_key(
-                    **{**new_kwargs, "input": i}
-                )
-                tasks.append(
-                    litellm.cache.async_get_cache(
-                        cache_key=preset_cache_key,
-                        dynamic_cache_object=self.dual_cache,
-                    )
-                )
-            cached_result = await asyncio.gather(*tasks)
+            preset_cache_keys = [
+                litellm.cache.get_cache_key(**{**new_kwargs, "input": i})
+                for i in new_kwargs["input"]
+            ]
+            ## single batch read (e.g. redis MGET) for all items ##
+            cached_result = await litellm.cache.async_batch_get_cache(
+                cache_keys=preset_cache_keys,
+                dynamic_cache_object=self.dual_cache,
+                cache=new_kwargs.get("cache") or {},
+                parent_otel_span=new_kwargs.get("parent_otel_span"),
+            )
             ## check if cached result is None ##
             if cached_result is not None and isinstance(cached_result, list):
                 # set cached_result to None if all elements are None
                 if all(result is None for result in cached_result):
                     cached_result = None
         else:
-            if litellm.cache._supports_async() is True:
+            if litellm.cache.stale_while_revalidate is not None:
+                (
+                    cached_result,
+                    is_stale,
+                ) = await litellm.cache.async_get_cache_with_staleness(
+                    dynamic_cache_object=self.dual_cache, **new_kwargs
+                )
+                if is_stale:
+                    self._schedule_stale_cache_refresh(
+                        cache_key=litellm.cache.get_cache_key(**new_kwargs),
+                        call_type=call_type,
+                        kwargs=kwargs,
+                        args=args,
+                    )
+            elif litellm.cache._supports_async() is True:
                 ## check if dual cache is supported ##
                 cached_result = await litellm.cache.async_get_cache(
                     dynamic_cache_object=self.dual_cache, **new_kwargs
@@ -624,8 +664,116 @@ class LLMCachingHandler:
                 cached_result = litellm.cache.get_cache(
                     dynamic_cache_object=self.dual_cache, **new_kwargs
                 )
+
+            if cached_result is None and litellm.cache.coalesce_requests is True:
+                cached_result = await self._async_get_in_flight_request_result(
+                    new_kwargs=new_kwargs
+                )
         return cached_result
 
+    async def _async_get_in_flight_request_result(
+        self, new_kwargs: Dict[str, Any]
+    ) -> Optional[Any]:
+        """
+        Single-flight coalescing on a cache miss.
+
+        - If an identical request is already in flight, wait for its result and treat it as a cache hit
+        - Else, register this request as the leader. Its result is published to followers in `async_set_cache`
+
+        Returns:
+            Optional[Any]: the leader's response dict, or None if this request should call the provider
+        """
+        if litellm.cache is None or self.in_flight_cache_key is not None:
+            return None
+        if litellm.cache.should_use_cache(**new_kwargs) is not True:
+            return None
+
+        cache_key = litellm.cache.get_cache_key(**new_kwargs)
+        leader_future = in_flight_request_coalescer.acquire(cache_key)
+        if leader_future is None:
+            self.in_flight_cache_key = cache_key
+            return None
+
+        verbose_logger.debug(
+            "Waiting on identical in-flight request for cache key: %s", cache_key
+        )
+        leader_result = await in_flight_request_coalescer.wait_for_leader(
+            leader_future
+        )
+        if isinstance(leader_result, str):
+            leader_result = json.loads(leader_result)
+        return leader_result
+
+    def _release_in_flight_request(self, result: Optional[Any] = None) -> None:
+        """
+        If this request is the leader for coalesced requests, publish its result (None on failure) to the followers
+        """
+        if self.in_flight_cache_key is None:
+            return
+        in_flight_request_coalescer.release(
+            cache_key=self.in_flight_cache_key, value=result
+        )
+        self.in_flight_cache_key = None
+
+    def _schedule_stale_cache_refresh(
+        self,
+        cache_key: str,
+        call_type: str,
+        kwargs: Dict[str, Any],
+        args: Tuple[Any, ...],
+    ) -> None:
+        """
+        A stale cached response was served - refresh it in the background. Only one refresh runs per cache key.
+        """
+        if not in_flight_request_coalescer.try_start_refresh(cache_key):
+            return
+        asyncio.create_task(
+            self._async_refresh_stale_cache(
+                cache_key=cache_key, call_type=call_type, kwargs=kwargs, args=args
+            )
+        )
+
+    async def _async_refresh_stale_cache(
+        self,
+        cache_key: str,
+        call_type: str,
+        kwargs: Dict[str, Any],
+        args: Tuple[Any, ...],
+    ) -> None:
+        """
+        Re-run the request through the litellm entrypoint, skipping the cache read, so the fresh response is written to the cache.
+
+        The refresh is marked with `litellm_cache_refresh`, so it is not logged or billed as a new request.
+        """
+        try:
+            llm_api_function = getattr(litellm, call_type, None)
+            if llm_api_function is None:
+                return
+            refresh_kwargs = {
+                k: v
+                for k, v in kwargs.items()
+                if k
+                not in ("litellm_logging_obj", "litellm_call_id", "parent_otel_span")
+            }
+            refresh_kwargs["cache"] = {
+                **(kwargs.get("cache") or {}),
+                "no-cache": True,
+            }
+            refresh_kwargs["litellm_cache_refresh"] = True
+            response = await llm_api_function(*args, **refresh_kwargs)
+            if isinstance(response, CustomStreamWrapper):
+                # response is cached once the stream is consumed
+                async for _ in response:
+                    pass
+        except Exception as e:
+            verbose_logger.debug(
+                "Error refreshing stale cache entry for cache key %s: %s",
+                cache_key,
+                str(e),
+            )
+        finally:
+            in_flight_request_coalescer.finish_refresh(cache_key)
+
     def _convert_cached_result_to_model_response(
         self,
         cached_result: Any,
@@ -806,6 +954,7 @@ class LLMCachingHandler:
         )
 
         if litellm.cache is None:
+            self._release_in_flight_request()
             return
 
         new_kwargs = kwargs.copy()
@@ -840,15 +989,18 @@ class LLMCachingHandler:
                         )
                     )
                 else:
+                    result_json = result.model_dump_json()
+                    self._release_in_flight_request(result=result_json)
                     asyncio.create_task(
                         litellm.cache.async_add_cache(
-                            result.model_dump_json(),
+                            result_json,
                             dynamic_cache_object=self.dual_cache,
                             **new_kwargs,
                         )
                     )
             else:
                 asyncio.create_task(litellm.cache.async_add_cache(result, **new_kwargs))
+        self._release_in_flight_request()
 
     def sync_set_cache(
         self,
@@ -942,6 +1094,8 @@ class LLMCachingHandler:
                 original_function=self.original_function,
                 kwargs=self.request_kwargs,
             )
+        else:
+            self._release_in_flight_request()
 
     def _sync_add_streaming_response_to_cache(self, processed_chunk: ModelResponse):
         """
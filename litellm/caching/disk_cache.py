@@ -1,5 +1,11 @@
+import asyncio
+import functools
 import json
-from typing import TYPE_CHECKING, Any, Optional, Union
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
+
+from litellm.constants import DEFAULT_DISK_CACHE_IO_MAX_WORKERS
 
 from .base_cache import BaseCache
 
@@ -10,9 +16,31 @@ if TYPE_CHECKING:
 else:
     Span = Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 
 class DiskCache(BaseCache):
-    def __init__(self, disk_cache_dir: Optional[str] = None):
+    """
+    Disk cache backed by `diskcache`.
+
+    When `disk_cache_offload_io=True`:
+        - all async get/set calls run in a dedicated thread pool, so disk I/O never blocks the event loop
+        - values are stored as JSON bytes (orjson if installed) instead of pickles
+        - payloads large enough to be stored as separate files by `diskcache` are memory-mapped on read
+
+    `disk_cache_size_limit` sets a byte budget for the cache directory, enforced with LRU eviction.
+    """
+
+    def __init__(
+        self,
+        disk_cache_dir: Optional[str] = None,
+        disk_cache_size_limit: Optional[int] = None,
+        disk_cache_offload_io: bool = False,
+        disk_cache_io_max_workers: int = DEFAULT_DISK_CACHE_IO_MAX_WORKERS,
+    ):
         try:
             import diskcache as dc
         except ModuleNotFoundError as e:
@@ -20,22 +48,108 @@ class DiskCache(BaseCache):
                 "Please install litellm with `litellm[caching]` to use disk caching."
             ) from e
 
+        cache_settings: dict = {}
+        if disk_cache_size_limit is not None:
+            cache_settings["size_limit"] = disk_cache_size_limit
+            cache_settings["eviction_policy"] = "least-recently-used"
+
         # if users don't provider one, use the default litellm cache
         if disk_cache_dir is None:
-            self.disk_cache = dc.Cache(".litellm_cache")
+            self.disk_cache = dc.Cache(".litellm_cache", **cache_settings)
         else:
-            self.disk_cache = dc.Cache(disk_cache_dir)
+            self.disk_cache = dc.Cache(disk_cache_dir, **cache_settings)
+
+        self.offload_io = disk_cache_offload_io
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        if disk_cache_offload_io is True:
+            self._io_executor = ThreadPoolExecutor(
+                max_workers=disk_cache_io_max_workers,
+                thread_name_prefix="litellm-disk-cache",
+            )
+
+    async def _run_in_io_executor(self, func: Callable, *args, **kwargs) -> Any:
+        if self._io_executor is None:
+            return func(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._io_executor, functools.partial(func, *args, **kwargs)
+        )
+
+    @staticmethod
+    def _encode_value(value: Any) -> Any:
+        """
+        Encode a value as JSON bytes. Values that are not JSON serializable are stored as-is (pickled by diskcache).
+        """
+        try:
+            if orjson is not None:
+                return orjson.dumps(value)
+            return json.dumps(value).encode("utf-8")
+        except TypeError:
+            return value
+
+    @staticmethod
+    def _decode_value(value: Any) -> Any:
+        if orjson is not None:
+            return orjson.loads(value)
+        return json.loads(bytes(value))
+
+    @staticmethod
+    def _load_json_string(cached_response: Any) -> Any:
+        if isinstance(cached_response, str):
+            try:
+                return json.loads(cached_response)
+            except Exception:
+                pass
+        return cached_response
+
+    def _get_binary_cache(self, key) -> Any:
+        """
+        Read a value written with the binary codec.
+
+        `read=True` makes diskcache return an open file for values stored as separate files,
+        which are decoded straight from a read-only memory map.
+        """
+        cached_value = self.disk_cache.get(key, read=True)
+        if cached_value is None:
+            return None
+        if isinstance(cached_value, (bytes, bytearray)):
+            return self._load_json_string(self._decode_value(cached_value))
+        if hasattr(cached_value, "fileno"):
+            with cached_value:
+                with mmap.mmap(
+                    cached_value.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mapped_value:
+                    with memoryview(mapped_value) as mapped_view:
+                        decoded_value = self._decode_value(mapped_view)
+            return self._load_json_string(decoded_value)
+        # value written before the binary codec was enabled
+        return self._load_json_string(cached_value)
 
     def set_cache(self, key, value, **kwargs):
+        if self.offload_io is True:
+            value = self._encode_value(value)
         if "ttl" in kwargs:
             self.disk_cache.set(key, value, expire=kwargs["ttl"])
         else:
             self.disk_cache.set(key, value)
 
     async def async_set_cache(self, key, value, **kwargs):
-        self.set_cache(key=key, value=value, **kwargs)
+        await self._run_in_io_executor(self.set_cache, key=key, value=value, **kwargs)
+
+    def _set_cache_pipeline(self, cache_list, **kwargs):
+        with self.disk_cache.transact():
+            for cache_key, cache_value in cache_list:
+                if "ttl" in kwargs:
+                    self.set_cache(key=cache_key, value=cache_value, ttl=kwargs["ttl"])
+                else:
+                    self.set_cache(key=cache_key, value=cache_value)
 
     async def async_set_cache_pipeline(self, cache_list, **kwargs):
+        if self.offload_io is True:
+            await self._run_in_io_executor(
+                self._set_cache_pipeline, cache_list=cache_list, **kwargs
+            )
+            return
         for cache_key, cache_value in cache_list:
             if "ttl" in kwargs:
                 self.set_cache(key=cache_key, value=cache_value, ttl=kwargs["ttl"])
@@ -43,6 +157,8 @@ class DiskCache(BaseCache):
                 self.set_cache(key=cache_key, value=cache_value)
 
     def get_cache(self, key, **kwargs):
+        if self.offload_io is True:
+            return self._get_binary_cache(key)
         original_cached_response = self.disk_cache.get(key)
         if original_cached_response:
             try:
@@ -67,16 +183,16 @@ class DiskCache(BaseCache):
         return value
 
     async def async_get_cache(self, key, **kwargs):
-        return self.get_cache(key=key, **kwargs)
+        return await self._run_in_io_executor(self.get_cache, key=key, **kwargs)
 
-    async def async_batch_get_cache(self, keys: list, **kwargs):
-        return_val = []
-        for k in keys:
-            val = self.get_cache(key=k, **kwargs)
-            return_val.append(val)
-        return return_val
+    async def async_batch_get_cache(self, keys: list, **kwargs) -> List[Any]:
+        return await self._run_in_io_executor(self.batch_get_cache, keys=keys, **kwargs)
 
     async def async_increment(self, key, value: int, **kwargs) -> int:
+        if self.offload_io is True:
+            return await self._run_in_io_executor(
+                self.increment_cache, key=key, value=value, **kwargs
+            )
         # get the value
         init_value = await self.async_get_cache(key=key) or 0
         value = init_value + value  # type: ignore
@@ -87,7 +203,9 @@ class DiskCache(BaseCache):
         self.disk_cache.clear()
 
     async def disconnect(self):
-        pass
+        if self._io_executor is not None:
+            self._io_executor.shutdown(wait=False)
+            self._io_executor = None
 
     def delete_cache(self, key):
         self.disk_cache.pop(key)
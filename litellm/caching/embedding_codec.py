@@ -0,0 +1,35 @@
+"""
+Packed float32 encoding for cached embedding vectors.
+
+Vectors are stored as base64 of little-endian float32 values - the same format OpenAI returns for
+`encoding_format="base64"` - which is ~4x smaller than a JSON list of floats and decodes without
+parsing every float.
+"""
+
+import base64
+import sys
+from array import array
+from typing import List, Literal, Sequence, cast
+
+FLOAT32_BASE64_ENCODING: Literal["float32_base64"] = "float32_base64"
+
+
+def pack_float32_embedding(embedding: Sequence[float]) -> str:
+    packed = array("f", embedding)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return base64.b64encode(packed.tobytes()).decode("ascii")
+
+
+def unpack_float32_embedding(packed_embedding: str) -> List[float]:
+    """
+    Decode a packed embedding. On little-endian hosts the floats are read through a memoryview over the decoded buffer, without an intermediate copy.
+    """
+    buffer = base64.b64decode(packed_embedding)
+    if sys.byteorder == "little":
+        # typeshed types memoryview.tolist() as List[int]
+        return cast(List[float], memoryview(buffer).cast("f").tolist())
+    unpacked = array("f")
+    unpacked.frombytes(buffer)
+    unpacked.byteswap()
+    return unpacked.tolist()
@@ -0,0 +1,98 @@
+"""
+Single-flight coalescing of identical in-flight LLM API requests.
+
+Used by `LLMCachingHandler` when `Cache(coalesce_requests=True)`:
+    - the first request to miss the cache for a cache key becomes the leader and calls the provider
+    - identical concurrent requests wait for the leader's result, instead of calling the provider N times
+    - the leader publishes its result when it is written to the cache (for streaming, once the stream completes)
+
+Also tracks in-flight background refreshes for `Cache(stale_while_revalidate=...)`, so only one refresh runs per cache key.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional, Set, Tuple
+
+from litellm._logging import verbose_logger
+from litellm.constants import IN_FLIGHT_REQUEST_COALESCING_TIMEOUT
+
+
+class InFlightRequestCoalescer:
+    def __init__(self, timeout: float = IN_FLIGHT_REQUEST_COALESCING_TIMEOUT):
+        self.timeout = timeout
+        self.in_flight_requests: Dict[str, Tuple[asyncio.Future, float]] = {}
+        self.in_flight_refreshes: Set[str] = set()
+
+    def acquire(self, cache_key: str) -> Optional[asyncio.Future]:
+        """
+        Register the caller as the leader for `cache_key`, if there is no live leader.
+
+        Returns:
+            None if the caller is now the leader, otherwise the leader's future to wait on
+        """
+        loop = asyncio.get_running_loop()
+        in_flight_request = self.in_flight_requests.get(cache_key)
+        if in_flight_request is not None:
+            future, start_time = in_flight_request
+            if (
+                not future.done()
+                and future.get_loop() is loop
+                and time.time() - start_time < self.timeout
+            ):
+                return future
+            # leader finished, timed out or belongs to another event loop - take over
+            self._resolve_future(future=future, value=None)
+
+        self.in_flight_requests[cache_key] = (loop.create_future(), time.time())
+        return None
+
+    async def wait_for_leader(self, future: asyncio.Future) -> Optional[Any]:
+        """
+        Wait for the leader's result.
+
+        Returns None if the leader failed, produced nothing cacheable or did not finish within `timeout`.
+        """
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            verbose_logger.debug(
+                "InFlightRequestCoalescer: timed out waiting for in-flight request"
+            )
+            return None
+
+    def release(self, cache_key: str, value: Optional[Any] = None) -> None:
+        """
+        Publish the leader's result (or None on failure) to all waiting followers.
+        """
+        in_flight_request = self.in_flight_requests.pop(cache_key, None)
+        if in_flight_request is None:
+            return
+        self._resolve_future(future=in_flight_request[0], value=value)
+
+    def try_start_refresh(self, cache_key: str) -> bool:
+        """
+        Returns True if the caller should run the background refresh for `cache_key`.
+        """
+        if cache_key in self.in_flight_refreshes:
+            return False
+        self.in_flight_refreshes.add(cache_key)
+        return True
+
+    def finish_refresh(self, cache_key: str) -> None:
+        self.in_flight_refreshes.discard(cache_key)
+
+    @staticmethod
+    def _resolve_future(future: asyncio.Future, value: Optional[Any]) -> None:
+        if future.done():
+            return
+        try:
+            future.get_loop().call_soon_threadsafe(
+                InFlightRequestCoalescer._set_future_result, future, value
+            )
+        except RuntimeError:  # event loop is closed
+            pass
+
+    @staticmethod
+    def _set_future_result(future: asyncio.Future, value: Optional[Any]) -> None:
+        if not future.done():
+            future.set_result(value)
@@ -0,0 +1,351 @@
+"""
+Tiered Cache implementation - N cache tiers, checked in order (e.g. in-memory -> local disk -> Redis -> S3/GCS).
+
+- get: tiers are read top to bottom. A hit in a lower tier is promoted to all tiers above it.
+- set: the top tier is written inline. Lower tiers are written in the background (write-behind), unless `write_behind=False`.
+- each tier has its own ttl (capped by the request ttl) and size budget (set on the tier's backend).
+- entries set with a request ttl are stored with their expiry, so a promoted entry keeps its remaining ttl - even in tiers without a ttl.
+- per-tier hit / miss counts and read latency are tracked, see `get_tier_stats()`.
+"""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
+
+from litellm._logging import verbose_logger
+
+from .base_cache import BaseCache
+from .redis_cache import RedisCache
+
+if TYPE_CHECKING:
+    from opentelemetry.trace import Span as _Span
+
+    Span = Union[_Span, Any]
+else:
+    Span = Any
+
+# key of the expiry (unix time) stored with entries set with a ttl
+EXPIRES_AT_KEY = "__litellm_tiered_cache_expires_at__"
+
+
+def _wrap_value(value: Any, ttl: Optional[float]) -> Any:
+    if ttl is None:
+        return value
+    return {EXPIRES_AT_KEY: time.time() + float(ttl), "value": value}
+
+
+def _unwrap_value(stored_value: Any) -> Tuple[Optional[Any], Optional[float]]:
+    """
+    Returns (value, remaining ttl) for a stored entry. Expired entries are returned as (None, None).
+    """
+    if not isinstance(stored_value, dict) or EXPIRES_AT_KEY not in stored_value:
+        return stored_value, None
+    remaining_ttl = stored_value[EXPIRES_AT_KEY] - time.time()
+    if remaining_ttl <= 0:
+        return None, None
+    return stored_value.get("value"), remaining_ttl
+
+
+class CacheTier:
+    def __init__(self, name: str, cache: BaseCache, ttl: Optional[float] = None):
+        self.name = name
+        self.cache = cache
+        self.ttl = ttl
+
+        # metrics
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.total_get_latency_ms = 0.0
+
+    def get_ttl_kwargs(self, **kwargs) -> dict:
+        """
+        Returns kwargs with the ttl for this tier - the tier ttl, capped by the request ttl
+        """
+        request_ttl = kwargs.get("ttl")
+        if self.ttl is None:
+            return kwargs
+        if request_ttl is None:
+            return {**kwargs, "ttl": self.ttl}
+        return {**kwargs, "ttl": min(float(request_ttl), self.ttl)}
+
+    def record_get(self, num_hits: int, num_misses: int, start_time: float) -> None:
+        self.hits += num_hits
+        self.misses += num_misses
+        self.total_get_latency_ms += (time.perf_counter() - start_time) * 1000
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "tier": self.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": self.hits / lookups if lookups > 0 else 0.0,
+            "avg_get_latency_ms": (
+                self.total_get_latency_ms / lookups if lookups > 0 else 0.0
+            ),
+        }
+
+
+class TieredCache(BaseCache):
+    def __init__(self, tiers: List[CacheTier], write_behind: bool = True):
+        super().__init__()
+        if len(tiers) == 0:
+            raise ValueError("TieredCache requires at least one cache tier")
+        self.tiers = tiers
+        self.write_behind = write_behind
+        self._background_tasks: Set[asyncio.Task] = set()
+
+    def get_tier_stats(self) -> List[Dict[str, Any]]:
+        return [tier.get_stats() for tier in self.tiers]
+
+    def _create_background_task(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    ### SET ###
+
+    def set_cache(self, key, value, **kwargs):
+        value = _wrap_value(value, kwargs.get("ttl"))
+        for tier in self.tiers:
+            try:
+                tier.cache.set_cache(key, value, **tier.get_ttl_kwargs(**kwargs))
+            except Exception as e:
+                tier.errors += 1
+                verbose_logger.debug(
+                    "TieredCache: error setting key in tier %s: %s", tier.name, str(e)
+                )
+
+    async def _async_set_cache_in_tiers(
+        self, tiers: List[CacheTier], key, value, **kwargs
+    ) -> None:
+        for tier in tiers:
+            try:
+                await tier.cache.async_set_cache(
+                    key, value, **tier.get_ttl_kwargs(**kwargs)
+                )
+            except Exception as e:
+                tier.errors += 1
+                verbose_logger.debug(
+                    "TieredCache: error setting key in tier %s: %s", tier.name, str(e)
+                )
+
+    async def async_set_cache(self, key, value, **kwargs):
+        value = _wrap_value(value, kwargs.get("ttl"))
+        if self.write_behind is False:
+            await self._async_set_cache_in_tiers(self.tiers, key, value, **kwargs)
+            return
+        await self._async_set_cache_in_tiers(self.tiers[:1], key, value, **kwargs)
+        if len(self.tiers) > 1:
+            self._create_background_task(
+                self._async_set_cache_in_tiers(self.tiers[1:], key, value, **kwargs)
+            )
+
+    async def _async_set_cache_pipeline_in_tiers(
+        self, tiers: List[CacheTier], cache_list, **kwargs
+    ) -> None:
+        for tier in tiers:
+            try:
+                await tier.cache.async_set_cache_pipeline(
+                    cache_list=cache_list, **tier.get_ttl_kwargs(**kwargs)
+                )
+            except Exception as e:
+                tier.errors += 1
+                verbose_logger.debug(
+                    "TieredCache: error setting keys in tier %s: %s",
+                    tier.name,
+                    str(e),
+                )
+
+    async def async_set_cache_pipeline(self, cache_list, **kwargs):
+        cache_list = [
+            (key, _wrap_value(value, kwargs.get("ttl"))) for key, value in cache_list
+        ]
+        if self.write_behind is False:
+            await self._async_set_cache_pipeline_in_tiers(
+                self.tiers, cache_list, **kwargs
+            )
+            return
+        await self._async_set_cache_pipeline_in_tiers(
+            self.tiers[:1], cache_list, **kwargs
+        )
+        if len(self.tiers) > 1:
+            self._create_background_task(
+                self._async_set_cache_pipeline_in_tiers(
+                    self.tiers[1:], cache_list, **kwargs
+                )
+            )
+
+    ### GET ###
+
+    def get_cache(self, key, **kwargs):
+        for tier_idx, tier in enumerate(self.tiers):
+            start_time = time.perf_counter()
+            try:
+                stored_value = tier.cache.get_cache(key, **kwargs)
+            except Exception as e:
+                tier.errors += 1
+                verbose_logger.debug(
+                    "TieredCache: error getting key from tier %s: %s", tier.name, str(e)
+                )
+                stored_value = None
+            value, remaining_ttl = _unwrap_value(stored_value)
+            tier.record_get(
+                num_hits=int(value is not None),
+                num_misses=int(value is None),
+                start_time=start_time,
+            )
+            if value is not None:
+                ## PROMOTE - to all tiers above the hit, with the remaining ttl
+                ttl_kwargs = {} if remaining_ttl is None else {"ttl": remaining_ttl}
+                for upper_tier in self.tiers[:tier_idx]:
+                    try:
+                        upper_tier.cache.set_cache(
+                            key, stored_value, **upper_tier.get_ttl_kwargs(**ttl_kwargs)
+                        )
+                    except Exception:
+                        upper_tier.errors += 1
+                return value
+        return None
+
+    async def async_get_cache(self, key, **kwargs):
+        for tier_idx, tier in enumerate(self.tiers):
+            start_time = time.perf_counter()
+            try:
+                stored_value = await tier.cache.async_get_cache(key, **kwargs)
+            except Exception as e:
+                tier.errors += 1
+                verbose_logger.debug(
+                    "TieredCache: error getting key from tier %s: %s", tier.name, str(e)
+                )
+                stored_value = None
+            value, remaining_ttl = _unwrap_value(stored_value)
+            tier.record_get(
+                num_hits=int(value is not None),
+                num_misses=int(value is None),
+                start_time=start_time,
+            )
+            if value is not None:
+                if tier_idx > 0:
+                    await self._async_promote(
+                        tier_idx=tier_idx,
+                        promote_list=[(key, stored_value, remaining_ttl)],
+                    )
+                return value
+        return None
+
+    async def _async_promote_in_tiers(
+        self,
+        tiers: List[CacheTier],
+        promote_list: List[Tuple[str, Any, Optional[float]]],
+    ) -> None:
+        for key, stored_value, remaining_ttl in promote_list:
+            ttl_kwargs = {} if remaining_ttl is None else {"ttl": remaining_ttl}
+            await self._async_set_cache_in_tiers(tiers, key, stored_value, **ttl_kwargs)
+
+    async def _async_promote(
+        self,
+        tier_idx: int,
+        promote_list: List[Tuple[str, Any, Optional[float]]],
+    ) -> None:
+        """
+        Write (key, stored value, remaining ttl) entries found in `tiers[tier_idx]` to the tiers above it.
+
+        The top tier is written inline, so the next read is served from it. Other tiers are written in the background.
+        """
+        await self._async_promote_in_tiers(self.tiers[:1], promote_list)
+        if tier_idx > 1:
+            self._create_background_task(
+                self._async_promote_in_tiers(self.tiers[1:tier_idx], promote_list)
+            )
+
+    @staticmethod
+    async def _async_batch_get_from_tier(
+        tier: CacheTier, keys: List[str], **kwargs
+    ) -> List[Optional[Any]]:
+        if isinstance(tier.cache, RedisCache):
+            key_value_dict = await tier.cache.async_batch_get_cache(
+                key_list=keys, parent_otel_span=kwargs.get("parent_otel_span")
+            )
+            return [key_value_dict.get(key) for key in keys]
+        if hasattr(tier.cache, "async_batch_get_cache"):
+            return await tier.cache.async_batch_get_cache(keys) or [None] * len(keys)  # type: ignore
+        return await asyncio.gather(*[tier.cache.async_get_cache(key) for key in keys])
+
+    async def async_batch_get_cache(
+        self, keys: list, parent_otel_span: Optional[Span] = None, **kwargs
+    ) -> List[Optional[Any]]:
+        """
+        Batch get across tiers - each tier is only asked for the keys missed by the tiers above it.
+        """
+        results: List[Optional[Any]] = [None] * len(keys)
+        missing_indices = list(range(len(keys)))
+        for tier_idx, tier in enumerate(self.tiers):
+            if not missing_indices:
+                break
+            start_time = time.perf_counter()
+            missing_keys = [keys[i] for i in missing_indices]
+            try:
+                tier_results = await self._async_batch_get_from_tier(
+                    tier, missing_keys, parent_otel_span=parent_otel_span
+                )
+            except Exception as e:
+                tier.errors += 1
+                verbose_logger.debug(
+                    "TieredCache: error batch getting keys from tier %s: %s",
+                    tier.name,
+                    str(e),
+                )
+                tier_results = [None] * len(missing_keys)
+
+            still_missing_indices = []
+            promote_list: List[Tuple[str, Any, Optional[float]]] = []
+            for key_idx, stored_value in zip(missing_indices, tier_results):
+                value, remaining_ttl = _unwrap_value(stored_value)
+                if value is None:
+                    still_missing_indices.append(key_idx)
+                else:
+                    results[key_idx] = value
+                    promote_list.append((keys[key_idx], stored_value, remaining_ttl))
+            tier.record_get(
+                num_hits=len(promote_list),
+                num_misses=len(still_missing_indices),
+                start_time=start_time,
+            )
+            if promote_list and tier_idx > 0:
+                await self._async_promote(tier_idx=tier_idx, promote_list=promote_list)
+            missing_indices = still_missing_indices
+        return results
+
+    ### DELETE / FLUSH ###
+
+    def delete_cache(self, key):
+        for tier in self.tiers:
+            try:
+                tier.cache.delete_cache(key)  # type: ignore
+            except Exception as e:
+                verbose_logger.debug(
+                    "TieredCache: error deleting key from tier %s: %s",
+                    tier.name,
+                    str(e),
+                )
+
+    def flush_cache(self):
+        for tier in self.tiers:
+            try:
+                tier.cache.flush_cache()  # type: ignore
+            except Exception as e:
+                verbose_logger.debug(
+                    "TieredCache: error flushing tier %s: %s", tier.name, str(e)
+                )
+
+    async def disconnect(self):
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        for tier in self.tiers:
+            try:
+                await tier.cache.disconnect()
+            except Exception:
+                pass
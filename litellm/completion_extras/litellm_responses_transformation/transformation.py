@@ -22,6 +22,7 @@ from openai.types.responses.tool_param import FunctionToolParam
 
 from litellm import ModelResponse
 from litellm._logging import verbose_logger
+from litellm.litellm_core_utils.sse_decoder import SSEChunk
 from litellm.llms.base_llm.base_model_iterator import BaseModelResponseIterator
 from litellm.llms.base_llm.bridges.completion_transformation import (
     CompletionTransformationBridge,
@@ -439,7 +440,7 @@ class LiteLLMResponsesTransformationHandler(CompletionTransformationBridge):
     def get_model_response_iterator(
         self,
         streaming_response: Union[
-            Iterator[str], AsyncIterator[str], "ModelResponse", "BaseModel"
+            Iterator[SSEChunk], AsyncIterator[SSEChunk], "ModelResponse", "BaseModel"
         ],
         sync_stream: bool,
         json_mode: Optional[bool] = False,
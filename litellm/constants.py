@@ -57,6 +57,22 @@ SINGLE_DEPLOYMENT_TRAFFIC_FAILURE_THRESHOLD = int(
 DEFAULT_FAILURE_THRESHOLD_MINIMUM_REQUESTS = int(
     os.getenv("DEFAULT_FAILURE_THRESHOLD_MINIMUM_REQUESTS", 5)
 )  # Minimum number of requests before applying error rate cooldown. Prevents cooldown from triggering on first failure.
+ADAPTIVE_CONCURRENCY_INITIAL_LIMIT = int(
+    os.getenv("ADAPTIVE_CONCURRENCY_INITIAL_LIMIT", 20)
+)  # in-flight requests allowed per deployment, before latency / rate limit errors are observed
+ADAPTIVE_CONCURRENCY_MIN_LIMIT = int(os.getenv("ADAPTIVE_CONCURRENCY_MIN_LIMIT", 1))
+ADAPTIVE_CONCURRENCY_MAX_LIMIT = int(
+    os.getenv("ADAPTIVE_CONCURRENCY_MAX_LIMIT", 1000)
+)  # deployments with `max_parallel_requests` use that as max limit
+ADAPTIVE_CONCURRENCY_LATENCY_TOLERANCE = float(
+    os.getenv("ADAPTIVE_CONCURRENCY_LATENCY_TOLERANCE", 1.5)
+)  # latency increase (vs. long-term average) tolerated before the limit is reduced
+ADAPTIVE_CONCURRENCY_BACKOFF_RATIO = float(
+    os.getenv("ADAPTIVE_CONCURRENCY_BACKOFF_RATIO", 0.9)
+)  # limit is multiplied by this on a rate limit error / timeout
+ADAPTIVE_CONCURRENCY_IN_FLIGHT_TTL_SECONDS = float(
+    os.getenv("ADAPTIVE_CONCURRENCY_IN_FLIGHT_TTL_SECONDS", 600)
+)  # requests without a success / failure event (e.g. cancelled) stop counting as in-flight after this
 
 DEFAULT_REASONING_EFFORT_DISABLE_THINKING_BUDGET = int(
     os.getenv("DEFAULT_REASONING_EFFORT_DISABLE_THINKING_BUDGET", 0)
@@ -115,6 +131,15 @@ AIOHTTP_TTL_DNS_CACHE = int(os.getenv("AIOHTTP_TTL_DNS_CACHE", 300))
 AIOHTTP_NEEDS_CLEANUP_CLOSED = (
     (3, 13, 0) <= sys.version_info < (3, 13, 1) or sys.version_info < (3, 12, 7)
 )
+# Upstream connection pool manager (litellm.upstream_connection_pool = True)
+# Max connections per origin pool - all traffic to an origin shares one pool. 0 = no limit
+UPSTREAM_CONNECTION_POOL_LIMIT = int(os.getenv("UPSTREAM_CONNECTION_POOL_LIMIT", 0))
+UPSTREAM_CONNECTION_POOL_PREWARM_CONNECTIONS = int(
+    os.getenv("UPSTREAM_CONNECTION_POOL_PREWARM_CONNECTIONS", 2)
+)
+UPSTREAM_CONNECTION_POOL_PREWARM_TIMEOUT = float(
+    os.getenv("UPSTREAM_CONNECTION_POOL_PREWARM_TIMEOUT", 5)
+)
 
 # WebSocket constants
 # Default to None (unlimited) to match OpenAI's official agents SDK behavior
@@ -164,6 +189,9 @@ MAX_IN_MEMORY_QUEUE_FLUSH_COUNT = int(
 MINIMUM_PROMPT_CACHE_TOKEN_COUNT = int(
     os.getenv("MINIMUM_PROMPT_CACHE_TOKEN_COUNT", 1024)
 )  # minimum number of tokens to cache a prompt by Anthropic
+PROMPT_CACHING_PREFIX_INDEX_MAX_BOUNDARIES = int(
+    os.getenv("PROMPT_CACHING_PREFIX_INDEX_MAX_BOUNDARIES", 64)
+)  # max number of message-boundary prefix hashes indexed per request for prompt caching routing
 DEFAULT_TRIM_RATIO = float(
     os.getenv("DEFAULT_TRIM_RATIO", 0.75)
 )  # default ratio of tokens to trim from the end of a prompt
@@ -252,6 +280,12 @@ NON_LLM_CONNECTION_TIMEOUT = int(
 MAX_EXCEPTION_MESSAGE_LENGTH = int(os.getenv("MAX_EXCEPTION_MESSAGE_LENGTH", 2000))
 MAX_STRING_LENGTH_PROMPT_IN_DB = int(os.getenv("MAX_STRING_LENGTH_PROMPT_IN_DB", 2048))
 BEDROCK_MAX_POLICY_SIZE = int(os.getenv("BEDROCK_MAX_POLICY_SIZE", 75))
+CREDENTIAL_REFRESH_AHEAD_SECONDS = float(
+    os.getenv("CREDENTIAL_REFRESH_AHEAD_SECONDS", 300)
+)  # refresh short-lived provider credentials (Vertex AI, Bedrock STS, Azure AD) this long before they expire
+CREDENTIAL_REFRESH_RETRY_SECONDS = float(
+    os.getenv("CREDENTIAL_REFRESH_RETRY_SECONDS", 10)
+)
 REPLICATE_POLLING_DELAY_SECONDS = float(
     os.getenv("REPLICATE_POLLING_DELAY_SECONDS", 0.5)
 )
@@ -269,6 +303,18 @@ TOGETHER_AI_EMBEDDING_350_M = int(os.getenv("TOGETHER_AI_EMBEDDING_350_M", 350))
 QDRANT_SCALAR_QUANTILE = float(os.getenv("QDRANT_SCALAR_QUANTILE", 0.99))
 QDRANT_VECTOR_SIZE = int(os.getenv("QDRANT_VECTOR_SIZE", 1536))
 CACHED_STREAMING_CHUNK_DELAY = float(os.getenv("CACHED_STREAMING_CHUNK_DELAY", 0.02))
+STREAM_COALESCING_DEFAULT_MAX_DELAY_MS = int(
+    os.getenv("STREAM_COALESCING_DEFAULT_MAX_DELAY_MS", 50)
+)  # max ms a streamed delta is held back, when proxy `stream_coalescing` is on
+STREAM_COALESCING_DEFAULT_MAX_BYTES = int(
+    os.getenv("STREAM_COALESCING_DEFAULT_MAX_BYTES", 1024)
+)  # coalesced deltas are flushed once they reach this size
+DEFAULT_DISK_CACHE_IO_MAX_WORKERS = int(
+    os.getenv("DEFAULT_DISK_CACHE_IO_MAX_WORKERS", 4)
+)  # threads in the dedicated disk cache I/O executor, when `disk_cache_offload_io` is on
+IN_FLIGHT_REQUEST_COALESCING_TIMEOUT = float(
+    os.getenv("IN_FLIGHT_REQUEST_COALESCING_TIMEOUT", 60)
+)  # max seconds a coalesced request waits on an identical in-flight request before calling the provider itself
 AUDIO_SPEECH_CHUNK_SIZE = int(
     os.getenv("AUDIO_SPEECH_CHUNK_SIZE", 8192)
 )  # chunk_size for audio speech streaming. Balance between latency and memory usage
@@ -309,6 +355,33 @@ MAX_TIME_TO_CLEAR_QUEUE = float(os.getenv("MAX_TIME_TO_CLEAR_QUEUE", 5.0))
 LOGGING_WORKER_AGGRESSIVE_CLEAR_COOLDOWN_SECONDS = float(
     os.getenv("LOGGING_WORKER_AGGRESSIVE_CLEAR_COOLDOWN_SECONDS", 0.5)
 )  # Cooldown time in seconds before allowing another aggressive clear (default: 0.5s)
+LOGGING_WORKER_QUEUE_FULL_POLICY = os.getenv(
+    "LOGGING_WORKER_QUEUE_FULL_POLICY", "clear"
+)  # What the default logging lane does when its queue is full: "clear", "drop" or "sample"
+LOGGING_WORKER_SAMPLE_RATE = float(
+    os.getenv("LOGGING_WORKER_SAMPLE_RATE", 0.1)
+)  # Fraction of tasks admitted by the "sample" policy, once the queue is LOGGING_WORKER_SAMPLING_QUEUE_PERCENTAGE full
+LOGGING_WORKER_SAMPLING_QUEUE_PERCENTAGE = int(
+    os.getenv("LOGGING_WORKER_SAMPLING_QUEUE_PERCENTAGE", 50)
+)  # Queue fill percentage at which the "sample" policy starts sampling (default: 50%)
+LOGGING_WORKER_BEST_EFFORT_MAX_QUEUE_SIZE = int(
+    os.getenv("LOGGING_WORKER_BEST_EFFORT_MAX_QUEUE_SIZE", 50_000)
+)
+LOGGING_WORKER_BEST_EFFORT_CONCURRENCY = int(
+    os.getenv("LOGGING_WORKER_BEST_EFFORT_CONCURRENCY", 50)
+)  # Must be above 0
+LOGGING_WORKER_BEST_EFFORT_QUEUE_FULL_POLICY = os.getenv(
+    "LOGGING_WORKER_BEST_EFFORT_QUEUE_FULL_POLICY", "clear"
+)  # What the best-effort logging lane does when its queue is full: "clear", "drop" or "sample"
+LOGGING_WORKER_BEST_EFFORT_SAMPLE_RATE = float(
+    os.getenv("LOGGING_WORKER_BEST_EFFORT_SAMPLE_RATE", LOGGING_WORKER_SAMPLE_RATE)
+)
+LOGGING_WORKER_PROCESSES = int(
+    os.getenv("LOGGING_WORKER_PROCESSES", 0)
+)  # Number of logging worker processes for out-of-process logging (default: 0 - off)
+LOGGING_WORKER_PROCESS_MAX_QUEUE_SIZE = int(
+    os.getenv("LOGGING_WORKER_PROCESS_MAX_QUEUE_SIZE", 10_000)
+)  # Max events queued for the logging worker processes, before logging in-process
 DD_TRACER_STREAMING_CHUNK_YIELD_RESOURCE = os.getenv(
     "DD_TRACER_STREAMING_CHUNK_YIELD_RESOURCE", "streaming.chunk.yield"
 )
@@ -1066,6 +1139,17 @@ RATE_LIMIT_ERROR_MESSAGE_FOR_VIRTUAL_KEY = "LiteLLM Virtual Key user_api_key_has
 # Format: "gen0,gen1,gen2" e.g., "1000,50,50"
 PYTHON_GC_THRESHOLD = os.getenv("PYTHON_GC_THRESHOLD")
 
+# Sampling profiler (/debug/profiler/* endpoints)
+SAMPLING_PROFILER_DEFAULT_INTERVAL_MS = float(
+    os.getenv("SAMPLING_PROFILER_DEFAULT_INTERVAL_MS", 10)
+)  # time between stack samples
+SAMPLING_PROFILER_MAX_DURATION_SECONDS = float(
+    os.getenv("SAMPLING_PROFILER_MAX_DURATION_SECONDS", 300)
+)  # the profiler stops itself after this long, if not stopped before
+SAMPLING_PROFILER_MAX_STACKS = int(
+    os.getenv("SAMPLING_PROFILER_MAX_STACKS", 50000)
+)  # max distinct stacks kept - further new stacks are counted as truncated
+
 # pass through route constansts
 BEDROCK_AGENT_RUNTIME_PASS_THROUGH_ROUTES = [
     "agents/",
@@ -1188,6 +1272,12 @@ SPECIAL_LITELLM_AUTH_TOKEN = ["ui-token"]
 DEFAULT_MANAGEMENT_OBJECT_IN_MEMORY_CACHE_TTL = int(
     os.getenv("DEFAULT_MANAGEMENT_OBJECT_IN_MEMORY_CACHE_TTL", 60)
 )
+PROXY_REQUEST_TEMPLATE_CACHE_SIZE = int(
+    os.getenv("PROXY_REQUEST_TEMPLATE_CACHE_SIZE", 1000)
+)  # max. precomputed key / team request templates kept in memory, 0 disables the cache
+PROXY_REQUEST_TEMPLATE_CACHE_TTL = int(
+    os.getenv("PROXY_REQUEST_TEMPLATE_CACHE_TTL", 60)
+)  # seconds a key / team request template is reused
 
 # Sentry Scrubbing Configuration
 SENTRY_DENYLIST = [
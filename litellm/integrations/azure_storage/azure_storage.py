@@ -1,5 +1,4 @@
 import asyncio
-import json
 import os
 import time
 from litellm._uuid import uuid
@@ -9,6 +8,10 @@ from typing import List, Optional
 from litellm._logging import verbose_logger
 from litellm.constants import _DEFAULT_TTL_FOR_HTTPX_CLIENTS, AZURE_STORAGE_MSFT_VERSION
 from litellm.integrations.custom_batch_logger import CustomBatchLogger
+from litellm.litellm_core_utils.serialized_logging_payload import (
+    get_standard_logging_payload_json,
+    get_standard_logging_payload_json_bytes,
+)
 from litellm.llms.azure.common_utils import get_azure_ad_token_from_entra_id
 from litellm.llms.custom_httpx.http_handler import (
     AsyncHTTPHandler,
@@ -168,7 +171,7 @@ class AzureBlobStorageLogger(CustomBatchLogger):
                     llm_provider=httpxSpecialProvider.LoggingCallback
                 )
                 json_payload = (
-                    json.dumps(payload) + "\n"
+                    get_standard_logging_payload_json(payload) + "\n"
                 )  # Add newline for each log entry
                 payload_bytes = json_payload.encode("utf-8")
                 filename = f"{payload.get('id') or str(uuid.uuid4())}.json"
@@ -384,7 +387,7 @@ class AzureBlobStorageLogger(CustomBatchLogger):
             await file_client.create_file()
 
             # Content to append
-            content = json.dumps(payload).encode("utf-8")
+            content = get_standard_logging_payload_json_bytes(payload)
 
             # Append content to the file
             await file_client.append_data(data=content, offset=0, length=len(content))
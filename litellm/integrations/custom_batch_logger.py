@@ -2,6 +2,10 @@
 Custom Logger that handles batching logic 
 
 Use this if you want your logs to be stored in memory and flushed periodically.
+
+Queue the encoded `standard_logging_object` - `get_standard_logging_payload_json_bytes(payload)` - and join the batch
+with `json_array_bytes` / `ndjson_bytes` (litellm_core_utils/serialized_logging_payload.py), instead of `json.dumps`-ing
+the whole batch.
 """
 
 import asyncio
@@ -14,6 +18,9 @@ from litellm.integrations.custom_logger import CustomLogger
 
 
 class CustomBatchLogger(CustomLogger):
+    # exports to a third-party service - a slow service should not delay spend tracking
+    logging_lane = "best_effort"
+
     def __init__(
         self,
         flush_lock: Optional[asyncio.Lock] = None,
@@ -11,6 +11,7 @@ from typing import (
     Optional,
     Tuple,
     Union,
+    cast,
 )
 
 from pydantic import BaseModel
@@ -18,6 +19,7 @@ from pydantic import BaseModel
 from litellm._logging import verbose_logger
 from litellm.caching.caching import DualCache
 from litellm.constants import DEFAULT_MAX_RECURSE_DEPTH_SENSITIVE_DATA_MASKER
+from litellm.litellm_core_utils.logging_worker import LoggingLane
 from litellm.types.integrations.argilla import ArgillaItem
 from litellm.types.llms.openai import AllMessageValues, ChatCompletionRequest
 from litellm.types.prompts.init_prompts import PromptSpec
@@ -65,6 +67,9 @@ _BASE64_INLINE_PATTERN = re.compile(
 
 class CustomLogger:  # https://docs.litellm.ai/docs/observability/custom_callback#callback-class
     # Class variables or attributes
+    # lane the async success / failure events of this logger run on - see `LoggingLane`
+    logging_lane: LoggingLane = "default"
+
     def __init__(
         self,
         turn_off_message_logging: bool = False,
@@ -558,7 +563,10 @@ class CustomLogger:  # https://docs.litellm.ai/docs/observability/custom_callbac
         """
         from copy import copy
 
-        from litellm import Choices, Message, ModelResponse
+        from litellm.litellm_core_utils.serialized_logging_payload import (
+            SerializedStandardLoggingPayload,
+            redact_standard_logging_payload,
+        )
 
         turn_off_message_logging: bool = getattr(
             self, "turn_off_message_logging", False
@@ -570,47 +578,20 @@ class CustomLogger:  # https://docs.litellm.ai/docs/observability/custom_callbac
         # Only make a shallow copy of the top-level dict to avoid deepcopy issues
         # with complex objects like AuthenticationError that may be present
         model_call_details_copy = copy(model_call_details)
-        redacted_str = "redacted-by-litellm"
         standard_logging_object = model_call_details.get("standard_logging_object")
         if standard_logging_object is None:
             return model_call_details_copy
 
-        # Make a copy of just the standard_logging_object to avoid modifying the original
-        standard_logging_object_copy = copy(standard_logging_object)
-
-        if standard_logging_object_copy.get("messages") is not None:
-            standard_logging_object_copy["messages"] = [
-                Message(content=redacted_str).model_dump()
-            ]
-
-        if standard_logging_object_copy.get("response") is not None:
-            response = standard_logging_object_copy["response"]
-            # Check if this is a ResponsesAPIResponse (has "output" field)
-            if isinstance(response, dict) and "output" in response:
-                # Make a copy to avoid modifying the original
-                from copy import deepcopy
-
-                response_copy = deepcopy(response)
-                # Redact content in output array
-                if isinstance(response_copy.get("output"), list):
-                    for output_item in response_copy["output"]:
-                        if isinstance(output_item, dict) and "content" in output_item:
-                            if isinstance(output_item["content"], list):
-                                # Redact text in content items
-                                for content_item in output_item["content"]:
-                                    if (
-                                        isinstance(content_item, dict)
-                                        and "text" in content_item
-                                    ):
-                                        content_item["text"] = redacted_str
-                standard_logging_object_copy["response"] = response_copy
-            else:
-                # Standard ModelResponse format
-                model_response = ModelResponse(
-                    choices=[Choices(message=Message(content=redacted_str))]
-                )
-                model_response_dict = model_response.model_dump()
-                standard_logging_object_copy["response"] = model_response_dict
+        # The redaction is shared by all loggers with message logging turned off
+        standard_logging_object_copy: StandardLoggingPayload
+        if isinstance(standard_logging_object, SerializedStandardLoggingPayload):
+            standard_logging_object_copy = cast(
+                StandardLoggingPayload, standard_logging_object.get_redacted_payload()
+            )
+        else:
+            standard_logging_object_copy = redact_standard_logging_payload(
+                standard_logging_object
+            )
 
         model_call_details_copy["standard_logging_object"] = (
             standard_logging_object_copy
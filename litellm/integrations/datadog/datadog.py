@@ -27,6 +27,9 @@ import litellm
 from litellm._logging import verbose_logger
 from litellm._uuid import uuid
 from litellm.integrations.custom_batch_logger import CustomBatchLogger
+from litellm.litellm_core_utils.serialized_logging_payload import (
+    get_standard_logging_payload_json,
+)
 from litellm.llms.custom_httpx.http_handler import (
     _get_httpx_client,
     get_async_httpx_client,
@@ -317,8 +320,7 @@ class DataDogLogger(
         standard_logging_object: StandardLoggingPayload,
         status: DataDogStatus,
     ) -> DatadogPayload:
-        from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
-        json_payload = safe_dumps(standard_logging_object)
+        json_payload = get_standard_logging_payload_json(standard_logging_object)
         verbose_logger.debug("Datadog: Logger - Logging payload = %s", json_payload)
         dd_payload = DatadogPayload(
             ddsource=self._get_datadog_source(),
@@ -1,9 +1,11 @@
-import json
 import os
 from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
 
 from litellm._logging import verbose_logger
 from litellm.integrations.custom_batch_logger import CustomBatchLogger
+from litellm.litellm_core_utils.serialized_logging_payload import (
+    get_standard_logging_payload_json_bytes,
+)
 from litellm.llms.custom_httpx.http_handler import (
     get_async_httpx_client,
     httpxSpecialProvider,
@@ -308,10 +310,13 @@ class GCSBucketBase(CustomBatchLogger):
         """
         Helper function to make POST request to GCS Bucket in the specified bucket.
         """
+        json_logged_payload: Union[str, bytes]
         if isinstance(logging_payload, str):
             json_logged_payload = logging_payload
         else:
-            json_logged_payload = json.dumps(logging_payload, default=str)
+            json_logged_payload = get_standard_logging_payload_json_bytes(
+                logging_payload
+            )
 
         bucket_name, object_name = self._handle_folders_in_bucket_name(
             bucket_name=bucket_name,
@@ -18,11 +18,14 @@ from litellm._logging import verbose_logger
 from litellm._uuid import uuid
 from litellm.integrations.custom_batch_logger import CustomBatchLogger
 from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
+from litellm.litellm_core_utils.serialized_logging_payload import (
+    get_standard_logging_payload_json_bytes,
+    json_array_bytes,
+)
 from litellm.llms.custom_httpx.http_handler import (
     get_async_httpx_client,
     httpxSpecialProvider,
 )
-from litellm.types.utils import StandardLoggingPayload
 
 API_EVENT_TYPES = Literal["llm_api_success", "llm_api_failure"]
 
@@ -166,7 +169,7 @@ class GenericAPILogger(CustomBatchLogger):
         self.flush_lock = asyncio.Lock()
         super().__init__(**kwargs, flush_lock=self.flush_lock)
         asyncio.create_task(self.periodic_flush())
-        self.log_queue: List[Union[Dict, StandardLoggingPayload]] = []
+        self.log_queue: List[Union[Dict, bytes]] = []
 
     def _get_headers(self, headers: Optional[dict] = None):
         """
@@ -239,8 +242,10 @@ class GenericAPILogger(CustomBatchLogger):
                 )
                 self.log_queue.append(payload)
             else:
-                # New logging payload, StandardLoggingPayload
-                self.log_queue.append(standard_logging_payload)
+                # New logging payload, StandardLoggingPayload - pre-encoded, shared with other loggers
+                self.log_queue.append(
+                    get_standard_logging_payload_json_bytes(standard_logging_payload)
+                )
 
             if len(self.log_queue) >= self.batch_size:
                 await self.async_send_batch()
@@ -276,7 +281,9 @@ class GenericAPILogger(CustomBatchLogger):
                 )
                 self.log_queue.append(payload)
             else:
-                self.log_queue.append(standard_logging_payload)
+                self.log_queue.append(
+                    get_standard_logging_payload_json_bytes(standard_logging_payload)
+                )
 
             if len(self.log_queue) >= self.batch_size:
                 await self.async_send_batch()
@@ -302,7 +309,14 @@ class GenericAPILogger(CustomBatchLogger):
             response = await self.async_httpx_client.post(
                 url=self.endpoint,
                 headers=self.headers,
-                data=safe_dumps(self.log_queue),
+                data=json_array_bytes(
+                    (
+                        item
+                        if isinstance(item, bytes)
+                        else safe_dumps(item).encode("utf-8")
+                    )
+                    for item in self.log_queue
+                ),
             )
 
             verbose_logger.debug(
@@ -109,6 +109,8 @@ def langfuse_client_init(
 
 
 class LangfusePromptManagement(LangFuseLogger, PromptManagementBase, CustomLogger):
+    logging_lane = "best_effort"
+
     def __init__(
         self,
         langfuse_public_key=None,
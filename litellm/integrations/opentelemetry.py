@@ -50,6 +50,7 @@ LITELLM_METER_NAME = os.getenv("LITELLM_METER_NAME", "litellm")
 LITELLM_LOGGER_NAME = os.getenv("LITELLM_LOGGER_NAME", "litellm")
 # Remove the hardcoded LITELLM_RESOURCE dictionary - we'll create it properly later
 RAW_REQUEST_SPAN_NAME = "raw_gen_ai_request"
+CONNECTION_PHASE_SPAN_NAME_PREFIX = "llm_api_connection."
 LITELLM_REQUEST_SPAN_NAME = "litellm_request"
 
 
@@ -623,6 +624,9 @@ class OpenTelemetry(CustomLogger):
         # 3. Guardrail span
         self._create_guardrail_span(kwargs=kwargs, context=ctx)
 
+        # 3b. Connection phase spans
+        self._create_connection_phase_spans(kwargs=kwargs, parent_span=span)
+
         # 4. Metrics & cost recording
         self._record_metrics(kwargs, response_obj, start_time, end_time)
 
@@ -1055,6 +1059,41 @@ class OpenTelemetry(CustomLogger):
 
             guardrail_span.end(end_time=self._to_ns(end_time_datetime))
 
+    def _create_connection_phase_spans(self, kwargs: dict, parent_span: Span):
+        """
+        Creates a child span of `parent_span` for each connection phase of the LLM API call - e.g. `llm_api_connection.pool_wait`
+        """
+        from opentelemetry import trace
+
+        standard_logging_payload: Optional[StandardLoggingPayload] = kwargs.get(
+            "standard_logging_object"
+        )
+        if standard_logging_payload is None:
+            return
+        connection_timings = standard_logging_payload.get("connection_timings")
+        if not connection_timings:
+            return
+
+        otel_tracer: Tracer = self.get_tracer_to_use_for_request(kwargs)
+        context = trace.set_span_in_context(parent_span)
+        start_time_ns = int(connection_timings["start_time"] * 1e9)
+        for phase, phase_timing in connection_timings["phases"].items():
+            phase_start_time_ns = start_time_ns + int(phase_timing["start_ms"] * 1e6)
+            phase_span = otel_tracer.start_span(
+                name=CONNECTION_PHASE_SPAN_NAME_PREFIX + phase,
+                start_time=phase_start_time_ns,
+                context=context,
+            )
+            if connection_timings["connection_reused"] is not None:
+                self.safe_set_attribute(
+                    span=phase_span,
+                    key="connection_reused",
+                    value=connection_timings["connection_reused"],
+                )
+            phase_span.end(
+                end_time=phase_start_time_ns + int(phase_timing["duration_ms"] * 1e6)
+            )
+
     def _handle_failure(self, kwargs, response_obj, start_time, end_time):
         from opentelemetry.trace import Status, StatusCode
 
@@ -1083,6 +1122,8 @@ class OpenTelemetry(CustomLogger):
         # Create span for guardrail information
         self._create_guardrail_span(kwargs=kwargs, context=_parent_context)
 
+        self._create_connection_phase_spans(kwargs=kwargs, parent_span=span)
+
         if parent_otel_span is not None:
             parent_otel_span.end(end_time=self._to_ns(datetime.now()))
 
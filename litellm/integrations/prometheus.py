@@ -114,6 +114,17 @@ class PrometheusLogger(CustomLogger):
                 buckets=LATENCY_BUCKETS,
             )
 
+            self.litellm_llm_api_connection_phase_latency_metric = (
+                self._histogram_factory(
+                    "litellm_llm_api_connection_phase_latency_metric",
+                    "Latency (seconds) of each connection phase of a models LLM API call - pool_wait, dns, connect, tls, time_to_first_byte, body_transfer",
+                    labelnames=self.get_labels_for_metric(
+                        "litellm_llm_api_connection_phase_latency_metric"
+                    ),
+                    buckets=LATENCY_BUCKETS,
+                )
+            )
+
             # Counter for spend
             self.litellm_spend_metric = self._counter_factory(
                 "litellm_spend_metric",
@@ -302,6 +313,12 @@ class PrometheusLogger(CustomLogger):
                 self.get_labels_for_metric("litellm_deployment_failed_fallbacks"),
             )
 
+            self.litellm_router_hedged_requests = self._counter_factory(
+                "litellm_router_hedged_requests",
+                "LLM Deployment Analytics - Number of requests hedged by the router (sent to a second deployment after the hedge delay). hedge_outcome is primary_won, hedge_won, all_failed or budget_exhausted (hedge delay passed, no hedge sent)",
+                self.get_labels_for_metric("litellm_router_hedged_requests"),
+            )
+
             # Callback Logging Failure Metrics
             self.litellm_callback_logging_failures_metric = self._counter_factory(
                 name="litellm_callback_logging_failures_metric",
@@ -932,6 +949,11 @@ class PrometheusLogger(CustomLogger):
             kwargs, start_time, end_time, enum_values, output_tokens
         )
 
+        self._set_connection_phase_metrics(
+            standard_logging_payload=standard_logging_payload,  # type: ignore
+            litellm_model_name=model,
+        )
+
         if (
             standard_logging_payload["stream"] is True
         ):  # log successful streaming requests from logging event hook.
@@ -1207,6 +1229,10 @@ class PrometheusLogger(CustomLogger):
                 user_id,
             ).inc()
             self.set_llm_deployment_failure_metrics(kwargs)
+            self._set_connection_phase_metrics(
+                standard_logging_payload=standard_logging_payload,
+                litellm_model_name=model,
+            )
         except Exception as e:
             verbose_logger.exception(
                 "prometheus Layer Error(): Exception occured - {}".format(str(e))
@@ -1322,6 +1348,36 @@ class PrometheusLogger(CustomLogger):
             )
             pass
 
+    def _set_connection_phase_metrics(
+        self,
+        standard_logging_payload: StandardLoggingPayload,
+        litellm_model_name: Optional[str],
+    ):
+        """
+        Observe the duration of each connection phase of the LLM API call, from `standard_logging_payload["connection_timings"]`
+        """
+        connection_timings = standard_logging_payload.get("connection_timings")
+        if not connection_timings:
+            return
+        enum_values = UserAPIKeyLabelValues(
+            litellm_model_name=litellm_model_name,
+            model_id=standard_logging_payload.get("model_id"),
+            api_base=standard_logging_payload.get("api_base"),
+            api_provider=standard_logging_payload.get("custom_llm_provider"),
+        )
+        _labels = prometheus_label_factory(
+            supported_enum_labels=self.get_labels_for_metric(
+                metric_name="litellm_llm_api_connection_phase_latency_metric"
+            ),
+            enum_values=enum_values,
+        )
+        for phase, phase_timing in connection_timings["phases"].items():
+            if UserAPIKeyLabelNames.CONNECTION_PHASE.value in _labels:
+                _labels[UserAPIKeyLabelNames.CONNECTION_PHASE.value] = phase
+            self.litellm_llm_api_connection_phase_latency_metric.labels(
+                **_labels
+            ).observe(phase_timing["duration_ms"] / 1000)
+
     def set_llm_deployment_failure_metrics(self, request_kwargs: dict):
         """
         Sets Failure metrics when an LLM API call fails
@@ -1738,6 +1794,12 @@ class PrometheusLogger(CustomLogger):
             litellm_model_name, model_id, api_base, api_provider, exception_status
         ).inc()
 
+    def increment_router_hedged_requests(self, model_group: str, hedge_outcome: str):
+        """
+        increment metric when litellm.Router hedges a request / skips a hedge because the hedge budget is used up
+        """
+        self.litellm_router_hedged_requests.labels(model_group, hedge_outcome).inc()
+
     def increment_callback_logging_failure(
         self,
         callback_name: str,
@@ -14,7 +14,9 @@ import litellm
 from litellm._logging import print_verbose, verbose_logger
 from litellm.constants import DEFAULT_S3_BATCH_SIZE, DEFAULT_S3_FLUSH_INTERVAL_SECONDS
 from litellm.integrations.s3 import get_s3_object_key
-from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
+from litellm.litellm_core_utils.serialized_logging_payload import (
+    get_standard_logging_payload_json_bytes,
+)
 from litellm.llms.bedrock.base_aws_llm import BaseAWSLLM
 from litellm.llms.custom_httpx.http_handler import (
     _get_httpx_client,
@@ -310,11 +312,13 @@ class S3Logger(CustomBatchLogger, BaseAWSLLM):
                     + batch_logging_element.s3_object_key
                 )
 
-            # Convert JSON to string
-            json_string = safe_dumps(batch_logging_element.payload)
+            # Convert JSON to bytes
+            json_string = get_standard_logging_payload_json_bytes(
+                batch_logging_element.payload
+            )
 
             # Calculate SHA256 hash of the content
-            content_hash = hashlib.sha256(json_string.encode("utf-8")).hexdigest()
+            content_hash = hashlib.sha256(json_string).hexdigest()
 
             # Prepare the request
             headers = {
@@ -426,7 +430,7 @@ class S3Logger(CustomBatchLogger, BaseAWSLLM):
         s3_object_download_filename = f"time-{start_time.strftime('%Y-%m-%dT%H-%M-%S-%f')}_{standard_logging_payload['id']}.json"
 
         return s3BatchLoggingElement(
-            payload=dict(standard_logging_payload),
+            payload=standard_logging_payload,
             s3_object_key=s3_object_key,
             s3_object_download_filename=s3_object_download_filename,
         )
@@ -464,11 +468,13 @@ class S3Logger(CustomBatchLogger, BaseAWSLLM):
                     + batch_logging_element.s3_object_key
                 )
 
-            # Convert JSON to string
-            json_string = safe_dumps(batch_logging_element.payload)
+            # Convert JSON to bytes
+            json_string = get_standard_logging_payload_json_bytes(
+                batch_logging_element.payload
+            )
 
             # Calculate SHA256 hash of the content
-            content_hash = hashlib.sha256(json_string.encode("utf-8")).hexdigest()
+            content_hash = hashlib.sha256(json_string).hexdigest()
 
             # Prepare the request
             headers = {
@@ -1,5 +1,6 @@
 # What is this?
 ## Helper utilities
+import copy
 from typing import TYPE_CHECKING, Any, Iterable, List, Literal, Optional, Union
 
 import httpx
@@ -303,6 +304,41 @@ def safe_deep_copy(data):
     return new_data
 
 
+_IMMUTABLE_SNAPSHOT_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+def snapshot_messages(data: Any, max_depth: int = 50) -> Any:
+    """
+    Snapshot of the request messages, equivalent to `copy.deepcopy(messages)`.
+
+    Dicts, lists and tuples are copied, immutable leaves (strings, bytes, numbers) are shared.
+    Much cheaper than `copy.deepcopy` for large prompts (long documents, base64 images), which
+    keeps a memo entry for every leaf. Other objects (e.g. pydantic messages) are deep-copied.
+    """
+    data_type = type(data)
+    if data_type in _IMMUTABLE_SNAPSHOT_TYPES:
+        return data
+    if max_depth <= 0:
+        # unusually deep / self-referencing structure - deepcopy handles cycles
+        return copy.deepcopy(data)
+    if data_type is dict:
+        # shallow copy in C, then only recurse into values that aren't immutable
+        new_dict = data.copy()
+        for k, v in new_dict.items():
+            if type(v) not in _IMMUTABLE_SNAPSHOT_TYPES:
+                new_dict[k] = snapshot_messages(v, max_depth - 1)
+        return new_dict
+    if data_type is list:
+        new_list = data.copy()
+        for i, v in enumerate(new_list):
+            if type(v) not in _IMMUTABLE_SNAPSHOT_TYPES:
+                new_list[i] = snapshot_messages(v, max_depth - 1)
+        return new_list
+    if data_type is tuple:
+        return tuple(snapshot_messages(v, max_depth - 1) for v in data)
+    return copy.deepcopy(data)
+
+
 def filter_exceptions_from_params(data: Any, max_depth: int = 20) -> Any:
     """
     Recursively filter out Exception objects and callable objects from dicts/lists.
@@ -0,0 +1,222 @@
+"""
+Proactive refresh for short-lived provider credentials - Vertex AI access tokens, Bedrock STS credentials, Azure AD tokens.
+
+- `load()` deduplicates concurrent loads of the same credential (single-flight), so a cold or expired credential costs one STS / OAuth call instead of one per in-flight request
+- `schedule_refresh()` runs a refresh on a background thread `CREDENTIAL_REFRESH_AHEAD_SECONDS` before the credential expires, so requests keep finding a valid credential in the provider's in-memory cache
+- a credential that was not used (`mark_used()`) since its last refresh is not refreshed again - the next request loads it inline, as before
+
+Credentials are not stored here - each provider keeps them in its existing cache, and its refresh callable writes the new credential there and calls `schedule_refresh()` again with the new expiry.
+"""
+
+import hashlib
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
+
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    CREDENTIAL_REFRESH_AHEAD_SECONDS,
+    CREDENTIAL_REFRESH_RETRY_SECONDS,
+)
+
+T = TypeVar("T")
+
+
+def _get_key_digest(key: Hashable) -> str:
+    """
+    Loggable form of a credential key - keys can contain the raw credentials, e.g. a service account json.
+    """
+    return hashlib.sha256(repr(key).encode("utf-8")).hexdigest()[:16]
+
+
+class _InFlightLoad:
+    __slots__ = ("done", "result", "exception")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.exception: Optional[BaseException] = None
+
+
+class _ScheduledRefresh:
+    __slots__ = ("refresh_fn", "expires_at", "sequence", "used")
+
+    def __init__(self, refresh_fn: Callable[[], None], expires_at: float):
+        self.refresh_fn = refresh_fn
+        self.expires_at = expires_at
+        self.sequence = -1
+        self.used = False
+
+
+class CredentialRefreshManager:
+    def __init__(
+        self,
+        refresh_ahead_seconds: float = CREDENTIAL_REFRESH_AHEAD_SECONDS,
+        retry_seconds: float = CREDENTIAL_REFRESH_RETRY_SECONDS,
+    ):
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self.retry_seconds = retry_seconds
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._in_flight: Dict[Hashable, _InFlightLoad] = {}
+        self._scheduled: Dict[Hashable, _ScheduledRefresh] = {}
+        # (refresh_at, sequence, key) - entries whose sequence no longer matches `_scheduled[key]` were cancelled / rescheduled
+        self._refresh_queue: List[Tuple[float, int, Hashable]] = []
+        self._sequence = itertools.count()
+        self._scheduler_thread: Optional[threading.Thread] = None
+
+    def load(self, key: Hashable, load_fn: Callable[[], T]) -> T:
+        """
+        Run `load_fn`, or wait for the call already running for `key` and share its result / exception.
+        """
+        with self._lock:
+            in_flight = self._in_flight.get(key)
+            is_owner = in_flight is None
+            if in_flight is None:
+                in_flight = _InFlightLoad()
+                self._in_flight[key] = in_flight
+
+        if not is_owner:
+            in_flight.done.wait()
+            if in_flight.exception is not None:
+                raise in_flight.exception
+            return in_flight.result  # type: ignore[return-value]
+
+        try:
+            in_flight.result = load_fn()
+            return in_flight.result  # type: ignore[return-value]
+        except BaseException as e:
+            in_flight.exception = e
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            in_flight.done.set()
+
+    def schedule_refresh(
+        self,
+        key: Hashable,
+        refresh_fn: Callable[[], None],
+        expires_at: Optional[float],
+    ) -> None:
+        """
+        Call `refresh_fn` in the background before `expires_at` (unix timestamp), if the credential is used in the meantime.
+
+        Replaces any refresh already scheduled for `key`.
+        """
+        if expires_at is None:
+            return
+        now = time.time()
+        refresh_at = expires_at - self.refresh_ahead_seconds
+        if refresh_at < now:
+            # credential was issued with less lifetime left than the refresh window
+            refresh_at = now + self.retry_seconds
+            if refresh_at >= expires_at:
+                self.cancel(key)
+                return
+
+        with self._lock:
+            scheduled_refresh = _ScheduledRefresh(
+                refresh_fn=refresh_fn, expires_at=expires_at
+            )
+            self._scheduled[key] = scheduled_refresh
+            self._push(key, scheduled_refresh, refresh_at)
+            self._ensure_scheduler_thread()
+
+    def mark_used(self, key: Hashable) -> None:
+        """
+        Hot path - record that a cached credential was used, so it is kept warm.
+        """
+        scheduled_refresh = self._scheduled.get(key)
+        if scheduled_refresh is not None:
+            scheduled_refresh.used = True
+
+    def cancel(self, key: Hashable) -> None:
+        with self._lock:
+            self._scheduled.pop(key, None)
+
+    def _push(
+        self, key: Hashable, scheduled_refresh: _ScheduledRefresh, refresh_at: float
+    ) -> None:
+        scheduled_refresh.sequence = next(self._sequence)
+        heapq.heappush(
+            self._refresh_queue, (refresh_at, scheduled_refresh.sequence, key)
+        )
+        self._wakeup.notify()
+
+    def _ensure_scheduler_thread(self) -> None:
+        if self._scheduler_thread is None or not self._scheduler_thread.is_alive():
+            self._scheduler_thread = threading.Thread(
+                target=self._run_scheduler,
+                name="litellm-credential-refresh",
+                daemon=True,
+            )
+            self._scheduler_thread.start()
+
+    def _run_scheduler(self) -> None:
+        while True:
+            with self._wakeup:
+                key, scheduled_refresh = self._wait_for_next_refresh()
+            # refresh off the scheduler thread, so a slow token endpoint does not delay other credentials
+            threading.Thread(
+                target=self._refresh,
+                args=(key, scheduled_refresh),
+                name="litellm-credential-refresh-worker",
+                daemon=True,
+            ).start()
+
+    def _wait_for_next_refresh(self) -> Tuple[Hashable, _ScheduledRefresh]:
+        while True:
+            while self._refresh_queue:
+                refresh_at, sequence, key = self._refresh_queue[0]
+                scheduled_refresh = self._scheduled.get(key)
+                if (
+                    scheduled_refresh is not None
+                    and scheduled_refresh.sequence == sequence
+                ):
+                    break
+                heapq.heappop(self._refresh_queue)  # cancelled or rescheduled
+            else:
+                self._wakeup.wait()
+                continue
+
+            wait_seconds = refresh_at - time.time()
+            if wait_seconds <= 0:
+                heapq.heappop(self._refresh_queue)
+                return key, scheduled_refresh
+            self._wakeup.wait(timeout=wait_seconds)
+
+    def _refresh(self, key: Hashable, scheduled_refresh: _ScheduledRefresh) -> None:
+        if not scheduled_refresh.used:
+            verbose_logger.debug(
+                "Credential not used since last refresh, not refreshing: %s",
+                _get_key_digest(key),
+            )
+            with self._lock:
+                if self._scheduled.get(key) is scheduled_refresh:
+                    del self._scheduled[key]
+            return
+
+        try:
+            scheduled_refresh.refresh_fn()
+        except Exception as e:
+            verbose_logger.warning(
+                "Background credential refresh failed, retrying in %ss: %s",
+                self.retry_seconds,
+                str(e),
+            )
+
+        # `refresh_fn` schedules the next refresh itself - if it did not, the refresh failed, retry while the credential is still valid
+        with self._lock:
+            if self._scheduled.get(key) is not scheduled_refresh:
+                return
+            retry_at = time.time() + self.retry_seconds
+            if retry_at >= scheduled_refresh.expires_at:
+                del self._scheduled[key]
+                return
+            self._push(key, scheduled_refresh, retry_at)
+
+
+credential_refresh_manager = CredentialRefreshManager()
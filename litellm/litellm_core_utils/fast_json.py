@@ -0,0 +1,57 @@
+"""
+Fast JSON (de)serialization for provider requests and responses.
+
+Uses orjson when installed (`pip install orjson`, included in `litellm[proxy]`), else falls back to the stdlib json module.
+
+- `json_dumps_bytes` serializes straight to bytes, so httpx does not re-encode a str body.
+- `json_loads` parses bytes / str, use `json_loads(response.content)` instead of `response.json()`.
+"""
+
+import json
+from typing import Any, Union
+
+import httpx
+
+try:
+    import orjson
+
+    _ORJSON_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+except ImportError:
+    orjson = None  # type: ignore
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize `obj` to JSON bytes.
+
+    Falls back to `json.dumps` for values orjson does not support (e.g. ints > 64 bits, objects handled by a custom json encoder).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_DUMPS_OPTIONS)
+        except TypeError:
+            pass
+    return json.dumps(obj).encode("utf-8")
+
+
+def json_loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def response_json(response: httpx.Response) -> Any:
+    """
+    Drop-in replacement for `httpx.Response.json()`.
+
+    Falls back to `response.json()` if the body is not utf-8 JSON, so errors match httpx.
+    """
+    content = getattr(response, "content", None)
+    if isinstance(content, (bytes, bytearray)):
+        try:
+            return json_loads(content)
+        except ValueError:
+            pass
+    return response.json()
@@ -126,6 +126,8 @@ def get_litellm_params(
         "vertex_ai_credentials": kwargs.get("vertex_ai_credentials"),
         "use_litellm_proxy": use_litellm_proxy,
         "litellm_request_debug": litellm_request_debug,
+        # background refresh of a stale cache entry - not a user request, callbacks are skipped
+        "litellm_cache_refresh": kwargs.get("litellm_cache_refresh"),
         "aws_region_name": kwargs.get("aws_region_name"),
         # AWS credentials for Bedrock/Sagemaker
         "aws_access_key_id": kwargs.get("aws_access_key_id"),
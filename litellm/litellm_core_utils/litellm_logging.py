@@ -1,7 +1,6 @@
 # What is this?
 ## Common Utility file for Logging handler
 # Logging function -> log the exact model details + what's being sent | Non-Blocking
-import copy
 import datetime
 import json
 import os
@@ -59,15 +58,26 @@ from litellm.integrations.custom_logger import CustomLogger
 from litellm.integrations.deepeval.deepeval import DeepEvalLogger
 from litellm.integrations.mlflow import MlflowLogger
 from litellm.integrations.sqs import SQSLogger
+from litellm.litellm_core_utils.core_helpers import snapshot_messages
 from litellm.litellm_core_utils.get_litellm_params import get_litellm_params
 from litellm.litellm_core_utils.llm_cost_calc.tool_call_cost_tracking import (
     StandardBuiltInToolCostTracking,
 )
+from litellm.litellm_core_utils.logging_worker import (
+    GLOBAL_BEST_EFFORT_LOGGING_WORKER,
+)
+from litellm.litellm_core_utils.logging_worker_process_pool import (
+    GLOBAL_LOGGING_WORKER_PROCESS_POOL,
+)
 from litellm.litellm_core_utils.model_param_helper import ModelParamHelper
 from litellm.litellm_core_utils.redact_messages import (
     redact_message_input_output_from_custom_logger,
     redact_message_input_output_from_logging,
 )
+from litellm.litellm_core_utils.serialized_logging_payload import (
+    SerializedStandardLoggingPayload,
+    get_standard_logging_payload_json_bytes,
+)
 from litellm.llms.base_llm.ocr.transformation import OCRResponse
 from litellm.llms.base_llm.search.transformation import SearchResponse
 from litellm.responses.utils import ResponseAPILoggingUtils
@@ -106,6 +116,7 @@ from litellm.types.utils import (
     StandardBuiltInToolsParams,
     StandardCallbackDynamicParams,
     StandardLoggingAdditionalHeaders,
+    StandardLoggingConnectionTimings,
     StandardLoggingHiddenParams,
     StandardLoggingMCPToolCall,
     StandardLoggingMetadata,
@@ -163,6 +174,7 @@ from .specialty_caches.dynamic_logging_cache import DynamicLoggingCache
 
 if TYPE_CHECKING:
     from litellm.llms.base_llm.passthrough.transformation import BasePassthroughConfig
+    from litellm.llms.custom_httpx.connection_timings import ConnectionPhaseTimings
 try:
     from litellm_enterprise.enterprise_callbacks.callback_controls import (
         EnterpriseCallbackControls,
@@ -323,7 +335,7 @@ class Logging(LiteLLMLoggingBaseClass):
                 messages = new_messages
 
         self.model = model
-        self.messages = copy.deepcopy(messages)
+        self.messages = snapshot_messages(messages)
         self.stream = stream
         self.start_time = start_time  # log the call start time
         self.call_type = call_type
@@ -375,9 +387,17 @@ class Logging(LiteLLMLoggingBaseClass):
 
         self.litellm_params = litellm_params
 
+        # background refresh of a stale cache entry - set from the call kwargs, so it applies to every call type
+        self.litellm_cache_refresh: bool = (
+            kwargs is not None and kwargs.get("litellm_cache_refresh") is True
+        )
+
         # Initialize cost breakdown field
         self.cost_breakdown: Optional[CostBreakdown] = None
 
+        # Connection phase timings of the last upstream http request, set by AsyncHTTPHandler
+        self.connection_timings: Optional["ConnectionPhaseTimings"] = None
+
         # Init Caching related details
         self.caching_details: Optional[CachingDetails] = None
 
@@ -512,6 +532,8 @@ class Logging(LiteLLMLoggingBaseClass):
             **scrub_sensitive_keys_in_metadata(litellm_params),
         }
         self.litellm_request_debug = litellm_params.get("litellm_request_debug", False)
+        if litellm_params.get("litellm_cache_refresh") is True:
+            self.litellm_cache_refresh = True
         self.logger_fn = litellm_params.get("logger_fn", None)
         verbose_logger.debug(f"self.optional_params: {self.optional_params}")
 
@@ -966,10 +988,8 @@ class Logging(LiteLLMLoggingBaseClass):
                             print_verbose=print_verbose,
                         )
                     elif callback == "sentry" and add_breadcrumb:
-                        try:
-                            details_to_log = copy.deepcopy(self.model_call_details)
-                        except Exception:
-                            details_to_log = self.model_call_details
+                        # only top-level keys are removed - a shallow copy is enough
+                        details_to_log = dict(self.model_call_details)
                         if litellm.turn_off_message_logging:
                             # make a copy of the _model_Call_details and log it
                             details_to_log.pop("messages", None)
@@ -1168,10 +1188,8 @@ class Logging(LiteLLMLoggingBaseClass):
                 try:
                     if callback == "sentry" and add_breadcrumb:
                         verbose_logger.debug("reaches sentry breadcrumbing")
-                        try:
-                            details_to_log = copy.deepcopy(self.model_call_details)
-                        except Exception:
-                            details_to_log = self.model_call_details
+                        # only top-level keys are removed - a shallow copy is enough
+                        details_to_log = dict(self.model_call_details)
                         if litellm.turn_off_message_logging:
                             # make a copy of the _model_Call_details and log it
                             details_to_log.pop("messages", None)
@@ -1490,6 +1508,13 @@ class Logging(LiteLLMLoggingBaseClass):
     def should_run_callback(
         self, callback: litellm.CALLBACK_TYPES, litellm_params: dict, event_hook: str
     ) -> bool:
+        if self.litellm_cache_refresh is True:
+            # stale cache refresh (`Cache(stale_while_revalidate=...)`) - the user's request was served from the cache, so it is not logged or billed again
+            verbose_logger.debug(
+                f"cache refresh request, skipping logging for {event_hook} event"
+            )
+            return False
+
         if litellm.global_disable_no_log_param:
             return True
 
@@ -2469,6 +2494,38 @@ class Logging(LiteLLMLoggingBaseClass):
 
         self.has_run_logging(event_type="async_success")
 
+        callbacks = self._send_to_logging_worker_processes(
+            callbacks=callbacks,
+            event_type="success",
+            event_hook="async_success_handler",
+            start_time=start_time,
+            end_time=end_time,
+        )
+        callbacks, best_effort_callbacks = self._split_callbacks_by_logging_lane(
+            callbacks
+        )
+        if best_effort_callbacks:
+            GLOBAL_BEST_EFFORT_LOGGING_WORKER.ensure_initialized_and_enqueue(
+                async_coroutine=self._run_async_success_callbacks(
+                    callbacks=best_effort_callbacks,
+                    result=result,
+                    start_time=start_time,
+                    end_time=end_time,
+                )
+            )
+        await self._run_async_success_callbacks(
+            callbacks=callbacks,
+            result=result,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
+    async def _run_async_success_callbacks(  # noqa: PLR0915
+        self, callbacks: List, result: Any, start_time, end_time
+    ):
+        """
+        Run the async success callbacks of `async_success_handler`
+        """
         for callback in callbacks:
             # check if callback can run for this request
             litellm_params = self.model_call_details.get("litellm_params", {})
@@ -2609,6 +2666,137 @@ class Logging(LiteLLMLoggingBaseClass):
                 self._handle_callback_failure(callback=callback)
                 pass
 
+    def has_critical_async_success_callbacks(self) -> bool:
+        """
+        True if a critical callback (e.g. proxy spend tracking) runs in `async_success_handler`.
+
+        Used to enqueue the handler on the default LoggingWorker lane with `droppable=False`, so the `drop` /
+        `sample` queue-full policies never drop spend tracking.
+        """
+        callbacks = self.get_combined_callback_list(
+            dynamic_success_callbacks=self.dynamic_async_success_callbacks,
+            global_callbacks=litellm._async_success_callback,
+        )
+        return any(
+            isinstance(callback, CustomLogger) and callback.logging_lane == "critical"
+            for callback in callbacks
+        )
+
+    def _split_callbacks_by_logging_lane(self, callbacks: List) -> Tuple[List, List]:
+        """
+        Split the async callbacks by `CustomLogger.logging_lane`.
+
+        If a critical callback (e.g. proxy spend tracking) is registered, the best-effort callbacks (third-party
+        exports) are split out, to run on the best-effort LoggingWorker lane - so a slow third-party logger can't
+        delay spend tracking. Critical callbacks run first.
+
+        Returns:
+            (callbacks to run now, best-effort callbacks)
+        """
+        critical_callbacks: List = []
+        default_callbacks: List = []
+        best_effort_callbacks: List = []
+        for callback in callbacks:
+            logging_lane = (
+                callback.logging_lane
+                if isinstance(callback, CustomLogger)
+                else "default"
+            )
+            if logging_lane == "critical":
+                critical_callbacks.append(callback)
+            elif logging_lane == "best_effort":
+                best_effort_callbacks.append(callback)
+            else:
+                default_callbacks.append(callback)
+        if not critical_callbacks:
+            return callbacks, []
+        return critical_callbacks + default_callbacks, best_effort_callbacks
+
+    def _send_to_logging_worker_processes(
+        self,
+        callbacks: List,
+        event_type: Literal["success", "failure"],
+        event_hook: Literal["async_success_handler", "async_failure_handler"],
+        start_time: datetime.datetime,
+        end_time: datetime.datetime,
+    ) -> List:
+        """
+        Ship the standard logging payload to the logging worker processes, for the callbacks that can run there.
+
+        Only used when `litellm.logging_worker_processes` > 0. See `logging_worker_process_pool.py`.
+
+        Returns:
+            The callbacks to run in this process
+        """
+        if not GLOBAL_LOGGING_WORKER_PROCESS_POOL.enabled:
+            return callbacks
+        standard_logging_object = self.model_call_details.get(
+            "standard_logging_object"
+        )
+        if standard_logging_object is None:
+            return callbacks
+        if (
+            event_type == "success"
+            and self.stream is True
+            and "async_complete_streaming_response" not in self.model_call_details
+        ):
+            return callbacks
+
+        in_process_callbacks: List = []
+        # payload json bytes -> (callbacks, callback names)
+        events: Dict[bytes, Tuple[List, List[str]]] = {}
+        # payload id -> (payload, payload json bytes) - callbacks sharing a payload encode it once. The payload is kept
+        # alive here, so its id is not reused
+        encoded_payloads: Dict[int, Tuple[Any, bytes]] = {}
+        litellm_params = self.model_call_details.get("litellm_params", {})
+        for callback in callbacks:
+            callback_name = GLOBAL_LOGGING_WORKER_PROCESS_POOL.get_callback_name(
+                callback
+            )
+            if callback_name is None:
+                in_process_callbacks.append(callback)
+                continue
+            if not self.should_run_callback(
+                callback=callback,
+                litellm_params=litellm_params,
+                event_hook=event_hook,
+            ):
+                continue
+            payload = callback.redact_standard_logging_payload_from_model_call_details(
+                model_call_details=self.model_call_details
+            )["standard_logging_object"]
+            if id(payload) not in encoded_payloads:
+                encoded_payloads[id(payload)] = (
+                    payload,
+                    get_standard_logging_payload_json_bytes(payload),
+                )
+            payload_json_bytes = encoded_payloads[id(payload)][1]
+            # grouped by the encoded payload - callbacks with message logging turned off each get their own copy of
+            # the redacted payload, with the same bytes
+            event_callbacks, callback_names = events.setdefault(
+                payload_json_bytes, ([], [])
+            )
+            event_callbacks.append(callback)
+            callback_names.append(callback_name)
+
+        # per key / team logging settings, e.g. gcs_bucket_name - plain dict, sent to the worker processes
+        standard_callback_dynamic_params = (
+            dict(self.standard_callback_dynamic_params)
+            if self.standard_callback_dynamic_params is not None
+            else None
+        )
+        for payload_json_bytes, (event_callbacks, callback_names) in events.items():
+            if not GLOBAL_LOGGING_WORKER_PROCESS_POOL.enqueue(
+                event_type=event_type,
+                callback_names=tuple(callback_names),
+                start_time=start_time,
+                end_time=end_time,
+                payload_json_bytes=payload_json_bytes,
+                standard_callback_dynamic_params=standard_callback_dynamic_params,
+            ):
+                in_process_callbacks.extend(event_callbacks)
+        return in_process_callbacks
+
     def _handle_callback_failure(self, callback: Any):
         """
         Handle callback logging failures by incrementing Prometheus metrics.
@@ -2931,6 +3119,38 @@ class Logging(LiteLLMLoggingBaseClass):
         result = None  # result sent to all loggers, init this to None incase it's not created
 
         self.has_run_logging(event_type="async_failure")
+        callbacks = self._send_to_logging_worker_processes(
+            callbacks=callbacks,
+            event_type="failure",
+            event_hook="async_failure_handler",
+            start_time=start_time,
+            end_time=end_time,
+        )
+        callbacks, best_effort_callbacks = self._split_callbacks_by_logging_lane(
+            callbacks
+        )
+        if best_effort_callbacks:
+            GLOBAL_BEST_EFFORT_LOGGING_WORKER.ensure_initialized_and_enqueue(
+                async_coroutine=self._run_async_failure_callbacks(
+                    callbacks=best_effort_callbacks,
+                    result=result,
+                    start_time=start_time,
+                    end_time=end_time,
+                )
+            )
+        await self._run_async_failure_callbacks(
+            callbacks=callbacks,
+            result=result,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
+    async def _run_async_failure_callbacks(
+        self, callbacks: List, result: Any, start_time, end_time
+    ):
+        """
+        Run the async failure callbacks of `async_failure_handler`
+        """
         for callback in callbacks:
             try:
                 litellm_params = self.model_call_details.get("litellm_params", {})
@@ -4714,6 +4934,18 @@ class StandardLoggingPayloadSetup:
         else:
             return logging_obj.litellm_trace_id
 
+    @staticmethod
+    def get_connection_timings(
+        logging_obj: Logging,
+    ) -> Optional[StandardLoggingConnectionTimings]:
+        """
+        Returns the connection phase timings of the last upstream http request made for this call
+        """
+        connection_timings = getattr(logging_obj, "connection_timings", None)
+        if connection_timings is None:
+            return None
+        return connection_timings.to_standard_logging_object()
+
     @staticmethod
     def _get_user_agent_tags(proxy_server_request: dict) -> Optional[List[str]]:
         """
@@ -5024,7 +5256,7 @@ def get_standard_logging_object_payload(
             kwargs.get("model", "") or "", custom_llm_provider, metadata
         )
 
-        payload: StandardLoggingPayload = StandardLoggingPayload(
+        payload = StandardLoggingPayload(
             id=str(id),
             trace_id=StandardLoggingPayloadSetup._get_standard_logging_payload_trace_id(
                 logging_obj=logging_obj,
@@ -5082,10 +5314,17 @@ def get_standard_logging_object_payload(
                 "standard_logging_guardrail_information", None
             ),
             standard_built_in_tools_params=standard_built_in_tools_params,
+            connection_timings=StandardLoggingPayloadSetup.get_connection_timings(
+                logging_obj=logging_obj
+            ),
+        )
+        # encoded once, on first use, for all callbacks
+        serialized_payload = cast(
+            StandardLoggingPayload, SerializedStandardLoggingPayload(payload)
         )
 
-        emit_standard_logging_payload(payload)
-        return payload
+        emit_standard_logging_payload(serialized_payload)
+        return serialized_payload
     except Exception as e:
         verbose_logger.exception(
             "Error creating standard logging object - {}".format(str(e))
@@ -3,14 +3,23 @@
 
 import asyncio
 import contextvars
-from typing import Coroutine, Optional
+import random
+import time
+from typing import Coroutine, Dict, Literal, Optional
 import atexit
 from typing_extensions import TypedDict
 
 from litellm._logging import verbose_logger
 from litellm.constants import (
+    LOGGING_WORKER_BEST_EFFORT_CONCURRENCY,
+    LOGGING_WORKER_BEST_EFFORT_MAX_QUEUE_SIZE,
+    LOGGING_WORKER_BEST_EFFORT_QUEUE_FULL_POLICY,
+    LOGGING_WORKER_BEST_EFFORT_SAMPLE_RATE,
     LOGGING_WORKER_CONCURRENCY,
     LOGGING_WORKER_MAX_QUEUE_SIZE,
+    LOGGING_WORKER_QUEUE_FULL_POLICY,
+    LOGGING_WORKER_SAMPLE_RATE,
+    LOGGING_WORKER_SAMPLING_QUEUE_PERCENTAGE,
     LOGGING_WORKER_MAX_TIME_PER_COROUTINE,
     LOGGING_WORKER_CLEAR_PERCENTAGE,
     LOGGING_WORKER_AGGRESSIVE_CLEAR_COOLDOWN_SECONDS,
@@ -19,6 +28,19 @@ from litellm.constants import (
 )
 
 
+# Lane of a logging callback:
+# - critical: billing / spend tracking - runs first, never dropped (tasks running it are enqueued with droppable=False)
+# - default: runs on the default LoggingWorker (GLOBAL_LOGGING_WORKER)
+# - best_effort: third-party observability exports - run on GLOBAL_BEST_EFFORT_LOGGING_WORKER, when critical callbacks are registered
+LoggingLane = Literal["critical", "default", "best_effort"]
+
+# What a LoggingWorker does when its queue is full:
+# - clear: process queued tasks right away to make room (never drops)
+# - drop: drop the new task
+# - sample: once the queue is LOGGING_WORKER_SAMPLING_QUEUE_PERCENTAGE full, admit new tasks with probability `sample_rate`; drop when full
+LoggingQueueFullPolicy = Literal["clear", "drop", "sample"]
+
+
 class LoggingTask(TypedDict):
     """
     A logging task with its associated context to ensure logging is executed in
@@ -27,6 +49,7 @@ class LoggingTask(TypedDict):
 
     coroutine: Coroutine
     context: contextvars.Context
+    enqueued_at: float
 
 
 class LoggingWorker:
@@ -43,10 +66,16 @@ class LoggingWorker:
         timeout: float = LOGGING_WORKER_MAX_TIME_PER_COROUTINE,
         max_queue_size: int = LOGGING_WORKER_MAX_QUEUE_SIZE,
         concurrency: int = LOGGING_WORKER_CONCURRENCY,
+        lane: LoggingLane = "default",
+        queue_full_policy: LoggingQueueFullPolicy = "clear",
+        sample_rate: float = LOGGING_WORKER_SAMPLE_RATE,
     ):
         self.timeout = timeout
         self.max_queue_size = max_queue_size
         self.concurrency = concurrency
+        self.lane = lane
+        self.queue_full_policy = queue_full_policy
+        self.sample_rate = sample_rate
         self._queue: Optional[asyncio.Queue[LoggingTask]] = None
         self._worker_task: Optional[asyncio.Task] = None
         self._running_tasks: set[asyncio.Task] = set()
@@ -54,6 +83,16 @@ class LoggingWorker:
         self._last_aggressive_clear_time: float = 0.0
         self._aggressive_clear_in_progress: bool = False
 
+        # metrics - see get_metrics()
+        self._enqueued: int = 0
+        self._processed: int = 0
+        self._dropped: int = 0
+        self._timed_out: int = 0
+        self._total_queue_wait: float = 0.0
+        self._max_queue_wait: float = 0.0
+        self._total_run_time: float = 0.0
+        self._max_run_time: float = 0.0
+
         # Register cleanup handler to flush remaining events on exit
         atexit.register(self._flush_on_exit)
 
@@ -74,15 +113,22 @@ class LoggingWorker:
         """Runs the logging task and handles cleanup. Releases semaphore when done."""
         try:
             if self._queue is not None:
+                started_at = self._record_task_started(task)
                 try:
                     # Run the coroutine in its original context
                     await asyncio.wait_for(
                         task["context"].run(asyncio.create_task, task["coroutine"]),
                         timeout=self.timeout,
                     )
+                except asyncio.TimeoutError:
+                    self._timed_out += 1
+                    verbose_logger.exception(
+                        f"LoggingWorker error: task timed out after {self.timeout}s, lane={self.lane}"
+                    )
                 except Exception as e:
                     verbose_logger.exception(f"LoggingWorker error: {e}")
                 finally:
+                    self._record_task_done(started_at)
                     self._queue.task_done()
         finally:
             # Always release semaphore, even if queue is None
@@ -116,24 +162,107 @@ class LoggingWorker:
             # Attempt to clear remaining items to prevent "never awaited" warnings
             await self.clear_queue()
 
-    def enqueue(self, coroutine: Coroutine) -> None:
+    def enqueue(self, coroutine: Coroutine, droppable: bool = True) -> None:
         """
         Add a coroutine to the logging queue.
         Hot path: never blocks, aggressively clears queue if full.
+
+        `droppable=False` - the coroutine runs critical callbacks (spend tracking). It is never dropped by the
+        `drop` / `sample` policies - a full queue is handled with `clear` instead.
         """
         if self._queue is None:
             return
 
         # Capture the current context when enqueueing
-        task = LoggingTask(coroutine=coroutine, context=contextvars.copy_context())
-        
+        task = LoggingTask(
+            coroutine=coroutine,
+            context=contextvars.copy_context(),
+            enqueued_at=time.perf_counter(),
+        )
+        self._enqueued += 1
+
+        if (
+            droppable
+            and self.queue_full_policy == "sample"
+            and not self._should_admit_sampled_task()
+        ):
+            self._drop_task(task)
+            return
+
         try:
             self._queue.put_nowait(task)
         except asyncio.QueueFull:
             # Queue is full - handle it appropriately
+            if droppable and self.queue_full_policy != "clear":
+                self._drop_task(task)
+                return
             verbose_logger.exception("LoggingWorker queue is full")
             self._handle_queue_full(task)
 
+    def _should_admit_sampled_task(self) -> bool:
+        """
+        `sample` policy - admit every task until the queue is LOGGING_WORKER_SAMPLING_QUEUE_PERCENTAGE full, then
+        admit `sample_rate` of them.
+        """
+        if self._queue is None:
+            return False
+        sampling_queue_size = (
+            self.max_queue_size * LOGGING_WORKER_SAMPLING_QUEUE_PERCENTAGE
+        ) // 100
+        if self._queue.qsize() < sampling_queue_size:
+            return True
+        return random.random() < self.sample_rate
+
+    def _drop_task(self, task: LoggingTask) -> None:
+        """Drop a task - `drop` / `sample` policies. Closes the coroutine to avoid 'never awaited' warnings."""
+        self._dropped += 1
+        task["coroutine"].close()
+        verbose_logger.debug(
+            f"LoggingWorker dropped task, lane={self.lane}, policy={self.queue_full_policy}"
+        )
+
+    def _record_task_started(self, task: LoggingTask) -> float:
+        started_at = time.perf_counter()
+        queue_wait = started_at - task["enqueued_at"]
+        self._total_queue_wait += queue_wait
+        self._max_queue_wait = max(self._max_queue_wait, queue_wait)
+        return started_at
+
+    def _record_task_done(self, started_at: float) -> None:
+        run_time = time.perf_counter() - started_at
+        self._processed += 1
+        self._total_run_time += run_time
+        self._max_run_time = max(self._max_run_time, run_time)
+
+    def get_metrics(self) -> Dict:
+        """
+        Queue depth and latency metrics of this worker.
+
+        - queue_wait_ms: time between enqueue and start of the task
+        - run_time_ms: time to run the task
+        """
+        processed = self._processed
+        return {
+            "lane": self.lane,
+            "queue_full_policy": self.queue_full_policy,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_size": self.max_queue_size,
+            "running_tasks": len(self._running_tasks),
+            "concurrency": self.concurrency,
+            "enqueued": self._enqueued,
+            "processed": processed,
+            "dropped": self._dropped,
+            "timed_out": self._timed_out,
+            "queue_wait_ms": {
+                "avg": (self._total_queue_wait / processed * 1000) if processed else 0.0,
+                "max": self._max_queue_wait * 1000,
+            },
+            "run_time_ms": {
+                "avg": (self._total_run_time / processed * 1000) if processed else 0.0,
+                "max": self._max_run_time * 1000,
+            },
+        }
+
     def _should_start_aggressive_clear(self) -> bool:
         """
         Check if we should start a new aggressive clear operation.
@@ -274,24 +403,30 @@ class LoggingWorker:
             
             extracted_tasks = self._extract_tasks_from_queue()
             
-            # Add new task to extracted tasks to process directly
-            if new_task is not None:
-                extracted_tasks.append(new_task)
-            
-            # Process extracted tasks directly
-            if extracted_tasks:
-                await self._process_extracted_tasks(extracted_tasks)
+            # Process extracted tasks directly, with the new task - it was never put on the queue, so it is
+            # not marked done on the queue
+            await asyncio.gather(
+                self._process_extracted_tasks(extracted_tasks),
+                *(
+                    [self._process_single_task(new_task, from_queue=False)]
+                    if new_task is not None
+                    else []
+                ),
+            )
         except Exception as e:
             verbose_logger.exception(f"LoggingWorker error during aggressive clear: {e}")
         finally:
             # Always reset the flag even if an error occurs
             self._aggressive_clear_in_progress = False
 
-    async def _process_single_task(self, task: LoggingTask) -> None:
-        """Process a single task and mark it done."""
+    async def _process_single_task(
+        self, task: LoggingTask, from_queue: bool = True
+    ) -> None:
+        """Process a single task and mark it done, if it was taken from the queue."""
         if self._queue is None:
             return
         
+        started_at = self._record_task_started(task)
         try:
             await asyncio.wait_for(
                 task["context"].run(asyncio.create_task, task["coroutine"]),
@@ -301,7 +436,9 @@ class LoggingWorker:
             # Suppress errors during processing to ensure we keep going
             pass
         finally:
-            self._queue.task_done()
+            self._record_task_done(started_at)
+            if from_queue:
+                self._queue.task_done()
 
     async def _process_extracted_tasks(self, tasks: list[LoggingTask]) -> None:
         """
@@ -314,12 +451,14 @@ class LoggingWorker:
         # Process all tasks concurrently for maximum speed
         await asyncio.gather(*[self._process_single_task(task) for task in tasks])
 
-    def ensure_initialized_and_enqueue(self, async_coroutine: Coroutine):
+    def ensure_initialized_and_enqueue(
+        self, async_coroutine: Coroutine, droppable: bool = True
+    ):
         """
         Ensure the logging worker is initialized and enqueue the coroutine.
         """
         self.start()
-        self.enqueue(async_coroutine)
+        self.enqueue(async_coroutine, droppable=droppable)
 
     async def stop(self) -> None:
         """Stop the logging worker and clean up resources."""
@@ -463,5 +602,25 @@ class LoggingWorker:
             loop.close()
 
 
-# Global instance for backward compatibility
-GLOBAL_LOGGING_WORKER = LoggingWorker()
+# Global instance for backward compatibility - the default lane
+GLOBAL_LOGGING_WORKER = LoggingWorker(
+    queue_full_policy=LOGGING_WORKER_QUEUE_FULL_POLICY,  # type: ignore[arg-type]
+)
+
+# Best-effort lane - third-party observability exports, with a separate queue / concurrency budget,
+# so a slow logger can't delay spend tracking on the default lane
+GLOBAL_BEST_EFFORT_LOGGING_WORKER = LoggingWorker(
+    max_queue_size=LOGGING_WORKER_BEST_EFFORT_MAX_QUEUE_SIZE,
+    concurrency=LOGGING_WORKER_BEST_EFFORT_CONCURRENCY,
+    lane="best_effort",
+    queue_full_policy=LOGGING_WORKER_BEST_EFFORT_QUEUE_FULL_POLICY,  # type: ignore[arg-type]
+    sample_rate=LOGGING_WORKER_BEST_EFFORT_SAMPLE_RATE,
+)
+
+
+def get_logging_lane_metrics() -> Dict[str, Dict]:
+    """Queue depth and latency metrics, per logging lane."""
+    return {
+        worker.lane: worker.get_metrics()
+        for worker in (GLOBAL_LOGGING_WORKER, GLOBAL_BEST_EFFORT_LOGGING_WORKER)
+    }
@@ -0,0 +1,360 @@
+"""
+Out-of-process logging worker pool.
+
+When `litellm.logging_worker_processes` (or `LOGGING_WORKER_PROCESSES`) is > 0, logging integrations that only need the
+`StandardLoggingPayload` (Datadog, S3, GCS, Azure Blob Storage, SQS, ...) are not run on the request-serving event loop.
+Instead, `Logging.async_success_handler` / `Logging.async_failure_handler` put one compact event per request on a
+bounded local queue:
+
+    (event_type, callback_names, start_time, end_time, <orjson encoded StandardLoggingPayload>,
+     standard_callback_dynamic_params)
+
+and a pool of logging worker processes decodes the payload and runs the callbacks - including batching and HTTP
+shipping. Callbacks that log the same payload share one event, so the request process encodes the payload once, no
+matter how many callbacks are enabled.
+
+Callbacks that need the in-process request state (custom callback classes, proxy hooks, guardrails, OTEL spans, ...) keep
+running in-process. So do integration instances built with constructor args (e.g. `GCSBucketLogger(bucket_name=...)`,
+or a `GenericAPILogger` from `callback_settings`) - the worker processes rebuild each integration from its name, with
+env vars / the litellm settings below only. If the queue is full, events are logged in-process instead of being dropped.
+
+The request's `standard_callback_dynamic_params` (per key / team logging settings - e.g. `gcs_bucket_name`) are sent
+with the event, so the worker processes log to the same destination as the request process would.
+"""
+
+import asyncio
+import atexit
+import multiprocessing
+from datetime import datetime
+from queue import Full
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple, Type
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    LOGGING_WORKER_CONCURRENCY,
+    LOGGING_WORKER_MAX_TIME_PER_COROUTINE,
+    LOGGING_WORKER_PROCESS_MAX_QUEUE_SIZE,
+    MAX_TIME_TO_CLEAR_QUEUE,
+)
+
+if TYPE_CHECKING:
+    from litellm.integrations.custom_logger import CustomLogger
+
+LoggingWorkerProcessEventType = Literal["success", "failure"]
+
+# (event_type, callback_names, start_time, end_time, payload json bytes, standard_callback_dynamic_params)
+LoggingWorkerProcessEvent = Tuple[
+    LoggingWorkerProcessEventType,
+    Tuple[str, ...],
+    datetime,
+    datetime,
+    bytes,
+    Optional[Dict[str, Any]],
+]
+
+# integrations that only read the standard logging payload, and are configured with env vars / the settings below
+LOGGING_WORKER_PROCESS_CALLBACKS: Tuple[str, ...] = (
+    "datadog",
+    "s3_v2",
+    "aws_sqs",
+    "gcs_bucket",
+    "gcs_pubsub",
+    "azure_storage",
+    "generic_api",
+)
+
+# litellm settings copied to the worker processes
+LOGGING_WORKER_PROCESS_LITELLM_SETTINGS: Tuple[str, ...] = (
+    "datadog_params",
+    "s3_callback_params",
+    "aws_sqs_callback_params",
+    "set_verbose",
+)
+
+
+class LoggingWorkerProcessPool:
+    """
+    Ships encoded logging events to a pool of logging worker processes.
+
+    Processes are started on the first event. Events are put on a bounded `multiprocessing` queue - `enqueue` never
+    blocks, the pickling / pipe writes happen on the queue's feeder thread.
+    """
+
+    def __init__(self, max_queue_size: int = LOGGING_WORKER_PROCESS_MAX_QUEUE_SIZE):
+        self.max_queue_size = max_queue_size
+        self._queue: Optional[Any] = None
+        self._processes: List[Any] = []
+        self._callback_class_to_name: Optional[Dict[Type, str]] = None
+        self.dropped_events: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        return (litellm.logging_worker_processes or 0) > 0
+
+    def get_callback_name(self, callback: Any) -> Optional[str]:
+        """
+        Name of the integration, if `callback` can run in a logging worker process. Else None.
+
+        Only exact class matches - subclasses can override what is logged. Integrations using their legacy (v1)
+        payload read the in-process request kwargs, so they run in-process.
+        """
+        if self._uses_legacy_payload(callback) or not self._uses_default_config(
+            callback
+        ):
+            return None
+        if self._callback_class_to_name is None:
+            from litellm.integrations.custom_logger import CustomLogger
+            from litellm.litellm_core_utils.custom_logger_registry import (
+                CustomLoggerRegistry,
+            )
+
+            self._callback_class_to_name = {}
+            for name in LOGGING_WORKER_PROCESS_CALLBACKS:
+                callback_class = (
+                    CustomLoggerRegistry.CALLBACK_CLASS_STR_TO_CLASS_TYPE.get(name)
+                )
+                if callback_class is not None and callback_class is not CustomLogger:
+                    self._callback_class_to_name[callback_class] = name
+        return self._callback_class_to_name.get(type(callback))
+
+    def _uses_default_config(self, callback: Any) -> bool:
+        """
+        True if `callback` was created by `_init_custom_logger_compatible_class` - the same way the worker processes
+        create it. Instances built with their own constructor args would lose that config in the worker processes.
+        """
+        from litellm.litellm_core_utils.litellm_logging import _in_memory_loggers
+
+        return any(logger is callback for logger in _in_memory_loggers)
+
+    def _uses_legacy_payload(self, callback: Any) -> bool:
+        if (
+            litellm.datadog_use_v1 is not True
+            and litellm.generic_api_use_v1 is not True
+        ):
+            return False
+        from litellm.integrations.datadog.datadog import DataDogLogger
+        from litellm.integrations.generic_api.generic_api_callback import (
+            GenericAPILogger,
+        )
+
+        return (litellm.datadog_use_v1 is True and type(callback) is DataDogLogger) or (
+            litellm.generic_api_use_v1 is True and type(callback) is GenericAPILogger
+        )
+
+    def start(self) -> None:
+        """Start the logging worker processes. Idempotent - safe to call multiple times."""
+        if self._queue is not None:
+            return
+        # spawn - forking a process with a running event loop / threads is not safe
+        ctx = multiprocessing.get_context("spawn")
+        self._queue = ctx.Queue(maxsize=self.max_queue_size)
+        litellm_settings = {
+            setting: getattr(litellm, setting, None)
+            for setting in LOGGING_WORKER_PROCESS_LITELLM_SETTINGS
+        }
+        for _ in range(litellm.logging_worker_processes):
+            process = ctx.Process(
+                target=run_logging_worker_process,
+                args=(self._queue, litellm_settings),
+                name="litellm-logging-worker",
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+        atexit.register(self.stop)
+        verbose_logger.debug(
+            "Started %s logging worker processes", len(self._processes)
+        )
+
+    def enqueue(
+        self,
+        event_type: LoggingWorkerProcessEventType,
+        callback_names: Tuple[str, ...],
+        start_time: datetime,
+        end_time: datetime,
+        payload_json_bytes: bytes,
+        standard_callback_dynamic_params: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """
+        Queue a logging event. Returns False if the queue is full - the caller should log the event in-process.
+        """
+        self.start()
+        if self._queue is None:
+            return False
+        event: LoggingWorkerProcessEvent = (
+            event_type,
+            callback_names,
+            start_time,
+            end_time,
+            payload_json_bytes,
+            standard_callback_dynamic_params,
+        )
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except Full:
+            self.dropped_events += 1
+            verbose_logger.warning(
+                "Logging worker process queue is full, logging in-process instead"
+            )
+            return False
+
+    def stop(self, timeout: float = MAX_TIME_TO_CLEAR_QUEUE) -> None:
+        """
+        Stop the logging worker processes, after they have logged the queued events. Called automatically via atexit.
+        """
+        if self._queue is None:
+            return
+        for _ in self._processes:
+            try:
+                self._queue.put(None, timeout=timeout)
+            except Full:
+                break
+        for process in self._processes:
+            process.join(timeout=timeout)
+            if process.is_alive():
+                process.terminate()
+        self._queue.close()
+        self._queue = None
+        self._processes = []
+
+
+##### Logging worker process #####
+
+
+def _get_worker_process_logger(
+    name: str, loggers: Dict[str, "CustomLogger"]
+) -> Optional["CustomLogger"]:
+    from litellm.litellm_core_utils.litellm_logging import (
+        _init_custom_logger_compatible_class,
+    )
+
+    if name not in loggers:
+        logger = _init_custom_logger_compatible_class(
+            logging_integration=name,  # type: ignore
+            internal_usage_cache=None,
+            llm_router=None,
+        )
+        if logger is None:
+            return None
+        loggers[name] = logger
+    return loggers[name]
+
+
+async def process_logging_event(
+    event: LoggingWorkerProcessEvent, loggers: Dict[str, "CustomLogger"]
+) -> None:
+    """
+    Run the callbacks of a logging event, with the kwargs the integrations read from `Logging.model_call_details`.
+    """
+    from litellm.litellm_core_utils.fast_json import json_loads
+    from litellm.litellm_core_utils.serialized_logging_payload import (
+        SerializedStandardLoggingPayload,
+    )
+
+    (
+        event_type,
+        callback_names,
+        start_time,
+        end_time,
+        payload_json_bytes,
+        standard_callback_dynamic_params,
+    ) = event
+    payload = SerializedStandardLoggingPayload(json_loads(payload_json_bytes))
+    kwargs: Dict[str, Any] = {
+        "standard_logging_object": payload,
+        "model": payload.get("model"),
+        "call_type": payload.get("call_type"),
+        "response_cost": payload.get("response_cost"),
+        "litellm_call_id": payload.get("id"),
+        "litellm_params": {},
+    }
+    if standard_callback_dynamic_params is not None:
+        kwargs["standard_callback_dynamic_params"] = standard_callback_dynamic_params
+    if event_type == "failure":
+        kwargs["exception"] = payload.get("error_str")
+    response_obj = payload.get("response") or {}
+
+    for name in callback_names:
+        try:
+            logger = _get_worker_process_logger(name, loggers)
+            if logger is None:
+                continue
+            if event_type == "success":
+                await logger.async_log_success_event(
+                    kwargs=dict(kwargs),
+                    response_obj=response_obj,
+                    start_time=start_time,
+                    end_time=end_time,
+                )
+            else:
+                await logger.async_log_failure_event(
+                    kwargs=dict(kwargs),
+                    response_obj=None,
+                    start_time=start_time,
+                    end_time=end_time,
+                )
+        except Exception as e:
+            verbose_logger.exception(
+                f"Logging worker process error for callback={name}: {e}"
+            )
+
+
+async def _logging_worker_process_loop(
+    queue: Any, litellm_settings: Dict[str, Any]
+) -> None:
+    from litellm.integrations.custom_batch_logger import CustomBatchLogger
+
+    for setting, value in litellm_settings.items():
+        setattr(litellm, setting, value)
+
+    loop = asyncio.get_running_loop()
+    loggers: Dict[str, "CustomLogger"] = {}
+    sem = asyncio.Semaphore(LOGGING_WORKER_CONCURRENCY)
+    running_tasks: set = set()
+
+    async def _process(event: LoggingWorkerProcessEvent) -> None:
+        try:
+            await asyncio.wait_for(
+                process_logging_event(event, loggers),
+                timeout=LOGGING_WORKER_MAX_TIME_PER_COROUTINE,
+            )
+        except Exception as e:
+            verbose_logger.exception(f"Logging worker process error: {e}")
+        finally:
+            sem.release()
+
+    while True:
+        event = await loop.run_in_executor(None, queue.get)
+        if event is None:
+            break
+        await sem.acquire()
+        task = asyncio.create_task(_process(event))
+        running_tasks.add(task)
+        task.add_done_callback(running_tasks.discard)
+
+    # log the queued events, then flush the batch loggers
+    await asyncio.gather(*running_tasks, return_exceptions=True)
+    for logger in loggers.values():
+        if isinstance(logger, CustomBatchLogger):
+            try:
+                await asyncio.wait_for(
+                    logger.flush_queue(), timeout=MAX_TIME_TO_CLEAR_QUEUE
+                )
+            except Exception as e:
+                verbose_logger.exception(
+                    f"Logging worker process error flushing {logger}: {e}"
+                )
+
+
+def run_logging_worker_process(queue: Any, litellm_settings: Dict[str, Any]) -> None:
+    """Entrypoint of a logging worker process."""
+    try:
+        asyncio.run(_logging_worker_process_loop(queue, litellm_settings))
+    except KeyboardInterrupt:
+        pass
+
+
+# Global instance, used by `Logging` when `litellm.logging_worker_processes` > 0
+GLOBAL_LOGGING_WORKER_PROCESS_POOL = LoggingWorkerProcessPool()
@@ -0,0 +1,234 @@
+"""
+`StandardLoggingPayload` encoding, shared by all logging callbacks.
+
+`get_standard_logging_object_payload` returns a `SerializedStandardLoggingPayload` - a dict (so it is still a
+`StandardLoggingPayload` for every integration), that encodes itself with orjson (instead of `safe_dumps`), and shares:
+- the redacted variant (messages / response replaced, for loggers with `turn_off_message_logging`) - redacted once,
+  for all loggers
+
+The encoded bytes are not cached - callbacks can modify nested values (e.g. `metadata`) in place, and a cached
+encoding would not see that. Batch loggers can keep the encoded bytes in their queue, and join them with
+`json_array_bytes` / `ndjson_bytes`.
+
+The redacted variant is dropped when a top-level key is set / removed (e.g. `truncate_standard_logging_payload_content`).
+It is a shallow copy, so it sees in-place changes to the other nested values.
+"""
+
+import json
+from typing import Any, FrozenSet, Iterable, Optional, cast
+
+from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
+from litellm.types.utils import StandardLoggingPayload
+
+try:
+    import orjson
+
+    _ORJSON_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+except ImportError:
+    orjson = None  # type: ignore
+
+REDACTED_CONTENT = "redacted-by-litellm"
+
+# projection of the payload without the request / response content
+CONTENT_FIELDS: FrozenSet[str] = frozenset({"messages", "response"})
+
+def _json_default(obj: Any) -> Any:
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    return str(obj)
+
+
+def dumps_standard_logging_payload(payload: Any) -> bytes:
+    """
+    JSON-encode a (projected) payload. Falls back to `safe_dumps` for circular / unusually deep values.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                payload, default=_json_default, option=_ORJSON_DUMPS_OPTIONS
+            )
+        except (TypeError, orjson.JSONEncodeError):
+            pass
+    else:
+        try:
+            return json.dumps(payload, default=_json_default).encode("utf-8")
+        except (TypeError, ValueError):
+            pass
+    return safe_dumps(payload).encode("utf-8")
+
+
+def redact_standard_logging_payload(
+    payload: StandardLoggingPayload,
+) -> StandardLoggingPayload:
+    """
+    Copy of `payload`, with the request messages and the response content redacted.
+    """
+    from copy import deepcopy
+
+    from litellm import Choices, Message, ModelResponse
+
+    redacted = cast(StandardLoggingPayload, dict(payload))
+    if redacted.get("messages") is not None:
+        redacted["messages"] = [Message(content=REDACTED_CONTENT).model_dump()]
+
+    response = redacted.get("response")
+    if response is not None:
+        # ResponsesAPIResponse - redact the text of the output items
+        if isinstance(response, dict) and "output" in response:
+            response_copy = deepcopy(response)
+            if isinstance(response_copy.get("output"), list):
+                for output_item in response_copy["output"]:
+                    if isinstance(output_item, dict) and isinstance(
+                        output_item.get("content"), list
+                    ):
+                        for content_item in output_item["content"]:
+                            if (
+                                isinstance(content_item, dict)
+                                and "text" in content_item
+                            ):
+                                content_item["text"] = REDACTED_CONTENT
+            redacted["response"] = response_copy
+        else:
+            redacted["response"] = ModelResponse(
+                choices=[Choices(message=Message(content=REDACTED_CONTENT))]
+            ).model_dump()
+    return redacted
+
+
+class SerializedStandardLoggingPayload(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._redacted_payload: Optional["SerializedStandardLoggingPayload"] = None
+
+    def _clear_redacted_payload(self) -> None:
+        self._redacted_payload = None
+
+    def get_json_bytes(
+        self,
+        exclude: Optional[FrozenSet[str]] = None,
+        redacted: bool = False,
+    ) -> bytes:
+        """
+        JSON bytes of the payload.
+
+        Args:
+            exclude: top-level keys to leave out, e.g. `CONTENT_FIELDS`
+            redacted: encode the redacted variant - see `get_redacted_payload`
+        """
+        if redacted:
+            return self._get_cached_redacted_payload().get_json_bytes(exclude=exclude)
+        if exclude:
+            return dumps_standard_logging_payload(
+                {k: v for k, v in self.items() if k not in exclude}
+            )
+        return dumps_standard_logging_payload(self)
+
+    def get_json_str(
+        self,
+        exclude: Optional[FrozenSet[str]] = None,
+        redacted: bool = False,
+    ) -> str:
+        return self.get_json_bytes(exclude=exclude, redacted=redacted).decode("utf-8")
+
+    def get_redacted_payload(self) -> "SerializedStandardLoggingPayload":
+        """
+        Redacted copy of the payload. The redaction is done once and shared by all loggers with message logging turned
+        off - each call returns a shallow copy of it, safe to modify at the top level.
+        """
+        return self._get_cached_redacted_payload().copy()
+
+    def _get_cached_redacted_payload(self) -> "SerializedStandardLoggingPayload":
+        if self._redacted_payload is None:
+            self._redacted_payload = SerializedStandardLoggingPayload(
+                redact_standard_logging_payload(cast(StandardLoggingPayload, self))
+            )
+        return self._redacted_payload
+
+    # top-level writes invalidate the redacted variant
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self._clear_redacted_payload()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._clear_redacted_payload()
+
+    def update(self, *args, **kwargs) -> None:  # type: ignore[override]
+        super().update(*args, **kwargs)
+        self._clear_redacted_payload()
+
+    def pop(self, *args):  # type: ignore[override]
+        self._clear_redacted_payload()
+        return super().pop(*args)
+
+    def popitem(self):  # type: ignore[override]
+        self._clear_redacted_payload()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):  # type: ignore[override]
+        self._clear_redacted_payload()
+        return super().setdefault(key, default)
+
+    def clear(self) -> None:
+        super().clear()
+        self._clear_redacted_payload()
+
+    # copies do not share the redacted variant - callers copy the payload to modify it
+    def copy(self) -> "SerializedStandardLoggingPayload":  # type: ignore[override]
+        return SerializedStandardLoggingPayload(self)
+
+    def __copy__(self) -> "SerializedStandardLoggingPayload":
+        return SerializedStandardLoggingPayload(self)
+
+    def __deepcopy__(self, memo: dict) -> "SerializedStandardLoggingPayload":
+        from copy import deepcopy
+
+        payload_copy = SerializedStandardLoggingPayload()
+        memo[id(self)] = payload_copy
+        for k, v in self.items():
+            dict.__setitem__(payload_copy, deepcopy(k, memo), deepcopy(v, memo))
+        return payload_copy
+
+    def __reduce__(self):
+        return (SerializedStandardLoggingPayload, (dict(self),))
+
+
+def get_standard_logging_payload_json_bytes(
+    payload: Any,
+    exclude: Optional[FrozenSet[str]] = None,
+    redacted: bool = False,
+) -> bytes:
+    """
+    JSON bytes of a standard logging payload - the redaction is shared if it is a `SerializedStandardLoggingPayload`.
+    """
+    if isinstance(payload, SerializedStandardLoggingPayload):
+        return payload.get_json_bytes(exclude=exclude, redacted=redacted)
+    if redacted:
+        payload = redact_standard_logging_payload(payload)
+    if exclude:
+        payload = {k: v for k, v in payload.items() if k not in exclude}
+    return dumps_standard_logging_payload(payload)
+
+
+def get_standard_logging_payload_json(
+    payload: Any,
+    exclude: Optional[FrozenSet[str]] = None,
+    redacted: bool = False,
+) -> str:
+    return get_standard_logging_payload_json_bytes(
+        payload, exclude=exclude, redacted=redacted
+    ).decode("utf-8")
+
+
+def json_array_bytes(encoded_items: Iterable[bytes]) -> bytes:
+    """
+    JSON array of already-encoded items
+    """
+    return b"[" + b",".join(encoded_items) + b"]"
+
+
+def ndjson_bytes(encoded_items: Iterable[bytes]) -> bytes:
+    """
+    Newline-delimited JSON of already-encoded items
+    """
+    return b"".join(item + b"\n" for item in encoded_items)
@@ -0,0 +1,113 @@
+"""
+Byte-level Server-Sent Events (SSE) decoder shared by provider streaming iterators.
+
+Works on the raw `response.aiter_bytes()` / `response.iter_bytes()` stream instead of `aiter_lines()`:
+
+- each network chunk is scanned once for line breaks, a line is only copied if it is split across chunks
+- `data:` payloads are parsed straight from the chunk bytes with `fast_json.json_loads` (orjson, if installed)
+
+Yields:
+- a `dict` for every `data:` line whose payload is a JSON object
+- the original line as a `str` for any other line with content (e.g. `data: [DONE]`, partial JSON, non-SSE JSON lines), so iterators keep their existing string handling for these
+
+Blank lines, comments (`:`) and `event:` / `id:` / `retry:` fields are dropped - providers repeat the event type in the JSON payload.
+"""
+
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Union
+
+from litellm.litellm_core_utils.fast_json import json_loads
+
+SSEChunk = Union[dict, str]
+
+_SKIPPED_FIELD_PREFIXES = (b"event:", b"id:", b"retry:")
+
+
+class SSEDecoder:
+    """
+    Incremental SSE line decoder. Feed raw bytes with `decode()`, call `flush()` once the stream ends.
+    """
+
+    def __init__(self):
+        # bytes of a line that is split across network chunks
+        self._pending = bytearray()
+
+    def decode(self, chunk: bytes) -> List[SSEChunk]:
+        decoded: List[SSEChunk] = []
+        newline_index = chunk.find(b"\n")
+        if newline_index == -1:
+            self._pending += chunk
+            return decoded
+
+        view = memoryview(chunk)
+        if self._pending:
+            self._pending += view[:newline_index]
+            with memoryview(self._pending) as pending_line:
+                self._decode_line(pending_line, decoded)
+            self._pending.clear()
+        else:
+            self._decode_line(view[:newline_index], decoded)
+
+        start = newline_index + 1
+        while True:
+            newline_index = chunk.find(b"\n", start)
+            if newline_index == -1:
+                break
+            self._decode_line(view[start:newline_index], decoded)
+            start = newline_index + 1
+
+        if start < len(chunk):
+            self._pending += view[start:]
+        return decoded
+
+    def flush(self) -> List[SSEChunk]:
+        decoded: List[SSEChunk] = []
+        if self._pending:
+            with memoryview(self._pending) as pending_line:
+                self._decode_line(pending_line, decoded)
+            self._pending.clear()
+        return decoded
+
+    @staticmethod
+    def _decode_line(line: memoryview, decoded: List[SSEChunk]) -> None:
+        if len(line) > 0 and line[-1] == 0x0D:  # \r\n line endings
+            line = line[:-1]
+        if len(line) == 0 or line[0] == 0x3A:  # blank line / ":" comment
+            return
+
+        if line[:5] == b"data:":
+            payload = line[6:] if line[5:6] == b" " else line[5:]
+            try:
+                parsed = json_loads(payload)
+            except ValueError:
+                parsed = None
+            if isinstance(parsed, dict):
+                decoded.append(parsed)
+                return
+        elif any(line[: len(prefix)] == prefix for prefix in _SKIPPED_FIELD_PREFIXES):
+            return
+
+        decoded.append(str(line, "utf-8", errors="replace"))
+
+
+def iter_sse_chunks(byte_iterator: Iterable[bytes]) -> Iterator[SSEChunk]:
+    """
+    Usage: `iter_sse_chunks(response.iter_bytes())`
+    """
+    decoder = SSEDecoder()
+    for chunk in byte_iterator:
+        yield from decoder.decode(chunk)
+    yield from decoder.flush()
+
+
+async def aiter_sse_chunks(
+    byte_iterator: AsyncIterable[bytes],
+) -> AsyncIterator[SSEChunk]:
+    """
+    Usage: `aiter_sse_chunks(response.aiter_bytes())`
+    """
+    decoder = SSEDecoder()
+    async for chunk in byte_iterator:
+        for sse_chunk in decoder.decode(chunk):
+            yield sse_chunk
+    for sse_chunk in decoder.flush():
+        yield sse_chunk
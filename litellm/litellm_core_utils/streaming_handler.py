@@ -57,10 +57,14 @@ def is_async_iterable(obj: Any) -> bool:
     return isinstance(obj, collections.abc.AsyncIterable)
 
 
-def print_verbose(print_statement):
+def print_verbose(print_statement, *args):
+    """
+    Print if `litellm.set_verbose`. Pass values as `args` (%-style) on the per-chunk path, so chunks are only formatted
+    when printed.
+    """
     try:
         if litellm.set_verbose:
-            print(print_statement)  # noqa
+            print(print_statement % args if args else print_statement)  # noqa
     except Exception:
         pass
 
@@ -145,6 +149,9 @@ class CustomStreamWrapper:
         self.chunks: List = (
             []
         )  # keep track of the returned chunks - used for calculating the input/output tokens for stream options
+        # content of the last chunk in `self.chunks`, and how many chunks in a row had it - used by `safety_checker`
+        self._repeated_chunk_content: Optional[Any] = None
+        self._repeated_chunk_count = 0
         self.is_function_call = self.check_is_function_call(logging_obj=logging_obj)
         self.created: Optional[int] = None
 
@@ -154,6 +161,23 @@ class CustomStreamWrapper:
     def __aiter__(self):
         return self
 
+    async def aclose(self):
+        """
+        Close the stream before it is fully consumed.
+        """
+        self._release_in_flight_cache_request()
+        if hasattr(self.completion_stream, "aclose"):
+            await self.completion_stream.aclose()
+
+    def _release_in_flight_cache_request(self) -> None:
+        """
+        If this stream is the leader for coalesced identical requests (`Cache(coalesce_requests=True)`), and it failed or was
+        closed before its response was cached, release the waiting requests - they call the provider themselves.
+        """
+        caching_handler = getattr(self.logging_obj, "_llm_caching_handler", None)
+        if caching_handler is not None:
+            caching_handler._release_in_flight_request()
+
     def check_send_stream_usage(self, stream_options: Optional[dict]):
         return (
             stream_options is not None
@@ -198,28 +222,35 @@ class CustomStreamWrapper:
 
         Raises - InternalServerError, if LLM enters infinite loop while streaming
         """
-        if len(self.chunks) >= litellm.REPEATED_STREAMING_CHUNK_LIMIT:
-            # Get the last n chunks
-            last_chunks = self.chunks[-litellm.REPEATED_STREAMING_CHUNK_LIMIT :]
-
-            # Extract the relevant content from the chunks
-            last_contents = [chunk.choices[0].delta.content for chunk in last_chunks]
+        # the last n chunks are identical
+        if self._repeated_chunk_count >= litellm.REPEATED_STREAMING_CHUNK_LIMIT:
+            repeated_content = self._repeated_chunk_content
+            if (
+                repeated_content is not None
+                and isinstance(repeated_content, str)
+                and len(repeated_content) > 2
+            ):  # ignore empty content - https://github.com/BerriAI/litellm/issues/5158#issuecomment-2287156946
+                raise litellm.InternalServerError(
+                    message="The model is repeating the same chunk = {}.".format(
+                        repeated_content
+                    ),
+                    model="",
+                    llm_provider="",
+                )
 
-            # Check if all extracted contents are identical
-            if all(content == last_contents[0] for content in last_contents):
-                if (
-                    last_contents[0] is not None
-                    and isinstance(last_contents[0], str)
-                    and len(last_contents[0]) > 2
-                ):  # ignore empty content - https://github.com/BerriAI/litellm/issues/5158#issuecomment-2287156946
-                    # All last n chunks are identical
-                    raise litellm.InternalServerError(
-                        message="The model is repeating the same chunk = {}.".format(
-                            last_contents[0]
-                        ),
-                        model="",
-                        llm_provider="",
-                    )
+    def _append_chunk(self, chunk: Any) -> None:
+        """
+        Add a returned chunk to `self.chunks`, and count repeated chunk content for `safety_checker`.
+        """
+        self.chunks.append(chunk)
+        choices = getattr(chunk, "choices", None)
+        delta = getattr(choices[0], "delta", None) if choices else None
+        content = getattr(delta, "content", None)
+        if self._repeated_chunk_count > 0 and content == self._repeated_chunk_content:
+            self._repeated_chunk_count += 1
+        else:
+            self._repeated_chunk_content = content
+            self._repeated_chunk_count = 1
 
     def check_special_tokens(self, chunk: str, finish_reason: Optional[str]):
         """
@@ -434,7 +465,7 @@ class CustomStreamWrapper:
 
     def handle_openai_chat_completion_chunk(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             str_line = chunk
             text = ""
             is_finished = False
@@ -484,7 +515,7 @@ class CustomStreamWrapper:
 
     def handle_azure_text_completion_chunk(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             text = ""
             is_finished = False
             finish_reason = None
@@ -505,7 +536,7 @@ class CustomStreamWrapper:
 
     def handle_openai_text_completion_chunk(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             text = ""
             is_finished = False
             finish_reason = None
@@ -870,7 +901,10 @@ class CustomStreamWrapper:
         )
 
         print_verbose(
-            f"completion_obj: {completion_obj}, model_response.choices[0]: {model_response.choices[0]}, response_obj: {response_obj}"
+            "completion_obj: %s, model_response.choices[0]: %s, response_obj: %s",
+            completion_obj,
+            model_response.choices[0],
+            response_obj,
         )
         is_chunk_non_empty = self.is_chunk_non_empty(
             completion_obj, model_response, response_obj
@@ -898,11 +932,11 @@ class CustomStreamWrapper:
                                     choice_json.pop(
                                         "finish_reason", None
                                     )  # for mistral etc. which return a value in their last chunk (not-openai compatible).
-                                    print_verbose(f"choice_json: {choice_json}")
+                                    print_verbose("choice_json: %s", choice_json)
                                     choices.append(StreamingChoices(**choice_json))
                             except Exception:
                                 choices.append(StreamingChoices())
-                        print_verbose(f"choices in streaming: {choices}")
+                        print_verbose("choices in streaming: %s", choices)
                         setattr(model_response, "choices", choices)
                     else:
                         return
@@ -921,7 +955,8 @@ class CustomStreamWrapper:
 
                     model_response = self.strip_role_from_delta(model_response)
                     verbose_logger.debug(
-                        f"model_response.choices[0].delta inside is_chunk_non_empty: {model_response.choices[0].delta}"
+                        "model_response.choices[0].delta inside is_chunk_non_empty: %s",
+                        model_response.choices[0].delta,
                     )
                 else:
                     ## else
@@ -953,7 +988,7 @@ class CustomStreamWrapper:
 
                 # Default - return StopIteration
                 if hasattr(model_response, "usage"):
-                    self.chunks.append(model_response)
+                    self._append_chunk(model_response)
                 raise StopIteration
             # flush any remaining holding chunk
             if len(self.holding_chunk) > 0:
@@ -983,7 +1018,7 @@ class CustomStreamWrapper:
             return self._handle_special_delta_content(model_response)
         else:
             if hasattr(model_response, "usage"):
-                self.chunks.append(model_response)
+                self._append_chunk(model_response)
             return
 
     def _optional_combine_thinking_block_in_choices(
@@ -1370,7 +1405,9 @@ class CustomStreamWrapper:
 
             model_response.model = self.model
             print_verbose(
-                f"model_response finish reason 3: {self.received_finish_reason}; response_obj={response_obj}"
+                "model_response finish reason 3: %s; response_obj=%s",
+                self.received_finish_reason,
+                response_obj,
             )
             ## FUNCTION CALL PARSING
             original_chunk = (
@@ -1431,7 +1468,7 @@ class CustomStreamWrapper:
                                             ):
                                                 t.function.arguments = ""
                             _json_delta = delta.model_dump()
-                            print_verbose(f"_json_delta: {_json_delta}")
+                            print_verbose("_json_delta: %s", _json_delta)
                             if "role" not in _json_delta or _json_delta["role"] is None:
                                 _json_delta[
                                     "role"
@@ -1465,10 +1502,10 @@ class CustomStreamWrapper:
                                 if original_chunk.choices[0].delta is None
                                 else dict(original_chunk.choices[0].delta)
                             )
-                            print_verbose(f"original delta: {delta}")
+                            print_verbose("original delta: %s", delta)
                             model_response.choices[0].delta = Delta(**delta)
                             print_verbose(
-                                f"new delta: {model_response.choices[0].delta}"
+                                "new delta: %s", model_response.choices[0].delta
                             )
                         except Exception:
                             model_response.choices[0].delta = Delta()
@@ -1480,9 +1517,11 @@ class CustomStreamWrapper:
                         return model_response
                     return
             print_verbose(
-                f"model_response.choices[0].delta: {model_response.choices[0].delta}; completion_obj: {completion_obj}"
+                "model_response.choices[0].delta: %s; completion_obj: %s",
+                model_response.choices[0].delta,
+                completion_obj,
             )
-            print_verbose(f"self.sent_first_chunk: {self.sent_first_chunk}")
+            print_verbose("self.sent_first_chunk: %s", self.sent_first_chunk)
 
             ## CHECK FOR TOOL USE
 
@@ -1656,12 +1695,14 @@ class CustomStreamWrapper:
                     chunk = next(self.completion_stream)
                 if chunk is not None and chunk != b"":
                     print_verbose(
-                        f"PROCESSED CHUNK PRE CHUNK CREATOR: {chunk}; custom_llm_provider: {self.custom_llm_provider}"
+                        "PROCESSED CHUNK PRE CHUNK CREATOR: %s; custom_llm_provider: %s",
+                        chunk,
+                        self.custom_llm_provider,
                     )
                     response: Optional[ModelResponseStream] = self.chunk_creator(
                         chunk=chunk
                     )
-                    print_verbose(f"PROCESSED CHUNK POST CHUNK CREATOR: {response}")
+                    print_verbose("PROCESSED CHUNK POST CHUNK CREATOR: %s", response)
 
                     if response is None:
                         continue
@@ -1685,7 +1726,7 @@ class CustomStreamWrapper:
                         input=self.response_uptil_now, model=self.model
                     )
                     # HANDLE STREAM OPTIONS
-                    self.chunks.append(response)
+                    self._append_chunk(response)
                     if hasattr(
                         response, "usage"
                     ):  # remove usage from chunk, only send on final chunk
@@ -1825,14 +1866,14 @@ class CustomStreamWrapper:
                     # chunk_creator() does logging/stream chunk building. We need to let it know its being called in_async_func, so we don't double add chunks.
                     # __anext__ also calls async_success_handler, which does logging
                     verbose_logger.debug(
-                        f"PROCESSED ASYNC CHUNK PRE CHUNK CREATOR: {chunk}"
+                        "PROCESSED ASYNC CHUNK PRE CHUNK CREATOR: %s", chunk
                     )
 
                     processed_chunk: Optional[ModelResponseStream] = self.chunk_creator(
                         chunk=chunk
                     )
                     verbose_logger.debug(
-                        f"PROCESSED ASYNC CHUNK POST CHUNK CREATOR: {processed_chunk}"
+                        "PROCESSED ASYNC CHUNK POST CHUNK CREATOR: %s", processed_chunk
                     )
                     if processed_chunk is None:
                         continue
@@ -1850,7 +1891,7 @@ class CustomStreamWrapper:
                     self.rules.post_call_rules(
                         input=self.response_uptil_now, model=self.model
                     )
-                    self.chunks.append(processed_chunk)
+                    self._append_chunk(processed_chunk)
                     if hasattr(
                         processed_chunk, "usage"
                     ):  # remove usage from chunk, only send on final chunk
@@ -1869,7 +1910,7 @@ class CustomStreamWrapper:
 
                         if is_empty:
                             continue
-                    print_verbose(f"final returned processed chunk: {processed_chunk}")
+                    print_verbose("final returned processed chunk: %s", processed_chunk)
 
                     # add usage as hidden param
                     if self.sent_last_chunk is True and self.stream_options is None:
@@ -1896,7 +1937,7 @@ class CustomStreamWrapper:
                     else:
                         chunk = next(self.completion_stream)
                     if chunk is not None and chunk != b"":
-                        print_verbose(f"PROCESSED CHUNK PRE CHUNK CREATOR: {chunk}")
+                        print_verbose("PROCESSED CHUNK PRE CHUNK CREATOR: %s", chunk)
                         processed_chunk: Optional[
                             ModelResponseStream
                         ] = self.chunk_creator(chunk=chunk)
@@ -1917,7 +1958,7 @@ class CustomStreamWrapper:
                             input=self.response_uptil_now, model=self.model
                         )
                         # RETURN RESULT
-                        self.chunks.append(processed_chunk)
+                        self._append_chunk(processed_chunk)
                         return processed_chunk
         except (StopAsyncIteration, StopIteration):
             if self.sent_last_chunk is True:
@@ -1943,6 +1984,8 @@ class CustomStreamWrapper:
                             cache_hit=cache_hit,
                         )
                     )
+                else:
+                    self._release_in_flight_cache_request()
                 if self.sent_stream_usage is False and self.send_stream_usage is True:
                     self.sent_stream_usage = True
                     return response
@@ -1975,6 +2018,7 @@ class CustomStreamWrapper:
             traceback_exception += "\nLiteLLM Default Request Timeout - {}".format(
                 litellm.request_timeout
             )
+            self._release_in_flight_cache_request()
             if self.logging_obj is not None:
                 ## LOGGING
                 threading.Thread(
@@ -1986,8 +2030,13 @@ class CustomStreamWrapper:
                     self.logging_obj.async_failure_handler(e, traceback_exception)
                 )
             raise e
+        except asyncio.CancelledError:
+            # e.g. client disconnected
+            self._release_in_flight_cache_request()
+            raise
         except Exception as e:
             traceback_exception = traceback.format_exc()
+            self._release_in_flight_cache_request()
             if self.logging_obj is not None:
                 ## LOGGING
                 threading.Thread(
@@ -25,6 +25,8 @@ import litellm.types
 import litellm.types.utils
 from litellm.constants import RESPONSE_FORMAT_TOOL_NAME
 from litellm.litellm_core_utils.core_helpers import map_finish_reason
+from litellm.litellm_core_utils.sse_decoder import aiter_sse_chunks, iter_sse_chunks
+from litellm.llms.base_llm.base_model_iterator import BaseModelResponseIterator
 from litellm.llms.custom_httpx.http_handler import (
     AsyncHTTPHandler,
     HTTPHandler,
@@ -100,7 +102,7 @@ async def make_call(
         raise AnthropicError(status_code=500, message=str(e))
 
     completion_stream = ModelResponseIterator(
-        streaming_response=response.aiter_lines(),
+        streaming_response=aiter_sse_chunks(response.aiter_bytes()),
         sync_stream=False,
         json_mode=json_mode,
     )
@@ -159,7 +161,9 @@ def make_sync_call(
         )
 
     completion_stream = ModelResponseIterator(
-        streaming_response=response.iter_lines(), sync_stream=True, json_mode=json_mode
+        streaming_response=iter_sse_chunks(response.iter_bytes()),
+        sync_stream=True,
+        json_mode=json_mode,
     )
 
     # LOGGING
@@ -482,15 +486,17 @@ class AnthropicChatCompletion(BaseLLM):
         pass
 
 
-class ModelResponseIterator:
+class ModelResponseIterator(BaseModelResponseIterator):
     def __init__(
         self, streaming_response, sync_stream: bool, json_mode: Optional[bool] = False
     ):
-        self.streaming_response = streaming_response
-        self.response_iterator = self.streaming_response
+        super().__init__(
+            streaming_response=streaming_response,
+            sync_stream=sync_stream,
+            json_mode=json_mode,
+        )
         self.content_blocks: List[ContentBlockDelta] = []
         self.tool_index = -1
-        self.json_mode = json_mode
         # Generate response ID once per stream to match OpenAI-compatible behavior
         self.response_id = _generate_id()
 
@@ -954,6 +960,21 @@ class ModelResponseIterator:
             self.chunk_type = "accumulated_json"
             return self._handle_accumulated_json_chunk(data_str)
 
+    def _handle_string_chunk(
+        self, str_line: str
+    ) -> Optional[Union[GenericStreamingChunk, ModelResponseStream]]:
+        if str_line.startswith("data:"):
+            # None while a partial JSON chunk is being accumulated
+            return self._parse_sse_data(str_line)
+        return GenericStreamingChunk(
+            text="",
+            is_finished=False,
+            finish_reason="",
+            usage=None,
+            index=0,
+            tool_use=None,
+        )
+
     # Sync iterator
     def __iter__(self):
         return self
@@ -976,27 +997,10 @@ class ModelResponseIterator:
                 raise RuntimeError(f"Error receiving chunk from stream: {e}")
 
             try:
-                str_line = chunk
-                if isinstance(chunk, bytes):  # Handle binary data
-                    str_line = chunk.decode("utf-8")  # Convert bytes to string
-                    index = str_line.find("data:")
-                    if index != -1:
-                        str_line = str_line[index:]
-
-                if str_line.startswith("data:"):
-                    result = self._parse_sse_data(str_line)
-                    if result is not None:
-                        return result
-                    # If None, continue loop to get more chunks for accumulation
-                else:
-                    return GenericStreamingChunk(
-                        text="",
-                        is_finished=False,
-                        finish_reason="",
-                        usage=None,
-                        index=0,
-                        tool_use=None,
-                    )
+                result = self._handle_chunk(chunk)
+                if result is not None:
+                    return result
+                # If None, continue loop to get more chunks for accumulation
             except StopIteration:
                 raise StopIteration
             except ValueError as e:
@@ -1025,27 +1029,10 @@ class ModelResponseIterator:
                 raise RuntimeError(f"Error receiving chunk from stream: {e}")
 
             try:
-                str_line = chunk
-                if isinstance(chunk, bytes):  # Handle binary data
-                    str_line = chunk.decode("utf-8")  # Convert bytes to string
-                    index = str_line.find("data:")
-                    if index != -1:
-                        str_line = str_line[index:]
-
-                if str_line.startswith("data:"):
-                    result = self._parse_sse_data(str_line)
-                    if result is not None:
-                        return result
-                    # If None, continue loop to get more chunks for accumulation
-                else:
-                    return GenericStreamingChunk(
-                        text="",
-                        is_finished=False,
-                        finish_reason="",
-                        usage=None,
-                        index=0,
-                        tool_use=None,
-                    )
+                result = self._handle_chunk(chunk)
+                if result is not None:
+                    return result
+                # If None, continue loop to get more chunks for accumulation
             except StopAsyncIteration:
                 raise StopAsyncIteration
             except ValueError as e:
@@ -16,6 +16,7 @@ from litellm.litellm_core_utils.prompt_templates.factory import (
     custom_prompt,
     prompt_factory,
 )
+from litellm.litellm_core_utils.sse_decoder import SSEChunk
 from litellm.llms.base_llm.base_model_iterator import BaseModelResponseIterator
 from litellm.llms.base_llm.chat.transformation import (
     BaseConfig,
@@ -267,7 +268,9 @@ class AnthropicTextConfig(BaseConfig):
 
     def get_model_response_iterator(
         self,
-        streaming_response: Union[Iterator[str], AsyncIterator[str], ModelResponse],
+        streaming_response: Union[
+            Iterator[SSEChunk], AsyncIterator[SSEChunk], ModelResponse
+        ],
         sync_stream: bool,
         json_mode: Optional[bool] = False,
     ):
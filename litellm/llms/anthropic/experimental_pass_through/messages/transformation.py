@@ -2,6 +2,7 @@ from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import httpx
 
+from litellm.litellm_core_utils.fast_json import response_json
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj, verbose_logger
 from litellm.llms.base_llm.anthropic_messages.transformation import (
     BaseAnthropicMessagesConfig,
@@ -122,7 +123,7 @@ class AnthropicMessagesConfig(BaseAnthropicMessagesConfig):
         No transformation is needed for Anthropic messages, since we want the response in the Anthropic /v1/messages API spec
         """
         try:
-            raw_response_json = raw_response.json()
+            raw_response_json = response_json(raw_response)
         except Exception:
             raise AnthropicError(
                 message=raw_response.text, status_code=raw_response.status_code
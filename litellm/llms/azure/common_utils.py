@@ -11,6 +11,8 @@ from litellm.caching.caching import DualCache
 from litellm.llms.base_llm.chat.transformation import BaseLLMException
 from litellm.llms.openai.common_utils import BaseOpenAILLM
 from litellm.secret_managers.get_azure_ad_token_provider import (
+    ProactiveRefreshTokenProvider,
+    get_azure_ad_token_cache_key,
     get_azure_ad_token_provider,
 )
 from litellm.secret_managers.main import get_secret_str
@@ -112,7 +114,12 @@ def get_azure_ad_token_from_entra_id(
 
     verbose_logger.debug("credential %s", credential)
 
-    token_provider = get_bearer_token_provider(credential, scope)
+    token_provider = ProactiveRefreshTokenProvider(
+        token_provider=get_bearer_token_provider(credential, scope),
+        cache_key=get_azure_ad_token_cache_key(
+            "entra_id", _tenant_id, _client_id, _client_secret, scope
+        ),
+    )
 
     verbose_logger.debug("token_provider %s", token_provider)
 
@@ -153,7 +160,12 @@ def get_azure_ad_token_from_username_password(
 
     verbose_logger.debug("credential %s", credential)
 
-    token_provider = get_bearer_token_provider(credential, scope)
+    token_provider = ProactiveRefreshTokenProvider(
+        token_provider=get_bearer_token_provider(credential, scope),
+        cache_key=get_azure_ad_token_cache_key(
+            "username_password", client_id, azure_username, azure_password, scope
+        ),
+    )
 
     verbose_logger.debug("token_provider %s", token_provider)
 
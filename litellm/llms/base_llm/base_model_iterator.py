@@ -3,6 +3,8 @@ from abc import abstractmethod
 from typing import List, Optional, Union, cast
 
 import litellm
+from litellm.litellm_core_utils.fast_json import json_loads
+from litellm.litellm_core_utils.sse_decoder import SSEChunk
 from litellm.types.utils import (
     Choices,
     Delta,
@@ -89,17 +91,37 @@ class BaseModelResponseIterator:
         )
         try:
             if stripped_chunk is not None:
-                stripped_json_chunk = json.loads(stripped_chunk)
+                stripped_json_chunk = json_loads(stripped_chunk)
             else:
                 stripped_json_chunk = None
         except json.JSONDecodeError:
             stripped_json_chunk = None
         return stripped_json_chunk
 
+    def _handle_chunk(
+        self, chunk: Union[SSEChunk, bytes]
+    ) -> Optional[Union[GenericStreamingChunk, ModelResponseStream]]:
+        """
+        Parse one chunk of the stream - a `dict` already parsed by the SSE decoder (`litellm_core_utils/sse_decoder.py`),
+        or a raw `str` / `bytes` line, handled by `_handle_string_chunk`.
+        """
+        if isinstance(chunk, dict):
+            return self.chunk_parser(chunk=chunk)
+        if isinstance(chunk, bytes):  # Handle binary data
+            str_line = chunk.decode("utf-8")  # Convert bytes to string
+            index = str_line.find("data:")
+            if index != -1:
+                str_line = str_line[index:]
+        else:
+            str_line = chunk
+        return self._handle_string_chunk(str_line=str_line)
+
     def _handle_string_chunk(
         self, str_line: str
-    ) -> Union[GenericStreamingChunk, ModelResponseStream]:
-        # chunk is a str at this point
+    ) -> Optional[Union[GenericStreamingChunk, ModelResponseStream]]:
+        """
+        Parse a `str` line of the stream. Subclasses return None if the line has nothing to emit yet (e.g. partial JSON).
+        """
         stripped_json_chunk = BaseModelResponseIterator._string_to_dict_parser(
             str_line=str_line
         )
@@ -133,14 +155,7 @@ class BaseModelResponseIterator:
             raise RuntimeError(f"Error receiving chunk from stream: {e}")
 
         try:
-            str_line = chunk
-            if isinstance(chunk, bytes):  # Handle binary data
-                str_line = chunk.decode("utf-8")  # Convert bytes to string
-                index = str_line.find("data:")
-                if index != -1:
-                    str_line = str_line[index:]
-            # chunk is a str at this point
-            return self._handle_string_chunk(str_line=str_line)
+            return self._handle_chunk(chunk)
         except StopIteration:
             raise StopIteration
         except ValueError as e:
@@ -161,17 +176,7 @@ class BaseModelResponseIterator:
             raise RuntimeError(f"Error receiving chunk from stream: {e}")
 
         try:
-            str_line = chunk
-            if isinstance(chunk, bytes):  # Handle binary data
-                str_line = chunk.decode("utf-8")  # Convert bytes to string
-                index = str_line.find("data:")
-                if index != -1:
-                    str_line = str_line[index:]
-
-            # chunk is a str at this point
-            chunk = self._handle_string_chunk(str_line=str_line)
-
-            return chunk
+            return self._handle_chunk(chunk)
         except StopAsyncIteration:
             raise StopAsyncIteration
         except ValueError as e:
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     from pydantic import BaseModel
 
     from litellm import LiteLLMLoggingObj, ModelResponse
+    from litellm.litellm_core_utils.sse_decoder import SSEChunk
     from litellm.llms.base_llm.base_model_iterator import BaseModelResponseIterator
     from litellm.types.llms.openai import AllMessageValues
 
@@ -48,7 +49,9 @@ class CompletionTransformationBridge(ABC):
     @abstractmethod
     def get_model_response_iterator(
         self,
-        streaming_response: Union[Iterator[str], AsyncIterator[str], "ModelResponse"],
+        streaming_response: Union[
+            Iterator["SSEChunk"], AsyncIterator["SSEChunk"], "ModelResponse"
+        ],
         sync_stream: bool,
         json_mode: Optional[bool] = False,
     ) -> "BaseModelResponseIterator":
@@ -21,6 +21,7 @@ import httpx
 from pydantic import BaseModel
 
 from litellm.constants import DEFAULT_MAX_TOKENS, RESPONSE_FORMAT_TOOL_NAME
+from litellm.litellm_core_utils.sse_decoder import SSEChunk
 from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
 from litellm.types.llms.openai import (
     AllMessageValues,
@@ -384,7 +385,9 @@ class BaseConfig(ABC):
 
     def get_model_response_iterator(
         self,
-        streaming_response: Union[Iterator[str], AsyncIterator[str], "ModelResponse"],
+        streaming_response: Union[
+            Iterator[SSEChunk], AsyncIterator[SSEChunk], "ModelResponse"
+        ],
         sync_stream: bool,
         json_mode: Optional[bool] = False,
     ) -> Any:
@@ -436,3 +439,12 @@ class BaseConfig(ABC):
         By default, this is true for almost all providers.
         """
         return True
+
+    @property
+    def supports_sse_byte_stream(self) -> bool:
+        """
+        If True, streaming responses are decoded with the shared byte-level SSE decoder (`litellm_core_utils/sse_decoder.py`) instead of `response.iter_lines()`.
+
+        The response iterator then receives already parsed `dict` chunks for JSON `data:` lines, so it must accept them (e.g. `BaseModelResponseIterator`).
+        """
+        return False
@@ -1,6 +1,8 @@
+import functools
 import hashlib
 import json
 import os
+import time
 import urllib.parse
 from datetime import datetime
 from typing import (
@@ -26,7 +28,12 @@ from litellm.constants import (
     BEDROCK_INVOKE_PROVIDERS_LITERAL,
     BEDROCK_MAX_POLICY_SIZE,
 )
+from litellm.litellm_core_utils.credential_refresh_manager import (
+    credential_refresh_manager,
+)
 from litellm.litellm_core_utils.dd_tracing import tracer
+from litellm.litellm_core_utils.fast_json import json_dumps_bytes
+from litellm.llms.bedrock.sigv4 import sign_request_headers
 from litellm.secret_managers.main import get_secret, get_secret_str
 
 if TYPE_CHECKING:
@@ -57,8 +64,10 @@ class AwsAuthError(Exception):
 
 
 class BaseAWSLLM:
+    # credentials are keyed by their auth args - shared by all instances, incl. per-request config objects
+    iam_cache = DualCache()
+
     def __init__(self) -> None:
-        self.iam_cache = DualCache()
         super().__init__()
         self.aws_authentication_params = [
             "aws_access_key_id",
@@ -168,8 +177,55 @@ class BaseAWSLLM:
         cache_key = self.get_cache_key(args)
         _cached_credentials = self.iam_cache.get_cache(cache_key)
         if _cached_credentials:
+            credential_refresh_manager.mark_used(cache_key)
             return _cached_credentials
 
+        # concurrent requests with the same credential args share one STS call
+        return credential_refresh_manager.load(
+            cache_key,
+            lambda: self._load_and_cache_credentials(cache_key=cache_key, args=args),
+        )
+
+    def _load_and_cache_credentials(
+        self, cache_key: str, args: Dict[str, Optional[str]]
+    ) -> Credentials:
+        """
+        Run the auth flow for `args`, cache the credentials and schedule their background refresh before they expire.
+        """
+        credentials, _cache_ttl = self._get_credentials_and_ttl(**args)
+        self.iam_cache.set_cache(cache_key, credentials, ttl=_cache_ttl)
+        if _cache_ttl is not None:
+            # the refresh does not hold on to `self` - instances can be per-request
+            credential_refresh_manager.schedule_refresh(
+                key=cache_key,
+                refresh_fn=functools.partial(
+                    BaseAWSLLM._refresh_credentials, cache_key=cache_key, args=args
+                ),
+                expires_at=time.time() + _cache_ttl,
+            )
+        return credentials
+
+    @staticmethod
+    def _refresh_credentials(cache_key: str, args: Dict[str, Optional[str]]) -> None:
+        aws_llm = BaseAWSLLM()
+        credential_refresh_manager.load(
+            cache_key,
+            lambda: aws_llm._load_and_cache_credentials(cache_key=cache_key, args=args),
+        )
+
+    def _get_credentials_and_ttl(
+        self,
+        aws_access_key_id: Optional[str],
+        aws_secret_access_key: Optional[str],
+        aws_session_token: Optional[str],
+        aws_region_name: Optional[str],
+        aws_session_name: Optional[str],
+        aws_profile_name: Optional[str],
+        aws_role_name: Optional[str],
+        aws_web_identity_token: Optional[str],
+        aws_sts_endpoint: Optional[str],
+        aws_external_id: Optional[str],
+    ) -> Tuple[Credentials, Optional[int]]:
         #########################################################
         # Handle diff boto3 auth flows
         # for each helper
@@ -254,8 +310,7 @@ class BaseAWSLLM:
         else:
             credentials, _cache_ttl = self._auth_with_env_vars()
 
-        self.iam_cache.set_cache(cache_key, credentials, ttl=_cache_ttl)
-        return credentials
+        return credentials, _cache_ttl
 
     def _get_aws_region_from_model_arn(self, model: Optional[str]) -> Optional[str]:
         try:
@@ -1051,6 +1106,23 @@ class BaseAWSLLM:
             # Filter headers for AWS signature calculation
             # AWS SigV4 only includes specific headers in signature calculation
             aws_signature_headers = self._filter_headers_for_aws_signature(headers)
+            signed_headers = sign_request_headers(
+                credentials=credentials,
+                service_name="bedrock",
+                region_name=aws_region_name,
+                url=endpoint_url,
+                headers=aws_signature_headers,
+                body=data,
+            )
+            if signed_headers is not None:
+                return self._get_prepared_request(
+                    signed_headers=signed_headers,
+                    headers=headers,
+                    extra_headers=extra_headers,
+                    endpoint_url=endpoint_url,
+                    data=data,
+                )
+
             sigv4 = SigV4Auth(credentials, "bedrock", aws_region_name)
             request = AWSRequest(
                 method="POST",
@@ -1072,6 +1144,43 @@ class BaseAWSLLM:
 
         return prepped
 
+    @staticmethod
+    def _get_prepared_request(
+        signed_headers: dict,
+        headers: dict,
+        extra_headers: Optional[dict],
+        endpoint_url: str,
+        data: Union[str, bytes],
+    ) -> AWSPreparedRequest:
+        """
+        Build the `AWSPreparedRequest` `AWSRequest(...).prepare()` returns, for headers signed by `sign_request_headers`.
+        """
+        from botocore.awsrequest import AWSPreparedRequest, HeadersDict
+
+        prepared_headers = HeadersDict(signed_headers.items())
+        # Add back all original headers (including forwarded ones) after signature calculation
+        for header_name, header_value in headers.items():
+            prepared_headers[header_name] = header_value
+        if (
+            extra_headers is not None and "Authorization" in extra_headers
+        ):  # prevent sigv4 from overwriting the auth header
+            prepared_headers["Authorization"] = extra_headers["Authorization"]
+
+        body = data if data != b"" else None
+        if (
+            body is not None
+            and "Transfer-Encoding" not in prepared_headers
+            and "Content-Length" not in prepared_headers
+        ):
+            prepared_headers["Content-Length"] = str(len(body))
+        return AWSPreparedRequest(
+            method="POST",
+            url=endpoint_url,
+            headers=prepared_headers,
+            body=body,
+            stream_output=False,
+        )
+
     def _filter_headers_for_aws_signature(self, headers: dict) -> dict:
         """
         Filter headers to only include those that AWS SigV4 includes in signature calculation.
@@ -1130,7 +1239,7 @@ class BaseAWSLLM:
             headers = headers or {}
             headers["Content-Type"] = "application/json"
             headers["Authorization"] = f"Bearer {aws_bearer_token}"
-            return headers, json.dumps(request_data).encode()
+            return headers, json_dumps_bytes(request_data)
 
         # If no bearer token is set, proceed with the existing SigV4 authentication
         try:
@@ -1168,16 +1277,32 @@ class BaseAWSLLM:
             aws_external_id=aws_external_id,
         )
 
-        sigv4 = SigV4Auth(credentials, service_name, aws_region_name)
         if headers is not None:
             headers = {"Content-Type": "application/json", **headers}
         else:
             headers = {"Content-Type": "application/json"}
 
+        body = json_dumps_bytes(request_data)
+        signed_headers = sign_request_headers(
+            credentials=credentials,
+            service_name=service_name,
+            region_name=aws_region_name,
+            url=api_base,
+            headers=headers,
+            body=body,
+        )
+        if signed_headers is not None:
+            if (
+                "Authorization" in headers
+            ):  # prevent sigv4 from overwriting the auth header
+                signed_headers["Authorization"] = headers["Authorization"]
+            return signed_headers, body
+
+        sigv4 = SigV4Auth(credentials, service_name, aws_region_name)
         request = AWSRequest(
             method="POST",
             url=api_base,
-            data=json.dumps(request_data),
+            data=body,
             headers=headers,
         )
         sigv4.add_auth(request)
@@ -12,6 +12,7 @@ import httpx
 
 from litellm._logging import verbose_logger
 from litellm._uuid import uuid
+from litellm.litellm_core_utils.fast_json import json_dumps_bytes
 from litellm.litellm_core_utils.prompt_templates.common_utils import (
     convert_content_list_to_str,
 )
@@ -124,7 +125,7 @@ class AmazonAgentCoreConfig(BaseConfig, BaseAWSLLM):
             headers["Content-Type"] = "application/json"
             headers["Authorization"] = f"Bearer {jwt_token}"
             # Return headers with bearer token and JSON-encoded body (not SigV4 signed)
-            return headers, json.dumps(request_data).encode()
+            return headers, json_dumps_bytes(request_data)
 
         # Otherwise, use AWS SigV4 authentication
         verbose_logger.debug("AgentCore: Using AWS SigV4 authentication (IAM)")
@@ -18,6 +18,7 @@ from litellm.litellm_core_utils.core_helpers import (
     map_finish_reason,
     safe_deep_copy,
 )
+from litellm.litellm_core_utils.fast_json import response_json
 from litellm.litellm_core_utils.litellm_logging import Logging
 from litellm.litellm_core_utils.prompt_templates.common_utils import (
     _parse_content_for_reasoning,
@@ -1400,7 +1401,7 @@ class AmazonConverseConfig(BaseConfig):
         json_mode: Optional[bool] = optional_params.pop("json_mode", None)
         ## RESPONSE OBJECT
         try:
-            completion_response = ConverseResponseBlock(**response.json())  # type: ignore
+            completion_response = ConverseResponseBlock(**response_json(response))  # type: ignore
         except Exception as e:
             raise BedrockError(
                 message="Received={}, Error converting to valid response block={}. File an issue if litellm error - https://github.com/BerriAI/litellm/issues".format(
@@ -23,6 +23,7 @@ from litellm import verbose_logger
 from litellm._uuid import uuid
 from litellm.caching.caching import InMemoryCache
 from litellm.litellm_core_utils.core_helpers import map_finish_reason
+from litellm.litellm_core_utils.fast_json import json_loads
 from litellm.litellm_core_utils.litellm_logging import Logging
 from litellm.litellm_core_utils.logging_utils import track_llm_api_timing
 from litellm.litellm_core_utils.prompt_templates.factory import (
@@ -67,6 +68,7 @@ from litellm.utils import CustomStreamWrapper, get_secret
 
 from ..base_aws_llm import BaseAWSLLM
 from ..common_utils import BedrockError, ModelResponseIterator, get_bedrock_tool_name
+from ..event_stream import AWSEventStreamBuffer, AWSEventStreamMessage
 
 _response_stream_shape_cache = None
 bedrock_tool_name_mappings: InMemoryCache = InMemoryCache(
@@ -1239,35 +1241,23 @@ def get_response_stream_shape():
 
 class AWSEventStreamDecoder:
     def __init__(self, model: str) -> None:
-        from botocore.parsers import EventStreamJSONParser
-
         self.model = model
-        self.parser = EventStreamJSONParser()
-        self.content_blocks: List[ContentBlockDeltaEvent] = []
+        # running state of the current content block, updated on each delta
+        self.is_tool_use_block: Optional[bool] = None
+        self.tool_use_args_length: int = 0
         self.tool_calls_index: Optional[int] = None
         self.response_id: Optional[str] = None
 
+    def _reset_content_block_state(self) -> None:
+        self.is_tool_use_block = None
+        self.tool_use_args_length = 0
+
     def check_empty_tool_call_args(self) -> bool:
         """
         Check if the tool call block so far has been an empty string
         """
-        args = ""
-        # if text content block -> skip
-        if len(self.content_blocks) == 0:
-            return False
-
-        if (
-            "toolUse" not in self.content_blocks[0]
-        ):  # be explicit - only do this if tool use block, as this is to prevent json decoding errors
-            return False
-
-        for block in self.content_blocks:
-            if "toolUse" in block:
-                args += block["toolUse"]["input"]
-
-        if len(args) == 0:
-            return True
-        return False
+        # be explicit - only do this if tool use block, as this is to prevent json decoding errors
+        return self.is_tool_use_block is True and self.tool_use_args_length == 0
 
     def extract_reasoning_content_str(
         self, reasoning_content_block: BedrockConverseReasoningContentBlockDelta
@@ -1343,7 +1333,7 @@ class AWSEventStreamDecoder:
             ]
         ] = None
 
-        self.content_blocks = []  # reset
+        self._reset_content_block_state()
         if start_obj is not None:
             if "toolUse" in start_obj and start_obj["toolUse"] is not None:
                 ## check tool name was formatted by litellm
@@ -1407,7 +1397,10 @@ class AWSEventStreamDecoder:
             ]
         ] = None
 
-        self.content_blocks.append(delta_obj)
+        if self.is_tool_use_block is None:
+            self.is_tool_use_block = "toolUse" in delta_obj
+        if "toolUse" in delta_obj:
+            self.tool_use_args_length += len(delta_obj["toolUse"]["input"])
         if "text" in delta_obj:
             text = delta_obj["text"]
         elif "toolUse" in delta_obj:
@@ -1605,66 +1598,44 @@ class AWSEventStreamDecoder:
         self, iterator: Iterator[bytes]
     ) -> Iterator[Union[GChunk, ModelResponseStream, dict]]:
         """Given an iterator that yields lines, iterate over it & yield every event encountered"""
-        from botocore.eventstream import EventStreamBuffer
-
-        event_stream_buffer = EventStreamBuffer()
+        event_stream_buffer = AWSEventStreamBuffer()
         for chunk in iterator:
-            event_stream_buffer.add_data(chunk)
-            for event in event_stream_buffer:
-                message = self._parse_message_from_event(event)
+            for event in event_stream_buffer.decode(chunk):
+                message = self._parse_message_from_event_stream_message(event)
                 if message:
-                    # sse_event = ServerSentEvent(data=message, event="completion")
-                    _data = json.loads(message)
-                    yield self._chunk_parser(chunk_data=_data)
+                    yield self._chunk_parser(chunk_data=json_loads(message))
 
     async def aiter_bytes(
         self, iterator: AsyncIterator[bytes]
     ) -> AsyncIterator[Union[GChunk, ModelResponseStream, dict]]:
         """Given an async iterator that yields lines, iterate over it & yield every event encountered"""
-        from botocore.eventstream import EventStreamBuffer
-
-        event_stream_buffer = EventStreamBuffer()
+        event_stream_buffer = AWSEventStreamBuffer()
         async for chunk in iterator:
-            event_stream_buffer.add_data(chunk)
-            for event in event_stream_buffer:
-                message = self._parse_message_from_event(event)
+            for event in event_stream_buffer.decode(chunk):
+                message = self._parse_message_from_event_stream_message(event)
                 if message:
-                    _data = json.loads(message)
-                    yield self._chunk_parser(chunk_data=_data)
-
-    def _parse_message_from_event(self, event) -> Optional[str]:
-        response_dict = event.to_response_dict()
-        parsed_response = self.parser.parse(response_dict, get_response_stream_shape())
-
-        if response_dict["status_code"] != 200:
-            decoded_body = response_dict["body"].decode()
-            if isinstance(decoded_body, dict):
-                error_message = decoded_body.get("message")
-            elif isinstance(decoded_body, str):
-                error_message = decoded_body
-            else:
-                error_message = ""
-            exception_status = response_dict["headers"].get(":exception-type")
-            error_message = exception_status + " " + error_message
+                    yield self._chunk_parser(chunk_data=json_loads(message))
+
+    def _parse_message_from_event_stream_message(
+        self, event: AWSEventStreamMessage
+    ) -> Optional[bytes]:
+        """
+        Returns the chunk bytes of a message decoded by `AWSEventStreamBuffer`, raises `BedrockError` for error / exception messages
+        """
+        if event.status_code != 200:
+            error_message = event.payload.decode(errors="replace")
+            exception_status = (
+                event.headers.get(":exception-type")
+                or event.headers.get(":error-code")
+                or ""
+            )
+            if isinstance(exception_status, bytes):
+                exception_status = exception_status.decode(errors="replace")
             raise BedrockError(
-                status_code=response_dict["status_code"],
-                message=(
-                    json.dumps(error_message)
-                    if isinstance(error_message, dict)
-                    else error_message
-                ),
+                status_code=event.status_code,
+                message=f"{exception_status} {error_message}",
             )
-        if "chunk" in parsed_response:
-            chunk = parsed_response.get("chunk")
-            if not chunk:
-                return None
-            return chunk.get("bytes").decode()  # type: ignore[no-any-return]
-        else:
-            chunk = response_dict.get("body")
-            if not chunk:
-                return None
-
-            return chunk.decode()  # type: ignore[no-any-return]
+        return event.get_chunk_bytes()
 
 
 class AmazonAnthropicClaudeStreamDecoder(AWSEventStreamDecoder):
@@ -9,6 +9,7 @@ import httpx
 import litellm
 from litellm._logging import verbose_logger
 from litellm.litellm_core_utils.core_helpers import map_finish_reason
+from litellm.litellm_core_utils.fast_json import response_json
 from litellm.litellm_core_utils.logging_utils import track_llm_api_timing
 from litellm.litellm_core_utils.prompt_templates.factory import (
     cohere_message_pt,
@@ -271,7 +272,7 @@ class AmazonInvokeConfig(BaseConfig, BaseAWSLLM):
         json_mode: Optional[bool] = None,
     ) -> ModelResponse:
         try:
-            completion_response = raw_response.json()
+            completion_response = response_json(raw_response)
         except Exception:
             raise BedrockError(
                 message=raw_response.text, status_code=raw_response.status_code
@@ -0,0 +1,147 @@
+"""
+Decoder for the AWS event stream binary framing used by Bedrock streaming responses (`application/vnd.amazon.eventstream`).
+
+Replaces `botocore.eventstream.EventStreamBuffer` + `EventStreamJSONParser` on the Bedrock streaming hot path:
+
+- frames are decoded straight from one growing buffer read at an offset, instead of re-slicing the remaining bytes after every frame
+- the consumed prefix is dropped once per network chunk, so decoding stays linear in the stream size
+- messages are routed on their `:message-type` / `:event-type` headers, without botocore shape parsing
+
+Frame layout: https://docs.aws.amazon.com/transcribe/latest/dg/streaming-setting-up.html#streaming-event-stream
+"""
+
+import base64
+import struct
+import zlib
+from typing import Dict, List, Optional, Union
+
+from litellm.litellm_core_utils.fast_json import json_loads
+
+# total length, headers length, prelude crc
+_PRELUDE = struct.Struct(">III")
+_PRELUDE_LENGTH = 12
+_MESSAGE_CRC_LENGTH = 4
+
+# header value type -> fixed value length in bytes (variable length types are read separately)
+_FIXED_HEADER_VALUE_LENGTHS = {0: 0, 1: 0, 2: 1, 3: 2, 4: 4, 5: 8, 8: 8, 9: 16}
+_VARIABLE_LENGTH_HEADER_TYPES = (6, 7)  # byte array, string
+
+
+class AWSEventStreamError(Exception):
+    pass
+
+
+class AWSEventStreamMessage:
+    __slots__ = ("headers", "payload")
+
+    def __init__(
+        self, headers: Dict[str, Union[str, bytes, int, bool]], payload: bytes
+    ):
+        self.headers = headers
+        self.payload = payload
+
+    @property
+    def status_code(self) -> int:
+        """
+        Same mapping as `botocore.eventstream.EventStreamMessage.to_response_dict`
+        """
+        if self.headers.get(":message-type") in ("error", "exception"):
+            return 400
+        return 200
+
+    def get_chunk_bytes(self) -> Optional[bytes]:
+        """
+        Returns the event payload - for invoke `chunk` events, the base64 decoded `bytes` field (what botocore's `EventStreamJSONParser` returns), else the raw payload.
+        """
+        if self.headers.get(":event-type") == "chunk":
+            chunk = json_loads(self.payload) if self.payload else None
+            if not chunk or not chunk.get("bytes"):
+                return None
+            return base64.b64decode(chunk["bytes"])
+        return self.payload or None
+
+
+class AWSEventStreamBuffer:
+    """
+    Incremental AWS event stream frame decoder. Feed raw response bytes with `decode()`.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def decode(self, data: bytes) -> List[AWSEventStreamMessage]:
+        self._buffer += data
+        messages: List[AWSEventStreamMessage] = []
+        offset = 0
+        buffer_length = len(self._buffer)
+        with memoryview(self._buffer) as view:
+            while buffer_length - offset >= _PRELUDE_LENGTH:
+                total_length, headers_length, prelude_crc = _PRELUDE.unpack_from(
+                    view, offset
+                )
+                if zlib.crc32(view[offset : offset + 8]) != prelude_crc:
+                    raise AWSEventStreamError(
+                        "Prelude checksum mismatch in event stream message"
+                    )
+                if buffer_length - offset < total_length:
+                    break
+
+                message_end = offset + total_length - _MESSAGE_CRC_LENGTH
+                (message_crc,) = struct.unpack_from(">I", view, message_end)
+                if zlib.crc32(view[offset:message_end]) != message_crc:
+                    raise AWSEventStreamError(
+                        "Message checksum mismatch in event stream message"
+                    )
+
+                headers_start = offset + _PRELUDE_LENGTH
+                payload_start = headers_start + headers_length
+                messages.append(
+                    AWSEventStreamMessage(
+                        headers=self._decode_headers(view[headers_start:payload_start]),
+                        payload=bytes(view[payload_start:message_end]),
+                    )
+                )
+                offset += total_length
+
+        if offset:
+            del self._buffer[:offset]
+        return messages
+
+    @staticmethod
+    def _decode_headers(
+        view: memoryview,
+    ) -> Dict[str, Union[str, bytes, int, bool]]:
+        headers: Dict[str, Union[str, bytes, int, bool]] = {}
+        offset = 0
+        while offset < len(view):
+            name_length = view[offset]
+            offset += 1
+            name = str(view[offset : offset + name_length], "utf-8")
+            offset += name_length
+            value_type = view[offset]
+            offset += 1
+
+            value: Union[str, bytes, int, bool]
+            if value_type in _VARIABLE_LENGTH_HEADER_TYPES:
+                (value_length,) = struct.unpack_from(">H", view, offset)
+                offset += 2
+                raw_value = view[offset : offset + value_length]
+                value = str(raw_value, "utf-8") if value_type == 7 else bytes(raw_value)
+                offset += value_length
+            elif value_type in _FIXED_HEADER_VALUE_LENGTHS:
+                value_length = _FIXED_HEADER_VALUE_LENGTHS[value_type]
+                if value_type in (0, 1):
+                    value = value_type == 0
+                elif value_type == 9:
+                    value = bytes(view[offset : offset + value_length])
+                else:
+                    value = int.from_bytes(
+                        view[offset : offset + value_length], "big", signed=True
+                    )
+                offset += value_length
+            else:
+                raise AWSEventStreamError(
+                    f"Unknown header value type {value_type} in event stream message"
+                )
+            headers[name] = value
+        return headers
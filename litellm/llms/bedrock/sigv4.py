@@ -0,0 +1,211 @@
+"""
+Lightweight AWS SigV4 signer for the Bedrock / SageMaker request hot path.
+
+Produces the same headers as `botocore.auth.SigV4Auth(credentials, service_name, region_name).add_auth(AWSRequest(...))`, without botocore's per-request objects:
+
+- the derived signing key is cached per (secret key, date, region, service) - botocore re-derives it with 4 HMACs on every request
+- the canonical request is built straight from the serialized body bytes, with the canonical URL path / host cached per URL
+
+`sign_request_headers()` returns None for requests it does not handle (e.g. a `Date` header, ipv6 hosts, non-bytes bodies) - callers fall back to botocore.
+
+Spec: https://docs.aws.amazon.com/IAM/latest/UserGuide/create-signed-request.html
+"""
+
+import hashlib
+import hmac
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import quote, urlsplit
+
+if TYPE_CHECKING:
+    from botocore.credentials import Credentials
+else:
+    Credentials = Any
+
+SIGV4_ALGORITHM = "AWS4-HMAC-SHA256"
+SIGV4_TIMESTAMP_FORMAT = "%Y%m%dT%H%M%SZ"
+EMPTY_SHA256_HASH = hashlib.sha256(b"").hexdigest()
+
+# same as `botocore.auth.SIGNED_HEADERS_BLACKLIST`
+_UNSIGNED_HEADERS = frozenset(
+    ("expect", "transfer-encoding", "user-agent", "x-amzn-trace-id")
+)
+# set by the signer - existing values are dropped before signing, like `SigV4Auth._modify_request_before_signing`
+_SIGNER_HEADERS = frozenset(("authorization", "x-amz-date", "x-amz-security-token"))
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+@lru_cache(maxsize=256)
+def _get_signing_key(
+    secret_key: str, date_stamp: str, region_name: str, service_name: str
+) -> bytes:
+    k_date = hmac.new(
+        f"AWS4{secret_key}".encode("utf-8"), date_stamp.encode("utf-8"), hashlib.sha256
+    ).digest()
+    k_region = hmac.new(k_date, region_name.encode("utf-8"), hashlib.sha256).digest()
+    k_service = hmac.new(
+        k_region, service_name.encode("utf-8"), hashlib.sha256
+    ).digest()
+    return hmac.new(k_service, b"aws4_request", hashlib.sha256).digest()
+
+
+def _remove_dot_segments(path: str) -> str:
+    """
+    Same as `botocore.utils.remove_dot_segments` - RFC 3986 section 5.2.4, plus consecutive slashes are collapsed.
+    """
+    if not path:
+        return ""
+    segments: List[str] = []
+    for segment in path.split("/"):
+        if not segment or segment == ".":
+            continue
+        if segment == "..":
+            if segments:
+                segments.pop()
+        else:
+            segments.append(segment)
+    first = "/" if path[0] == "/" else ""
+    last = "/" if path[-1] == "/" and segments else ""
+    return first + "/".join(segments) + last
+
+
+@lru_cache(maxsize=1024)
+def _get_canonical_url_parts(url: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Returns (canonical path, canonical query string, host) for the url, None if the url needs botocore's handling.
+    """
+    url_parts = urlsplit(url)
+    host = url_parts.hostname
+    if host is None or ":" in host:  # no host / ipv6 endpoint
+        return None
+    try:
+        port = url_parts.port
+    except ValueError:
+        return None
+    if port is not None and port != _DEFAULT_PORTS.get(url_parts.scheme):
+        host = f"{host}:{port}"
+
+    path = url_parts.path
+    canonical_path = quote(_remove_dot_segments(path) if path else "/", safe="/~")
+
+    canonical_query_string = ""
+    if url_parts.query:
+        key_value_pairs = []
+        for pair in url_parts.query.split("&"):
+            key, _, value = pair.partition("=")
+            key_value_pairs.append((key, value))
+        canonical_query_string = "&".join(
+            f"{key}={value}" for key, value in sorted(key_value_pairs)
+        )
+    return canonical_path, canonical_query_string, host
+
+
+def sign_request_headers(
+    credentials: Credentials,
+    service_name: str,
+    region_name: str,
+    url: str,
+    headers: Dict[str, str],
+    body: Optional[Union[bytes, str]],
+    method: str = "POST",
+    timestamp: Optional[str] = None,
+) -> Optional[Dict[str, str]]:
+    """
+    Sign a request with AWS SigV4.
+
+    Returns `headers` plus the `X-Amz-Date`, `X-Amz-Security-Token` and `Authorization` headers, or None if the request should be signed with botocore instead.
+    """
+    if credentials is None:
+        return None
+    if hasattr(credentials, "get_frozen_credentials"):
+        credentials = credentials.get_frozen_credentials()
+    access_key = credentials.access_key
+    secret_key = credentials.secret_key
+    session_token = credentials.token
+    if not access_key or not secret_key:
+        return None
+
+    url_parts = _get_canonical_url_parts(url)
+    if url_parts is None:
+        return None
+    canonical_path, canonical_query_string, host = url_parts
+
+    if body is None:
+        body = b""
+    elif isinstance(body, str):
+        body = body.encode("utf-8")
+    elif not isinstance(body, bytes):
+        return None
+
+    if timestamp is None:
+        timestamp = time.strftime(SIGV4_TIMESTAMP_FORMAT, time.gmtime())
+
+    signed_request_headers: Dict[str, str] = {}
+    headers_to_sign: Dict[str, str] = {}
+    payload_hash: Optional[str] = None
+    for header_name, header_value in headers.items():
+        if not isinstance(header_value, str):
+            return None
+        header_name_lower = header_name.lower()
+        if header_name_lower == "x-amz-security-token" and not session_token:
+            # botocore signs a caller provided token if the credentials have none
+            return None
+        if header_name_lower in _SIGNER_HEADERS:
+            continue
+        if header_name_lower == "date" or header_name_lower in headers_to_sign:
+            # `Date` replaces `X-Amz-Date` / repeated header names - leave these to botocore
+            return None
+        signed_request_headers[header_name] = header_value
+        if header_name_lower == "x-amz-content-sha256":
+            payload_hash = header_value
+        if header_name_lower not in _UNSIGNED_HEADERS:
+            headers_to_sign[header_name_lower] = " ".join(header_value.split())
+
+    signed_request_headers["X-Amz-Date"] = timestamp
+    headers_to_sign["x-amz-date"] = timestamp
+    if session_token:
+        signed_request_headers["X-Amz-Security-Token"] = session_token
+        headers_to_sign["x-amz-security-token"] = " ".join(session_token.split())
+    if "host" not in headers_to_sign:
+        headers_to_sign["host"] = host
+
+    if payload_hash is None:
+        payload_hash = hashlib.sha256(body).hexdigest() if body else EMPTY_SHA256_HASH
+
+    sorted_header_names = sorted(headers_to_sign)
+    signed_headers = ";".join(sorted_header_names)
+    canonical_request = "\n".join(
+        (
+            method.upper(),
+            canonical_path,
+            canonical_query_string,
+            "".join(
+                f"{name}:{headers_to_sign[name]}\n" for name in sorted_header_names
+            ),
+            signed_headers,
+            payload_hash,
+        )
+    )
+
+    date_stamp = timestamp[:8]
+    credential_scope = f"{date_stamp}/{region_name}/{service_name}/aws4_request"
+    string_to_sign = "\n".join(
+        (
+            SIGV4_ALGORITHM,
+            timestamp,
+            credential_scope,
+            hashlib.sha256(canonical_request.encode("utf-8")).hexdigest(),
+        )
+    )
+    signature = hmac.new(
+        _get_signing_key(secret_key, date_stamp, region_name, service_name),
+        string_to_sign.encode("utf-8"),
+        hashlib.sha256,
+    ).hexdigest()
+
+    signed_request_headers["Authorization"] = (
+        f"{SIGV4_ALGORITHM} Credential={access_key}/{credential_scope}, "
+        f"SignedHeaders={signed_headers}, Signature={signature}"
+    )
+    return signed_request_headers
@@ -5,6 +5,7 @@ from typing import AsyncIterator, Iterator, List, Optional, Union
 import httpx
 
 import litellm
+from litellm.litellm_core_utils.sse_decoder import SSEChunk
 from litellm.llms.base_llm.base_model_iterator import BaseModelResponseIterator
 from litellm.llms.base_llm.chat.transformation import (
     BaseConfig,
@@ -176,7 +177,9 @@ class CloudflareChatConfig(BaseConfig):
 
     def get_model_response_iterator(
         self,
-        streaming_response: Union[Iterator[str], AsyncIterator[str], ModelResponse],
+        streaming_response: Union[
+            Iterator[SSEChunk], AsyncIterator[SSEChunk], ModelResponse
+        ],
         sync_stream: bool,
         json_mode: Optional[bool] = False,
     ):
@@ -6,6 +6,7 @@ import httpx
 
 import litellm
 from litellm.litellm_core_utils.prompt_templates.factory import cohere_messages_pt_v2
+from litellm.litellm_core_utils.sse_decoder import SSEChunk
 from litellm.llms.base_llm.chat.transformation import BaseConfig, BaseLLMException
 from litellm.types.llms.openai import AllMessageValues
 from litellm.types.utils import ModelResponse, Usage
@@ -357,7 +358,9 @@ class CohereChatConfig(BaseConfig):
 
     def get_model_response_iterator(
         self,
-        streaming_response: Union[Iterator[str], AsyncIterator[str], ModelResponse],
+        streaming_response: Union[
+            Iterator[SSEChunk], AsyncIterator[SSEChunk], ModelResponse
+        ],
         sync_stream: bool,
         json_mode: Optional[bool] = False,
     ):
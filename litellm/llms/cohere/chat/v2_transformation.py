@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator, List, Optional,
 import httpx
 
 import litellm
+from litellm.litellm_core_utils.sse_decoder import SSEChunk
 from litellm.llms.base_llm.chat.transformation import BaseLLMException
 from litellm.types.llms.cohere import CohereV2ChatResponse
 from litellm.types.llms.openai import (
@@ -261,7 +262,9 @@ class CohereV2ChatConfig(OpenAIGPTConfig):
 
     def get_model_response_iterator(
         self,
-        streaming_response: Union[Iterator[str], AsyncIterator[str], ModelResponse],
+        streaming_response: Union[
+            Iterator[SSEChunk], AsyncIterator[SSEChunk], ModelResponse
+        ],
         sync_stream: bool,
         json_mode: Optional[bool] = False,
     ):
@@ -13,6 +13,10 @@ from aiohttp.client import ClientResponse, ClientSession
 
 import litellm
 from litellm._logging import verbose_logger
+from litellm.llms.custom_httpx.connection_timings import (
+    CONNECTION_TIMINGS_EXTENSION,
+    ConnectionPhaseTimings,
+)
 from litellm.secret_managers.main import str_to_bool
 
 AIOHTTP_EXC_MAP: Dict = {
@@ -77,13 +81,20 @@ def map_aiohttp_exceptions() -> typing.Iterator[None]:
 class AiohttpResponseStream(httpx.AsyncByteStream):
     CHUNK_SIZE = 1024 * 16
 
-    def __init__(self, aiohttp_response: ClientResponse) -> None:
+    def __init__(
+        self,
+        aiohttp_response: ClientResponse,
+        connection_timings: Optional[ConnectionPhaseTimings] = None,
+    ) -> None:
         self._aiohttp_response = aiohttp_response
+        self._connection_timings = connection_timings
 
     async def __aiter__(self) -> typing.AsyncIterator[bytes]:
         try:
             async for chunk in self._aiohttp_response.content.iter_chunked(self.CHUNK_SIZE):
                 yield chunk
+            if self._connection_timings is not None:
+                self._connection_timings.mark("response_end")
         except (
             aiohttp.ClientPayloadError,
             aiohttp.client_exceptions.ClientPayloadError,
@@ -252,6 +263,7 @@ class LiteLLMAiohttpTransport(AiohttpTransport):
             ),
             proxy=proxy,
             server_hostname=sni_hostname,
+            trace_request_ctx=request.extensions.get(CONNECTION_TIMINGS_EXTENSION),
         ).__aenter__()
 
         return response
@@ -305,7 +317,10 @@ class LiteLLMAiohttpTransport(AiohttpTransport):
         return httpx.Response(
             status_code=response.status,
             headers=response.headers,
-            content=AiohttpResponseStream(response),
+            content=AiohttpResponseStream(
+                response,
+                connection_timings=request.extensions.get(CONNECTION_TIMINGS_EXTENSION),
+            ),
             request=request,
         )
 
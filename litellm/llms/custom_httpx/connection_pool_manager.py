@@ -0,0 +1,334 @@
+"""
+Upstream connection pool manager - one long-lived connection pool per upstream origin (scheme://host:port).
+
+Enabled with `litellm.upstream_connection_pool = True`.
+
+- Pools are shared by every AsyncHTTPHandler, so they survive the httpx client cache ttl (`_DEFAULT_TTL_FOR_HTTPX_CLIENTS`) and are not split across (provider, params) client cache keys.
+- All traffic to an origin shares its pool, so pools are not capped by `AIOHTTP_CONNECTOR_LIMIT_PER_HOST` - set `UPSTREAM_CONNECTION_POOL_LIMIT` to cap them.
+- Origins in `litellm.upstream_http2_origins` use an HTTP/2 httpx transport (requires `h2`). All other origins use the aiohttp transport (or httpx, if `disable_aiohttp_transport` is set).
+- `prewarm()` opens connections to a list of api_bases ahead of traffic - e.g. every configured `api_base` at proxy startup.
+- `get_stats()` returns per-origin idle / active connections and handshake latency.
+"""
+
+import asyncio
+import ssl
+import time
+from typing import Any, Awaitable, Dict, List, Optional, Union
+
+import httpx
+from aiohttp import ClientSession, TCPConnector, TraceConfig
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    AIOHTTP_KEEPALIVE_TIMEOUT,
+    AIOHTTP_NEEDS_CLEANUP_CLOSED,
+    AIOHTTP_TTL_DNS_CACHE,
+    UPSTREAM_CONNECTION_POOL_LIMIT,
+    UPSTREAM_CONNECTION_POOL_PREWARM_CONNECTIONS,
+    UPSTREAM_CONNECTION_POOL_PREWARM_TIMEOUT,
+)
+from litellm.llms.custom_httpx.aiohttp_transport import LiteLLMAiohttpTransport
+from litellm.llms.custom_httpx.connection_timings import (
+    HttpcoreTrace,
+    get_connection_timings_trace_config,
+)
+
+
+class HandshakeStats:
+    def __init__(self):
+        self.num_handshakes = 0
+        self.total_handshake_ms = 0.0
+        self.max_handshake_ms = 0.0
+
+    def record(self, handshake_ms: float) -> None:
+        self.num_handshakes += 1
+        self.total_handshake_ms += handshake_ms
+        self.max_handshake_ms = max(self.max_handshake_ms, handshake_ms)
+
+
+class OriginConnectionPool:
+    """
+    Connection pool for a single upstream origin.
+    """
+
+    def __init__(self, origin: str, http2: bool = False):
+        self.origin = origin
+        self.http2 = http2
+        self.num_requests = 0
+        self.handshake_stats = HandshakeStats()
+        self._transport: Optional[httpx.AsyncBaseTransport] = None
+        self._transport_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_ssl_context(self) -> Union[bool, ssl.SSLContext]:
+        from litellm.llms.custom_httpx.http_handler import get_ssl_configuration
+
+        ssl_config = get_ssl_configuration()
+        if isinstance(ssl_config, (bool, ssl.SSLContext)):
+            return ssl_config
+        return ssl.create_default_context(cafile=ssl_config)
+
+    def _create_httpx_transport(self) -> httpx.AsyncHTTPTransport:
+        return httpx.AsyncHTTPTransport(
+            verify=self._get_ssl_context(),
+            http1=not self.http2,
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=UPSTREAM_CONNECTION_POOL_LIMIT or None,
+                max_keepalive_connections=UPSTREAM_CONNECTION_POOL_LIMIT or None,
+                keepalive_expiry=AIOHTTP_KEEPALIVE_TIMEOUT,
+            ),
+            local_address="0.0.0.0" if litellm.force_ipv4 else None,
+        )
+
+    def _create_aiohttp_session(self) -> ClientSession:
+        from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
+
+        ssl_context = self._get_ssl_context()
+        connector_kwargs: Dict[str, Any] = {
+            # 0 = no limit
+            "limit": UPSTREAM_CONNECTION_POOL_LIMIT,
+            "keepalive_timeout": AIOHTTP_KEEPALIVE_TIMEOUT,
+            "ttl_dns_cache": AIOHTTP_TTL_DNS_CACHE,
+            "enable_cleanup_closed": AIOHTTP_NEEDS_CLEANUP_CLOSED,
+            **AsyncHTTPHandler._get_ssl_connector_kwargs(
+                ssl_verify=ssl_context if isinstance(ssl_context, bool) else None,
+                ssl_context=(
+                    ssl_context if isinstance(ssl_context, ssl.SSLContext) else None
+                ),
+            ),
+        }
+        trace_config = TraceConfig()
+        trace_config.on_connection_create_start.append(self._on_connection_create_start)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        return ClientSession(
+            connector=TCPConnector(**connector_kwargs),
+            trace_configs=[trace_config, get_connection_timings_trace_config()],
+            trust_env=litellm.aiohttp_trust_env,
+        )
+
+    async def _on_connection_create_start(self, session, trace_config_ctx, params):
+        trace_config_ctx.connection_create_start = time.perf_counter()
+
+    async def _on_connection_create_end(self, session, trace_config_ctx, params):
+        start_time = getattr(trace_config_ctx, "connection_create_start", None)
+        if start_time is not None:
+            self.handshake_stats.record((time.perf_counter() - start_time) * 1000)
+
+    def _create_transport(self) -> httpx.AsyncBaseTransport:
+        from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
+
+        if self.http2 is False and AsyncHTTPHandler._should_use_aiohttp_transport():
+            return LiteLLMAiohttpTransport(client=self._create_aiohttp_session)
+        return self._create_httpx_transport()
+
+    def get_transport(self) -> httpx.AsyncBaseTransport:
+        """
+        Returns the transport for this origin. httpx transports are bound to the event loop they were first used on, so a new one is created per event loop.
+        """
+        if self._transport is None:
+            self._transport = self._create_transport()
+        elif isinstance(self._transport, httpx.AsyncHTTPTransport):
+            try:
+                current_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                current_loop = None
+            if (
+                self._transport_loop is not None
+                and current_loop is not None
+                and self._transport_loop is not current_loop
+            ):
+                self._transport = self._create_transport()
+            self._transport_loop = current_loop
+        return self._transport
+
+    def _get_httpx_trace(self, request_trace: Optional[HttpcoreTrace] = None):
+        """
+        Returns an httpcore trace callback that records the tcp + tls handshake time of a new connection, and calls the request's own trace callback (if any)
+        """
+        handshake_start_time: Optional[float] = None
+        handshake_end_event = (
+            "connection.connect_tcp.complete"
+            if self.origin.startswith("http://")
+            else "connection.start_tls.complete"
+        )
+
+        async def trace(event_name: str, info: dict) -> None:
+            nonlocal handshake_start_time
+            if event_name == "connection.connect_tcp.started":
+                handshake_start_time = time.perf_counter()
+            elif event_name == handshake_end_event and handshake_start_time is not None:
+                self.handshake_stats.record(
+                    (time.perf_counter() - handshake_start_time) * 1000
+                )
+                handshake_start_time = None
+            if request_trace is not None:
+                await request_trace(event_name, info)
+
+        return trace
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.num_requests += 1
+        transport = self.get_transport()
+        if isinstance(transport, httpx.AsyncHTTPTransport):
+            request.extensions["trace"] = self._get_httpx_trace(
+                request_trace=request.extensions.get("trace")
+            )
+        return await transport.handle_async_request(request)
+
+    def get_stats(self) -> Dict[str, Any]:
+        idle_connections = 0
+        active_connections = 0
+        transport = self._transport
+        if isinstance(transport, LiteLLMAiohttpTransport) and isinstance(
+            transport.client, ClientSession
+        ):
+            connector = transport.client.connector
+            idle_connections = sum(
+                len(conns) for conns in getattr(connector, "_conns", {}).values()
+            )
+            active_connections = len(getattr(connector, "_acquired", ()))
+        elif isinstance(transport, httpx.AsyncHTTPTransport):
+            for connection in getattr(transport._pool, "connections", []):
+                if connection.is_idle():
+                    idle_connections += 1
+                elif not connection.is_closed():
+                    active_connections += 1
+
+        handshake_stats = self.handshake_stats
+        return {
+            "origin": self.origin,
+            "http2": self.http2,
+            "idle_connections": idle_connections,
+            "active_connections": active_connections,
+            "num_requests": self.num_requests,
+            "num_handshakes": handshake_stats.num_handshakes,
+            "avg_handshake_ms": (
+                handshake_stats.total_handshake_ms / handshake_stats.num_handshakes
+                if handshake_stats.num_handshakes > 0
+                else 0.0
+            ),
+            "max_handshake_ms": handshake_stats.max_handshake_ms,
+        }
+
+    async def close(self) -> None:
+        if self._transport is None:
+            return
+        transport = self._transport
+        self._transport = None
+        if isinstance(transport, LiteLLMAiohttpTransport):
+            if isinstance(transport.client, ClientSession):
+                await transport.client.close()
+        else:
+            await transport.aclose()
+
+
+class UpstreamConnectionPoolManager:
+    def __init__(self):
+        self.origin_pools: Dict[str, OriginConnectionPool] = {}
+
+    @staticmethod
+    def get_origin(url: Union[str, httpx.URL]) -> str:
+        url = httpx.URL(url) if isinstance(url, str) else url
+        port = url.port or (443 if url.scheme == "https" else 80)
+        return f"{url.scheme}://{url.host}:{port}"
+
+    @staticmethod
+    def _is_http2_origin(origin: str) -> bool:
+        http2_origins = {
+            UpstreamConnectionPoolManager.get_origin(url)
+            for url in litellm.upstream_http2_origins
+        }
+        if origin not in http2_origins:
+            return False
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            verbose_logger.warning(
+                "upstream_http2_origins: `h2` is not installed, using HTTP/1.1 for %s. Run `pip install h2` to enable HTTP/2.",
+                origin,
+            )
+            return False
+        return True
+
+    def get_pool(self, url: Union[str, httpx.URL]) -> OriginConnectionPool:
+        origin = self.get_origin(url)
+        pool = self.origin_pools.get(origin)
+        if pool is None:
+            pool = OriginConnectionPool(
+                origin=origin, http2=self._is_http2_origin(origin)
+            )
+            self.origin_pools[origin] = pool
+        return pool
+
+    def get_transport(self) -> "UpstreamPoolTransport":
+        return UpstreamPoolTransport(manager=self)
+
+    async def prewarm(
+        self,
+        api_bases: List[str],
+        num_connections: int = UPSTREAM_CONNECTION_POOL_PREWARM_CONNECTIONS,
+        timeout: float = UPSTREAM_CONNECTION_POOL_PREWARM_TIMEOUT,
+    ) -> None:
+        """
+        Open `num_connections` connections to each api_base origin (1 for HTTP/2 origins, since requests are multiplexed).
+
+        Connections are opened with a HEAD request to the origin, the response status is ignored.
+        """
+        origins = {self.get_origin(api_base) for api_base in api_bases}
+        # closing the client does not close the pools
+        async with httpx.AsyncClient(
+            transport=self.get_transport(), timeout=timeout
+        ) as client:
+            requests: List[Awaitable[httpx.Response]] = []
+            for origin in origins:
+                pool_num_connections = (
+                    1 if self.get_pool(origin).http2 else num_connections
+                )
+                requests.extend(
+                    client.head(origin) for _ in range(pool_num_connections)
+                )
+            results = await asyncio.gather(*requests, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                verbose_logger.debug(
+                    "UpstreamConnectionPoolManager: prewarm request failed - %s",
+                    str(result),
+                )
+        verbose_logger.debug(
+            "UpstreamConnectionPoolManager: prewarmed %s origins", len(origins)
+        )
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {origin: pool.get_stats() for origin, pool in self.origin_pools.items()}
+
+    async def close(self) -> None:
+        for pool in self.origin_pools.values():
+            try:
+                await pool.close()
+            except Exception as e:
+                verbose_logger.debug(
+                    "UpstreamConnectionPoolManager: error closing pool for %s - %s",
+                    pool.origin,
+                    str(e),
+                )
+
+
+class UpstreamPoolTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that sends each request on the pool for its origin.
+
+    Pools are owned by the UpstreamConnectionPoolManager, so closing a client does not close them.
+    """
+
+    def __init__(self, manager: UpstreamConnectionPoolManager):
+        self.manager = manager
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.manager.get_pool(request.url).handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+upstream_connection_pool_manager = UpstreamConnectionPoolManager()
@@ -0,0 +1,193 @@
+"""
+Connection phase timings for upstream LLM API requests
+
+`AsyncHTTPHandler.post` records the phases of each request made with a logging object:
+- aiohttp transport - with an aiohttp `TraceConfig`, added to the client sessions litellm creates
+- httpx transport - with the httpcore `trace` request extension
+
+Phases:
+- pool_wait - request sent to the http client -> connection acquired from the pool (includes waiting for a free connection)
+- dns - host resolution, for new connections (aiohttp only, httpx resolves as part of `connect`)
+- connect - tcp connect for new connections. aiohttp does not report the tls handshake separately, so it is included here
+- tls - tls handshake for new connections (httpx only)
+- time_to_first_byte - request headers sent -> response headers received
+- body_transfer - response headers received -> response body read (streaming: stream exhausted)
+
+The timings are logged in `StandardLoggingPayload["connection_timings"]`, and exported as Prometheus histograms / OTEL spans.
+"""
+
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+from aiohttp import TraceConfig
+
+from litellm.types.utils import (
+    StandardLoggingConnectionPhase,
+    StandardLoggingConnectionTimings,
+)
+
+# request extension the timings are passed to the transport in
+CONNECTION_TIMINGS_EXTENSION = "litellm_connection_timings"
+
+# phase -> (start event, end event). A `None` start event is the request start
+CONNECTION_PHASES = {
+    "pool_wait": (None, "connection_acquired"),
+    "dns": ("dns_start", "dns_end"),
+    "connect": ("connect_start", "connect_end"),
+    "tls": ("tls_start", "tls_end"),
+    "time_to_first_byte": ("request_sent", "response_headers"),
+    "body_transfer": ("response_headers", "response_end"),
+}
+
+HttpcoreTrace = Callable[[str, dict], Awaitable[None]]
+
+
+class ConnectionPhaseTimings:
+    def __init__(self):
+        self.start_time = time.time()
+        self._start = time.perf_counter()
+        # event -> time.perf_counter()
+        self.events: Dict[str, float] = {}
+        self.connection_reused: Optional[bool] = None
+
+    def mark(self, event: str) -> None:
+        self.events[event] = time.perf_counter()
+
+    def add_to_request(self, request: httpx.Request) -> None:
+        """
+        Record the timings of `request`, on either transport
+        """
+        request.extensions[CONNECTION_TIMINGS_EXTENSION] = self
+        request.extensions["trace"] = self._get_httpcore_trace(
+            request.extensions.get("trace")
+        )
+
+    def _get_httpcore_trace(
+        self, request_trace: Optional[HttpcoreTrace] = None
+    ) -> HttpcoreTrace:
+        async def trace(event_name: str, info: dict) -> None:
+            self._on_httpcore_event(event_name)
+            if request_trace is not None:
+                await request_trace(event_name, info)
+
+        return trace
+
+    def _on_httpcore_event(self, event_name: str) -> None:
+        if event_name == "connection.connect_tcp.started":
+            self.connection_reused = False
+            self.mark("connection_acquired")
+            self.mark("connect_start")
+        elif event_name == "connection.connect_tcp.complete":
+            self.mark("connect_end")
+        elif event_name == "connection.start_tls.started":
+            self.mark("tls_start")
+        elif event_name == "connection.start_tls.complete":
+            self.mark("tls_end")
+        elif event_name.endswith(".send_request_headers.started"):
+            if self.connection_reused is None:
+                self.connection_reused = True
+                self.mark("connection_acquired")
+            self.mark("request_sent")
+        elif event_name.endswith(".receive_response_headers.complete"):
+            self.mark("response_headers")
+        elif event_name.endswith(".receive_response_body.complete"):
+            self.mark("response_end")
+
+    def get_phases(self) -> Dict[str, StandardLoggingConnectionPhase]:
+        phases: Dict[str, StandardLoggingConnectionPhase] = {}
+        for phase, (start_event, end_event) in CONNECTION_PHASES.items():
+            start = self._start if start_event is None else self.events.get(start_event)
+            end = self.events.get(end_event)
+            if start is None or end is None or end < start:
+                continue
+            phases[phase] = StandardLoggingConnectionPhase(
+                start_ms=round((start - self._start) * 1000, 3),
+                duration_ms=round((end - start) * 1000, 3),
+            )
+        return phases
+
+    def to_standard_logging_object(self) -> StandardLoggingConnectionTimings:
+        return StandardLoggingConnectionTimings(
+            start_time=self.start_time,
+            connection_reused=self.connection_reused,
+            phases=self.get_phases(),
+        )
+
+
+def _get_timings(trace_config_ctx: Any) -> Optional[ConnectionPhaseTimings]:
+    timings = getattr(trace_config_ctx, "trace_request_ctx", None)
+    if isinstance(timings, ConnectionPhaseTimings):
+        return timings
+    return None
+
+
+async def _on_connection_reuseconn(session, trace_config_ctx, params) -> None:
+    timings = _get_timings(trace_config_ctx)
+    if timings is not None:
+        timings.connection_reused = True
+        timings.mark("connection_acquired")
+
+
+async def _on_connection_create_start(session, trace_config_ctx, params) -> None:
+    timings = _get_timings(trace_config_ctx)
+    if timings is not None:
+        timings.connection_reused = False
+        timings.mark("connection_acquired")
+        timings.mark("connect_start")
+
+
+async def _on_dns_resolvehost_start(session, trace_config_ctx, params) -> None:
+    timings = _get_timings(trace_config_ctx)
+    if timings is not None:
+        timings.mark("dns_start")
+
+
+async def _on_dns_resolvehost_end(session, trace_config_ctx, params) -> None:
+    timings = _get_timings(trace_config_ctx)
+    if timings is not None:
+        timings.mark("dns_end")
+        # tcp connect starts once the host is resolved
+        timings.mark("connect_start")
+
+
+async def _on_connection_create_end(session, trace_config_ctx, params) -> None:
+    timings = _get_timings(trace_config_ctx)
+    if timings is not None:
+        timings.mark("connect_end")
+
+
+async def _on_request_headers_sent(session, trace_config_ctx, params) -> None:
+    timings = _get_timings(trace_config_ctx)
+    if timings is not None:
+        timings.mark("request_sent")
+
+
+async def _on_request_end(session, trace_config_ctx, params) -> None:
+    timings = _get_timings(trace_config_ctx)
+    if timings is not None:
+        timings.mark("response_headers")
+
+
+_connection_timings_trace_config: Optional[TraceConfig] = None
+
+
+def get_connection_timings_trace_config() -> TraceConfig:
+    """
+    aiohttp TraceConfig recording `ConnectionPhaseTimings` - pass it in `ClientSession(trace_configs=...)`.
+
+    Requests are only traced if they are sent with a `ConnectionPhaseTimings` as `trace_request_ctx`.
+    """
+    global _connection_timings_trace_config
+    if _connection_timings_trace_config is None:
+        trace_config = TraceConfig()
+        trace_config.on_connection_reuseconn.append(_on_connection_reuseconn)
+        trace_config.on_connection_create_start.append(_on_connection_create_start)
+        trace_config.on_dns_resolvehost_start.append(_on_dns_resolvehost_start)
+        trace_config.on_dns_resolvehost_end.append(_on_dns_resolvehost_end)
+        trace_config.on_connection_create_end.append(_on_connection_create_end)
+        trace_config.on_request_headers_sent.append(_on_request_headers_sent)
+        trace_config.on_request_end.append(_on_request_end)
+        trace_config.freeze()
+        _connection_timings_trace_config = trace_config
+    return _connection_timings_trace_config
@@ -31,7 +31,12 @@ from litellm.constants import (
     AIOHTTP_TTL_DNS_CACHE,
     DEFAULT_SSL_CIPHERS,
 )
+from litellm.litellm_core_utils.fast_json import json_dumps_bytes
 from litellm.litellm_core_utils.logging_utils import track_llm_api_timing
+from litellm.llms.custom_httpx.connection_timings import (
+    ConnectionPhaseTimings,
+    get_connection_timings_trace_config,
+)
 from litellm.types.llms.custom_http import *
 
 if TYPE_CHECKING:
@@ -98,6 +103,25 @@ def _prepare_request_data_and_content(
     return request_data, request_content
 
 
+def _prepare_json_content(
+    json: Any,
+    content: Any,
+    headers: Optional[dict],
+) -> Tuple[Any, Any, Optional[dict]]:
+    """
+    Serialize `json=` request bodies to bytes with `json_dumps_bytes` (orjson if installed), instead of httpx's stdlib json encoder.
+
+    Returns:
+        Tuple of (request_json, request_content, request_headers)
+    """
+    if json is None or content is not None:
+        return json, content, headers
+    request_headers = dict(headers) if headers is not None else {}
+    if not any(key.lower() == "content-type" for key in request_headers):
+        request_headers["Content-Type"] = "application/json"
+    return None, json_dumps_bytes(json), request_headers
+
+
 # Cache for SSL contexts to avoid creating duplicate contexts with the same configuration
 # Key: tuple of (cafile, ssl_security_level, ssl_ecdh_curve)
 # Value: ssl.SSLContext
@@ -334,11 +358,22 @@ class AsyncHTTPHandler:
             timeout = _DEFAULT_TIMEOUT
         # Create a client with a connection pool
 
-        transport = AsyncHTTPHandler._create_async_transport(
-            ssl_context=ssl_config if isinstance(ssl_config, ssl.SSLContext) else None,
-            ssl_verify=ssl_config if isinstance(ssl_config, bool) else None,
-            shared_session=shared_session,
-        )
+        transport: Optional[httpx.AsyncBaseTransport]
+        if litellm.upstream_connection_pool is True and ssl_verify is None:
+            # share one warm connection pool per upstream origin across all clients
+            from litellm.llms.custom_httpx.connection_pool_manager import (
+                upstream_connection_pool_manager,
+            )
+
+            transport = upstream_connection_pool_manager.get_transport()
+        else:
+            transport = AsyncHTTPHandler._create_async_transport(
+                ssl_context=(
+                    ssl_config if isinstance(ssl_config, ssl.SSLContext) else None
+                ),
+                ssl_verify=ssl_config if isinstance(ssl_config, bool) else None,
+                shared_session=shared_session,
+            )
 
         return httpx.AsyncClient(
             transport=transport,
@@ -404,18 +439,25 @@ class AsyncHTTPHandler:
             request_data, request_content = _prepare_request_data_and_content(
                 data, content
             )
+            request_json, request_content, request_headers = _prepare_json_content(
+                json=json, content=request_content, headers=headers
+            )
 
             req = self.client.build_request(
                 "POST",
                 url,
                 data=request_data,
-                json=json,
+                json=request_json,
                 params=params,
-                headers=headers,
+                headers=request_headers,
                 timeout=timeout,
                 files=files,
                 content=request_content,
             )
+            if logging_obj is not None:
+                connection_timings = ConnectionPhaseTimings()
+                connection_timings.add_to_request(req)
+                logging_obj.connection_timings = connection_timings
             response = await self.client.send(req, stream=stream)
             response.raise_for_status()
             return response
@@ -830,6 +872,7 @@ class AsyncHTTPHandler:
             client=lambda: ClientSession(
                 connector=TCPConnector(**transport_connector_kwargs),
                 trust_env=trust_env,
+                trace_configs=[get_connection_timings_trace_config()],
             ),
         )
 
@@ -940,22 +983,25 @@ class HTTPHandler:
             request_data, request_content = _prepare_request_data_and_content(
                 data, content
             )
+            request_json, request_content, request_headers = _prepare_json_content(
+                json=json, content=request_content, headers=headers
+            )
 
             if timeout is not None:
                 req = self.client.build_request(
                     "POST",
                     url,
                     data=request_data,  # type: ignore
-                    json=json,
+                    json=request_json,
                     params=params,
-                    headers=headers,
+                    headers=request_headers,
                     timeout=timeout,
                     files=files,
                     content=request_content,  # type: ignore
                 )
             else:
                 req = self.client.build_request(
-                    "POST", url, data=request_data, json=json, params=params, headers=headers, files=files, content=request_content  # type: ignore
+                    "POST", url, data=request_data, json=request_json, params=params, headers=request_headers, files=files, content=request_content  # type: ignore
                 )
             response = self.client.send(req, stream=stream)
             response.raise_for_status()
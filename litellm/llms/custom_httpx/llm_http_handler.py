@@ -21,7 +21,9 @@ import litellm.types
 import litellm.types.utils
 from litellm._logging import verbose_logger
 from litellm.constants import REALTIME_WEBSOCKET_MAX_MESSAGE_SIZE_BYTES
+from litellm.litellm_core_utils.fast_json import json_dumps_bytes
 from litellm.litellm_core_utils.realtime_streaming import RealTimeStreaming
+from litellm.litellm_core_utils.sse_decoder import aiter_sse_chunks, iter_sse_chunks
 from litellm.llms.base_llm.anthropic_messages.transformation import (
     BaseAnthropicMessagesConfig,
 )
@@ -160,7 +162,7 @@ class BaseLLMHTTPHandler:
                     data=(
                         signed_json_body
                         if signed_json_body is not None
-                        else json.dumps(data)
+                        else json_dumps_bytes(data)
                     ),
                     timeout=timeout,
                     stream=stream,
@@ -220,7 +222,7 @@ class BaseLLMHTTPHandler:
                     data=(
                         signed_json_body
                         if signed_json_body is not None
-                        else json.dumps(data)
+                        else json_dumps_bytes(data)
                     ),
                     timeout=timeout,
                     stream=stream,
@@ -604,7 +606,11 @@ class BaseLLMHTTPHandler:
             )
         else:
             completion_stream = provider_config.get_model_response_iterator(
-                streaming_response=response.iter_lines(),
+                streaming_response=(
+                    iter_sse_chunks(response.iter_bytes())
+                    if provider_config.supports_sse_byte_stream
+                    else response.iter_lines()
+                ),
                 sync_stream=True,
                 json_mode=json_mode,
             )
@@ -742,7 +748,12 @@ class BaseLLMHTTPHandler:
             )
         else:
             completion_stream = provider_config.get_model_response_iterator(
-                streaming_response=response.aiter_lines(), sync_stream=False
+                streaming_response=(
+                    aiter_sse_chunks(response.aiter_bytes())
+                    if provider_config.supports_sse_byte_stream
+                    else response.aiter_lines()
+                ),
+                sync_stream=False,
             )
         # LOGGING
         logging_obj.post_call(
@@ -858,7 +869,7 @@ class BaseLLMHTTPHandler:
             response = sync_httpx_client.post(
                 url=api_base,
                 headers=headers,
-                data=json.dumps(data),
+                data=json_dumps_bytes(data),
                 timeout=timeout,
             )
         except Exception as e:
@@ -992,7 +1003,7 @@ class BaseLLMHTTPHandler:
             response = sync_httpx_client.post(
                 url=api_base,
                 headers=headers,
-                data=json.dumps(data),
+                data=json_dumps_bytes(data),
                 timeout=timeout,
             )
         except Exception as e:
@@ -1034,7 +1045,7 @@ class BaseLLMHTTPHandler:
             response = await async_httpx_client.post(
                 url=api_base,
                 headers=headers,
-                data=json.dumps(request_data),
+                data=json_dumps_bytes(request_data),
                 timeout=timeout,
             )
         except Exception as e:
@@ -1909,7 +1920,7 @@ class BaseLLMHTTPHandler:
             response = await async_httpx_client.post(
                 url=request_url,
                 headers=headers,
-                data=signed_json_body or json.dumps(request_body),
+                data=signed_json_body or json_dumps_bytes(request_body),
                 stream=stream or False,
                 logging_obj=logging_obj,
             )
@@ -2847,7 +2858,9 @@ class BaseLLMHTTPHandler:
                         **headers,
                         **transformed_request["initial_request"]["headers"],
                     },
-                    data=json.dumps(transformed_request["initial_request"]["data"]),
+                    data=json_dumps_bytes(
+                        transformed_request["initial_request"]["data"]
+                    ),
                     timeout=timeout,
                 )
 
@@ -2958,7 +2971,9 @@ class BaseLLMHTTPHandler:
                         **headers,
                         **transformed_request["initial_request"]["headers"],
                     },
-                    data=json.dumps(transformed_request["initial_request"]["data"]),
+                    data=json_dumps_bytes(
+                        transformed_request["initial_request"]["data"]
+                    ),
                     timeout=timeout,
                 )
 
@@ -6130,7 +6145,9 @@ class BaseLLMHTTPHandler:
         )
 
         request_data = (
-            json.dumps(request_body) if signed_json_body is None else signed_json_body
+            json_dumps_bytes(request_body)
+            if signed_json_body is None
+            else signed_json_body
         )
 
         try:
@@ -6233,7 +6250,9 @@ class BaseLLMHTTPHandler:
         )
 
         request_data = (
-            json.dumps(request_body) if signed_json_body is None else signed_json_body
+            json_dumps_bytes(request_body)
+            if signed_json_body is None
+            else signed_json_body
         )
 
         try:
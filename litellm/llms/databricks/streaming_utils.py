@@ -3,6 +3,7 @@ from typing import Optional
 
 import litellm
 from litellm import verbose_logger
+from litellm.llms.base_llm.base_model_iterator import BaseModelResponseIterator
 from litellm.types.llms.openai import (
     ChatCompletionToolCallChunk,
     ChatCompletionToolCallFunctionChunk,
@@ -11,9 +12,9 @@ from litellm.types.llms.openai import (
 from litellm.types.utils import GenericStreamingChunk, Usage
 
 
-class ModelResponseIterator:
+class ModelResponseIterator(BaseModelResponseIterator):
     def __init__(self, streaming_response, sync_stream: bool):
-        self.streaming_response = streaming_response
+        super().__init__(streaming_response=streaming_response, sync_stream=sync_stream)
 
     def chunk_parser(self, chunk: dict) -> GenericStreamingChunk:
         try:
@@ -72,14 +73,23 @@ class ModelResponseIterator:
         except json.JSONDecodeError:
             raise ValueError(f"Failed to decode JSON from chunk: {chunk}")
 
+    def _handle_string_chunk(self, str_line: str) -> Optional[GenericStreamingChunk]:
+        """Returns None for the `[DONE]` line"""
+        chunk = litellm.CustomStreamWrapper._strip_sse_data_from_chunk(str_line) or ""
+        chunk = chunk.strip()
+        if chunk == "[DONE]":
+            return None
+        if len(chunk) > 0:
+            json_chunk = json.loads(chunk)
+            return self.chunk_parser(chunk=json_chunk)
+        return _empty_chunk()
+
     # Sync iterator
     def __iter__(self):
         self.response_iterator = self.streaming_response
         return self
 
     def __next__(self):
-        if not hasattr(self, "response_iterator"):
-            self.response_iterator = self.streaming_response
         try:
             chunk = self.response_iterator.__next__()
         except StopIteration:
@@ -88,34 +98,14 @@ class ModelResponseIterator:
             raise RuntimeError(f"Error receiving chunk from stream: {e}")
 
         try:
-            chunk = litellm.CustomStreamWrapper._strip_sse_data_from_chunk(chunk) or ""
-            chunk = chunk.strip()
-            if len(chunk) > 0:
-                json_chunk = json.loads(chunk)
-                return self.chunk_parser(chunk=json_chunk)
-            else:
-                return GenericStreamingChunk(
-                    text="",
-                    is_finished=False,
-                    finish_reason="",
-                    usage=None,
-                    index=0,
-                    tool_use=None,
-                )
+            return self._handle_chunk(chunk) or _empty_chunk()
         except StopIteration:
             raise StopIteration
         except ValueError as e:
             verbose_logger.debug(
                 f"Error parsing chunk: {e},\nReceived chunk: {chunk}. Defaulting to empty chunk here."
             )
-            return GenericStreamingChunk(
-                text="",
-                is_finished=False,
-                finish_reason="",
-                usage=None,
-                index=0,
-                tool_use=None,
-            )
+            return _empty_chunk()
 
     # Async iterator
     def __aiter__(self):
@@ -133,33 +123,23 @@ class ModelResponseIterator:
             raise RuntimeError(f"Error receiving chunk from stream: {e}")
 
         try:
-            chunk = litellm.CustomStreamWrapper._strip_sse_data_from_chunk(chunk) or ""
-            chunk = chunk.strip()
-            if chunk == "[DONE]":
-                raise StopAsyncIteration
-            if len(chunk) > 0:
-                json_chunk = json.loads(chunk)
-                return self.chunk_parser(chunk=json_chunk)
-            else:
-                return GenericStreamingChunk(
-                    text="",
-                    is_finished=False,
-                    finish_reason="",
-                    usage=None,
-                    index=0,
-                    tool_use=None,
-                )
-        except StopAsyncIteration:
-            raise StopAsyncIteration
+            processed_chunk = self._handle_chunk(chunk)
         except ValueError as e:
             verbose_logger.debug(
                 f"Error parsing chunk: {e},\nReceived chunk: {chunk}. Defaulting to empty chunk here."
             )
-            return GenericStreamingChunk(
-                text="",
-                is_finished=False,
-                finish_reason="",
-                usage=None,
-                index=0,
-                tool_use=None,
-            )
+            return _empty_chunk()
+        if processed_chunk is None:
+            raise StopAsyncIteration
+        return processed_chunk
+
+
+def _empty_chunk() -> GenericStreamingChunk:
+    return GenericStreamingChunk(
+        text="",
+        is_finished=False,
+        finish_reason="",
+        usage=None,
+        index=0,
+        tool_use=None,
+    )
@@ -17,6 +17,7 @@ from typing import (
 
 import httpx
 
+from litellm.litellm_core_utils.sse_decoder import SSEChunk
 from litellm.llms.openai.chat.gpt_transformation import (
     OpenAIChatCompletionStreamingHandler,
 )
@@ -83,9 +84,15 @@ class GroqChatConfig(OpenAILikeChatConfig):
     def get_config(cls):
         return super().get_config()
 
+    @property
+    def supports_sse_byte_stream(self) -> bool:
+        return True
+
     def get_model_response_iterator(
         self,
-        streaming_response: Union[Iterator[str], AsyncIterator[str], ModelResponse],
+        streaming_response: Union[
+            Iterator[SSEChunk], AsyncIterator[SSEChunk], ModelResponse
+        ],
         sync_stream: bool,
         json_mode: Optional[bool] = False,
     ) -> Any:
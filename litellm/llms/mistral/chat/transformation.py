@@ -28,6 +28,7 @@ from litellm.litellm_core_utils.prompt_templates.common_utils import (
     handle_messages_with_content_list_to_str_conversion,
     strip_none_values_from_message,
 )
+from litellm.litellm_core_utils.sse_decoder import SSEChunk
 from litellm.llms.openai.chat.gpt_transformation import (
     OpenAIGPTConfig,
     OpenAIChatCompletionStreamingHandler,
@@ -608,9 +609,15 @@ class MistralConfig(OpenAIGPTConfig):
 
         return final_response_obj
 
+    @property
+    def supports_sse_byte_stream(self) -> bool:
+        return True
+
     def get_model_response_iterator(
         self,
-        streaming_response: Union[Iterator[str], AsyncIterator[str], ModelResponse],
+        streaming_response: Union[
+            Iterator[SSEChunk], AsyncIterator[SSEChunk], ModelResponse
+        ],
         sync_stream: bool,
         json_mode: Optional[bool] = False,
     ):
@@ -9,6 +9,7 @@ from urllib.parse import urlparse
 import httpx
 
 import litellm
+from litellm.litellm_core_utils.fast_json import json_dumps_bytes
 from litellm.litellm_core_utils.logging_utils import track_llm_api_timing
 from litellm.llms.base_llm.chat.transformation import BaseConfig, BaseLLMException
 from litellm.llms.custom_httpx.http_handler import (
@@ -294,7 +295,7 @@ class OCIChatConfig(BaseConfig):
             ValueError: If HTTP method is unsupported
         """
         oci_signer = optional_params.get("oci_signer")
-        body = json.dumps(request_data).encode("utf-8")
+        body = json_dumps_bytes(request_data)
         method = str(optional_params.get("method", "POST")).upper()
 
         if method not in ["POST", "GET", "PUT", "DELETE", "PATCH"]:
@@ -377,7 +378,7 @@ class OCIChatConfig(BaseConfig):
             )
 
         method = str(optional_params.get("method", "POST")).upper()
-        body = json.dumps(request_data).encode("utf-8")
+        body = json_dumps_bytes(request_data)
         parsed = urlparse(api_base)
         path = parsed.path or "/"
         host = parsed.netloc
@@ -20,6 +20,7 @@ from typing import (
 import httpx
 
 import litellm
+from litellm.litellm_core_utils.fast_json import response_json
 from litellm.litellm_core_utils.llm_response_utils.convert_dict_to_response import (
     _extract_reasoning_content,
     _handle_invalid_parallel_tool_calls,
@@ -30,6 +31,7 @@ from litellm.litellm_core_utils.prompt_templates.image_handling import (
     async_convert_url_to_base64,
     convert_url_to_base64,
 )
+from litellm.litellm_core_utils.sse_decoder import SSEChunk
 from litellm.llms.base_llm.base_model_iterator import BaseModelResponseIterator
 from litellm.llms.base_llm.base_utils import BaseLLMModelInfo
 from litellm.llms.base_llm.chat.transformation import BaseConfig, BaseLLMException
@@ -624,7 +626,7 @@ class OpenAIGPTConfig(BaseLLMModelInfo, BaseConfig):
 
         ## RESPONSE OBJECT
         try:
-            completion_response = raw_response.json()
+            completion_response = response_json(raw_response)
         except Exception as e:
             response_headers = getattr(raw_response, "headers", None)
             raise OpenAIError(
@@ -752,9 +754,19 @@ class OpenAIGPTConfig(BaseLLMModelInfo, BaseConfig):
     def get_base_model(model: Optional[str] = None) -> Optional[str]:
         return model
 
+    @property
+    def supports_sse_byte_stream(self) -> bool:
+        # subclasses returning their own response iterator opt in explicitly
+        return (
+            type(self).get_model_response_iterator
+            is OpenAIGPTConfig.get_model_response_iterator
+        )
+
     def get_model_response_iterator(
         self,
-        streaming_response: Union[Iterator[str], AsyncIterator[str], ModelResponse],
+        streaming_response: Union[
+            Iterator[SSEChunk], AsyncIterator[SSEChunk], ModelResponse
+        ],
         sync_stream: bool,
         json_mode: Optional[bool] = False,
     ) -> Any:
@@ -11,6 +11,7 @@ import httpx
 
 import litellm
 from litellm import LlmProviders
+from litellm.litellm_core_utils.sse_decoder import aiter_sse_chunks, iter_sse_chunks
 from litellm.llms.bedrock.chat.invoke_handler import MockResponseIterator
 from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
 from litellm.llms.databricks.streaming_utils import ModelResponseIterator
@@ -50,7 +51,8 @@ async def make_call(
         completion_stream = MockResponseIterator(model_response=model_response)
     else:
         completion_stream = ModelResponseIterator(
-            streaming_response=response.aiter_lines(), sync_stream=False
+            streaming_response=aiter_sse_chunks(response.aiter_bytes()),
+            sync_stream=False,
         )
     # LOGGING
     logging_obj.post_call(
@@ -94,7 +96,8 @@ def make_sync_call(
         completion_stream = MockResponseIterator(model_response=model_response)
     else:
         completion_stream = ModelResponseIterator(
-            streaming_response=response.iter_lines(), sync_stream=True
+            streaming_response=iter_sse_chunks(response.iter_bytes()),
+            sync_stream=True,
         )
 
     # LOGGING
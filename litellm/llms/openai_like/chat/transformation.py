@@ -6,6 +6,9 @@ from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
 
 import httpx
 
+from litellm.litellm_core_utils.fast_json import (
+    response_json as fast_response_json,
+)
 from litellm.secret_managers.main import get_secret_str
 from litellm.types.llms.openai import AllMessageValues, ChatCompletionAssistantMessage
 from litellm.types.utils import ModelResponse
@@ -94,7 +97,7 @@ class OpenAILikeChatConfig(OpenAIGPTConfig):
         custom_llm_provider: Optional[str],
         base_model: Optional[str],
     ) -> ModelResponse:
-        response_json = response.json()
+        response_json = fast_response_json(response)
         logging_obj.post_call(
             input=messages,
             api_key="",
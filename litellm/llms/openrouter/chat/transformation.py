@@ -12,6 +12,7 @@ from typing import Any, AsyncIterator, Iterator, List, Optional, Tuple, Union, c
 import httpx
 import litellm
 
+from litellm.litellm_core_utils.sse_decoder import SSEChunk
 from litellm.llms.base_llm.base_model_iterator import BaseModelResponseIterator
 from litellm.llms.base_llm.chat.transformation import BaseLLMException
 from litellm.types.llms.openai import AllMessageValues, ChatCompletionToolParam
@@ -235,9 +236,15 @@ class OpenrouterConfig(OpenAIGPTConfig):
             headers=headers,
         )
 
+    @property
+    def supports_sse_byte_stream(self) -> bool:
+        return True
+
     def get_model_response_iterator(
         self,
-        streaming_response: Union[Iterator[str], AsyncIterator[str], ModelResponse],
+        streaming_response: Union[
+            Iterator[SSEChunk], AsyncIterator[SSEChunk], ModelResponse
+        ],
         sync_stream: bool,
         json_mode: Optional[bool] = False,
     ) -> Any:
@@ -7,6 +7,7 @@ import litellm
 import httpx
 
 
+from litellm.litellm_core_utils.sse_decoder import SSEChunk
 from litellm.types.llms.openai import AllMessageValues
 from litellm.types.utils import ModelResponse
 
@@ -289,7 +290,9 @@ class GenAIHubOrchestrationConfig(OpenAIGPTConfig):
 
     def get_model_response_iterator(
             self,
-            streaming_response: Union[Iterator[str], AsyncIterator[str], "ModelResponse"],
+            streaming_response: Union[
+                Iterator[SSEChunk], AsyncIterator[SSEChunk], "ModelResponse"
+            ],
             sync_stream: bool,
             json_mode: Optional[bool] = False,
     ):
@@ -35,9 +35,12 @@ from litellm.constants import (
     DEFAULT_REASONING_EFFORT_MINIMAL_THINKING_BUDGET_GEMINI_2_5_FLASH_LITE,
     DEFAULT_REASONING_EFFORT_MINIMAL_THINKING_BUDGET_GEMINI_2_5_PRO,
 )
+from litellm.litellm_core_utils.fast_json import response_json
 from litellm.litellm_core_utils.prompt_templates.factory import (
     _encode_tool_call_id_with_signature,
 )
+from litellm.litellm_core_utils.sse_decoder import aiter_sse_chunks, iter_sse_chunks
+from litellm.llms.base_llm.base_model_iterator import BaseModelResponseIterator
 from litellm.llms.base_llm.chat.transformation import BaseConfig, BaseLLMException
 from litellm.llms.custom_httpx.http_handler import (
     AsyncHTTPHandler,
@@ -1885,7 +1888,7 @@ class VertexGeminiConfig(VertexAIBaseConfig, BaseConfig):
 
         ## RESPONSE OBJECT
         try:
-            completion_response = GenerateContentResponseBody(**raw_response.json())  # type: ignore
+            completion_response = GenerateContentResponseBody(**response_json(raw_response))  # type: ignore
         except Exception as e:
             raise VertexAIError(
                 message="Received={}, Error converting to valid response block={}. File an issue if litellm error - https://github.com/BerriAI/litellm/issues".format(
@@ -2087,7 +2090,7 @@ async def make_call(
         )
 
     completion_stream = ModelResponseIterator(
-        streaming_response=response.aiter_lines(),
+        streaming_response=aiter_sse_chunks(response.aiter_bytes()),
         sync_stream=False,
         logging_obj=logging_obj,
     )
@@ -2129,7 +2132,7 @@ def make_sync_call(
         )
 
     completion_stream = ModelResponseIterator(
-        streaming_response=response.iter_lines(),
+        streaming_response=iter_sse_chunks(response.iter_bytes()),
         sync_stream=True,
         logging_obj=logging_obj,
     )
@@ -2582,7 +2585,7 @@ class VertexLLM(VertexBase):
         )
 
 
-class ModelResponseIterator:
+class ModelResponseIterator(BaseModelResponseIterator):
     def __init__(
         self, streaming_response, sync_stream: bool, logging_obj: LoggingClass
     ):
@@ -2590,7 +2593,7 @@ class ModelResponseIterator:
             check_is_function_call,
         )
 
-        self.streaming_response = streaming_response
+        super().__init__(streaming_response=streaming_response, sync_stream=sync_stream)
         self.chunk_type: Literal["valid_json", "accumulated_json"] = "valid_json"
         self.accumulated_json = ""
         self.sent_first_chunk = False
@@ -2598,7 +2601,7 @@ class ModelResponseIterator:
         self.is_function_call = check_is_function_call(logging_obj)
         self.cumulative_tool_call_index: int = 0
 
-    def chunk_parser(self, chunk: dict) -> Optional["ModelResponseStream"]:
+    def chunk_parser(self, chunk: dict) -> "ModelResponseStream":
         try:
             verbose_logger.debug(f"RAW GEMINI CHUNK: {chunk}")
             from litellm.types.utils import ModelResponseStream
@@ -2692,25 +2695,25 @@ class ModelResponseIterator:
             # If it's not valid JSON yet, continue to the next event
             return None
 
+    def _handle_string_chunk(self, str_line: str) -> Optional["ModelResponseStream"]:
+        chunk = litellm.CustomStreamWrapper._strip_sse_data_from_chunk(str_line) or ""
+        if len(chunk) > 0:
+            """
+            Check if initial chunk valid json
+            - if partial json -> enter accumulated json logic
+            - if valid - continue
+            """
+            if self.chunk_type == "valid_json":
+                return self.handle_valid_json_chunk(chunk=chunk)
+            elif self.chunk_type == "accumulated_json":
+                return self.handle_accumulated_json_chunk(chunk=chunk)
+
+        return None
+
     def _common_chunk_parsing_logic(
-        self, chunk: str
+        self, chunk: Union[str, dict]
     ) -> Optional["ModelResponseStream"]:
-        try:
-            chunk = litellm.CustomStreamWrapper._strip_sse_data_from_chunk(chunk) or ""
-            if len(chunk) > 0:
-                """
-                Check if initial chunk valid json
-                - if partial json -> enter accumulated json logic
-                - if valid - continue
-                """
-                if self.chunk_type == "valid_json":
-                    return self.handle_valid_json_chunk(chunk=chunk)
-                elif self.chunk_type == "accumulated_json":
-                    return self.handle_accumulated_json_chunk(chunk=chunk)
-
-            return None
-        except Exception:
-            raise
+        return cast(Optional["ModelResponseStream"], self._handle_chunk(chunk))
 
     def __next__(self):
         try:
@@ -4,13 +4,19 @@ Base Vertex, Google AI Studio LLM Class
 Handles Authentication and generating request urls for Vertex AI and Google AI Studio
 """
 
+import functools
+import hashlib
 import json
 import os
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, Literal, Optional, Tuple
 
 import litellm
 from litellm._logging import verbose_logger
 from litellm.litellm_core_utils.asyncify import asyncify
+from litellm.litellm_core_utils.credential_refresh_manager import (
+    credential_refresh_manager,
+)
 from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
 from litellm.secret_managers.main import get_secret_str
 from litellm.types.llms.vertex_ai import VERTEX_CREDENTIALS_TYPES, VertexPartnerProvider
@@ -267,6 +273,68 @@ class VertexBase:
 
         credentials.refresh(Request())
 
+    @staticmethod
+    def _get_credentials_expiry(credentials: Any) -> Optional[float]:
+        """
+        Unix timestamp at which the google credentials' access token expires - google-auth stores it as a naive UTC datetime.
+        """
+        expiry = getattr(credentials, "expiry", None)
+        if not isinstance(expiry, datetime):
+            return None
+        if expiry.tzinfo is None:
+            expiry = expiry.replace(tzinfo=timezone.utc)
+        return expiry.timestamp()
+
+    @staticmethod
+    def _get_credentials_refresh_key(
+        credential_cache_key: Tuple, credentials: Any
+    ) -> Tuple[str, int]:
+        """
+        Key of the credentials object in `credential_refresh_manager`.
+
+        The credential cache key holds the raw service account json - so it is hashed. Each instance loads its own
+        credentials object, so its id is part of the key. While the refresh is scheduled / in flight it holds the
+        credentials object, so the id is not reused.
+        """
+        credentials_hash = hashlib.sha256(
+            json.dumps(credential_cache_key, default=str).encode("utf-8")
+        ).hexdigest()
+        return credentials_hash, id(credentials)
+
+    def _schedule_credentials_refresh(
+        self, credential_cache_key: Tuple, credentials: Any
+    ) -> None:
+        VertexBase._schedule_refresh(
+            refresh_key=self._get_credentials_refresh_key(
+                credential_cache_key, credentials
+            ),
+            credentials=credentials,
+        )
+
+    @staticmethod
+    def _schedule_refresh(refresh_key: Tuple[str, int], credentials: Any) -> None:
+        # the refresh does not hold on to `self` - instances can be per-request
+        credential_refresh_manager.schedule_refresh(
+            key=refresh_key,
+            refresh_fn=functools.partial(
+                VertexBase._refresh_credentials,
+                refresh_key=refresh_key,
+                credentials=credentials,
+            ),
+            expires_at=VertexBase._get_credentials_expiry(credentials),
+        )
+
+    @staticmethod
+    def _refresh_credentials(refresh_key: Tuple[str, int], credentials: Any) -> None:
+        """
+        Background refresh of cached credentials, before they expire. The credentials object is refreshed in place.
+        """
+        vertex_base = VertexBase()
+        credential_refresh_manager.load(
+            refresh_key, lambda: vertex_base.refresh_auth(credentials)
+        )
+        VertexBase._schedule_refresh(refresh_key=refresh_key, credentials=credentials)
+
     def _ensure_access_token(
         self,
         credentials: Optional[VERTEX_CREDENTIALS_TYPES],
@@ -464,8 +532,11 @@ class VertexBase:
         )
 
         # Clear the cached credentials
-        if credential_cache_key in self._credentials_project_mapping:
-            del self._credentials_project_mapping[credential_cache_key]
+        cached_entry = self._credentials_project_mapping.pop(credential_cache_key, None)
+        if isinstance(cached_entry, tuple):
+            credential_refresh_manager.cancel(
+                self._get_credentials_refresh_key(credential_cache_key, cached_entry[0])
+            )
 
         # Retry once with _retry_reauth=True to prevent infinite recursion
         try:
@@ -536,6 +607,9 @@ class VertexBase:
                 "Using cached credentials for project_id: %s",
                 credential_project_id,
             )
+            credential_refresh_manager.mark_used(
+                self._get_credentials_refresh_key(credential_cache_key, _credentials)
+            )
 
         else:
             verbose_logger.debug(
@@ -563,6 +637,7 @@ class VertexBase:
                 _credentials,
                 credential_project_id,
             )
+            self._schedule_credentials_refresh(credential_cache_key, _credentials)
 
         ## VALIDATE CREDENTIALS
         verbose_logger.debug(f"Validating credentials for project_id: {project_id}")
@@ -589,11 +664,18 @@ class VertexBase:
                 verbose_logger.debug(
                     f"Credentials expired, refreshing for project_id: {project_id}"
                 )
-                self.refresh_auth(_credentials)
+                # concurrent requests wait for one refresh, instead of each refreshing the token
+                credential_refresh_manager.load(
+                    self._get_credentials_refresh_key(
+                        credential_cache_key, _credentials
+                    ),
+                    lambda: self.refresh_auth(_credentials),
+                )
                 self._credentials_project_mapping[credential_cache_key] = (
                     _credentials,
                     credential_project_id,
                 )
+                self._schedule_credentials_refresh(credential_cache_key, _credentials)
             except Exception as e:
                 # if refresh fails, it's possible the user has re-authenticated via `gcloud auth application-default login`
                 # in this case, we should try to reload the credentials by clearing the cache and retrying
@@ -633,6 +715,11 @@ class VertexBase:
         if custom_llm_provider == "gemini":
             return "", ""
         else:
+            cached_access_token = self._get_cached_access_token(
+                credentials=credentials, project_id=project_id
+            )
+            if cached_access_token is not None:
+                return cached_access_token
             try:
                 return await asyncify(self.get_access_token)(
                     credentials=credentials,
@@ -641,6 +728,35 @@ class VertexBase:
             except Exception as e:
                 raise e
 
+    def _get_cached_access_token(
+        self,
+        credentials: Optional[VERTEX_CREDENTIALS_TYPES],
+        project_id: Optional[str],
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Returns the cached, unexpired access token and project id, without leaving the event loop. None if `get_access_token` has to load or refresh credentials.
+        """
+        cache_credentials = (
+            json.dumps(credentials) if isinstance(credentials, dict) else credentials
+        )
+        credential_cache_key = (cache_credentials, project_id)
+        cached_entry = self._credentials_project_mapping.get(credential_cache_key)
+        if not isinstance(cached_entry, tuple):
+            return None
+        _credentials, credential_project_id = cached_entry
+        if _credentials is None or _credentials.expired:
+            return None
+        if not isinstance(_credentials.token, str):
+            return None
+        if project_id is None and isinstance(credential_project_id, str):
+            project_id = credential_project_id
+        if project_id is None:
+            return None
+        credential_refresh_manager.mark_used(
+            self._get_credentials_refresh_key(credential_cache_key, _credentials)
+        )
+        return _credentials.token, project_id
+
     def set_headers(
         self, auth_header: Optional[str], extra_headers: Optional[dict]
     ) -> dict:
@@ -1464,6 +1464,7 @@ def completion(  # type: ignore # noqa: PLR0915
             max_retries=max_retries,
             timeout=timeout,
             litellm_request_debug=kwargs.get("litellm_request_debug", False),
+            litellm_cache_refresh=kwargs.get("litellm_cache_refresh"),
         )
         cast(LiteLLMLoggingObj, logging).update_environment_variables(
             model=model,
@@ -1934,6 +1934,14 @@ class ConfigGeneralSettings(LiteLLMPydanticObjectBase):
         description="[DEPRECATED] Use 'user_header_mappings' instead. When set, the header value is treated as the end user id unless overridden by user_header_mappings.",
     )
     user_header_mappings: Optional[List[UserHeaderMapping]] = None
+    stream_coalescing: Optional[Dict[str, int]] = Field(
+        None,
+        description="Merge streamed text deltas into one SSE event every `max_delay_ms` or `max_bytes`, for high-fanout clients. The first chunk is always sent immediately. Can be overridden in key/team metadata and deployment model_info.",
+    )
+    stream_passthrough: Optional[bool] = Field(
+        None,
+        description="Forward SSE events from OpenAI-compatible upstreams as-is (only `id` / `model` patched), when no guardrail, streaming hook or stream coalescing needs the parsed chunks. Chunks are parsed after the stream is done, for usage / cost logging. Can be overridden in key/team metadata and deployment model_info.",
+    )
     supported_db_objects: Optional[List[SupportedDBObjectType]] = Field(
         None,
         description="Fine-grained control over which object types to load from the database when store_model_in_db is True. Available types: 'models', 'mcp', 'guardrails', 'vector_stores', 'pass_through_endpoints', 'prompts', 'model_cost_map'. If not set, all objects are loaded (default behavior).",
@@ -325,6 +325,9 @@ async def check_if_request_size_is_safe(request: Request) -> bool:
         ProxyException: If the request size is too large
 
     """
+    from litellm.proxy.common_utils.http_parsing_utils import (
+        _get_proxy_request_body,
+    )
     from litellm.proxy.proxy_server import general_settings, premium_user
 
     max_request_size_mb = general_settings.get("max_request_size_mb", None)
@@ -355,9 +358,8 @@ async def check_if_request_size_is_safe(request: Request) -> bool:
                     param="content-length",
                 )
         else:
-            # If Content-Length is not available, read the body
-            body = await request.body()
-            body_size = len(body)
+            # If Content-Length is not available, read the body - shared with the request handler
+            body_size = (await _get_proxy_request_body(request)).size
             request_size_mb = bytes_to_mb(bytes_value=body_size)
 
             verbose_proxy_logger.debug(
@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 
 import litellm
 from litellm._logging import verbose_proxy_logger
-from litellm.caching.caching import RedisCache
+from litellm.caching.caching import RedisCache, TieredCache
 from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
 from litellm.litellm_core_utils.sensitive_data_masker import SensitiveDataMasker
 from litellm.proxy._types import ProxyErrorTypes, ProxyException
@@ -96,6 +96,11 @@ async def cache_ping():
                 status="healthy",
                 cache_type=str(litellm.cache.type),
                 litellm_cache_params=safe_dumps(litellm_cache_params),
+                tier_stats=(
+                    litellm.cache.cache.get_tier_stats()
+                    if isinstance(litellm.cache.cache, TieredCache)
+                    else None
+                ),
             )
     except Exception as e:
         import traceback
@@ -922,6 +922,9 @@ class ProxyBaseLLMRequestProcessing:
         verbose_proxy_logger.debug("inside generator")
         try:
             str_so_far = ""
+            run_post_call_streaming_hooks = (
+                proxy_logging_obj.has_post_call_streaming_hooks()
+            )
             async for (
                 chunk
             ) in proxy_logging_obj.async_post_call_streaming_iterator_hook(
@@ -930,19 +933,20 @@ class ProxyBaseLLMRequestProcessing:
                 request_data=request_data,
             ):
                 verbose_proxy_logger.debug(
-                    "async_data_generator: received streaming chunk - {}".format(chunk)
-                )
-                ### CALL HOOKS ### - modify outgoing data
-                chunk = await proxy_logging_obj.async_post_call_streaming_hook(
-                    user_api_key_dict=user_api_key_dict,
-                    response=chunk,
-                    data=request_data,
-                    str_so_far=str_so_far,
+                    "async_data_generator: received streaming chunk - %s", chunk
                 )
+                if run_post_call_streaming_hooks:
+                    ### CALL HOOKS ### - modify outgoing data
+                    chunk = await proxy_logging_obj.async_post_call_streaming_hook(
+                        user_api_key_dict=user_api_key_dict,
+                        response=chunk,
+                        data=request_data,
+                        str_so_far=str_so_far,
+                    )
 
-                if isinstance(chunk, (ModelResponse, ModelResponseStream)):
-                    response_str = litellm.get_response_string(response_obj=chunk)
-                    str_so_far += response_str
+                    if isinstance(chunk, (ModelResponse, ModelResponseStream)):
+                        response_str = litellm.get_response_string(response_obj=chunk)
+                        str_so_far += response_str
 
                 # Inject cost into Anthropic-style SSE usage for /v1/messages for any provider
                 model_name = request_data.get("model", "")
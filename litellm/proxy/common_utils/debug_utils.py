@@ -9,12 +9,21 @@ from collections import Counter
 from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
 
 from litellm import get_secret_str
 from litellm._logging import verbose_proxy_logger
-from litellm.constants import PYTHON_GC_THRESHOLD
-from litellm.proxy._types import UserAPIKeyAuth
+from litellm.constants import (
+    PYTHON_GC_THRESHOLD,
+    SAMPLING_PROFILER_DEFAULT_INTERVAL_MS,
+    SAMPLING_PROFILER_MAX_DURATION_SECONDS,
+)
+from litellm.proxy._types import CommonProxyErrors, LitellmUserRoles, UserAPIKeyAuth
 from litellm.proxy.auth.user_api_key_auth import user_api_key_auth
+from litellm.proxy.common_utils.sampling_profiler import (
+    MIN_INTERVAL_MS,
+    sampling_profiler,
+)
 
 router = APIRouter()
 
@@ -669,6 +678,106 @@ async def configure_gc_thresholds_endpoint(
     }
 
 
+def _check_proxy_admin(user_api_key_dict: UserAPIKeyAuth) -> None:
+    if user_api_key_dict.user_role != LitellmUserRoles.PROXY_ADMIN:
+        raise HTTPException(
+            status_code=403,
+            detail={
+                "error": "{}, your role={}".format(
+                    CommonProxyErrors.not_allowed_access.value,
+                    user_api_key_dict.user_role,
+                )
+            },
+        )
+
+
+@router.post("/debug/profiler/start", include_in_schema=False)
+async def start_sampling_profiler(
+    user_api_key_dict: UserAPIKeyAuth = Depends(user_api_key_auth),
+    interval_ms: float = Query(
+        SAMPLING_PROFILER_DEFAULT_INTERVAL_MS,
+        ge=MIN_INTERVAL_MS,
+        description="Time between stack samples, in milliseconds",
+    ),
+    duration_s: float = Query(
+        SAMPLING_PROFILER_MAX_DURATION_SECONDS,
+        gt=0,
+        le=SAMPLING_PROFILER_MAX_DURATION_SECONDS,
+        description="Stop the profiler automatically after this many seconds",
+    ),
+) -> Dict[str, Any]:
+    """
+    Start the sampling profiler on the worker serving this request. Admin only.
+
+    Samples the Python stacks of all threads (event loop + background threads) every `interval_ms`, and measures
+    event loop lag. Clears the previous profile.
+
+    Example:
+    curl -X POST "http://localhost:4000/debug/profiler/start?interval_ms=10&duration_s=60" -H "Authorization: Bearer sk-1234"
+
+    Then download the flamegraph input with GET /debug/profiler/flamegraph.
+    """
+    _check_proxy_admin(user_api_key_dict)
+    try:
+        sampling_profiler.start(interval_ms=interval_ms, duration_s=duration_s)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail={"error": str(e)})
+    return {
+        "message": "Sampling profiler started",
+        "pid": os.getpid(),
+        "interval_ms": interval_ms,
+        "duration_s": duration_s,
+    }
+
+
+@router.post("/debug/profiler/stop", include_in_schema=False)
+async def stop_sampling_profiler(
+    user_api_key_dict: UserAPIKeyAuth = Depends(user_api_key_auth),
+) -> Dict[str, Any]:
+    """
+    Stop the sampling profiler. The profile is kept until the next start. Admin only.
+
+    Example:
+    curl -X POST "http://localhost:4000/debug/profiler/stop" -H "Authorization: Bearer sk-1234"
+    """
+    _check_proxy_admin(user_api_key_dict)
+    sampling_profiler.stop()
+    return sampling_profiler.get_status()
+
+
+@router.get("/debug/profiler/status", include_in_schema=False)
+async def get_sampling_profiler_status(
+    user_api_key_dict: UserAPIKeyAuth = Depends(user_api_key_auth),
+    top_n: int = Query(20, ge=0, description="Number of most sampled stacks to return"),
+) -> Dict[str, Any]:
+    """
+    Sampling profiler status - sample counts, the most sampled stacks and the event loop lag histogram. Admin only.
+
+    Example:
+    curl "http://localhost:4000/debug/profiler/status?top_n=10" -H "Authorization: Bearer sk-1234"
+    """
+    _check_proxy_admin(user_api_key_dict)
+    return sampling_profiler.get_status(top_n=top_n)
+
+
+@router.get("/debug/profiler/flamegraph", include_in_schema=False)
+async def get_sampling_profiler_flamegraph(
+    user_api_key_dict: UserAPIKeyAuth = Depends(user_api_key_auth),
+) -> PlainTextResponse:
+    """
+    Profile as folded stacks ("frame;frame;frame count" per line). Admin only.
+
+    Render with flamegraph.pl, inferno or speedscope:
+    curl "http://localhost:4000/debug/profiler/flamegraph" -H "Authorization: Bearer sk-1234" > profile.folded
+    flamegraph.pl profile.folded > profile.svg
+    """
+    _check_proxy_admin(user_api_key_dict)
+    return PlainTextResponse(
+        sampling_profiler.get_folded_stacks(),
+        headers={"X-Profiler-Pid": str(os.getpid())},
+    )
+
+
 @router.get("/otel-spans", include_in_schema=False)
 async def get_otel_spans():
     from litellm.proxy.proxy_server import open_telemetry_logger
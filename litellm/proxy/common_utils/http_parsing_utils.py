@@ -13,6 +13,83 @@ from litellm.proxy.common_utils.callback_utils import (
 from litellm.types.router import Deployment
 
 
+PROXY_REQUEST_BODY_SCOPE_KEY = "litellm_request_body"
+
+
+class ProxyRequestBody:
+    """
+    Request-scoped body, shared by auth, routing and the endpoint handlers.
+
+    Keeps the raw bytes as received and the JSON body (parsed on first use) - so a request body is read and parsed once,
+    no matter how many stages look at it.
+
+    `raw_body` is the body as received. `json()` is not a copy - `_read_request_body` hands the same dict to its first
+    caller, which can update it. Use `_read_request_body` for the body as updated by the proxy.
+    """
+
+    def __init__(self, raw_body: bytes):
+        self.raw_body = raw_body
+        self._parsed_body: Optional[dict] = None
+
+    @property
+    def size(self) -> int:
+        """Size of the raw body in bytes"""
+        return len(self.raw_body)
+
+    def json(self) -> dict:
+        """
+        Parsed JSON body, parsed on first use and shared - not a copy. Empty dict for an empty body.
+
+        Raises:
+        - ProxyException: if the body is not valid JSON
+        """
+        if self._parsed_body is None:
+            self._parsed_body = _parse_json_body(self.raw_body)
+        return self._parsed_body
+
+
+async def _get_proxy_request_body(request: Request) -> ProxyRequestBody:
+    """
+    Get the request-scoped `ProxyRequestBody` - the raw body is read once per request.
+    """
+    request_body = request.scope.get(PROXY_REQUEST_BODY_SCOPE_KEY)
+    if isinstance(request_body, ProxyRequestBody):
+        return request_body
+    request_body = ProxyRequestBody(raw_body=await request.body())
+    request.scope[PROXY_REQUEST_BODY_SCOPE_KEY] = request_body
+    return request_body
+
+
+def _parse_json_body(body: bytes) -> dict:
+    # Return empty dict if body is empty or None
+    if not body:
+        return {}
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        # First try the standard json module which is more forgiving
+        # First decode bytes to string if needed
+        body_str = body.decode("utf-8") if isinstance(body, bytes) else body
+
+        # Replace invalid surrogate pairs
+        # This regex finds incomplete surrogate pairs
+        body_str = re.sub(r"[\uD800-\uDBFF](?![\uDC00-\uDFFF])", "", body_str)
+        # This regex finds low surrogates without high surrogates
+        body_str = re.sub(r"(?<![\uD800-\uDBFF])[\uDC00-\uDFFF]", "", body_str)
+
+        try:
+            return json.loads(body_str)
+        except json.JSONDecodeError:
+            # If both orjson and json.loads fail, throw a proper error
+            verbose_proxy_logger.error(f"Invalid JSON payload received: {str(e)}")
+            raise ProxyException(
+                message=f"Invalid JSON payload: {str(e)}",
+                type="invalid_request_error",
+                param="request_body",
+                code=status.HTTP_400_BAD_REQUEST,
+            )
+
+
 async def _read_request_body(request: Optional[Request]) -> Dict:
     """
     Safely read the request body and parse it as JSON.
@@ -42,41 +119,8 @@ async def _read_request_body(request: Optional[Request]) -> Dict:
             if "metadata" in parsed_body and isinstance(parsed_body["metadata"], str):
                 parsed_body["metadata"] = json.loads(parsed_body["metadata"])
         else:
-            # Read the request body
-            body = await request.body()
-
-            # Return empty dict if body is empty or None
-            if not body:
-                parsed_body = {}
-            else:
-                try:
-                    parsed_body = orjson.loads(body)
-                except orjson.JSONDecodeError as e:
-                    # First try the standard json module which is more forgiving
-                    # First decode bytes to string if needed
-                    body_str = body.decode("utf-8") if isinstance(body, bytes) else body
-
-                    # Replace invalid surrogate pairs
-                    # This regex finds incomplete surrogate pairs
-                    body_str = re.sub(
-                        r"[\uD800-\uDBFF](?![\uDC00-\uDFFF])", "", body_str
-                    )
-                    # This regex finds low surrogates without high surrogates
-                    body_str = re.sub(
-                        r"(?<![\uD800-\uDBFF])[\uDC00-\uDFFF]", "", body_str
-                    )
-
-                    try:
-                        parsed_body = json.loads(body_str)
-                    except json.JSONDecodeError:
-                        # If both orjson and json.loads fail, throw a proper error
-                        verbose_proxy_logger.error(f"Invalid JSON payload received: {str(e)}")
-                        raise ProxyException(
-                            message=f"Invalid JSON payload: {str(e)}",
-                            type="invalid_request_error",
-                            param="request_body",
-                            code=status.HTTP_400_BAD_REQUEST,
-                        )
+            # Read and parse the request body - shared with the other stages of the request
+            parsed_body = (await _get_proxy_request_body(request)).json()
 
         # Cache the parsed result
         _safe_set_request_parsed_body(request=request, parsed_body=parsed_body)
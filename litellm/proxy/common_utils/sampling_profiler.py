@@ -0,0 +1,286 @@
+"""
+Low-overhead sampling profiler for the proxy, switched on / off at runtime via the `/debug/profiler/*` endpoints.
+
+A sampler thread takes a snapshot of every thread's Python stack (`sys._current_frames()`) every `interval`, and counts
+identical stacks. This covers the event loop (the running task's coroutine frames, or the loop waiting in `select` when
+idle) and background threads (logging workers, batch flushers, ...), without instrumenting any function - unlike
+`performance_utils.profile_endpoint` (cProfile), which profiles one endpoint at a time.
+
+Samples of the event loop thread are grouped under the name of the running asyncio task, when known.
+
+While running, a task on the event loop measures event loop lag (how late a `sleep(interval)` wakes up) into a
+histogram.
+
+Exports:
+- `get_folded_stacks()` - folded stacks ("frame;frame;frame count" per line), for flamegraph.pl / speedscope / inferno
+- `get_status()` - sample counts, top stacks and the event loop lag histogram
+
+Profiles are per process - with multiple workers, each worker profiles itself.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Any, Dict, List, Optional, Tuple
+
+from litellm._logging import verbose_proxy_logger
+from litellm.constants import (
+    SAMPLING_PROFILER_DEFAULT_INTERVAL_MS,
+    SAMPLING_PROFILER_MAX_DURATION_SECONDS,
+    SAMPLING_PROFILER_MAX_STACKS,
+)
+
+# upper bounds (ms) of the event loop lag histogram buckets
+EVENT_LOOP_LAG_BUCKETS_MS: Tuple[float, ...] = (
+    1,
+    2,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    float("inf"),
+)
+
+MAX_STACK_DEPTH = 128
+# shortest time between samples - below this, the sampler thread keeps the GIL busy
+MIN_INTERVAL_MS = 1
+TRUNCATED_STACK = ("[truncated - too many distinct stacks]",)
+
+# (thread / task label, code objects from the outermost frame to the innermost)
+_StackKey = Tuple[Any, ...]
+
+
+def _format_code(code: Any) -> str:
+    name = getattr(code, "co_qualname", None) or code.co_name
+    return f"{os.path.basename(code.co_filename)}:{name}"
+
+
+def _task_name(task: Any) -> str:
+    coro = task.get_coro()
+    coro_name = getattr(coro, "__qualname__", None) or getattr(
+        coro, "__name__", type(coro).__name__
+    )
+    return f"task:{coro_name}"
+
+
+class EventLoopLagHistogram:
+    def __init__(self):
+        self.bucket_counts: List[int] = [0] * len(EVENT_LOOP_LAG_BUCKETS_MS)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, lag_ms: float) -> None:
+        for i, upper_bound in enumerate(EVENT_LOOP_LAG_BUCKETS_MS):
+            if lag_ms <= upper_bound:
+                self.bucket_counts[i] += 1
+                break
+        self.count += 1
+        self.sum_ms += lag_ms
+        self.max_ms = max(self.max_ms, lag_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "buckets_ms": {
+                ("+Inf" if upper_bound == float("inf") else str(upper_bound)): count
+                for upper_bound, count in zip(
+                    EVENT_LOOP_LAG_BUCKETS_MS, self.bucket_counts
+                )
+            },
+            "count": self.count,
+            "mean_ms": self.sum_ms / self.count if self.count else None,
+            "max_ms": self.max_ms if self.count else None,
+        }
+
+
+class SamplingProfiler:
+    def __init__(self, max_stacks: int = SAMPLING_PROFILER_MAX_STACKS):
+        self.max_stacks = max_stacks
+        self._lock = threading.Lock()
+        self._stacks: Counter = Counter()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._lag_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self.interval_s = SAMPLING_PROFILER_DEFAULT_INTERVAL_MS / 1000
+        self.started_at: Optional[float] = None
+        self.stopped_at: Optional[float] = None
+        self.samples = 0
+        self.sampling_time_s = 0.0
+        self.event_loop_lag = EventLoopLagHistogram()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(
+        self,
+        interval_ms: float = SAMPLING_PROFILER_DEFAULT_INTERVAL_MS,
+        duration_s: Optional[float] = SAMPLING_PROFILER_MAX_DURATION_SECONDS,
+    ) -> None:
+        """
+        Start sampling every `interval_ms`, for at most `duration_s` seconds. Clears the previous profile.
+
+        When called from the event loop, event loop samples are labelled with the running task, and event loop lag is
+        measured.
+        """
+        if self.running:
+            raise ValueError("Sampling profiler is already running")
+        if interval_ms < MIN_INTERVAL_MS:
+            raise ValueError(f"interval_ms must be >= {MIN_INTERVAL_MS}")
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        with self._lock:
+            self._stacks = Counter()
+        self.interval_s = interval_ms / 1000
+        self.samples = 0
+        self.sampling_time_s = 0.0
+        self.event_loop_lag = EventLoopLagHistogram()
+        self.started_at = time.time()
+        self.stopped_at = None
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident() if loop is not None else None
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(duration_s,),
+            name="litellm-sampling-profiler",
+            daemon=True,
+        )
+        self._thread.start()
+        if loop is not None:
+            self._lag_task = loop.create_task(self._measure_event_loop_lag())
+        verbose_proxy_logger.info(
+            "Sampling profiler started, interval=%sms, duration=%ss",
+            interval_ms,
+            duration_s,
+        )
+
+    def stop(self) -> None:
+        """Stop sampling. The profile is kept until the next `start`."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        if self._lag_task is not None:
+            self._lag_task.cancel()
+            self._lag_task = None
+        if self.started_at is not None and self.stopped_at is None:
+            self.stopped_at = time.time()
+            verbose_proxy_logger.info(
+                "Sampling profiler stopped after %s samples", self.samples
+            )
+
+    def _run(self, duration_s: Optional[float]) -> None:
+        deadline = time.monotonic() + duration_s if duration_s else None
+        own_thread_id = threading.get_ident()
+        while not self._stop_event.wait(self.interval_s):
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            sample_start = time.perf_counter()
+            try:
+                self._sample(own_thread_id)
+            except Exception as e:
+                verbose_proxy_logger.debug("Sampling profiler error: %s", e)
+            self.sampling_time_s += time.perf_counter() - sample_start
+        if self.stopped_at is None:
+            self.stopped_at = time.time()
+
+    def _sample(self, own_thread_id: int) -> None:
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        loop_task_label = None
+        if self._loop is not None:
+            try:
+                task = asyncio.current_task(self._loop)
+                if task is not None:
+                    loop_task_label = _task_name(task)
+            except Exception:
+                pass
+
+        sampled: List[_StackKey] = []
+        for thread_id, thread_frame in sys._current_frames().items():
+            if thread_id == own_thread_id:
+                continue
+            frame: Optional[FrameType] = thread_frame
+            codes: List[CodeType] = []
+            while frame is not None and len(codes) < MAX_STACK_DEPTH:
+                codes.append(frame.f_code)
+                frame = frame.f_back
+            codes.reverse()
+            label = thread_names.get(thread_id, f"thread-{thread_id}")
+            if thread_id == self._loop_thread_id and loop_task_label is not None:
+                sampled.append((label, loop_task_label, *codes))
+            else:
+                sampled.append((label, *codes))
+
+        with self._lock:
+            for key in sampled:
+                if key in self._stacks or len(self._stacks) < self.max_stacks:
+                    self._stacks[key] += 1
+                else:
+                    self._stacks[TRUNCATED_STACK] += 1
+            self.samples += 1
+
+    async def _measure_event_loop_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self.running:
+            scheduled = loop.time()
+            await asyncio.sleep(self.interval_s)
+            lag_s = loop.time() - scheduled - self.interval_s
+            self.event_loop_lag.observe(max(lag_s, 0) * 1000)
+
+    def _formatted_stacks(self) -> List[Tuple[str, int]]:
+        with self._lock:
+            stacks = list(self._stacks.items())
+        formatted: Counter = Counter()
+        for key, count in stacks:
+            formatted[
+                ";".join(
+                    part if isinstance(part, str) else _format_code(part)
+                    for part in key
+                )
+            ] += count
+        return formatted.most_common()
+
+    def get_folded_stacks(self) -> str:
+        """Folded stacks - one "frame;frame;frame count" line per distinct stack"""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self._formatted_stacks()
+        )
+
+    def get_status(self, top_n: int = 20) -> Dict[str, Any]:
+        end = self.stopped_at or time.time()
+        return {
+            "running": self.running,
+            "pid": os.getpid(),
+            "interval_ms": self.interval_s * 1000,
+            "started_at": self.started_at,
+            "stopped_at": self.stopped_at,
+            "duration_s": end - self.started_at if self.started_at else None,
+            "samples": self.samples,
+            # time spent sampling, i.e. the profiler's overhead
+            "sampling_time_ms": self.sampling_time_s * 1000,
+            "distinct_stacks": len(self._stacks),
+            "top_stacks": [
+                {"stack": stack, "count": count}
+                for stack, count in self._formatted_stacks()[:top_n]
+            ],
+            "event_loop_lag": self.event_loop_lag.to_dict(),
+        }
+
+
+# Global instance, used by the `/debug/profiler/*` endpoints
+sampling_profiler = SamplingProfiler()
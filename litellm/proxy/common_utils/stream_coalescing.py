@@ -0,0 +1,267 @@
+"""
+Coalesce streamed deltas into fewer SSE events.
+
+High-fanout clients (e.g. a browser tab per user, behind a websocket relay) pay per event, not per token.
+With `stream_coalescing` on, consecutive text deltas are merged, and flushed as one chunk every `max_delay_ms` or
+once they reach `max_bytes` - whichever comes first.
+
+- Chunks are sent immediately until the first one with text (time-to-first-token) - e.g. OpenAI's leading empty
+  `{"role": "assistant", "content": ""}` chunk doesn't count
+- Only plain `content` / `reasoning_content` deltas are merged. Any other chunk (tool calls, finish reason, usage,
+  multiple choices, errors) flushes the buffered text, and is sent as-is
+- Merging happens in `async_data_generator`, after `async_post_call_streaming_iterator_hook`. Logging and iterator
+  hooks see every provider chunk. `async_post_call_streaming_hook`, serialization and the socket write run once per
+  merged event.
+
+Config (most specific wins):
+- key metadata: `{"stream_coalescing": {"max_delay_ms": 100}}`, or `false` to turn it off for the key
+- team metadata: `{"stream_coalescing": {...}}`
+- deployment: `model_info: {"stream_coalescing": {...}}`
+- proxy wide: `general_settings: {"stream_coalescing": {...}}`
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, List, Optional, Tuple, TypedDict, Union
+
+from litellm.constants import (
+    STREAM_COALESCING_DEFAULT_MAX_BYTES,
+    STREAM_COALESCING_DEFAULT_MAX_DELAY_MS,
+)
+from litellm.proxy._types import UserAPIKeyAuth
+from litellm.types.utils import ModelResponseStream
+
+
+class StreamCoalescingSettings(TypedDict, total=False):
+    max_delay_ms: int
+    max_bytes: int
+
+
+def _get_setting_value(
+    source: Optional[dict], setting_name: str
+) -> Optional[Union[bool, dict]]:
+    if not isinstance(source, dict):
+        return None
+    value = source.get(setting_name)
+    if isinstance(value, (bool, dict)):
+        return value
+    return None
+
+
+def get_streaming_setting(
+    setting_name: str,
+    user_api_key_dict: UserAPIKeyAuth,
+    request_data: dict,
+    general_settings: dict,
+) -> Optional[Union[bool, dict]]:
+    """
+    Returns the most specific value of a proxy streaming setting (e.g. `stream_coalescing`) for the request, or None if
+    it isn't set - key metadata, team metadata, deployment `model_info`, then `general_settings`.
+    """
+    model_info: Optional[dict] = None
+    for metadata_key in ("metadata", "litellm_metadata"):
+        metadata = request_data.get(metadata_key)
+        if isinstance(metadata, dict) and isinstance(metadata.get("model_info"), dict):
+            model_info = metadata["model_info"]
+            break
+
+    for source in (
+        getattr(user_api_key_dict, "metadata", None),
+        getattr(user_api_key_dict, "team_metadata", None),
+        model_info,
+        general_settings,
+    ):
+        value = _get_setting_value(source, setting_name)
+        if value is not None:
+            return value
+    return None
+
+
+def get_stream_coalescing_settings(
+    user_api_key_dict: UserAPIKeyAuth,
+    request_data: dict,
+    general_settings: dict,
+) -> Optional[StreamCoalescingSettings]:
+    """
+    Returns the coalescing settings for the request, or None if coalescing is off.
+    """
+    value = get_streaming_setting(
+        setting_name="stream_coalescing",
+        user_api_key_dict=user_api_key_dict,
+        request_data=request_data,
+        general_settings=general_settings,
+    )
+    if value is None or value is False:
+        return None
+    settings = StreamCoalescingSettings(
+        max_delay_ms=STREAM_COALESCING_DEFAULT_MAX_DELAY_MS,
+        max_bytes=STREAM_COALESCING_DEFAULT_MAX_BYTES,
+    )
+    if isinstance(value, dict):
+        for key in ("max_delay_ms", "max_bytes"):
+            if value.get(key) is not None:
+                settings[key] = int(value[key])  # type: ignore[literal-required]
+    return settings
+
+
+def _get_mergeable_field(chunk: Any) -> Optional[str]:
+    """
+    Returns the delta field ("content" / "reasoning_content") of a plain text chunk, or None if the chunk can't be merged.
+    """
+    if not isinstance(chunk, ModelResponseStream) or len(chunk.choices) != 1:
+        return None
+    if getattr(chunk, "usage", None) is not None:
+        return None
+    choice = chunk.choices[0]
+    if (
+        choice.finish_reason is not None
+        or getattr(choice, "logprobs", None) is not None
+    ):
+        return None
+    delta = choice.delta
+    if (
+        delta.tool_calls is not None
+        or delta.function_call is not None
+        or getattr(delta, "audio", None) is not None
+        or getattr(delta, "images", None) is not None
+        or getattr(delta, "thinking_blocks", None) is not None
+        or getattr(delta, "annotations", None) is not None
+    ):
+        return None
+    content = delta.content
+    reasoning_content = getattr(delta, "reasoning_content", None)
+    if content and not reasoning_content:
+        return "content"
+    if reasoning_content and not content:
+        return "reasoning_content"
+    return None
+
+
+def _has_text(chunk: Any) -> bool:
+    """
+    Returns True if the chunk carries `content` / `reasoning_content` text.
+    """
+    if not isinstance(chunk, ModelResponseStream):
+        return False
+    return any(
+        choice.delta.content or getattr(choice.delta, "reasoning_content", None)
+        for choice in chunk.choices
+    )
+
+
+def _merge_chunks(chunks: List[ModelResponseStream], field: str) -> ModelResponseStream:
+    if len(chunks) == 1:
+        return chunks[0]
+    # chunks are also kept by the logging object - don't modify them
+    merged = chunks[0].model_copy(deep=True)
+    setattr(
+        merged.choices[0].delta,
+        field,
+        "".join(getattr(chunk.choices[0].delta, field) for chunk in chunks),
+    )
+    return merged
+
+
+# returned by `_next_chunk` when the buffered text is due before the next chunk arrives
+_FLUSH_DUE = object()
+
+
+class _TextBuffer:
+    def __init__(self):
+        self.chunks: List[ModelResponseStream] = []
+        self.field: Optional[str] = None
+        self.num_bytes = 0
+        self.flush_at = 0.0
+
+    def add(self, chunk: ModelResponseStream, field: str, flush_at: float) -> None:
+        if not self.chunks:
+            self.field = field
+            self.num_bytes = 0
+            self.flush_at = flush_at
+        self.chunks.append(chunk)
+        self.num_bytes += len(getattr(chunk.choices[0].delta, field).encode("utf-8"))
+
+    def flush(self) -> ModelResponseStream:
+        merged = _merge_chunks(self.chunks, self.field)  # type: ignore[arg-type]
+        self.chunks = []
+        return merged
+
+
+async def _next_chunk(
+    iterator: AsyncIterator[Any],
+    pending: Optional[asyncio.Future],
+    timeout: Optional[float],
+) -> Tuple[Any, Optional[asyncio.Future]]:
+    """
+    Wait for the next chunk, at most `timeout` seconds (None = no limit).
+
+    Returns (chunk, None), or (_FLUSH_DUE, pending read) if `timeout` passed first - the read is resumed on the next call.
+    Raises StopAsyncIteration at the end of the stream.
+    """
+    if pending is None:
+        if timeout is None:
+            return await iterator.__anext__(), None
+        pending = asyncio.ensure_future(iterator.__anext__())
+    if timeout is not None:
+        done, _ = await asyncio.wait({pending}, timeout=max(timeout, 0))
+        if not done:
+            return _FLUSH_DUE, pending
+    return await pending, None
+
+
+async def coalesce_stream(
+    stream: AsyncIterator[Any],
+    max_delay_ms: int = STREAM_COALESCING_DEFAULT_MAX_DELAY_MS,
+    max_bytes: int = STREAM_COALESCING_DEFAULT_MAX_BYTES,
+) -> AsyncIterator[Any]:
+    """
+    Yields the chunks of `stream`, with consecutive text deltas merged.
+
+    Buffered text is flushed after `max_delay_ms` even if the upstream stalls.
+    """
+    loop = asyncio.get_running_loop()
+    iterator = stream.__aiter__()
+    max_delay = max_delay_ms / 1000
+    buffer = _TextBuffer()
+    has_sent_first_token = False
+    pending: Optional[asyncio.Future] = None
+
+    try:
+        while True:
+            try:
+                chunk, pending = await _next_chunk(
+                    iterator,
+                    pending=pending,
+                    timeout=buffer.flush_at - loop.time() if buffer.chunks else None,
+                )
+            except StopAsyncIteration:
+                break
+            except Exception:
+                # send what the client has already been streamed, then surface the error
+                if buffer.chunks:
+                    yield buffer.flush()
+                raise
+
+            if chunk is _FLUSH_DUE:
+                yield buffer.flush()
+                continue
+            if not has_sent_first_token:
+                has_sent_first_token = _has_text(chunk)
+                yield chunk
+                continue
+
+            field = _get_mergeable_field(chunk)
+            if buffer.chunks and field != buffer.field:
+                yield buffer.flush()
+            if field is None:
+                yield chunk
+                continue
+
+            buffer.add(chunk, field, flush_at=loop.time() + max_delay)
+            if buffer.num_bytes >= max_bytes or loop.time() >= buffer.flush_at:
+                yield buffer.flush()
+
+        if buffer.chunks:
+            yield buffer.flush()
+    finally:
+        if pending is not None:
+            pending.cancel()
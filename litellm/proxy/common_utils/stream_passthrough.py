@@ -0,0 +1,285 @@
+"""
+Forward SSE events from OpenAI-compatible upstreams as-is, for pure-proxy streams.
+
+Without it, every streamed chunk is parsed into a `ModelResponseStream` (`CustomStreamWrapper`) and serialized again
+(`async_data_generator`). With `stream_passthrough` on, the upstream `data:` lines are forwarded, with only `id` /
+`model` patched to the values the proxy returns otherwise.
+
+- Only used when nothing needs the parsed chunks - the stream comes from the OpenAI SDK (`openai` and OpenAI-compatible
+  providers), and there's no stream coalescing, no per-chunk / iterator proxy hook (e.g. streaming guardrails), no
+  `post_call_rules`, no `async_post_call_streaming_deployment_hook`, no `merge_reasoning_content_in_choices` and no
+  `include_cost_in_streaming_usage`. Streams the router has already read from (request hedging) aren't forwarded.
+  Otherwise the stream takes the regular path.
+- Chunks are parsed lazily. While streaming, only chunks with `usage` or `error` are parsed - to drop usage the client
+  didn't ask for, and to raise upstream errors. All chunks are parsed once, after the stream is done, for usage / cost /
+  spend logging and caching.
+- Mid-stream fallbacks don't apply - an upstream error mid-stream is returned as an error event.
+
+Config (most specific wins):
+- key metadata: `{"stream_passthrough": true}`, or `false` to turn it off for the key
+- team metadata: `{"stream_passthrough": true}`
+- deployment: `model_info: {"stream_passthrough": true}`
+- proxy wide: `general_settings: {"stream_passthrough": true}`
+"""
+
+import asyncio
+import datetime
+import json
+import threading
+import traceback
+from typing import Any, AsyncIterator, List, Optional
+
+from openai import AsyncStream
+
+import litellm
+from litellm._logging import verbose_proxy_logger
+from litellm.integrations.custom_logger import CustomLogger
+from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
+from litellm.litellm_core_utils.thread_pool_executor import executor
+from litellm.proxy._types import UserAPIKeyAuth
+from litellm.proxy.common_utils.stream_coalescing import get_streaming_setting
+from litellm.types.utils import ModelResponseStream
+
+
+def is_stream_passthrough_enabled(
+    user_api_key_dict: UserAPIKeyAuth,
+    request_data: dict,
+    general_settings: dict,
+) -> bool:
+    return (
+        get_streaming_setting(
+            setting_name="stream_passthrough",
+            user_api_key_dict=user_api_key_dict,
+            request_data=request_data,
+            general_settings=general_settings,
+        )
+        is True
+    )
+
+
+def _has_streaming_deployment_hooks() -> bool:
+    from litellm.proxy.utils import _overrides_custom_logger_hook
+
+    return any(
+        isinstance(callback, CustomLogger)
+        and _overrides_custom_logger_hook(
+            callback, "async_post_call_streaming_deployment_hook"
+        )
+        for callback in litellm.callbacks
+    )
+
+
+def _get_passthrough_stream(response: Any) -> Optional[CustomStreamWrapper]:
+    """
+    Returns the deployment stream to forward as-is, or None if the stream has to take the regular path.
+    """
+    # the router's fallback wrapper - None if the router already read from the stream
+    stream = getattr(response, "model_response", response)
+    if type(stream) is not CustomStreamWrapper:
+        return None
+    if (
+        stream.custom_llm_provider != "openai"
+        and stream.custom_llm_provider not in litellm.openai_compatible_providers
+    ):
+        return None
+    if not isinstance(stream.completion_stream, AsyncStream):
+        return None
+    if stream.sent_first_chunk or len(stream.chunks) > 0:
+        return None
+    if (
+        stream.merge_reasoning_content_in_choices
+        or len(litellm.post_call_rules) > 0
+        or litellm.include_cost_in_streaming_usage
+        or _has_streaming_deployment_hooks()
+    ):
+        return None
+    return stream
+
+
+class _SSEChunkPatcher:
+    """
+    Sets `id` (the first upstream id) and `model` on upstream chunks, like `CustomStreamWrapper` does.
+
+    Chunks that already have the id, and the model (or the upstream model, seen before) are patched in the string.
+    Anything else (e.g. the first chunk) is parsed and serialized again.
+    """
+
+    def __init__(self, model: str):
+        self.model = model
+        self.response_id: Optional[str] = None
+        self._id_field: Optional[str] = None
+        self._model_field = '"model":' + json.dumps(model)
+        self._upstream_model_field: Optional[str] = None
+
+    def patch(self, data: str) -> str:
+        if self._id_field is not None and self._id_field in data:
+            if self._model_field in data:
+                return data
+            if (
+                self._upstream_model_field is not None
+                and self._upstream_model_field in data
+            ):
+                return data.replace(self._upstream_model_field, self._model_field, 1)
+        return self.patch_chunk(json.loads(data))
+
+    def patch_chunk(self, chunk: dict) -> str:
+        chunk_id = chunk.get("id")
+        if (
+            self.response_id is None
+            and isinstance(chunk_id, str)
+            and chunk_id.strip()
+        ):
+            self.response_id = chunk_id
+            self._id_field = '"id":' + json.dumps(chunk_id)
+        if self.response_id is not None:
+            chunk["id"] = self.response_id
+        upstream_model = chunk.get("model")
+        if isinstance(upstream_model, str) and upstream_model != self.model:
+            self._upstream_model_field = '"model":' + json.dumps(upstream_model)
+        chunk["model"] = self.model
+        return json.dumps(chunk, separators=(",", ":"))
+
+
+async def _log_passthrough_stream(
+    stream: CustomStreamWrapper, raw_chunks: List[str], response_id: Optional[str]
+) -> None:
+    """
+    Parse the forwarded chunks, and run success logging and caching for the complete response - like
+    `CustomStreamWrapper` does at the end of a stream.
+    """
+    try:
+        chunks: List[ModelResponseStream] = []
+        for data in raw_chunks:
+            chunk = json.loads(data)
+            if not isinstance(chunk, dict):
+                continue
+            if response_id is not None:
+                chunk["id"] = response_id
+            chunk["model"] = stream.model
+            chunks.append(ModelResponseStream(**chunk))
+        complete_streaming_response = litellm.stream_chunk_builder(
+            chunks=chunks,
+            messages=stream.messages,
+            logging_obj=stream.logging_obj,
+        )
+        if complete_streaming_response is not None:
+            await stream.async_cache_streaming_response(
+                processed_chunk=complete_streaming_response.model_copy(deep=True),
+                cache_hit=False,
+            )
+        else:
+            stream._release_in_flight_cache_request()
+        await stream.logging_obj.async_success_handler(
+            complete_streaming_response,
+            cache_hit=False,
+            start_time=None,
+            end_time=None,
+        )
+        executor.submit(
+            stream.logging_obj.success_handler,
+            complete_streaming_response,
+            cache_hit=False,
+            start_time=None,
+            end_time=None,
+        )
+    except Exception as e:
+        verbose_proxy_logger.exception(
+            "litellm.proxy.common_utils.stream_passthrough._log_passthrough_stream(): Exception occured - {}".format(
+                str(e)
+            )
+        )
+
+
+def _raise_on_upstream_error(stream: CustomStreamWrapper, chunk: dict) -> None:
+    """
+    Raise for an upstream error event, or a `finish_reason: error` chunk - like the OpenAI SDK / `CustomStreamWrapper`.
+    """
+    message: Optional[str] = None
+    if chunk.get("error"):
+        error = chunk["error"]
+        message = error.get("message") if isinstance(error, dict) else None
+        message = message or "An error occurred during streaming"
+    elif any(
+        isinstance(choice, dict) and choice.get("finish_reason") == "error"
+        for choice in chunk.get("choices") or []
+    ):
+        message = "{} raised a streaming error - finish_reason: error".format(
+            stream.custom_llm_provider
+        )
+    if message is not None:
+        raise litellm.APIError(
+            status_code=500,
+            message=message,
+            llm_provider=stream.custom_llm_provider or "openai",
+            model=stream.model,
+        )
+
+
+async def _passthrough_sse_events(stream: CustomStreamWrapper) -> AsyncIterator[str]:
+    completion_stream: AsyncStream = stream.completion_stream
+    upstream_response = completion_stream.response
+    patcher = _SSEChunkPatcher(model=stream.model)
+    raw_chunks: List[str] = []
+    is_done = False
+    try:
+        async for line in upstream_response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if not data:
+                continue
+            if data.startswith("[DONE]"):
+                break
+            if stream.logging_obj.completion_start_time is None:
+                stream.logging_obj._update_completion_start_time(
+                    completion_start_time=datetime.datetime.now()
+                )
+            raw_chunks.append(data)
+
+            if '"usage"' in data or '"error"' in data:
+                chunk = json.loads(data)
+                if not isinstance(chunk, dict):
+                    continue
+                _raise_on_upstream_error(stream=stream, chunk=chunk)
+                # usage is only sent if the client asked for it
+                if chunk.get("usage") is not None and not stream.send_stream_usage:
+                    del chunk["usage"]
+                    if not chunk.get("choices"):
+                        continue
+                data = patcher.patch_chunk(chunk)
+            else:
+                data = patcher.patch(data)
+            yield f"data: {data}\n\n"
+        is_done = True
+    except Exception as e:
+        traceback_exception = traceback.format_exc()
+        threading.Thread(
+            target=stream.logging_obj.failure_handler,
+            args=(e, traceback_exception),
+        ).start()
+        asyncio.create_task(
+            stream.logging_obj.async_failure_handler(e, traceback_exception)
+        )
+        raise
+    finally:
+        if not is_done:
+            # e.g. client disconnected
+            await stream.aclose()
+        await upstream_response.aclose()
+
+    asyncio.create_task(
+        _log_passthrough_stream(
+            stream=stream, raw_chunks=raw_chunks, response_id=patcher.response_id
+        )
+    )
+
+
+def get_sse_passthrough_events(response: Any) -> Optional[AsyncIterator[str]]:
+    """
+    Returns the upstream SSE events (`data: {...}\\n\\n`, without `[DONE]`) if the stream can be forwarded as-is,
+    else None.
+    """
+    stream = _get_passthrough_stream(response)
+    if stream is None:
+        return None
+    return _passthrough_sse_events(stream)
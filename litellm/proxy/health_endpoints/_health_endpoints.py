@@ -888,6 +888,42 @@ async def shared_health_check_status_endpoint(
         )
 
 
+@router.get(
+    "/health/connection_pools",
+    tags=["health"],
+    dependencies=[Depends(user_api_key_auth)],
+)
+async def connection_pools_endpoint():
+    """
+    Get per-origin stats for the upstream connection pools - idle / active connections, handshake latency.
+
+    Requires `litellm_settings: upstream_connection_pool: true`.
+    """
+    from litellm.llms.custom_httpx.connection_pool_manager import (
+        upstream_connection_pool_manager,
+    )
+
+    return {
+        "upstream_connection_pool_enabled": litellm.upstream_connection_pool,
+        "pools": upstream_connection_pool_manager.get_stats(),
+    }
+
+
+@router.get(
+    "/health/logging_workers",
+    tags=["health"],
+    dependencies=[Depends(user_api_key_auth)],
+)
+async def logging_workers_endpoint():
+    """
+    Get queue depth and latency metrics of the logging worker lanes - `default` (spend tracking, callbacks) and
+    `best_effort` (third-party logging exports).
+    """
+    from litellm.litellm_core_utils.logging_worker import get_logging_lane_metrics
+
+    return {"lanes": get_logging_lane_metrics()}
+
+
 db_health_cache = {"status": "unknown", "last_updated": datetime.now()}
 
 
@@ -23,6 +23,9 @@ from litellm.utils import get_end_user_id_for_cost_tracking
 
 
 class _ProxyDBLogger(CustomLogger):
+    # spend tracking - runs before best-effort loggers
+    logging_lane = "critical"
+
     async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
         await self._PROXY_track_cost_callback(
             kwargs, response_obj, start_time, end_time
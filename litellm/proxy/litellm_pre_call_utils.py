@@ -9,6 +9,12 @@ from starlette.datastructures import Headers
 import litellm
 from litellm._logging import verbose_logger, verbose_proxy_logger
 from litellm._service_logger import ServiceLogging
+from litellm.caching.in_memory_cache import InMemoryCache
+from litellm.constants import (
+    PROXY_REQUEST_TEMPLATE_CACHE_SIZE,
+    PROXY_REQUEST_TEMPLATE_CACHE_TTL,
+)
+from litellm.litellm_core_utils.fast_json import json_dumps_bytes
 from litellm.litellm_core_utils.safe_json_loads import safe_json_loads
 from litellm.proxy._types import (
     AddTeamCallback,
@@ -707,6 +713,50 @@ class LiteLLMProxyRequestSetup:
         )
         return data
 
+    @staticmethod
+    def add_team_level_controls(
+        team_metadata: dict, data: dict, _metadata_variable_name: str
+    ) -> dict:
+        ## TEAM-LEVEL SPEND LOGS/TAGS
+        if "tags" in team_metadata and team_metadata["tags"] is not None:
+            data[_metadata_variable_name]["tags"] = (
+                LiteLLMProxyRequestSetup._merge_tags(
+                    request_tags=data[_metadata_variable_name].get("tags"),
+                    tags_to_add=team_metadata["tags"],
+                )
+            )
+        if "disable_global_guardrails" in team_metadata and isinstance(
+            team_metadata["disable_global_guardrails"], bool
+        ):
+            data[_metadata_variable_name]["disable_global_guardrails"] = team_metadata[
+                "disable_global_guardrails"
+            ]
+        if "spend_logs_metadata" in team_metadata and isinstance(
+            team_metadata["spend_logs_metadata"], dict
+        ):
+            if "spend_logs_metadata" in data[_metadata_variable_name] and isinstance(
+                data[_metadata_variable_name]["spend_logs_metadata"], dict
+            ):
+                for key, value in team_metadata["spend_logs_metadata"].items():
+                    if (
+                        key not in data[_metadata_variable_name]["spend_logs_metadata"]
+                    ):  # don't override k-v pair sent by request (user request)
+                        data[_metadata_variable_name]["spend_logs_metadata"][
+                            key
+                        ] = value
+            else:
+                data[_metadata_variable_name]["spend_logs_metadata"] = team_metadata[
+                    "spend_logs_metadata"
+                ]
+
+        ## TEAM-LEVEL METADATA
+        data = LiteLLMProxyRequestSetup.add_management_endpoint_metadata_to_request_metadata(
+            data=data,
+            management_endpoint_metadata=team_metadata,
+            _metadata_variable_name=_metadata_variable_name,
+        )
+        return data
+
     @staticmethod
     def _merge_tags(request_tags: Optional[list], tags_to_add: Optional[list]) -> list:
         """
@@ -776,6 +826,197 @@ class LiteLLMProxyRequestSetup:
         return tags
 
 
+class KeyTeamRequestTemplate:
+    """
+    The key / team derived part of `add_litellm_data_to_request` - key / team tags, spend logs metadata, cache controls,
+    management endpoint metadata, dynamic logging callbacks, guardrails and enforced params.
+
+    Computed once per (key metadata, team metadata, proxy config) and reused by all requests made with the key, see
+    `get_key_team_request_template`. It is never modified after it is built - mutable values are copied into the
+    request.
+    """
+
+    def __init__(
+        self,
+        user_api_key_dict: UserAPIKeyAuth,
+        proxy_config: ProxyConfig,
+        general_settings: Optional[Dict[str, Any]],
+    ):
+        self.proxy_config = proxy_config
+        key_metadata = user_api_key_dict.metadata
+        team_metadata = user_api_key_dict.team_metadata or {}
+
+        # run the key / team controls on an empty request, then merge the result into each request
+        template_data: dict = {
+            "metadata": {
+                "user_api_key_auth_metadata": dict(key_metadata or {}),
+                "spend_logs_metadata": {},
+            }
+        }
+        LiteLLMProxyRequestSetup.add_key_level_controls(
+            key_metadata=key_metadata,
+            data=template_data,
+            _metadata_variable_name="metadata",
+        )
+        LiteLLMProxyRequestSetup.add_team_level_controls(
+            team_metadata=team_metadata,
+            data=template_data,
+            _metadata_variable_name="metadata",
+        )
+        template_metadata: dict = template_data["metadata"]
+        self.cache_controls: Optional[dict] = template_data.get("cache")
+        self.disable_fallbacks: Optional[bool] = template_data.get("disable_fallbacks")
+        self.tags: Optional[list] = template_metadata.get("tags")
+        self.disable_global_guardrails: Optional[bool] = template_metadata.get(
+            "disable_global_guardrails"
+        )
+        self.spend_logs_metadata: Optional[dict] = None
+        if isinstance(
+            (key_metadata or {}).get("spend_logs_metadata"), dict
+        ) or isinstance(team_metadata.get("spend_logs_metadata"), dict):
+            self.spend_logs_metadata = template_metadata["spend_logs_metadata"]
+        self.user_api_key_auth_metadata: dict = template_metadata[
+            "user_api_key_auth_metadata"
+        ]
+
+        self.callback_settings: Optional[TeamCallbackMetadata] = (
+            _get_dynamic_logging_metadata(
+                user_api_key_dict=user_api_key_dict, proxy_config=proxy_config
+            )
+        )
+        self.disabled_callbacks: Optional[list] = None
+        if key_metadata and "litellm_disabled_callbacks" in key_metadata:
+            disabled_callbacks = key_metadata["litellm_disabled_callbacks"]
+            if disabled_callbacks and isinstance(disabled_callbacks, list):
+                self.disabled_callbacks = disabled_callbacks
+
+        guardrails_data: dict = {"metadata": {}}
+        _add_guardrails_from_key_or_team_metadata(
+            key_metadata=key_metadata,
+            team_metadata=team_metadata,
+            data=guardrails_data,
+            metadata_variable_name="metadata",
+        )
+        self.guardrails: Optional[list] = guardrails_data["metadata"].get("guardrails")
+
+        self.enforced_params: Optional[list] = _get_enforced_params(
+            general_settings=general_settings, user_api_key_dict=user_api_key_dict
+        )
+
+    def add_key_and_team_controls_to_request(
+        self, data: dict, _metadata_variable_name: str
+    ) -> None:
+        """
+        Same as `add_key_level_controls` + `add_team_level_controls`, for the key / team of the template.
+        """
+        metadata = data[_metadata_variable_name]
+        if self.cache_controls is not None:
+            data["cache"] = dict(self.cache_controls)
+        if self.disable_fallbacks is not None:
+            data["disable_fallbacks"] = self.disable_fallbacks
+        if self.tags is not None:
+            metadata["tags"] = LiteLLMProxyRequestSetup._merge_tags(
+                request_tags=metadata.get("tags"), tags_to_add=self.tags
+            )
+        if self.disable_global_guardrails is not None:
+            metadata["disable_global_guardrails"] = self.disable_global_guardrails
+        if self.spend_logs_metadata is not None:
+            request_spend_logs_metadata = metadata.get("spend_logs_metadata")
+            if isinstance(request_spend_logs_metadata, dict):
+                for key, value in self.spend_logs_metadata.items():
+                    if (
+                        key not in request_spend_logs_metadata
+                    ):  # don't override k-v pair sent by request (user request)
+                        request_spend_logs_metadata[key] = value
+            else:
+                metadata["spend_logs_metadata"] = dict(self.spend_logs_metadata)
+        metadata["user_api_key_auth_metadata"] = dict(self.user_api_key_auth_metadata)
+
+    def add_callbacks_and_guardrails_to_request(
+        self, data: dict, _metadata_variable_name: str
+    ) -> None:
+        if self.callback_settings is not None:
+            data["success_callback"] = _copy_list(
+                self.callback_settings.success_callback
+            )
+            data["failure_callback"] = _copy_list(
+                self.callback_settings.failure_callback
+            )
+            if self.callback_settings.callback_vars is not None:
+                # unpack callback_vars in data
+                for k, v in self.callback_settings.callback_vars.items():
+                    data[k] = v
+        if self.disabled_callbacks is not None:
+            data["litellm_disabled_callbacks"] = list(self.disabled_callbacks)
+        if self.guardrails is not None:
+            data[_metadata_variable_name]["guardrails"] = list(self.guardrails)
+
+
+def _copy_list(value: Optional[list]) -> Optional[list]:
+    return list(value) if value is not None else None
+
+
+# key / team request templates, keyed by the key + team metadata they are built from
+_key_team_request_template_cache = InMemoryCache(
+    max_size_in_memory=PROXY_REQUEST_TEMPLATE_CACHE_SIZE,
+    default_ttl=PROXY_REQUEST_TEMPLATE_CACHE_TTL,
+)
+
+
+def get_key_team_request_template(
+    user_api_key_dict: UserAPIKeyAuth,
+    proxy_config: ProxyConfig,
+    general_settings: Optional[Dict[str, Any]],
+    premium_user: bool,
+) -> KeyTeamRequestTemplate:
+    """
+    Returns the cached `KeyTeamRequestTemplate` for the key / team of the request, builds it on a cache miss.
+
+    Keys with the same metadata share a template. Templates are rebuilt after `PROXY_REQUEST_TEMPLATE_CACHE_TTL` seconds,
+    or when the proxy config changes - see `invalidate_key_team_request_templates`.
+    """
+    general_settings = general_settings or {}
+    try:
+        cache_key = json_dumps_bytes(
+            [
+                user_api_key_dict.team_id,
+                user_api_key_dict.metadata,
+                user_api_key_dict.team_metadata,
+                general_settings.get("enforced_params"),
+                general_settings.get("service_account_settings"),
+                premium_user,
+            ]
+        )
+    except (TypeError, ValueError):
+        # metadata is not json serializable - don't cache the template
+        return KeyTeamRequestTemplate(
+            user_api_key_dict=user_api_key_dict,
+            proxy_config=proxy_config,
+            general_settings=general_settings,
+        )
+
+    template = _key_team_request_template_cache.get_cache(key=cache_key)
+    if (
+        isinstance(template, KeyTeamRequestTemplate)
+        and template.proxy_config is proxy_config
+    ):
+        return template
+    template = KeyTeamRequestTemplate(
+        user_api_key_dict=user_api_key_dict,
+        proxy_config=proxy_config,
+        general_settings=general_settings,
+    )
+    _key_team_request_template_cache.set_cache(key=cache_key, value=template)
+    return template
+
+
+def invalidate_key_team_request_templates() -> None:
+    """
+    Drop the cached key / team request templates. Called when the proxy config is updated.
+    """
+    _key_team_request_template_cache.flush_cache()
+
+
 async def add_litellm_data_to_request(  # noqa: PLR0915
     data: dict,
     request: Request,
@@ -929,49 +1170,15 @@ async def add_litellm_data_to_request(  # noqa: PLR0915
             general_settings.get("global_max_parallel_requests", None)
         )
 
-    ### KEY-LEVEL Controls
-    key_metadata = user_api_key_dict.metadata
-    data = LiteLLMProxyRequestSetup.add_key_level_controls(
-        key_metadata=key_metadata,
-        data=data,
-        _metadata_variable_name=_metadata_variable_name,
+    ### KEY-LEVEL / TEAM-LEVEL Controls - precomputed per key + team
+    key_team_request_template = get_key_team_request_template(
+        user_api_key_dict=user_api_key_dict,
+        proxy_config=proxy_config,
+        general_settings=general_settings,
+        premium_user=premium_user,
     )
-    ## TEAM-LEVEL SPEND LOGS/TAGS
-    team_metadata = user_api_key_dict.team_metadata or {}
-    if "tags" in team_metadata and team_metadata["tags"] is not None:
-        data[_metadata_variable_name]["tags"] = LiteLLMProxyRequestSetup._merge_tags(
-            request_tags=data[_metadata_variable_name].get("tags"),
-            tags_to_add=team_metadata["tags"],
-        )
-    if "disable_global_guardrails" in team_metadata and isinstance(
-        team_metadata["disable_global_guardrails"], bool
-    ):
-        data[_metadata_variable_name]["disable_global_guardrails"] = team_metadata[
-            "disable_global_guardrails"
-        ]
-    if "spend_logs_metadata" in team_metadata and isinstance(
-        team_metadata["spend_logs_metadata"], dict
-    ):
-        if "spend_logs_metadata" in data[_metadata_variable_name] and isinstance(
-            data[_metadata_variable_name]["spend_logs_metadata"], dict
-        ):
-            for key, value in team_metadata["spend_logs_metadata"].items():
-                if (
-                    key not in data[_metadata_variable_name]["spend_logs_metadata"]
-                ):  # don't override k-v pair sent by request (user request)
-                    data[_metadata_variable_name]["spend_logs_metadata"][key] = value
-        else:
-            data[_metadata_variable_name]["spend_logs_metadata"] = team_metadata[
-                "spend_logs_metadata"
-            ]
-
-    ## TEAM-LEVEL METADATA
-    data = (
-        LiteLLMProxyRequestSetup.add_management_endpoint_metadata_to_request_metadata(
-            data=data,
-            management_endpoint_metadata=team_metadata,
-            _metadata_variable_name=_metadata_variable_name,
-        )
+    key_team_request_template.add_key_and_team_controls_to_request(
+        data=data, _metadata_variable_name=_metadata_variable_name
     )
 
     # Team spend, budget - used by prometheus.py
@@ -1047,33 +1254,14 @@ async def add_litellm_data_to_request(  # noqa: PLR0915
     if tags is not None:
         data[_metadata_variable_name]["tags"] = tags
 
-    # Team Callbacks controls
-    callback_settings_obj = _get_dynamic_logging_metadata(
-        user_api_key_dict=user_api_key_dict, proxy_config=proxy_config
+    # Team Callbacks controls, disabled callbacks, key / team guardrails
+    key_team_request_template.add_callbacks_and_guardrails_to_request(
+        data=data, _metadata_variable_name=_metadata_variable_name
     )
-    if callback_settings_obj is not None:
-        data["success_callback"] = callback_settings_obj.success_callback
-        data["failure_callback"] = callback_settings_obj.failure_callback
-
-        if callback_settings_obj.callback_vars is not None:
-            # unpack callback_vars in data
-            for k, v in callback_settings_obj.callback_vars.items():
-                data[k] = v
 
-    # Add disabled callbacks from key metadata
-    if (
-        user_api_key_dict.metadata
-        and "litellm_disabled_callbacks" in user_api_key_dict.metadata
-    ):
-        disabled_callbacks = user_api_key_dict.metadata["litellm_disabled_callbacks"]
-        if disabled_callbacks and isinstance(disabled_callbacks, list):
-            data["litellm_disabled_callbacks"] = disabled_callbacks
-
-    # Guardrails
-    move_guardrails_to_metadata(
-        data=data,
-        _metadata_variable_name=_metadata_variable_name,
-        user_api_key_dict=user_api_key_dict,
+    # Guardrails from the request body
+    _add_request_guardrails_to_metadata(
+        data=data, _metadata_variable_name=_metadata_variable_name
     )
 
     # Team Model Aliases
@@ -1095,10 +1283,9 @@ async def add_litellm_data_to_request(  # noqa: PLR0915
     ## ENFORCED PARAMS CHECK
     # loop through each enforced param
     # example enforced_params ['user', 'metadata', 'metadata.generation_name']
-    _enforced_params_check(
+    _check_enforced_params(
         request_body=data,
-        general_settings=general_settings,
-        user_api_key_dict=user_api_key_dict,
+        enforced_params=key_team_request_template.enforced_params,
         premium_user=premium_user,
     )
 
@@ -1175,7 +1362,8 @@ def _get_enforced_params(
 ) -> Optional[list]:
     enforced_params: Optional[list] = None
     if general_settings is not None:
-        enforced_params = general_settings.get("enforced_params")
+        if general_settings.get("enforced_params") is not None:
+            enforced_params = list(general_settings["enforced_params"])
         if (
             "service_account_settings" in general_settings
             and check_if_token_is_service_account(user_api_key_dict) is True
@@ -1218,6 +1406,16 @@ def _enforced_params_check(
     enforced_params: Optional[list] = _get_enforced_params(
         general_settings=general_settings, user_api_key_dict=user_api_key_dict
     )
+    return _check_enforced_params(
+        request_body=request_body,
+        enforced_params=enforced_params,
+        premium_user=premium_user,
+    )
+
+
+def _check_enforced_params(
+    request_body: dict, enforced_params: Optional[list], premium_user: bool
+) -> bool:
     if enforced_params is None:
         return True
     if enforced_params and premium_user is not True:
@@ -1309,7 +1507,12 @@ def move_guardrails_to_metadata(
         data=data,
         metadata_variable_name=_metadata_variable_name,
     )
+    _add_request_guardrails_to_metadata(
+        data=data, _metadata_variable_name=_metadata_variable_name
+    )
+
 
+def _add_request_guardrails_to_metadata(data: dict, _metadata_variable_name: str):
     #########################################################################################
     # User's might send "guardrails" in the request body, we need to add them to the request metadata.
     # Since downstream logic requires "guardrails" to be in the request metadata
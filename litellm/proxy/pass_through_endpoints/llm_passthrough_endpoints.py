@@ -151,7 +151,8 @@ async def llm_passthrough_factory_proxy_route(
     # anthropic is streaming when 'stream' = True is in the body
     if request.method == "POST":
         if "multipart/form-data" not in request.headers.get("content-type", ""):
-            _request_body = await request.json()
+            # body parsed by auth - not parsed again
+            _request_body = await _read_request_body(request)
         else:
             _request_body = await get_form_data(request)
 
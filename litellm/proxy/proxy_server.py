@@ -252,6 +252,14 @@ from litellm.proxy.common_utils.openai_endpoint_utils import (
 )
 from litellm.proxy.common_utils.proxy_state import ProxyState
 from litellm.proxy.common_utils.reset_budget_job import ResetBudgetJob
+from litellm.proxy.common_utils.stream_coalescing import (
+    coalesce_stream,
+    get_stream_coalescing_settings,
+)
+from litellm.proxy.common_utils.stream_passthrough import (
+    get_sse_passthrough_events,
+    is_stream_passthrough_enabled,
+)
 from litellm.proxy.common_utils.swagger_utils import ERROR_RESPONSES
 from litellm.proxy.container_endpoints.endpoints import router as container_router
 from litellm.proxy.credential_endpoints.endpoints import router as credential_router
@@ -276,7 +284,10 @@ from litellm.proxy.hooks.prompt_injection_detection import (
 )
 from litellm.proxy.hooks.proxy_track_cost_callback import _ProxyDBLogger
 from litellm.proxy.image_endpoints.endpoints import router as image_router
-from litellm.proxy.litellm_pre_call_utils import add_litellm_data_to_request
+from litellm.proxy.litellm_pre_call_utils import (
+    add_litellm_data_to_request,
+    invalidate_key_team_request_templates,
+)
 from litellm.proxy.management_endpoints.budget_management_endpoints import (
     router as budget_management_router,
 )
@@ -639,6 +650,10 @@ async def _initialize_shared_aiohttp_session():
     try:
         from aiohttp import ClientSession, TCPConnector
 
+        from litellm.llms.custom_httpx.connection_timings import (
+            get_connection_timings_trace_config,
+        )
+
         connector_kwargs = {
             "keepalive_timeout": AIOHTTP_KEEPALIVE_TIMEOUT,
             "ttl_dns_cache": AIOHTTP_TTL_DNS_CACHE,
@@ -650,7 +665,10 @@ async def _initialize_shared_aiohttp_session():
             connector_kwargs["limit_per_host"] = AIOHTTP_CONNECTOR_LIMIT_PER_HOST
         
         connector = TCPConnector(**connector_kwargs)
-        session = ClientSession(connector=connector)
+        session = ClientSession(
+            connector=connector,
+            trace_configs=[get_connection_timings_trace_config()],
+        )
         
         verbose_proxy_logger.info(
             f"SESSION REUSE: Created shared aiohttp session for connection pooling (ID: {id(session)}, "
@@ -784,16 +802,16 @@ async def proxy_startup_event(app: FastAPI):
     ## Initialize shared aiohttp session for connection reuse
     shared_aiohttp_session = await _initialize_shared_aiohttp_session()
 
+    ## [Optional] Prewarm upstream connection pools
+    ProxyStartupEvent._prewarm_upstream_connection_pools(llm_router=llm_router)
+
     # End of startup event
     yield
 
-    # Shutdown event - close shared aiohttp session
-    if shared_aiohttp_session is not None:
-        try:
-            await shared_aiohttp_session.close()
-            verbose_proxy_logger.info("SESSION REUSE: Closed shared aiohttp session")
-        except Exception as e:
-            verbose_proxy_logger.error(f"Error closing shared aiohttp session: {e}")
+    # Shutdown event - close shared aiohttp session and upstream connection pools
+    await ProxyStartupEvent._close_http_connections(
+        shared_aiohttp_session=shared_aiohttp_session
+    )
 
     await proxy_shutdown_event()  # type: ignore[reportGeneralTypeIssues]
 
@@ -2026,6 +2044,8 @@ class ProxyConfig:
 
     def update_config_state(self, config: dict):
         self.config = config
+        # team callbacks are read from the config
+        invalidate_key_team_request_templates()
 
     def get_config_state(self):
         """
@@ -4165,26 +4185,61 @@ async def async_data_generator(
         # Use a list to accumulate response segments to avoid O(n^2) string concatenation
         str_so_far_parts: list[str] = []
         error_message: Optional[str] = None
-        async for chunk in proxy_logging_obj.async_post_call_streaming_iterator_hook(
+        stream_coalescing_settings = get_stream_coalescing_settings(
             user_api_key_dict=user_api_key_dict,
-            response=response,
             request_data=request_data,
+            general_settings=general_settings,
+        )
+        # pure-proxy streams - no per-chunk hooks, chunks are only serialized
+        run_post_call_streaming_hooks = (
+            proxy_logging_obj.has_post_call_streaming_hooks()
+        )
+
+        ## PASS-THROUGH - forward the upstream SSE events, if nothing needs the parsed chunks
+        passthrough_events = None
+        if (
+            stream_coalescing_settings is None
+            and run_post_call_streaming_hooks is False
+            and is_stream_passthrough_enabled(
+                user_api_key_dict=user_api_key_dict,
+                request_data=request_data,
+                general_settings=general_settings,
+            )
+            and not proxy_logging_obj.has_post_call_streaming_iterator_hooks(
+                request_data=request_data
+            )
         ):
+            passthrough_events = get_sse_passthrough_events(response)
+        if passthrough_events is not None:
+            async for event in passthrough_events:
+                yield event
+            yield "data: [DONE]\n\n"
+            return
+
+        chunks = proxy_logging_obj.async_post_call_streaming_iterator_hook(
+            user_api_key_dict=user_api_key_dict,
+            response=response,
+            request_data=request_data,
+        )
+        if stream_coalescing_settings is not None:
+            chunks = coalesce_stream(chunks, **stream_coalescing_settings)
+        async for chunk in chunks:
             verbose_proxy_logger.debug(
-                "async_data_generator: received streaming chunk - {}".format(chunk)
+                "async_data_generator: received streaming chunk - %s", chunk
             )
 
-            ### CALL HOOKS ### - modify outgoing data
-            chunk = await proxy_logging_obj.async_post_call_streaming_hook(
-                user_api_key_dict=user_api_key_dict,
-                response=chunk,
-                data=request_data,
-                str_so_far="".join(str_so_far_parts),
-            )
+            if run_post_call_streaming_hooks:
+                ### CALL HOOKS ### - modify outgoing data
+                chunk = await proxy_logging_obj.async_post_call_streaming_hook(
+                    user_api_key_dict=user_api_key_dict,
+                    response=chunk,
+                    data=request_data,
+                    str_so_far="".join(str_so_far_parts),
+                )
 
-            if isinstance(chunk, (ModelResponse, ModelResponseStream)):
-                response_str = litellm.get_response_string(response_obj=chunk)
-                str_so_far_parts.append(response_str)
+                if isinstance(chunk, (ModelResponse, ModelResponseStream)):
+                    response_str = litellm.get_response_string(response_obj=chunk)
+                    str_so_far_parts.append(response_str)
 
             if isinstance(chunk, BaseModel):
                 chunk = chunk.model_dump_json(exclude_none=True, exclude_unset=True)
@@ -4770,6 +4825,58 @@ class ProxyStartupEvent:
             prof.start()
             verbose_proxy_logger.debug("Datadog Profiler started......")
 
+    @classmethod
+    def _prewarm_upstream_connection_pools(cls, llm_router: Optional[Router]):
+        """
+        Open connections to every configured `api_base` - if `litellm.upstream_connection_pool` is True
+
+        Runs in the background, so it does not block startup.
+        """
+        if litellm.upstream_connection_pool is not True or llm_router is None:
+            return
+        from litellm.llms.custom_httpx.connection_pool_manager import (
+            upstream_connection_pool_manager,
+        )
+
+        api_bases: List[str] = []
+        for deployment in llm_router.get_model_list() or []:
+            api_base = deployment.get("litellm_params", {}).get("api_base")
+            if isinstance(api_base, str) and api_base.startswith("os.environ/"):
+                api_base = get_secret_str(api_base)
+            if isinstance(api_base, str) and api_base.startswith("http"):
+                api_bases.append(api_base)
+        if len(api_bases) == 0:
+            return
+        verbose_proxy_logger.info(
+            "Prewarming upstream connection pools for %s api_bases", len(api_bases)
+        )
+        asyncio.create_task(upstream_connection_pool_manager.prewarm(api_bases))
+
+    @classmethod
+    async def _close_http_connections(
+        cls, shared_aiohttp_session: Optional["ClientSession"]
+    ):
+        """
+        On shutdown - close the shared aiohttp session, and the upstream connection pools (if `litellm.upstream_connection_pool` is True)
+        """
+        if shared_aiohttp_session is not None:
+            try:
+                await shared_aiohttp_session.close()
+                verbose_proxy_logger.info(
+                    "SESSION REUSE: Closed shared aiohttp session"
+                )
+            except Exception as e:
+                verbose_proxy_logger.error(
+                    f"Error closing shared aiohttp session: {e}"
+                )
+
+        if litellm.upstream_connection_pool is True:
+            from litellm.llms.custom_httpx.connection_pool_manager import (
+                upstream_connection_pool_manager,
+            )
+
+            await upstream_connection_pool_manager.close()
+
 
 #### API ENDPOINTS ####
 @router.get(
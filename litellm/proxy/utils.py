@@ -231,6 +231,17 @@ class InternalUsageCache:
         )
 
 
+def _overrides_custom_logger_hook(callback: CustomLogger, hook_name: str) -> bool:
+    """
+    True if `callback` implements `hook_name`, instead of inheriting the no-op default of `CustomLogger`.
+    """
+    if hook_name in getattr(callback, "__dict__", {}):
+        return True
+    return getattr(type(callback), hook_name, None) is not getattr(
+        CustomLogger, hook_name
+    )
+
+
 ### LOGGING ###
 class ProxyLogging:
     """
@@ -1584,6 +1595,12 @@ class ProxyLogging:
         if response_str is not None:
             for callback in litellm.callbacks:
                 try:
+                    if isinstance(
+                        callback, CustomLogger
+                    ) and not _overrides_custom_logger_hook(
+                        callback, "async_post_call_streaming_hook"
+                    ):
+                        continue
                     _callback: Optional[CustomLogger] = None
                     if isinstance(callback, CustomGuardrail):
                         # Main - V2 Guardrails implementation
@@ -1627,6 +1644,56 @@ class ProxyLogging:
                     raise e
         return response
 
+    def has_post_call_streaming_hooks(self) -> bool:
+        """
+        True if a callback checks / modifies the outgoing stream chunk by chunk, via `async_post_call_streaming_hook`.
+
+        If not, the streaming data generators skip `async_post_call_streaming_hook` and don't build the response
+        string so far.
+        """
+        for callback in litellm.callbacks:
+            _callback: Optional[CustomLogger] = None
+            if isinstance(callback, str):
+                _callback = litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class(
+                    cast(_custom_logger_compatible_callbacks_literal, callback)
+                )
+            else:
+                _callback = callback  # type: ignore
+            if isinstance(_callback, CustomLogger) and _overrides_custom_logger_hook(
+                _callback, "async_post_call_streaming_hook"
+            ):
+                return True
+        return False
+
+    def has_post_call_streaming_iterator_hooks(self, request_data: dict) -> bool:
+        """
+        True if `async_post_call_streaming_iterator_hook` wraps the stream for this request - a guardrail that runs on
+        the request, or a callback that implements the hook.
+        """
+        for callback in litellm.callbacks:
+            _callback: Optional[CustomLogger] = None
+            if isinstance(callback, str):
+                _callback = litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class(
+                    cast(_custom_logger_compatible_callbacks_literal, callback)
+                )
+            else:
+                _callback = callback  # type: ignore
+            if not isinstance(_callback, CustomLogger):
+                continue
+            if isinstance(
+                _callback, CustomGuardrail
+            ) and not _callback.should_run_guardrail(
+                data=request_data, event_type=GuardrailEventHooks.post_call
+            ):
+                continue
+            if "apply_guardrail" in type(
+                callback
+            ).__dict__ or _overrides_custom_logger_hook(
+                _callback, "async_post_call_streaming_iterator_hook"
+            ):
+                return True
+        return False
+
     async def async_post_call_streaming_iterator_hook(
         self,
         response,
@@ -1666,7 +1733,10 @@ class ProxyLogging:
                                 response=current_response,
                             )
                         )
-                    else:
+                    # the default hook yields the chunks unchanged
+                    elif _overrides_custom_logger_hook(
+                        _callback, "async_post_call_streaming_iterator_hook"
+                    ):
                         current_response = (
                             _callback.async_post_call_streaming_iterator_hook(
                                 user_api_key_dict=user_api_key_dict,
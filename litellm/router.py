@@ -109,12 +109,16 @@ from litellm.router_utils.handle_error import (
     async_raise_no_deployment_exception,
     send_llm_exception_alert,
 )
+from litellm.router_utils.pre_call_checks.adaptive_concurrency_check import (
+    AdaptiveConcurrencyCheck,
+)
 from litellm.router_utils.pre_call_checks.prompt_caching_deployment_check import (
     PromptCachingDeploymentCheck,
 )
 from litellm.router_utils.pre_call_checks.responses_api_deployment_check import (
     ResponsesApiDeploymentCheck,
 )
+from litellm.router_utils.request_hedging import RouterRequestHedging
 from litellm.router_utils.router_callbacks.track_deployment_metrics import (
     increment_deployment_failures_for_current_minute,
     increment_deployment_successes_for_current_minute,
@@ -136,6 +140,7 @@ from litellm.types.router import (
     CustomRoutingStrategyBase,
     Deployment,
     DeploymentTypedDict,
+    HedgingPolicy,
     LiteLLM_Params,
     MockRouterTestingParams,
     ModelGroupInfo,
@@ -265,6 +270,9 @@ class Router:
         allowed_fails_policy: Optional[
             AllowedFailsPolicy
         ] = None,  # set custom allowed fails policy
+        hedging_policy: Optional[
+            Union[HedgingPolicy, dict]
+        ] = None,  # hedge slow requests to another deployment in the model group
         cooldown_time: Optional[
             float
         ] = None,  # (seconds) time to cooldown a deployment after failure
@@ -313,6 +321,7 @@ class Router:
             retry_after (int): Minimum time to wait before retrying a failed request. Defaults to 0.
             allowed_fails (Optional[int]): Number of allowed fails before adding to cooldown. Defaults to None.
             cooldown_time (float): Time to cooldown a deployment after failure in seconds. Defaults to 1.
+            hedging_policy (Optional[HedgingPolicy]): Send requests that are slower than a percentile of the deployment's recent latency to a second deployment. Defaults to None.
             routing_strategy (Literal["simple-shuffle", "least-busy", "usage-based-routing", "latency-based-routing", "cost-based-routing"]): Routing strategy. Defaults to "simple-shuffle".
             routing_strategy_args (dict): Additional args for latency-based routing. Defaults to {}.
             alerting_config (AlertingConfig): Slack alerting configuration. Defaults to None.
@@ -624,6 +633,23 @@ class Router:
                 )
             )
 
+        self.request_hedging: Optional[RouterRequestHedging] = None
+        if hedging_policy is not None:
+            if isinstance(hedging_policy, dict):
+                hedging_policy = HedgingPolicy(**hedging_policy)
+            self.request_hedging = RouterRequestHedging(
+                litellm_router_instance=self,
+                hedging_policy=hedging_policy,
+                latency_handler=self._get_hedging_latency_handler(
+                    routing_strategy_args=routing_strategy_args
+                ),
+            )
+            verbose_router_logger.info(
+                "\033[32mRouter Hedging Policy Set:\n{}\033[0m".format(
+                    hedging_policy.model_dump(exclude_none=True)
+                )
+            )
+
         self.alerting_config: Optional[AlertingConfig] = alerting_config
 
         if optional_pre_call_checks is not None:
@@ -705,6 +731,20 @@ class Router:
         if self.cache.redis_cache is None:
             self.cache.redis_cache = cache
 
+    def _get_hedging_latency_handler(
+        self, routing_strategy_args: dict
+    ) -> LowestLatencyLoggingHandler:
+        """
+        Latency tracking for request hedging
+
+        Not added to `litellm.callbacks` - only one instance of a callback class is kept there, so a second router's
+        handler would never see a response. It's updated from this router's `deployment_callback_on_success` instead.
+        """
+        # own in-memory cache - other routing strategies use the same `{model_group}_map` keys
+        return LowestLatencyLoggingHandler(
+            router_cache=DualCache(), routing_args=routing_strategy_args
+        )
+
     def routing_strategy_init(
         self, routing_strategy: Union[RoutingStrategy, str], routing_strategy_args: dict
     ):
@@ -1109,6 +1149,8 @@ class Router:
                     )
                 elif pre_call_check == "responses_api_deployment_check":
                     _callback = ResponsesApiDeploymentCheck()
+                elif pre_call_check == "adaptive_concurrency":
+                    _callback = AdaptiveConcurrencyCheck()
                 if _callback is not None:
                     if self.optional_callbacks is None:
                         self.optional_callbacks = []
@@ -1308,11 +1350,14 @@ class Router:
         model_response: CustomStreamWrapper,
         messages: List[Dict[str, str]],
         initial_kwargs: dict,
+        prefetched_chunks: Optional[List[Any]] = None,
     ) -> CustomStreamWrapper:
         """
         Helper to iterate over a streaming response.
 
         Catches errors for fallbacks using the router's fallback system
+
+        `prefetched_chunks` - chunks already read from `model_response` (e.g. by request hedging), yielded first
         """
         from litellm.exceptions import MidStreamFallbackError
 
@@ -1326,6 +1371,10 @@ class Router:
                     logging_obj=model_response.logging_obj,
                 )
                 self._async_generator = async_generator
+                # the deployment's stream, if nothing was read from it yet - forwarded as-is by the proxy's `stream_passthrough`
+                self.model_response: Optional[CustomStreamWrapper] = (
+                    None if prefetched_chunks else model_response
+                )
 
             def __aiter__(self):
                 return self
@@ -1335,6 +1384,8 @@ class Router:
 
         async def stream_with_fallbacks():
             try:
+                for item in prefetched_chunks or []:
+                    yield item
                 async for item in model_response:
                     yield item
             except MidStreamFallbackError as e:
@@ -1447,7 +1498,6 @@ class Router:
         - semaphore specific to it's rpm
         - in the semaphore,  make a check against it's local rpm before running
         """
-        model_name = None
         _timeout_debug_deployment_dict = (
             {}
         )  # this is a temporary dict to debug timeout issues
@@ -1457,10 +1507,11 @@ class Router:
 
             parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
             start_time = time.time()
+            specific_deployment = kwargs.pop("specific_deployment", None)
             deployment = await self.async_get_available_deployment(
                 model=model,
                 messages=messages,
-                specific_deployment=kwargs.pop("specific_deployment", None),
+                specific_deployment=specific_deployment,
                 request_kwargs=kwargs,
             )
 
@@ -1478,6 +1529,68 @@ class Router:
                 )
             )
 
+            prefetched_chunks: Optional[List[Any]] = None
+            if (
+                self.request_hedging is not None
+                and not specific_deployment
+                and self.request_hedging.should_hedge(model_group=model)
+            ):
+                (
+                    response,
+                    prefetched_chunks,
+                ) = await self.request_hedging.async_call_with_hedging(
+                    model_group=model,
+                    deployment=deployment,
+                    messages=messages,
+                    kwargs=kwargs,
+                    parent_otel_span=parent_otel_span,
+                )
+            else:
+                response = await self._acompletion_call_deployment(
+                    deployment=deployment,
+                    model=model,
+                    messages=messages,
+                    kwargs=kwargs,
+                    parent_otel_span=parent_otel_span,
+                )
+
+            if isinstance(response, CustomStreamWrapper):
+                return await self._acompletion_streaming_iterator(
+                    model_response=response,
+                    messages=messages,
+                    initial_kwargs=input_kwargs_for_streaming_fallback,
+                    prefetched_chunks=prefetched_chunks,
+                )
+
+            return response
+        except litellm.Timeout as e:
+            deployment_request_timeout_param = _timeout_debug_deployment_dict.get(
+                "litellm_params", {}
+            ).get("request_timeout", None)
+            deployment_timeout_param = _timeout_debug_deployment_dict.get(
+                "litellm_params", {}
+            ).get("timeout", None)
+            e.message += f"\n\nDeployment Info: request_timeout: {deployment_request_timeout_param}\ntimeout: {deployment_timeout_param}"
+            raise e
+
+    async def _acompletion_call_deployment(
+        self,
+        deployment: dict,
+        model: str,
+        messages: List[Dict[str, str]],
+        kwargs: dict,
+        parent_otel_span: Optional[Span],
+    ) -> Union[
+        ModelResponse,
+        CustomStreamWrapper,
+    ]:
+        """
+        Make the `litellm.acompletion` call to the selected deployment, for `_acompletion`
+
+        Also used by request hedging, to call a second deployment.
+        """
+        model_name = None
+        try:
             # debug how often this deployment picked
 
             self._track_deployment_metrics(
@@ -1559,24 +1672,9 @@ class Router:
                 response=response,
                 parent_otel_span=parent_otel_span,
             )
-
-            if isinstance(response, CustomStreamWrapper):
-                return await self._acompletion_streaming_iterator(
-                    model_response=response,
-                    messages=messages,
-                    initial_kwargs=input_kwargs_for_streaming_fallback,
-                )
-
             return response
-        except litellm.Timeout as e:
-            deployment_request_timeout_param = _timeout_debug_deployment_dict.get(
-                "litellm_params", {}
-            ).get("request_timeout", None)
-            deployment_timeout_param = _timeout_debug_deployment_dict.get(
-                "litellm_params", {}
-            ).get("timeout", None)
-            e.message += f"\n\nDeployment Info: request_timeout: {deployment_request_timeout_param}\ntimeout: {deployment_timeout_param}"
-            raise e
+        except litellm.Timeout:
+            raise
         except Exception as e:
             verbose_router_logger.info(
                 f"litellm.acompletion(model={model_name})\033[31m Exception {str(e)}\033[0m"
@@ -4815,6 +4913,15 @@ class Router:
                     deployment_id=id,
                 )
 
+                ## track response times for request hedging
+                if self.request_hedging is not None:
+                    await self.request_hedging.latency_handler.async_log_success_event(
+                        kwargs=kwargs,
+                        response_obj=completion_response,
+                        start_time=start_time,
+                        end_time=end_time,
+                    )
+
                 ## if all are none, return - no need to track current tpm/rpm usage for models with no tpm/rpm set
                 if (
                     tpm is None
@@ -1,5 +1,6 @@
 #### What this does ####
 #   picks based on response time (for streaming, this is time to first token)
+import math
 import random
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
@@ -20,10 +21,17 @@ else:
     Span = Any
 
 
+def _get_seconds(value: Union[float, timedelta]) -> float:
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return float(value)
+
+
 class RoutingArgs(LiteLLMPydanticObjectBase):
     ttl: float = 1 * 60 * 60  # 1 hour
     lowest_latency_buffer: float = 0
     max_latency_list_size: int = 10
+    max_response_time_list_size: int = 100  # unnormalized response times, used for request hedging
 
 
 class LowestLatencyLoggingHandler(CustomLogger):
@@ -161,6 +169,14 @@ class LowestLatencyLoggingHandler(CustomLogger):
                             time_to_first_token
                         ]
 
+                ## Response time - not normalized by completion tokens
+                self._update_response_times(
+                    deployment_latency_map=request_count_dict[id],
+                    kwargs=kwargs,
+                    start_time=start_time,
+                    end_time=end_time,
+                )
+
                 if precise_minute not in request_count_dict[id]:
                     request_count_dict[id][precise_minute] = {}
 
@@ -383,6 +399,14 @@ class LowestLatencyLoggingHandler(CustomLogger):
                             time_to_first_token
                         ]
 
+                ## Response time - not normalized by completion tokens
+                self._update_response_times(
+                    deployment_latency_map=request_count_dict[id],
+                    kwargs=kwargs,
+                    start_time=start_time,
+                    end_time=end_time,
+                )
+
                 if precise_minute not in request_count_dict[id]:
                     request_count_dict[id][precise_minute] = {}
 
@@ -411,6 +435,55 @@ class LowestLatencyLoggingHandler(CustomLogger):
             )
             pass
 
+    def _update_response_times(
+        self, deployment_latency_map: dict, kwargs: dict, start_time, end_time
+    ) -> None:
+        """
+        Keep the last `max_response_time_list_size` response times / times to first token (seconds) of the deployment
+        """
+        max_size = self.routing_args.max_response_time_list_size
+        response_time = _get_seconds(end_time - start_time)
+        deployment_latency_map["response_time"] = (
+            deployment_latency_map.get("response_time", []) + [response_time]
+        )[-max_size:]
+        if kwargs.get("stream", None) is True:
+            time_to_first_token = _get_seconds(
+                kwargs.get("completion_start_time", end_time) - start_time
+            )
+            deployment_latency_map["time_to_first_token_response_time"] = (
+                deployment_latency_map.get("time_to_first_token_response_time", [])
+                + [time_to_first_token]
+            )[-max_size:]
+
+    async def async_get_response_time_percentile(
+        self,
+        model_group: str,
+        deployment_id: str,
+        percentile: float,
+        stream: bool = False,
+        min_samples: int = 1,
+    ) -> Optional[float]:
+        """
+        Returns the `percentile` of the deployment's recent response times in seconds (time to first token, if `stream`)
+
+        Returns None if fewer than `min_samples` responses were tracked.
+        """
+        request_count_dict = (
+            await self.router_cache.async_get_cache(
+                key=f"{model_group}_map", local_only=True
+            )
+            or {}
+        )
+        deployment_latency_map = request_count_dict.get(deployment_id) or {}
+        response_times = deployment_latency_map.get(
+            "time_to_first_token_response_time" if stream else "response_time", []
+        )
+        if len(response_times) == 0 or len(response_times) < min_samples:
+            return None
+        response_times = sorted(response_times)
+        index = math.ceil(percentile / 100 * len(response_times)) - 1
+        return response_times[min(max(index, 0), len(response_times) - 1)]
+
     def _get_available_deployments(  # noqa: PLR0915
         self,
         model_group: str,
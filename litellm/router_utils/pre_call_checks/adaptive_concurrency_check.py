@@ -0,0 +1,264 @@
+"""
+Adaptive concurrency limit per deployment
+
+Caps the in-flight requests of each deployment at a limit that follows the deployment's observed capacity:
+- latency gradient - the limit grows while latency stays within `ADAPTIVE_CONCURRENCY_LATENCY_TOLERANCE` of its long-term average, and shrinks as latency rises above it
+- rate limit errors / timeouts - the limit is multiplied by `ADAPTIVE_CONCURRENCY_BACKOFF_RATIO`
+
+Deployments at their limit are filtered out before routing. If every deployment is at its limit, the router returns a 'No deployments available' error, same as for rpm/tpm limits - without putting deployments in cooldown.
+
+Limits are tracked in-memory, per instance.
+"""
+
+import math
+import time
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Union
+
+import litellm
+from litellm._logging import verbose_router_logger
+from litellm.constants import (
+    ADAPTIVE_CONCURRENCY_BACKOFF_RATIO,
+    ADAPTIVE_CONCURRENCY_IN_FLIGHT_TTL_SECONDS,
+    ADAPTIVE_CONCURRENCY_INITIAL_LIMIT,
+    ADAPTIVE_CONCURRENCY_LATENCY_TOLERANCE,
+    ADAPTIVE_CONCURRENCY_MAX_LIMIT,
+    ADAPTIVE_CONCURRENCY_MIN_LIMIT,
+)
+from litellm.integrations.custom_logger import CustomLogger, Span
+from litellm.types.llms.openai import AllMessageValues
+from litellm.types.utils import ModelResponse
+
+# weight of a new latency sample in the long-term latency average
+LONG_TERM_LATENCY_SMOOTHING = 0.05
+# weight of a new limit, vs. the current one
+LIMIT_SMOOTHING = 0.2
+
+
+class DeploymentConcurrency:
+    def __init__(self, limit: float, max_limit: float):
+        self.limit = limit
+        self.max_limit = max_limit
+        # start times (monotonic) of the in-flight requests
+        self.in_flight: Deque[float] = deque()
+        # long-term latency average, for streaming (time to first token) / non-streaming (seconds per output token) requests
+        self.long_term_latency: Dict[bool, float] = {}
+
+    def get_in_flight(self) -> int:
+        expire_before = time.monotonic() - ADAPTIVE_CONCURRENCY_IN_FLIGHT_TTL_SECONDS
+        while self.in_flight and self.in_flight[0] < expire_before:
+            self.in_flight.popleft()
+        return len(self.in_flight)
+
+    def release(self) -> None:
+        if self.in_flight:
+            self.in_flight.popleft()
+
+
+class AdaptiveConcurrencyCheck(CustomLogger):
+    def __init__(
+        self,
+        initial_limit: float = ADAPTIVE_CONCURRENCY_INITIAL_LIMIT,
+        min_limit: float = ADAPTIVE_CONCURRENCY_MIN_LIMIT,
+        max_limit: float = ADAPTIVE_CONCURRENCY_MAX_LIMIT,
+        latency_tolerance: float = ADAPTIVE_CONCURRENCY_LATENCY_TOLERANCE,
+        backoff_ratio: float = ADAPTIVE_CONCURRENCY_BACKOFF_RATIO,
+    ):
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+        self.deployments: Dict[str, DeploymentConcurrency] = {}
+
+    def get_deployment_limit(self, model_id: str) -> Optional[int]:
+        """
+        Returns the current concurrency limit of the deployment, None if it was not called yet
+        """
+        deployment_concurrency = self.deployments.get(model_id)
+        if deployment_concurrency is None:
+            return None
+        return int(deployment_concurrency.limit)
+
+    def _get_deployment_concurrency(self, deployment: dict) -> DeploymentConcurrency:
+        model_id = deployment["model_info"]["id"]
+        deployment_concurrency = self.deployments.get(model_id)
+        if deployment_concurrency is None:
+            max_limit = (
+                deployment.get("litellm_params", {}).get("max_parallel_requests")
+                or self.max_limit
+            )
+            deployment_concurrency = DeploymentConcurrency(
+                limit=max(self.min_limit, min(self.initial_limit, max_limit)),
+                max_limit=max_limit,
+            )
+            self.deployments[model_id] = deployment_concurrency
+        return deployment_concurrency
+
+    async def async_filter_deployments(
+        self,
+        model: str,
+        healthy_deployments: List,
+        messages: Optional[List[AllMessageValues]],
+        request_kwargs: Optional[dict] = None,
+        parent_otel_span: Optional[Span] = None,
+    ) -> List[dict]:
+        """
+        Filter out deployments with `limit` requests in flight
+        """
+        available_deployments = []
+        for deployment in healthy_deployments:
+            deployment_concurrency = self.deployments.get(
+                deployment["model_info"]["id"]
+            )
+            if (
+                deployment_concurrency is None
+                or deployment_concurrency.get_in_flight()
+                < int(deployment_concurrency.limit)
+            ):
+                available_deployments.append(deployment)
+        if len(available_deployments) < len(healthy_deployments):
+            verbose_router_logger.debug(
+                "adaptive concurrency - %s/%s deployments at their limit, for model=%s",
+                len(healthy_deployments) - len(available_deployments),
+                len(healthy_deployments),
+                model,
+            )
+        return available_deployments
+
+    def pre_call_check(self, deployment: dict) -> Optional[dict]:
+        """
+        Count the request as in-flight, for the deployment it is sent to
+        """
+        self._get_deployment_concurrency(deployment).in_flight.append(time.monotonic())
+        return None
+
+    async def async_pre_call_check(
+        self, deployment: dict, parent_otel_span: Optional[Span]
+    ) -> Optional[dict]:
+        return self.pre_call_check(deployment)
+
+    def log_success_event(self, kwargs, response_obj, start_time, end_time):
+        self._on_success(kwargs, response_obj, start_time, end_time)
+
+    async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
+        self._on_success(kwargs, response_obj, start_time, end_time)
+
+    def log_failure_event(self, kwargs, response_obj, start_time, end_time):
+        self._on_failure(kwargs)
+
+    async def async_log_failure_event(self, kwargs, response_obj, start_time, end_time):
+        self._on_failure(kwargs)
+
+    def _get_deployment_concurrency_from_kwargs(
+        self, kwargs: dict
+    ) -> Optional[DeploymentConcurrency]:
+        model_id = (
+            (kwargs.get("litellm_params") or {}).get("model_info", {}).get("id", None)
+        )
+        if model_id is None:
+            return None
+        return self.deployments.get(str(model_id))
+
+    def _on_success(self, kwargs: dict, response_obj, start_time, end_time) -> None:
+        try:
+            deployment_concurrency = self._get_deployment_concurrency_from_kwargs(
+                kwargs
+            )
+            if deployment_concurrency is None:
+                return
+            deployment_concurrency.release()
+            stream = kwargs.get("stream", None) is True
+            latency = _get_latency_sample(
+                kwargs=kwargs,
+                response_obj=response_obj,
+                start_time=start_time,
+                end_time=end_time,
+                stream=stream,
+            )
+            if latency is not None and latency > 0:
+                self._update_limit(
+                    deployment_concurrency, latency=latency, stream=stream
+                )
+        except Exception as e:
+            verbose_router_logger.debug(
+                "adaptive concurrency - error updating limit: %s", str(e)
+            )
+
+    def _on_failure(self, kwargs: dict) -> None:
+        try:
+            deployment_concurrency = self._get_deployment_concurrency_from_kwargs(
+                kwargs
+            )
+            if deployment_concurrency is None:
+                return
+            deployment_concurrency.release()
+            exception = kwargs.get("exception", None)
+            if isinstance(exception, (litellm.RateLimitError, litellm.Timeout)):
+                deployment_concurrency.limit = max(
+                    self.min_limit, deployment_concurrency.limit * self.backoff_ratio
+                )
+        except Exception as e:
+            verbose_router_logger.debug(
+                "adaptive concurrency - error backing off limit: %s", str(e)
+            )
+
+    def _update_limit(
+        self,
+        deployment_concurrency: DeploymentConcurrency,
+        latency: float,
+        stream: bool,
+    ) -> None:
+        """
+        Gradient update - new limit = limit * min(1, tolerance * long-term latency / latency) + sqrt(limit)
+        """
+        long_term_latency = deployment_concurrency.long_term_latency.get(stream)
+        if long_term_latency is None:
+            deployment_concurrency.long_term_latency[stream] = latency
+            return
+        long_term_latency += (latency - long_term_latency) * LONG_TERM_LATENCY_SMOOTHING
+        deployment_concurrency.long_term_latency[stream] = long_term_latency
+
+        limit = deployment_concurrency.limit
+        gradient = max(
+            0.5, min(1.0, self.latency_tolerance * long_term_latency / latency)
+        )
+        new_limit = limit * gradient + math.sqrt(limit)
+        if new_limit > limit and deployment_concurrency.get_in_flight() < limit / 2:
+            # not using the current limit - no signal that more is ok
+            return
+        new_limit = limit * (1 - LIMIT_SMOOTHING) + new_limit * LIMIT_SMOOTHING
+        deployment_concurrency.limit = max(
+            self.min_limit, min(deployment_concurrency.max_limit, new_limit)
+        )
+
+
+def _get_timestamp(value: Union[datetime, float]) -> float:
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+def _get_latency_sample(
+    kwargs: dict,
+    response_obj,
+    start_time: Union[datetime, float],
+    end_time: Union[datetime, float],
+    stream: bool,
+) -> Optional[float]:
+    """
+    Time to first token for streaming requests, seconds per output token otherwise - comparable across requests with different output lengths
+    """
+    if stream:
+        completion_start_time = kwargs.get("completion_start_time", None)
+        if completion_start_time is None:
+            return None
+        return _get_timestamp(completion_start_time) - _get_timestamp(start_time)
+    response_seconds = _get_timestamp(end_time) - _get_timestamp(start_time)
+    usage = getattr(response_obj, "usage", None)
+    if isinstance(response_obj, ModelResponse) and usage is not None:
+        completion_tokens = getattr(usage, "completion_tokens", None) or 0
+        if completion_tokens > 0:
+            return response_seconds / completion_tokens
+    return response_seconds
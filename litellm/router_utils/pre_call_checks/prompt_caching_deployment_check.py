@@ -11,7 +11,6 @@ from litellm.caching.dual_cache import DualCache
 from litellm.integrations.custom_logger import CustomLogger, Span
 from litellm.types.llms.openai import AllMessageValues
 from litellm.types.utils import CallTypes, StandardLoggingPayload
-from litellm.utils import is_prompt_caching_valid_prompt
 
 from ..prompt_caching_cache import PromptCachingCache
 
@@ -28,9 +27,14 @@ class PromptCachingDeploymentCheck(CustomLogger):
         request_kwargs: Optional[dict] = None,
         parent_otel_span: Optional[Span] = None,
     ) -> List[dict]:
-        if messages is not None and is_prompt_caching_valid_prompt(
-            messages=messages,
-            model=model,
+        if messages is None:
+            return healthy_deployments
+        # tokenized once - for the validity check and the prefix lookup
+        prompt_token_counts = PromptCachingCache.get_prompt_token_counts(
+            messages=cast(List[AllMessageValues], messages), tools=None, model=model
+        )
+        if PromptCachingCache.is_cacheable_prompt(
+            prompt_token_counts
         ):  # prompt > 1024 tokens
             prompt_cache = PromptCachingCache(
                 cache=self.cache,
@@ -46,6 +50,22 @@ class PromptCachingDeploymentCheck(CustomLogger):
                     if deployment["model_info"]["id"] == model_id:
                         return [deployment]
 
+            ## LONGEST PREFIX - route to the deployment holding the longest cached prefix (e.g. earlier turns of this conversation)
+            prefix_model_ids = await prompt_cache.async_get_longest_prefix_model_ids(
+                messages=cast(List[AllMessageValues], messages),
+                tools=None,
+                model=model,
+                prompt_token_counts=prompt_token_counts,
+            )
+            if prefix_model_ids:
+                deployments_by_id = {
+                    deployment["model_info"]["id"]: deployment
+                    for deployment in healthy_deployments
+                }
+                for model_id in prefix_model_ids:
+                    if model_id in deployments_by_id:
+                        return [deployments_by_id[model_id]]
+
         return healthy_deployments
 
     async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
@@ -83,10 +103,10 @@ class PromptCachingDeploymentCheck(CustomLogger):
             return
 
         ## PROMPT CACHING - cache model id, if prompt caching valid prompt + provider
-        if is_prompt_caching_valid_prompt(
-            model=model,
-            messages=cast(List[AllMessageValues], messages),
-        ):
+        prompt_token_counts = PromptCachingCache.get_prompt_token_counts(
+            messages=cast(List[AllMessageValues], messages), tools=None, model=model
+        )
+        if PromptCachingCache.is_cacheable_prompt(prompt_token_counts):
             cache = PromptCachingCache(
                 cache=self.cache,
             )
@@ -95,5 +115,12 @@ class PromptCachingDeploymentCheck(CustomLogger):
                 messages=messages,
                 tools=None,  # [TODO]: add tools once standard_logging_object supports it
             )
+            await cache.async_add_model_id_to_prefix_index(
+                model_id=model_id,
+                messages=messages,
+                tools=None,
+                model=model,
+                prompt_token_counts=prompt_token_counts,
+            )
 
         return
@@ -10,6 +10,11 @@ from typing_extensions import TypedDict
 
 from litellm.caching.caching import DualCache
 from litellm.caching.in_memory_cache import InMemoryCache
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    MINIMUM_PROMPT_CACHE_TOKEN_COUNT,
+    PROMPT_CACHING_PREFIX_INDEX_MAX_BOUNDARIES,
+)
 from litellm.types.llms.openai import AllMessageValues, ChatCompletionToolParam
 
 if TYPE_CHECKING:
@@ -156,6 +161,125 @@ class PromptCachingCache:
         hashed_data = hashlib.sha256(data_to_hash_str.encode()).hexdigest()
         return f"deployment:{hashed_data}:prompt_caching"
 
+    @staticmethod
+    def get_prompt_token_counts(
+        messages: List[AllMessageValues],
+        tools: Optional[List[ChatCompletionToolParam]],
+        model: str,
+    ) -> List[int]:
+        """
+        Token count of the prompt up to and including each message - the last value is the token count of the whole prompt.
+
+        Each message is tokenized once, so the counts can be shared by the prompt caching checks of a request.
+        Returns an empty list if the prompt can't be tokenized.
+        """
+        from litellm.utils import token_counter
+
+        try:
+            # reply priming + tool definitions, counted once like `token_counter` does for the whole prompt
+            prompt_token_count = token_counter(model=model, messages=[], tools=tools)
+            prompt_token_counts: List[int] = []
+            for message in messages:
+                prompt_token_count += token_counter(
+                    model=model,
+                    messages=[message],
+                    count_response_tokens=True,
+                    use_default_image_token_count=True,
+                )
+                prompt_token_counts.append(prompt_token_count)
+        except Exception as e:
+            verbose_logger.debug(
+                "PromptCachingCache: could not count prompt tokens - %s", str(e)
+            )
+            return []
+        return prompt_token_counts
+
+    @staticmethod
+    def _get_first_cacheable_boundary(prompt_token_counts: List[int]) -> Optional[int]:
+        """
+        Index of the first message boundary with a prefix of at least `MINIMUM_PROMPT_CACHE_TOKEN_COUNT` tokens.
+
+        Shorter prefixes are not cached by providers - and a short prefix shared by many users (e.g. a system prompt)
+        would pin unrelated conversations to one deployment.
+        """
+        for msg_idx, prefix_token_count in enumerate(prompt_token_counts):
+            if prefix_token_count >= MINIMUM_PROMPT_CACHE_TOKEN_COUNT:
+                return msg_idx
+        return None
+
+    @staticmethod
+    def is_cacheable_prompt(prompt_token_counts: List[int]) -> bool:
+        """
+        Returns True if the prompt has at least `MINIMUM_PROMPT_CACHE_TOKEN_COUNT` tokens.
+        """
+        return PromptCachingCache._get_first_cacheable_boundary(prompt_token_counts) is not None
+
+    @staticmethod
+    def get_prefix_cache_keys(
+        messages: Optional[List[AllMessageValues]],
+        tools: Optional[List[ChatCompletionToolParam]],
+        model: str = "",
+        prompt_token_counts: Optional[List[int]] = None,
+    ) -> List[str]:
+        """
+        Get a cache key for the prompt prefix ending at each message boundary.
+
+        Uses a rolling hash, so `keys[i]` identifies `tools + messages[: i + 1]` and
+        is computed in a single pass over the messages. Does not depend on
+        `cache_control`, so it also covers providers with implicit prefix caching
+        (OpenAI, Gemini, vLLM).
+
+        Only prefixes of at least `MINIMUM_PROMPT_CACHE_TOKEN_COUNT` tokens are
+        returned, and of those only the last `PROMPT_CACHING_PREFIX_INDEX_MAX_BOUNDARIES`
+        boundaries (the longest prefixes). Pass `prompt_token_counts` (from
+        `get_prompt_token_counts`) if the prompt was already tokenized.
+
+        Returns:
+            List of cache keys, ordered from shortest to longest prefix
+        """
+        if not messages:
+            return []
+
+        if prompt_token_counts is None:
+            prompt_token_counts = PromptCachingCache.get_prompt_token_counts(
+                messages=messages, tools=tools, model=model
+            )
+        first_cacheable_boundary = PromptCachingCache._get_first_cacheable_boundary(
+            prompt_token_counts
+        )
+        if first_cacheable_boundary is None:
+            return []
+
+        hasher = hashlib.sha256()
+        if tools is not None:
+            hasher.update(
+                json.dumps(
+                    PromptCachingCache.serialize_object(tools),
+                    sort_keys=True,
+                    separators=(",", ":"),
+                ).encode()
+            )
+
+        first_indexed_boundary = max(
+            first_cacheable_boundary,
+            len(messages) - PROMPT_CACHING_PREFIX_INDEX_MAX_BOUNDARIES,
+        )
+        prefix_cache_keys: List[str] = []
+        for msg_idx, message in enumerate(messages):
+            hasher.update(b"\x1e")  # record separator between messages
+            hasher.update(
+                json.dumps(
+                    PromptCachingCache.serialize_object(message),
+                    sort_keys=True,
+                    separators=(",", ":"),
+                ).encode()
+            )
+            if msg_idx >= first_indexed_boundary:
+                prefix_cache_keys.append(
+                    f"deployment:{hasher.copy().hexdigest()}:prompt_caching_prefix"
+                )
+        return prefix_cache_keys
+
     def add_model_id(
         self,
         model_id: str,
@@ -175,6 +299,83 @@ class PromptCachingCache:
         )
         return None
 
+    def add_model_id_to_prefix_index(
+        self,
+        model_id: str,
+        messages: Optional[List[AllMessageValues]],
+        tools: Optional[List[ChatCompletionToolParam]],
+        model: str = "",
+        prompt_token_counts: Optional[List[int]] = None,
+    ) -> None:
+        """
+        Store the model id under every cacheable message-boundary prefix of the prompt.
+        """
+        for prefix_cache_key in PromptCachingCache.get_prefix_cache_keys(
+            messages, tools, model=model, prompt_token_counts=prompt_token_counts
+        ):
+            self.cache.set_cache(
+                prefix_cache_key, PromptCachingCacheValue(model_id=model_id), ttl=300
+            )
+        return None
+
+    async def async_add_model_id_to_prefix_index(
+        self,
+        model_id: str,
+        messages: Optional[List[AllMessageValues]],
+        tools: Optional[List[ChatCompletionToolParam]],
+        model: str = "",
+        prompt_token_counts: Optional[List[int]] = None,
+    ) -> None:
+        """
+        Store the model id under every cacheable message-boundary prefix of the prompt, in a single pipeline write.
+        """
+        prefix_cache_keys = PromptCachingCache.get_prefix_cache_keys(
+            messages, tools, model=model, prompt_token_counts=prompt_token_counts
+        )
+        if not prefix_cache_keys:
+            return None
+
+        await self.cache.async_set_cache_pipeline(
+            cache_list=[
+                (prefix_cache_key, PromptCachingCacheValue(model_id=model_id))
+                for prefix_cache_key in prefix_cache_keys
+            ],
+            ttl=300,  # store for 5 minutes
+        )
+        return None
+
+    async def async_get_longest_prefix_model_ids(
+        self,
+        messages: Optional[List[AllMessageValues]],
+        tools: Optional[List[ChatCompletionToolParam]],
+        model: str = "",
+        prompt_token_counts: Optional[List[int]] = None,
+    ) -> List[str]:
+        """
+        Get the model ids holding a cached prefix of this prompt.
+
+        All message-boundary prefix keys are read with one batch get. Model ids are
+        returned ordered by the length of the prefix they hold, longest first, so the
+        caller can pick the first one that is still healthy.
+        """
+        prefix_cache_keys = PromptCachingCache.get_prefix_cache_keys(
+            messages, tools, model=model, prompt_token_counts=prompt_token_counts
+        )
+        if not prefix_cache_keys:
+            return []
+
+        cache_results = await self.cache.async_batch_get_cache(keys=prefix_cache_keys)
+        if cache_results is None:
+            return []
+
+        model_ids: List[str] = []
+        for cache_result in reversed(cache_results):
+            if isinstance(cache_result, dict):
+                model_id = cache_result.get("model_id")
+                if model_id is not None and model_id not in model_ids:
+                    model_ids.append(model_id)
+        return model_ids
+
     async def async_add_model_id(
         self,
         model_id: str,
@@ -0,0 +1,308 @@
+"""
+Tail-latency request hedging for `Router.acompletion`
+
+If the deployment picked for a request has not responded (streaming: sent its first chunk) within `HedgingPolicy.percentile` of its recent response times - tracked by `LowestLatencyLoggingHandler` - the request is also sent to another healthy deployment in the model group.
+The first response is returned, the other call is cancelled.
+
+Hedges are limited to `HedgingPolicy.max_hedge_ratio` of requests (token bucket), so a slow model group does not double its own load.
+"""
+
+import asyncio
+import random
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from litellm._logging import verbose_router_logger
+from litellm._uuid import uuid
+from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
+from litellm.router_strategy.lowest_latency import LowestLatencyLoggingHandler
+from litellm.router_utils.cooldown_callbacks import (
+    _get_prometheus_logger_from_callbacks,
+)
+from litellm.types.router import HedgingPolicy
+
+if TYPE_CHECKING:
+    from opentelemetry.trace import Span as _Span
+
+    from litellm.router import Router as _Router
+
+    LitellmRouter = _Router
+    Span = Optional[_Span]
+else:
+    LitellmRouter = Any
+    Span = Any
+
+# (response, chunks already read from the response stream)
+HedgedResponse = Tuple[Any, List[Any]]
+
+
+class RouterRequestHedging:
+    def __init__(
+        self,
+        litellm_router_instance: LitellmRouter,
+        hedging_policy: HedgingPolicy,
+        latency_handler: LowestLatencyLoggingHandler,
+    ):
+        self.litellm_router_instance = litellm_router_instance
+        self.hedging_policy = hedging_policy
+        self.latency_handler = latency_handler
+        self.hedge_budget: float = 0.0
+        self.hedge_stats: Dict[str, int] = defaultdict(int)
+
+    def should_hedge(self, model_group: str) -> bool:
+        return (
+            self.hedging_policy.model_groups is None
+            or model_group in self.hedging_policy.model_groups
+        )
+
+    async def async_call_with_hedging(
+        self,
+        model_group: str,
+        deployment: dict,
+        messages: List[Dict[str, str]],
+        kwargs: dict,
+        parent_otel_span: Span,
+    ) -> HedgedResponse:
+        """
+        Call `deployment`, and hedge the call to another deployment in `model_group` if it is slow.
+
+        Returns the response and, for streaming responses, the chunks read from it while waiting for the first chunk.
+        """
+        stream = kwargs.get("stream", None) is True
+        hedge_kwargs = self._get_hedge_kwargs(kwargs)
+        self.hedge_stats["requests"] += 1
+        self.hedge_budget = min(
+            self.hedge_budget + self.hedging_policy.max_hedge_ratio,
+            self.hedging_policy.max_hedge_burst,
+        )
+
+        primary_task = asyncio.create_task(
+            self._async_call_deployment(
+                deployment=deployment,
+                model_group=model_group,
+                messages=messages,
+                kwargs=kwargs,
+                parent_otel_span=parent_otel_span,
+                stream=stream,
+            )
+        )
+        hedge_task: Optional[asyncio.Task] = None
+        # set once a call's response is returned - every other call is cancelled on exit
+        winner_task: Optional[asyncio.Task] = None
+        try:
+            hedge_delay = await self.async_get_hedge_delay(
+                model_group=model_group, deployment=deployment, stream=stream
+            )
+            done: set = set()
+            if hedge_delay is not None:
+                done, _ = await asyncio.wait({primary_task}, timeout=hedge_delay)
+            if hedge_delay is None or primary_task in done:
+                winner_task = primary_task
+                return await primary_task
+
+            if self.hedge_budget < 1:
+                self._record_hedge(model_group=model_group, outcome="budget_exhausted")
+                winner_task = primary_task
+                return await primary_task
+            hedge_deployment = await self._async_get_hedge_deployment(
+                model_group=model_group,
+                deployment=deployment,
+                messages=messages,
+                kwargs=hedge_kwargs,
+                parent_otel_span=parent_otel_span,
+            )
+            if hedge_deployment is None:
+                self.hedge_stats["no_hedge_deployment"] += 1
+                winner_task = primary_task
+                return await primary_task
+
+            self.hedge_budget -= 1
+            verbose_router_logger.debug(
+                "Hedging request to model_group=%s after %ss: deployment=%s -> %s",
+                model_group,
+                hedge_delay,
+                deployment["model_info"]["id"],
+                hedge_deployment["model_info"]["id"],
+            )
+            hedge_task = asyncio.create_task(
+                self._async_call_deployment(
+                    deployment=hedge_deployment,
+                    model_group=model_group,
+                    messages=messages,
+                    kwargs=hedge_kwargs,
+                    parent_otel_span=parent_otel_span,
+                    stream=stream,
+                )
+            )
+            winner_task = await self._async_get_first_response(
+                model_group=model_group,
+                primary_task=primary_task,
+                hedge_task=hedge_task,
+            )
+            return winner_task.result()
+        finally:
+            for task in (primary_task, hedge_task):
+                if task is not None and task is not winner_task:
+                    _discard_task(task)
+
+    async def async_get_hedge_delay(
+        self, model_group: str, deployment: dict, stream: bool
+    ) -> Optional[float]:
+        """
+        Returns the seconds to wait for `deployment` before hedging, None if the request should not be hedged
+        """
+        deployment_id = deployment.get("model_info", {}).get("id", None)
+        if deployment_id is None:
+            return None
+        hedge_delay = await self.latency_handler.async_get_response_time_percentile(
+            model_group=model_group,
+            deployment_id=str(deployment_id),
+            percentile=self.hedging_policy.percentile,
+            stream=stream,
+            min_samples=self.hedging_policy.min_samples,
+        )
+        if hedge_delay is None:
+            hedge_delay = self.hedging_policy.default_hedge_delay
+        if hedge_delay is None:
+            return None
+        return max(hedge_delay, self.hedging_policy.min_hedge_delay)
+
+    async def _async_call_deployment(
+        self,
+        deployment: dict,
+        model_group: str,
+        messages: List[Dict[str, str]],
+        kwargs: dict,
+        parent_otel_span: Span,
+        stream: bool,
+    ) -> HedgedResponse:
+        response = await self.litellm_router_instance._acompletion_call_deployment(
+            deployment=deployment,
+            model=model_group,
+            messages=messages,
+            kwargs=kwargs,
+            parent_otel_span=parent_otel_span,
+        )
+        if not stream or not isinstance(response, CustomStreamWrapper):
+            return response, []
+
+        # a streaming call has responded once it sends its first chunk
+        try:
+            return response, [await response.__anext__()]
+        except StopAsyncIteration:
+            return response, []
+        except BaseException:
+            await _close_stream(response)
+            raise
+
+    async def _async_get_first_response(
+        self,
+        model_group: str,
+        primary_task: asyncio.Task,
+        hedge_task: asyncio.Task,
+    ) -> asyncio.Task:
+        """
+        Returns the call that responded first - raises the primary deployment's exception if both calls fail
+        """
+        pending = {primary_task, hedge_task}
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in (primary_task, hedge_task):
+                if task not in done or task.exception() is not None:
+                    continue
+                is_hedge = task is hedge_task
+                self._record_hedge(
+                    model_group=model_group,
+                    outcome="hedge_won" if is_hedge else "primary_won",
+                )
+                response, _ = task.result()
+                hidden_params = getattr(response, "_hidden_params", None)
+                if isinstance(hidden_params, dict):
+                    hidden_params["hedged_request"] = True
+                    hidden_params["hedge_response"] = is_hedge
+                return task
+
+        self._record_hedge(model_group=model_group, outcome="all_failed")
+        raise primary_task.exception()  # type: ignore[misc]
+
+    async def _async_get_hedge_deployment(
+        self,
+        model_group: str,
+        deployment: dict,
+        messages: List[Dict[str, str]],
+        kwargs: dict,
+        parent_otel_span: Span,
+    ) -> Optional[dict]:
+        try:
+            healthy_deployments = (
+                await self.litellm_router_instance.async_get_healthy_deployments(
+                    model=model_group,
+                    request_kwargs=kwargs,
+                    messages=messages,
+                    parent_otel_span=parent_otel_span,
+                )
+            )
+        except Exception as e:
+            verbose_router_logger.debug(
+                "No deployment to hedge model_group=%s: %s", model_group, str(e)
+            )
+            return None
+        if not isinstance(healthy_deployments, list):
+            return None
+        deployment_id = deployment["model_info"]["id"]
+        hedge_deployments = [
+            d for d in healthy_deployments if d["model_info"]["id"] != deployment_id
+        ]
+        if len(hedge_deployments) == 0:
+            return None
+        return random.choice(hedge_deployments)
+
+    def _get_hedge_kwargs(self, kwargs: dict) -> dict:
+        """
+        Copy of the request kwargs for the hedge - it is logged as a separate call
+        """
+        hedge_kwargs = kwargs.copy()
+        hedge_kwargs.pop("litellm_logging_obj", None)
+        if "litellm_call_id" in hedge_kwargs:
+            hedge_kwargs["litellm_call_id"] = str(uuid.uuid4())
+        for metadata_variable_name in ("metadata", "litellm_metadata"):
+            if isinstance(hedge_kwargs.get(metadata_variable_name), dict):
+                hedge_kwargs[metadata_variable_name] = hedge_kwargs[
+                    metadata_variable_name
+                ].copy()
+        return hedge_kwargs
+
+    def _record_hedge(self, model_group: str, outcome: str) -> None:
+        self.hedge_stats[outcome] += 1
+        prometheus_logger = _get_prometheus_logger_from_callbacks()
+        if prometheus_logger is not None:
+            prometheus_logger.increment_router_hedged_requests(
+                model_group=model_group, hedge_outcome=outcome
+            )
+
+
+async def _close_stream(response: CustomStreamWrapper) -> None:
+    completion_stream = getattr(response, "completion_stream", None)
+    aclose = getattr(completion_stream, "aclose", None)
+    if aclose is None:
+        return
+    try:
+        await aclose()
+    except Exception as e:
+        verbose_router_logger.debug("Error closing hedged stream: %s", str(e))
+
+
+def _discard_task(task: asyncio.Task) -> None:
+    """
+    Cancel the losing call - or close its stream, if it already responded
+    """
+    if not task.done():
+        task.cancel()
+        return
+    if task.cancelled() or task.exception() is not None:
+        return
+    response, _ = task.result()
+    if isinstance(response, CustomStreamWrapper):
+        asyncio.create_task(_close_stream(response))
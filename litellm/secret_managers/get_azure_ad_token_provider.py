@@ -1,11 +1,87 @@
+import base64
+import hashlib
+import json
 import os
+import time
 from typing import Any, Callable, Optional, Union
 
 from litellm._logging import verbose_logger
+from litellm.caching.in_memory_cache import InMemoryCache
+from litellm.litellm_core_utils.credential_refresh_manager import (
+    credential_refresh_manager,
+)
 from litellm.types.secret_managers.get_azure_ad_token_provider import (
     AzureCredentialType,
 )
 
+# tokens are treated as expired this long before their `exp` claim
+AZURE_AD_TOKEN_EXPIRY_BUFFER_SECONDS = 60
+
+# shared by every token provider created for the same credential - `get_azure_ad_token` creates a new provider per request
+azure_ad_token_cache = InMemoryCache(max_size_in_memory=1000, default_ttl=3600)
+
+
+def get_azure_ad_token_cache_key(*credential_args: Optional[str]) -> str:
+    """
+    Hash of everything that identifies the credential (incl. the secret), so a token is only shared by callers holding the same secret.
+    """
+    credential_str = json.dumps(credential_args)
+    return hashlib.sha256(credential_str.encode()).hexdigest()
+
+
+def _get_token_expiry(token: str) -> Optional[float]:
+    """
+    Read the `exp` claim of an Azure AD access token (JWT), without verifying it. None if the token is not a JWT.
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+        return float(claims["exp"])
+    except Exception:
+        return None
+
+
+class ProactiveRefreshTokenProvider:
+    """
+    Wraps an Azure AD bearer token provider - returns the cached token, and refreshes it in the background before it expires.
+
+    Tokens without a readable `exp` claim are not cached, every call goes to the wrapped provider.
+    """
+
+    def __init__(self, token_provider: Callable[[], str], cache_key: str):
+        self.token_provider = token_provider
+        self.cache_key = cache_key
+
+    def __call__(self) -> str:
+        token = azure_ad_token_cache.get_cache(self.cache_key)
+        if token is not None:
+            credential_refresh_manager.mark_used(self.cache_key)
+            return token
+        # concurrent requests share one token request
+        return credential_refresh_manager.load(self.cache_key, self._load_token)
+
+    def _load_token(self) -> str:
+        token = self.token_provider()
+        token_expiry = _get_token_expiry(token) if isinstance(token, str) else None
+        if token_expiry is None:
+            return token
+
+        expires_at = token_expiry - AZURE_AD_TOKEN_EXPIRY_BUFFER_SECONDS
+        ttl = expires_at - time.time()
+        if ttl > 0:
+            azure_ad_token_cache.set_cache(self.cache_key, token, ttl=ttl)
+            credential_refresh_manager.schedule_refresh(
+                key=self.cache_key,
+                refresh_fn=self._refresh_token,
+                expires_at=expires_at,
+            )
+        return token
+
+    def _refresh_token(self) -> None:
+        credential_refresh_manager.load(self.cache_key, self._load_token)
+
 
 def infer_credential_type_from_environment() -> AzureCredentialType:
     if (
@@ -118,4 +194,14 @@ def get_azure_ad_token_provider(
     if credential is None:
         raise ValueError("No credential provided")
 
-    return get_bearer_token_provider(credential, azure_scope)
+    return ProactiveRefreshTokenProvider(
+        token_provider=get_bearer_token_provider(credential, azure_scope),
+        cache_key=get_azure_ad_token_cache_key(
+            cred,
+            azure_scope,
+            os.environ.get("AZURE_CLIENT_ID"),
+            os.environ.get("AZURE_TENANT_ID"),
+            os.environ.get("AZURE_CLIENT_SECRET"),
+            os.environ.get("AZURE_CERTIFICATE_PATH"),
+        ),
+    )
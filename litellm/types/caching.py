@@ -2,7 +2,7 @@ from enum import Enum
 from typing import Any, Dict, List, Literal, Optional, Union
 
 from pydantic import BaseModel
-from typing_extensions import TypedDict
+from typing_extensions import NotRequired, TypedDict
 
 
 class LiteLLMCacheType(str, Enum):
@@ -14,6 +14,7 @@ class LiteLLMCacheType(str, Enum):
     QDRANT_SEMANTIC = "qdrant-semantic"
     AZURE_BLOB = "azure-blob"
     GCS = "gcs"
+    TIERED = "tiered"
 
 
 CachingSupportedCallTypes = Literal[
@@ -68,12 +69,26 @@ DynamicCacheControl = TypedDict(
 )
 
 
+class CacheTierConfig(TypedDict, total=False):
+    """
+    Config for one tier of a `type: tiered` cache.
+
+    All other keys are passed to the tier's backend, e.g. `host` / `port` for redis, `disk_cache_dir` for disk.
+    """
+
+    type: Literal["local", "disk", "redis", "s3", "gcs", "azure-blob"]
+    ttl: float  # max ttl for entries in this tier, capped by the request ttl
+    max_size_in_memory: int  # max number of entries, for `local` tiers
+    max_size_per_item: int  # max size of an entry in KB, for `local` tiers
+
+
 class CachePingResponse(BaseModel):
     status: str
     cache_type: str
     ping_response: Optional[bool] = None
     set_cache_response: Optional[str] = None
     litellm_cache_params: Optional[str] = None
+    tier_stats: Optional[List[dict]] = None
 
     # intentionally a dict, since we run masker.mask_dict() on HealthCheckCacheParams
     health_check_cache_params: Optional[dict] = None
@@ -93,7 +108,9 @@ class HealthCheckCacheParams(BaseModel):
 
 class CachedEmbedding(TypedDict):
     """Type definition for cached embedding objects"""
-    embedding: Optional[List[float]]
+    embedding: Optional[Union[List[float], str]]
     index: Optional[int]
     object: Optional[str]
     model: Optional[str]
+    embedding_encoding: NotRequired[Literal["float32_base64"]]
+    """Set when `embedding` is stored as base64 of packed little-endian float32 values"""
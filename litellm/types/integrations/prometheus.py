@@ -150,11 +150,14 @@ class UserAPIKeyLabelNames(Enum):
     FALLBACK_MODEL = "fallback_model"
     ROUTE = "route"
     MODEL_GROUP = "model_group"
+    HEDGE_OUTCOME = "hedge_outcome"
+    CONNECTION_PHASE = "connection_phase"
 
 
 DEFINED_PROMETHEUS_METRICS = Literal[
     "litellm_llm_api_latency_metric",
     "litellm_llm_api_time_to_first_token_metric",
+    "litellm_llm_api_connection_phase_latency_metric",
     "litellm_request_total_latency_metric",
     "litellm_overhead_latency_metric",
     "litellm_remaining_requests_metric",
@@ -180,6 +183,7 @@ DEFINED_PROMETHEUS_METRICS = Literal[
     "litellm_deployment_total_requests",
     "litellm_deployment_success_responses",
     "litellm_deployment_cooled_down",
+    "litellm_router_hedged_requests",
     "litellm_pod_lock_manager_size",
     "litellm_in_memory_daily_spend_update_queue_size",
     "litellm_redis_daily_spend_update_queue_size",
@@ -208,6 +212,14 @@ class PrometheusMetricLabels:
         UserAPIKeyLabelNames.TEAM_ALIAS.value,
     ]
 
+    litellm_llm_api_connection_phase_latency_metric = [
+        UserAPIKeyLabelNames.v2_LITELLM_MODEL_NAME.value,
+        UserAPIKeyLabelNames.MODEL_ID.value,
+        UserAPIKeyLabelNames.API_BASE.value,
+        UserAPIKeyLabelNames.API_PROVIDER.value,
+        UserAPIKeyLabelNames.CONNECTION_PHASE.value,
+    ]
+
     litellm_request_total_latency_metric = [
         UserAPIKeyLabelNames.END_USER.value,
         UserAPIKeyLabelNames.API_KEY_HASH.value,
@@ -357,6 +369,11 @@ class PrometheusMetricLabels:
         UserAPIKeyLabelNames.EXCEPTION_STATUS.value,
     ]
 
+    litellm_router_hedged_requests = [
+        UserAPIKeyLabelNames.MODEL_GROUP.value,
+        UserAPIKeyLabelNames.HEDGE_OUTCOME.value,
+    ]
+
     litellm_deployment_successful_fallbacks = [
         UserAPIKeyLabelNames.REQUESTED_MODEL.value,
         UserAPIKeyLabelNames.FALLBACK_MODEL.value,
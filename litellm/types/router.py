@@ -545,6 +545,22 @@ class RetryPolicy(BaseModel):
     InternalServerErrorRetries: Optional[int] = None
 
 
+class HedgingPolicy(BaseModel):
+    """
+    Use this to hedge slow requests (`Router.acompletion`)
+    If a deployment has not responded (streaming: sent its first chunk) within the `percentile` of its recent latency, the request is also sent to another healthy deployment in the model group.
+    The first response is returned, the other call is cancelled.
+    """
+
+    percentile: float = 95.0  # percentile of the deployment's recent response times (time to first token, for streaming) to wait before hedging
+    min_samples: int = 10  # deployments with fewer latency samples use `default_hedge_delay`
+    min_hedge_delay: float = 0.05  # (seconds) lower bound on the time to wait before hedging
+    default_hedge_delay: Optional[float] = None  # (seconds) time to wait before hedging, without enough samples. None = don't hedge
+    max_hedge_ratio: float = 0.1  # max share of requests that are hedged
+    max_hedge_burst: int = 10  # max hedges sent in a row, when the hedge budget was unused
+    model_groups: Optional[List[str]] = None  # model groups to hedge. None = all
+
+
 class AlertingConfig(BaseModel):
     """
     Use this configure alerting for the router. Receive alerts on the following events
@@ -771,6 +787,7 @@ OptionalPreCallChecks = List[
         "router_budget_limiting",
         "responses_api_deployment_check",
         "forward_client_headers_by_model_group",
+        "adaptive_concurrency",
     ]
 ]
 
@@ -1121,6 +1121,13 @@ class Delta(OpenAIObject):
         List[Union[ChatCompletionThinkingBlock, ChatCompletionRedactedThinkingBlock]]
     ] = None
     provider_specific_fields: Optional[Dict[str, Any]] = Field(default=None)
+    content: Optional[str] = None
+    role: Optional[str] = None
+    function_call: Optional[Union[FunctionCall, Any]] = None
+    tool_calls: Optional[List[Union[ChatCompletionDeltaToolCall, Any]]] = None
+    audio: Optional[ChatCompletionAudioResponse] = None
+    images: Optional[List[ImageURLListItem]] = None
+    annotations: Optional[List[ChatCompletionAnnotation]] = None
 
     def __init__(
         self,
@@ -1139,46 +1146,10 @@ class Delta(OpenAIObject):
         annotations: Optional[List[ChatCompletionAnnotation]] = None,
         **params,
     ):
-        super(Delta, self).__init__(**params)
-        add_provider_specific_fields(self, params.get("provider_specific_fields", {}))
-        self.content = content
-        self.role = role
-        # Set default values and correct types
-        self.function_call: Optional[Union[FunctionCall, Any]] = None
-        self.tool_calls: Optional[List[Union[ChatCompletionDeltaToolCall, Any]]] = None
-        self.audio: Optional[ChatCompletionAudioResponse] = None
-        self.images: Optional[List[ImageURLListItem]] = None
-        self.annotations: Optional[List[ChatCompletionAnnotation]] = None
-
-        if reasoning_content is not None:
-            self.reasoning_content = reasoning_content
-        else:
-            # ensure default response matches OpenAI spec
-            del self.reasoning_content
-
-        if thinking_blocks is not None:
-            self.thinking_blocks = thinking_blocks
-        else:
-            # ensure default response matches OpenAI spec
-            del self.thinking_blocks
-
-        # Add annotations to the delta, ensure they are only on Delta if they exist (Match OpenAI spec)
-        if annotations is not None:
-            self.annotations = annotations
-        else:
-            del self.annotations
-
-        if images is not None and len(images) > 0:
-            self.images = images
-        else:
-            del self.images
-
         if function_call is not None and isinstance(function_call, dict):
-            self.function_call = FunctionCall(**function_call)
-        else:
-            self.function_call = function_call
+            function_call = FunctionCall(**function_call)
         if tool_calls is not None and isinstance(tool_calls, list):
-            self.tool_calls = []
+            _tool_calls: List[Union[ChatCompletionDeltaToolCall, Any]] = []
             current_index = 0
             for tool_call in tool_calls:
                 if isinstance(tool_call, dict):
@@ -1187,13 +1158,44 @@ class Delta(OpenAIObject):
                         current_index += 1
                     if tool_call.get("type", None) is None:
                         tool_call["type"] = "function"
-                    self.tool_calls.append(ChatCompletionDeltaToolCall(**tool_call))
+                    _tool_calls.append(ChatCompletionDeltaToolCall(**tool_call))
                 elif isinstance(tool_call, ChatCompletionDeltaToolCall):
-                    self.tool_calls.append(tool_call)
-        else:
-            self.tool_calls = tool_calls
+                    _tool_calls.append(tool_call)
+            tool_calls = _tool_calls
 
-        self.audio = audio
+        super(Delta, self).__init__(**params)
+        add_provider_specific_fields(self, params.get("provider_specific_fields", {}))
+
+        # Set directly in `__dict__`, not through pydantic's `__setattr__` - Delta is built for every streaming chunk.
+        # Values are stored as given, like before they were declared: partial streaming deltas (e.g. audio without
+        # `data`, provider thinking blocks) don't match the full response types.
+        delta_values: Dict[str, Any] = {
+            "content": content,
+            "role": role,
+            "function_call": function_call,
+            "tool_calls": tool_calls,
+            "audio": audio,
+        }
+        # ensure default response matches OpenAI spec - images / annotations / reasoning are only on Delta if they exist
+        instance_dict = self.__dict__
+        if images is not None and len(images) > 0:
+            delta_values["images"] = images
+        else:
+            del instance_dict["images"]
+        if annotations is not None:
+            delta_values["annotations"] = annotations
+        else:
+            del instance_dict["annotations"]
+        if reasoning_content is not None:
+            delta_values["reasoning_content"] = reasoning_content
+        else:
+            del instance_dict["reasoning_content"]
+        if thinking_blocks is not None:
+            delta_values["thinking_blocks"] = thinking_blocks
+        else:
+            del instance_dict["thinking_blocks"]
+        instance_dict.update(delta_values)
+        self.__pydantic_fields_set__.update(delta_values)
 
     def __contains__(self, key):
         # Define custom behavior for the 'in' operator
@@ -2579,6 +2581,24 @@ class StandardLoggingPayloadStatusFields(TypedDict, total=False):
     """
 
 
+class StandardLoggingConnectionPhase(TypedDict):
+    start_ms: float  # offset from `StandardLoggingConnectionTimings.start_time`
+    duration_ms: float
+
+
+class StandardLoggingConnectionTimings(TypedDict):
+    """
+    Connection phase timings of the last upstream http request made for a call
+    """
+
+    start_time: float  # unix timestamp, when the request was sent to the http client
+    connection_reused: Optional[bool]
+    phases: Dict[str, StandardLoggingConnectionPhase]
+    """
+    Phases that were measured for the request - `pool_wait`, `dns`, `connect`, `tls`, `time_to_first_byte`, `body_transfer`
+    """
+
+
 class StandardLoggingPayload(TypedDict):
     id: str
     trace_id: str  # Trace multiple LLM calls belonging to same overall request (e.g. fallbacks/retries)
@@ -2619,6 +2639,7 @@ class StandardLoggingPayload(TypedDict):
     hidden_params: StandardLoggingHiddenParams
     guardrail_information: Optional[List[StandardLoggingGuardrailInformation]]
     standard_built_in_tools_params: Optional[StandardBuiltInToolsParams]
+    connection_timings: Optional[StandardLoggingConnectionTimings]
 
 
 from typing import AsyncIterator, Iterator
@@ -2850,6 +2871,7 @@ all_litellm_params = (
         "prompt_label",
         "shared_session",
         "search_tool_name",
+        "litellm_cache_refresh",
     ]
     + list(StandardCallbackDynamicParams.__annotations__.keys())
     + list(CustomPricingLiteLLMParams.model_fields.keys())
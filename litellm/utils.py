@@ -877,7 +877,8 @@ async def _client_async_logging_helper(
         GLOBAL_LOGGING_WORKER.ensure_initialized_and_enqueue(
             async_coroutine=logging_obj.async_success_handler(
                 result=result, start_time=start_time, end_time=end_time
-            )
+            ),
+            droppable=not logging_obj.has_critical_async_success_callbacks(),
         )
 
         ################################################
@@ -1583,6 +1584,7 @@ def client(original_function):  # noqa: PLR0915
         except Exception as e:
             traceback_exception = traceback.format_exc()
             end_time = datetime.datetime.now()
+            _llm_caching_handler._release_in_flight_request()
             if logging_obj:
                 try:
                     logging_obj.failure_handler(
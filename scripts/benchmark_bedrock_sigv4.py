@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark SigV4 signing of Bedrock requests.
+
+Compares botocore (`SigV4Auth.add_auth` on a new `AWSRequest`, used before) against
+`litellm.llms.bedrock.sigv4.sign_request_headers`, and `BaseAWSLLM._sign_request` end to end.
+
+USAGE:
+   python scripts/benchmark_bedrock_sigv4.py
+   python scripts/benchmark_bedrock_sigv4.py --iterations 50000 --body-kb 1 64
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable
+from unittest.mock import patch
+
+sys.path.insert(0, ".")
+
+from botocore.auth import SigV4Auth  # noqa: E402
+from botocore.awsrequest import AWSRequest  # noqa: E402
+from botocore.credentials import Credentials  # noqa: E402
+
+from litellm.llms.bedrock.base_aws_llm import BaseAWSLLM  # noqa: E402
+from litellm.llms.bedrock.sigv4 import sign_request_headers  # noqa: E402
+
+URL = "https://bedrock-runtime.us-east-1.amazonaws.com/model/anthropic.claude-3-5-sonnet-20240620-v1%3A0/converse"
+CREDENTIALS = Credentials("ASIAEXAMPLE", "secret", "session-token")
+HEADERS = {"Content-Type": "application/json"}
+
+
+def sign_botocore(body: bytes) -> dict:
+    request = AWSRequest(method="POST", url=URL, data=body, headers=HEADERS)
+    SigV4Auth(CREDENTIALS, "bedrock", "us-east-1").add_auth(request)
+    return dict(request.headers)
+
+
+def sign_litellm(body: bytes) -> dict:
+    signed_headers = sign_request_headers(
+        credentials=CREDENTIALS,
+        service_name="bedrock",
+        region_name="us-east-1",
+        url=URL,
+        headers=HEADERS,
+        body=body,
+    )
+    assert signed_headers is not None
+    return signed_headers
+
+
+def _per_call_us(fn: Callable[[], object], iterations: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--body-kb", type=int, nargs="+", default=[1, 16, 256])
+    args = parser.parse_args()
+
+    llm = BaseAWSLLM()
+    print(
+        f"{'body':>8} {'path':>14} {'botocore us':>12} {'litellm us':>12} {'speedup':>8}"
+    )
+    for body_kb in args.body_kb:
+        text = "x" * (body_kb * 1024)
+        body = ('{"messages": [{"role": "user", "content": "%s"}]}' % text).encode()
+
+        botocore_us = _per_call_us(lambda: sign_botocore(body), args.iterations)
+        litellm_us = _per_call_us(lambda: sign_litellm(body), args.iterations)
+        print(
+            f"{body_kb:>6}KB {'signer':>14} {botocore_us:>12.1f} {litellm_us:>12.1f} {botocore_us / litellm_us:>7.1f}x"
+        )
+
+        def sign_request():
+            return llm._sign_request(
+                service_name="bedrock",
+                headers={},
+                optional_params={"aws_region_name": "us-east-1"},
+                request_data={"messages": [{"role": "user", "content": text}]},
+                api_base=URL,
+            )
+
+        with patch.object(llm, "get_credentials", return_value=CREDENTIALS), patch.dict(
+            os.environ, {"AWS_BEARER_TOKEN_BEDROCK": ""}
+        ):
+            litellm_us = _per_call_us(sign_request, args.iterations)
+            with patch(
+                "litellm.llms.bedrock.base_aws_llm.sign_request_headers",
+                return_value=None,
+            ):
+                botocore_us = _per_call_us(sign_request, args.iterations)
+        print(
+            f"{body_kb:>6}KB {'_sign_request':>14} {botocore_us:>12.1f} {litellm_us:>12.1f} {botocore_us / litellm_us:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
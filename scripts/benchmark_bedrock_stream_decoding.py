@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark Bedrock converse stream decoding on a synthetic tool-call stream.
+
+Compares the botocore frame decoder (`EventStreamBuffer` + `EventStreamJSONParser`, used before) against
+`litellm.llms.bedrock.event_stream.AWSEventStreamBuffer`, on their own and with `AWSEventStreamDecoder._chunk_parser`.
+
+The stream is a single tool call streamed as N `contentBlockDelta` events (default 50k), read in fixed size network chunks.
+
+USAGE:
+   python scripts/benchmark_bedrock_stream_decoding.py
+   python scripts/benchmark_bedrock_stream_decoding.py --num-deltas 100000 --chunk-sizes 1024 65536
+"""
+
+import argparse
+import json
+import struct
+import sys
+import time
+import zlib
+from typing import Callable, Iterator, Tuple
+
+sys.path.insert(0, ".")
+
+from litellm.litellm_core_utils.fast_json import json_loads  # noqa: E402
+from litellm.llms.bedrock.chat.invoke_handler import (  # noqa: E402
+    AWSEventStreamDecoder,
+)
+from litellm.llms.bedrock.event_stream import AWSEventStreamBuffer  # noqa: E402
+
+
+def _encode_frame(event_type: str, event: dict) -> bytes:
+    headers = b""
+    for name, value in (
+        (":event-type", event_type),
+        (":content-type", "application/json"),
+        (":message-type", "event"),
+    ):
+        headers += bytes([len(name)]) + name.encode() + bytes([7])
+        headers += struct.pack(">H", len(value)) + value.encode()
+    payload = json.dumps(event).encode()
+    total_length = 12 + len(headers) + len(payload) + 4
+    prelude = struct.pack(">II", total_length, len(headers))
+    message = prelude + struct.pack(">I", zlib.crc32(prelude)) + headers + payload
+    return message + struct.pack(">I", zlib.crc32(message))
+
+
+def build_tool_call_stream(num_deltas: int) -> bytes:
+    frames = [
+        _encode_frame("messageStart", {"role": "assistant"}),
+        _encode_frame(
+            "contentBlockStart",
+            {
+                "start": {"toolUse": {"toolUseId": "tooluse_1", "name": "write_file"}},
+                "contentBlockIndex": 0,
+            },
+        ),
+    ]
+    for i in range(num_deltas):
+        frames.append(
+            _encode_frame(
+                "contentBlockDelta",
+                {
+                    "delta": {"toolUse": {"input": f'"line {i}\\n", '}},
+                    "contentBlockIndex": 0,
+                },
+            )
+        )
+    frames.append(_encode_frame("contentBlockStop", {"contentBlockIndex": 0}))
+    frames.append(_encode_frame("messageStop", {"stopReason": "tool_use"}))
+    return b"".join(frames)
+
+
+def _chunks(stream: bytes, chunk_size: int) -> Iterator[bytes]:
+    for i in range(0, len(stream), chunk_size):
+        yield stream[i : i + chunk_size]
+
+
+def decode_botocore(stream: bytes, chunk_size: int, parse_chunks: bool) -> int:
+    from botocore.eventstream import EventStreamBuffer
+
+    decoder = AWSEventStreamDecoder(model="anthropic.claude-sonnet-4")
+    event_stream_buffer = EventStreamBuffer()
+    num_events = 0
+    for chunk in _chunks(stream, chunk_size):
+        event_stream_buffer.add_data(chunk)
+        for event in event_stream_buffer:
+            message = decoder._parse_message_from_event(event)
+            if message:
+                chunk_data = json.loads(message)
+                if parse_chunks:
+                    decoder._chunk_parser(chunk_data=chunk_data)
+                num_events += 1
+    return num_events
+
+
+def decode_litellm(stream: bytes, chunk_size: int, parse_chunks: bool) -> int:
+    decoder = AWSEventStreamDecoder(model="anthropic.claude-sonnet-4")
+    if parse_chunks:
+        return sum(1 for _ in decoder.iter_bytes(_chunks(stream, chunk_size)))
+
+    event_stream_buffer = AWSEventStreamBuffer()
+    num_events = 0
+    for chunk in _chunks(stream, chunk_size):
+        for event in event_stream_buffer.decode(chunk):
+            message = decoder._parse_message_from_event_stream_message(event)
+            if message:
+                json_loads(message)
+                num_events += 1
+    return num_events
+
+
+def _timed(fn: Callable[[], int]) -> Tuple[int, float]:
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--num-deltas", type=int, default=50_000)
+    parser.add_argument(
+        "--chunk-sizes", type=int, nargs="+", default=[1024, 65_536, 1_048_576]
+    )
+    args = parser.parse_args()
+
+    stream = build_tool_call_stream(args.num_deltas)
+    print(
+        f"stream: {args.num_deltas} tool-call deltas, {len(stream) / 1024 / 1024:.1f}MB"
+    )
+    for parse_chunks in (False, True):
+        print(
+            "\nframe decoding + chunk parsing"
+            if parse_chunks
+            else "\nframe decoding only"
+        )
+        print(f"{'chunk size':>12} {'botocore s':>12} {'litellm s':>12} {'speedup':>8}")
+        for chunk_size in args.chunk_sizes:
+            botocore_events, botocore_s = _timed(
+                lambda: decode_botocore(stream, chunk_size, parse_chunks)
+            )
+            litellm_events, litellm_s = _timed(
+                lambda: decode_litellm(stream, chunk_size, parse_chunks)
+            )
+            assert botocore_events == litellm_events
+            print(
+                f"{chunk_size:>12} {botocore_s:>12.3f} {litellm_s:>12.3f} {botocore_s / litellm_s:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
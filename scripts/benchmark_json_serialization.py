@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for provider request / response JSON serialization.
+
+Compares stdlib `json.dumps(data)` (str body, re-encoded by httpx) + `response.json()` against
+`litellm.litellm_core_utils.fast_json` (orjson to bytes + orjson parsing, if installed).
+
+Payloads:
+  - chat request with a ~100k token prompt
+  - chat request with 128 large tool schemas
+  - 32-turn chat request with mixed text / image content
+  - chat completion response with a 16k token answer
+
+USAGE:
+   python scripts/benchmark_json_serialization.py
+   python scripts/benchmark_json_serialization.py --iterations 500
+"""
+
+import argparse
+import json
+import random
+import string
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+import httpx
+
+sys.path.insert(0, ".")
+
+from litellm.litellm_core_utils.fast_json import (  # noqa: E402
+    json_dumps_bytes,
+    orjson,
+    response_json,
+)
+
+
+def _words(num_words: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return " ".join(
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9)))
+        for _ in range(num_words)
+    )
+
+
+def build_payloads() -> Dict[str, dict]:
+    large_prompt = {
+        "model": "claude-sonnet-4-5",
+        "max_tokens": 4096,
+        "messages": [
+            {"role": "system", "content": _words(2_000, seed=1)},
+            {"role": "user", "content": _words(75_000, seed=2)},
+        ],
+    }
+    large_tools = {
+        "model": "gpt-4o",
+        "messages": [{"role": "user", "content": "What's the weather?"}],
+        "tools": [
+            {
+                "type": "function",
+                "function": {
+                    "name": f"tool_{i}",
+                    "description": _words(60, seed=i),
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            f"param_{j}": {
+                                "type": ["string", "integer", "boolean"][j % 3],
+                                "description": _words(20, seed=i * 100 + j),
+                                "enum": [f"value_{k}" for k in range(5)],
+                            }
+                            for j in range(12)
+                        },
+                        "required": [f"param_{j}" for j in range(6)],
+                    },
+                },
+            }
+            for i in range(128)
+        ],
+    }
+    multi_turn: List[dict] = []
+    for turn in range(32):
+        multi_turn.append(
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": _words(300, seed=turn)},
+                    {
+                        "type": "image_url",
+                        "image_url": {"url": "data:image/png;base64," + "A" * 20_000},
+                    },
+                ],
+            }
+        )
+        multi_turn.append({"role": "assistant", "content": _words(300, seed=-turn)})
+    chat_response = {
+        "id": "chatcmpl-123",
+        "object": "chat.completion",
+        "created": 1700000000,
+        "model": "gpt-4o",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": _words(12_000, seed=3)},
+            }
+        ],
+        "usage": {"prompt_tokens": 100, "completion_tokens": 16000},
+    }
+    return {
+        "request: 100k token prompt": large_prompt,
+        "request: 128 tool schemas": large_tools,
+        "request: 32 turns + images": {"model": "gpt-4o", "messages": multi_turn},
+        "response: 16k token answer": chat_response,
+    }
+
+
+def _time(fn: Callable[[], object], iterations: int) -> float:
+    fn()  # warmup
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def bench_payload(name: str, payload: dict, iterations: int) -> Tuple[float, float]:
+    if name.startswith("response"):
+        response = httpx.Response(200, content=json.dumps(payload).encode("utf-8"))
+
+        def stdlib():
+            return response.json()
+
+        def fast():
+            return response_json(response)
+
+    else:
+
+        def stdlib():
+            # str body, httpx encodes it to bytes before sending
+            return json.dumps(payload).encode("utf-8")
+
+        def fast():
+            return json_dumps_bytes(payload)
+
+    return _time(stdlib, iterations), _time(fast, iterations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"orjson installed: {orjson is not None}")
+    print(
+        f"{'payload':<30} {'size':>10} {'stdlib ms':>10} {'fast ms':>10} {'speedup':>8}"
+    )
+    for name, payload in build_payloads().items():
+        size_kb = len(json_dumps_bytes(payload)) / 1024
+        stdlib_ms, fast_ms = bench_payload(name, payload, args.iterations)
+        print(
+            f"{name:<30} {size_kb:>8.0f}KB {stdlib_ms:>10.3f} {fast_ms:>10.3f} {stdlib_ms / fast_ms:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
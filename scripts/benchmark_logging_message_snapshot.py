@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark the messages snapshot taken by the `Logging` object for every call.
+
+Compares `copy.deepcopy(messages)` (used before) against `snapshot_messages(messages)`,
+on ~10 MB prompts: one long document, base64 images, and a long conversation.
+Reports time per snapshot and the peak memory allocated while taking it (tracemalloc).
+
+USAGE:
+   python scripts/benchmark_logging_message_snapshot.py
+   python scripts/benchmark_logging_message_snapshot.py --iterations 20 --prompt-mb 1 10
+"""
+
+import argparse
+import copy
+import sys
+import time
+import tracemalloc
+from typing import Callable, List
+
+sys.path.insert(0, ".")
+
+from litellm.litellm_core_utils.core_helpers import snapshot_messages  # noqa: E402
+
+
+def long_document(size: int) -> List[dict]:
+    return [
+        {"role": "system", "content": "Summarize the document."},
+        {"role": "user", "content": "x" * size},
+    ]
+
+
+def base64_images(size: int) -> List[dict]:
+    num_images = 10
+    image_url = "data:image/png;base64," + "A" * (size // num_images)
+    return [
+        {
+            "role": "user",
+            "content": [{"type": "text", "text": "describe these images"}]
+            + [
+                {"type": "image_url", "image_url": {"url": image_url, "detail": "auto"}}
+                for _ in range(num_images)
+            ],
+        }
+    ]
+
+
+def long_conversation(size: int) -> List[dict]:
+    turn_size = 2048
+    messages = []
+    for i in range(size // turn_size):
+        messages.append(
+            {
+                "role": "user" if i % 2 == 0 else "assistant",
+                "content": [{"type": "text", "text": "x" * turn_size}],
+            }
+        )
+    return messages
+
+
+def _measure(fn: Callable[[], object], iterations: int):
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    ms = (time.perf_counter() - start) / iterations * 1000
+
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return ms, peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--prompt-mb", type=int, nargs="+", default=[10])
+    args = parser.parse_args()
+
+    print(
+        f"{'prompt':>6} {'shape':>18} {'deepcopy ms':>12} {'snapshot ms':>12} {'speedup':>8} {'deepcopy KB':>12} {'snapshot KB':>12}"
+    )
+    for prompt_mb in args.prompt_mb:
+        size = prompt_mb * 1024 * 1024
+        for shape in (long_document, base64_images, long_conversation):
+            messages = shape(size)
+            deepcopy_ms, deepcopy_kb = _measure(
+                lambda: copy.deepcopy(messages), args.iterations
+            )
+            snapshot_ms, snapshot_kb = _measure(
+                lambda: snapshot_messages(messages), args.iterations
+            )
+            print(
+                f"{prompt_mb:>4}MB {shape.__name__:>18} {deepcopy_ms:>12.3f} {snapshot_ms:>12.3f} {deepcopy_ms / snapshot_ms:>7.1f}x {deepcopy_kb:>12.1f} {snapshot_kb:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
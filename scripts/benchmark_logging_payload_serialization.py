@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark StandardLoggingPayload serialization with several logging callbacks enabled.
+
+Compares each callback serializing the payload with `safe_dumps` (used before) against
+`SerializedStandardLoggingPayload`, which encodes with orjson.
+
+USAGE:
+   python scripts/benchmark_logging_payload_serialization.py
+   python scripts/benchmark_logging_payload_serialization.py --iterations 2000 --message-kb 1 64
+"""
+
+import argparse
+import sys
+import time
+from typing import Callable
+
+sys.path.insert(0, ".")
+
+from litellm.litellm_core_utils.litellm_logging import (  # noqa: E402
+    create_dummy_standard_logging_payload,
+)
+from litellm.litellm_core_utils.safe_json_dumps import safe_dumps  # noqa: E402
+from litellm.litellm_core_utils.serialized_logging_payload import (  # noqa: E402
+    SerializedStandardLoggingPayload,
+)
+
+
+def _per_call_us(fn: Callable[[], object], iterations: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--message-kb", type=int, nargs="+", default=[4, 64])
+    parser.add_argument("--callbacks", type=int, nargs="+", default=[1, 3, 6])
+    args = parser.parse_args()
+
+    print(
+        f"{'messages':>9} {'callbacks':>9} {'safe_dumps us':>14} {'orjson us':>18} {'speedup':>8}"
+    )
+    for message_kb in args.message_kb:
+        payload = dict(create_dummy_standard_logging_payload())
+        payload["messages"] = [
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": "x" * (message_kb * 1024)},
+        ]
+        for num_callbacks in args.callbacks:
+
+            def each_callback_serializes():
+                for _ in range(num_callbacks):
+                    safe_dumps(payload)
+
+            def each_callback_orjson():
+                # a new payload per logged request
+                serialized_payload = SerializedStandardLoggingPayload(payload)
+                for _ in range(num_callbacks):
+                    serialized_payload.get_json_bytes()
+
+            before_us = _per_call_us(each_callback_serializes, args.iterations)
+            after_us = _per_call_us(each_callback_orjson, args.iterations)
+            print(
+                f"{message_kb:>7}KB {num_callbacks:>9} {before_us:>14.1f} {after_us:>18.1f} {before_us / after_us:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
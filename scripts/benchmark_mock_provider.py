@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Local mock LLM provider for proxy benchmarks - OpenAI, Anthropic and Bedrock (converse) compatible.
+
+Responds to every request with `--tokens` completion tokens after `--latency-ms`, and when streaming, sends one chunk
+per token every `--token-latency-ms`. The provider latency is fixed, so anything a client measures on top of it through
+the proxy is proxy overhead. Used by `scripts/benchmark_proxy_hot_path.py`.
+
+Routes:
+- OpenAI:    POST /v1/chat/completions, POST /v1/embeddings
+- Anthropic: POST /v1/messages
+- Bedrock:   POST /model/{model_id}/converse, POST /model/{model_id}/converse-stream
+
+USAGE:
+   python scripts/benchmark_mock_provider.py --port 8090
+   python scripts/benchmark_mock_provider.py --port 8090 --latency-ms 200 --tokens 100 --token-latency-ms 5
+
+   # point a proxy deployment at it
+   model_list:
+     - model_name: gpt-4o
+       litellm_params:
+         model: openai/gpt-4o
+         api_base: http://127.0.0.1:8090/v1
+         api_key: fake-key
+"""
+
+import argparse
+import asyncio
+import json
+import struct
+import time
+import uuid
+import zlib
+from typing import AsyncIterator, Dict
+
+from aiohttp import web
+
+
+class MockProvider:
+    def __init__(self, latency_ms: float, tokens: int, token_latency_ms: float):
+        self.latency_s = latency_ms / 1000
+        self.tokens = tokens
+        self.token_latency_s = token_latency_ms / 1000
+        self.requests = 0
+
+    async def _wait(self, seconds: float) -> None:
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+
+    async def _read_json(self, request: web.Request) -> Dict:
+        self.requests += 1
+        body = await request.read()
+        # ~4 bytes per token
+        request["prompt_tokens"] = max(len(body) // 4, 1)
+        return json.loads(body) if body else {}
+
+    async def _stream(
+        self, request: web.Request, content_type: str, chunks: AsyncIterator[bytes]
+    ) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": content_type})
+        await response.prepare(request)
+        async for chunk in chunks:
+            await response.write(chunk)
+        await response.write_eof()
+        return response
+
+    async def _tokens(self) -> AsyncIterator[str]:
+        for i in range(self.tokens):
+            if i > 0:
+                await self._wait(self.token_latency_s)
+            yield f"tok{i} "
+
+    ##### OpenAI #####
+
+    async def openai_chat_completions(self, request: web.Request) -> web.StreamResponse:
+        data = await self._read_json(request)
+        model = data.get("model", "mock-model")
+        prompt_tokens = request["prompt_tokens"]
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": self.tokens,
+            "total_tokens": prompt_tokens + self.tokens,
+        }
+        response_id = f"chatcmpl-{uuid.uuid4().hex}"
+        created = int(time.time())
+        await self._wait(self.latency_s)
+
+        if not data.get("stream"):
+            return web.json_response(
+                {
+                    "id": response_id,
+                    "object": "chat.completion",
+                    "created": created,
+                    "model": model,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {
+                                "role": "assistant",
+                                "content": "".join(
+                                    f"tok{i} " for i in range(self.tokens)
+                                ),
+                            },
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": usage,
+                }
+            )
+
+        include_usage = (data.get("stream_options") or {}).get("include_usage")
+
+        def _chunk(delta: dict, finish_reason=None, chunk_usage=None) -> bytes:
+            chunk = {
+                "id": response_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": (
+                    []
+                    if chunk_usage is not None
+                    else [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+                ),
+            }
+            if chunk_usage is not None:
+                chunk["usage"] = chunk_usage
+            return f"data: {json.dumps(chunk)}\n\n".encode()
+
+        async def _chunks() -> AsyncIterator[bytes]:
+            yield _chunk({"role": "assistant", "content": ""})
+            async for token in self._tokens():
+                yield _chunk({"content": token})
+            yield _chunk({}, finish_reason="stop")
+            if include_usage:
+                yield _chunk({}, chunk_usage=usage)
+            yield b"data: [DONE]\n\n"
+
+        return await self._stream(request, "text/event-stream", _chunks())
+
+    async def openai_embeddings(self, request: web.Request) -> web.Response:
+        data = await self._read_json(request)
+        inputs = data.get("input") or [""]
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        await self._wait(self.latency_s)
+        return web.json_response(
+            {
+                "object": "list",
+                "data": [
+                    {"object": "embedding", "index": i, "embedding": [0.0] * 8}
+                    for i in range(len(inputs))
+                ],
+                "model": data.get("model", "mock-embedding-model"),
+                "usage": {
+                    "prompt_tokens": request["prompt_tokens"],
+                    "total_tokens": request["prompt_tokens"],
+                },
+            }
+        )
+
+    ##### Anthropic #####
+
+    async def anthropic_messages(self, request: web.Request) -> web.StreamResponse:
+        data = await self._read_json(request)
+        model = data.get("model", "mock-model")
+        prompt_tokens = request["prompt_tokens"]
+        message_id = f"msg_{uuid.uuid4().hex}"
+        await self._wait(self.latency_s)
+
+        if not data.get("stream"):
+            return web.json_response(
+                {
+                    "id": message_id,
+                    "type": "message",
+                    "role": "assistant",
+                    "model": model,
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": "".join(f"tok{i} " for i in range(self.tokens)),
+                        }
+                    ],
+                    "stop_reason": "end_turn",
+                    "stop_sequence": None,
+                    "usage": {
+                        "input_tokens": prompt_tokens,
+                        "output_tokens": self.tokens,
+                    },
+                }
+            )
+
+        def _event(event_type: str, event: dict) -> bytes:
+            event["type"] = event_type
+            return f"event: {event_type}\ndata: {json.dumps(event)}\n\n".encode()
+
+        async def _chunks() -> AsyncIterator[bytes]:
+            yield _event(
+                "message_start",
+                {
+                    "message": {
+                        "id": message_id,
+                        "type": "message",
+                        "role": "assistant",
+                        "model": model,
+                        "content": [],
+                        "stop_reason": None,
+                        "stop_sequence": None,
+                        "usage": {"input_tokens": prompt_tokens, "output_tokens": 1},
+                    }
+                },
+            )
+            yield _event(
+                "content_block_start",
+                {"index": 0, "content_block": {"type": "text", "text": ""}},
+            )
+            async for token in self._tokens():
+                yield _event(
+                    "content_block_delta",
+                    {"index": 0, "delta": {"type": "text_delta", "text": token}},
+                )
+            yield _event("content_block_stop", {"index": 0})
+            yield _event(
+                "message_delta",
+                {
+                    "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                    "usage": {"output_tokens": self.tokens},
+                },
+            )
+            yield _event("message_stop", {})
+
+        return await self._stream(request, "text/event-stream", _chunks())
+
+    ##### Bedrock #####
+
+    def _bedrock_usage(self, prompt_tokens: int) -> dict:
+        return {
+            "inputTokens": prompt_tokens,
+            "outputTokens": self.tokens,
+            "totalTokens": prompt_tokens + self.tokens,
+        }
+
+    async def bedrock_converse(self, request: web.Request) -> web.Response:
+        await self._read_json(request)
+        await self._wait(self.latency_s)
+        return web.json_response(
+            {
+                "output": {
+                    "message": {
+                        "role": "assistant",
+                        "content": [
+                            {"text": "".join(f"tok{i} " for i in range(self.tokens))}
+                        ],
+                    }
+                },
+                "stopReason": "end_turn",
+                "usage": self._bedrock_usage(request["prompt_tokens"]),
+                "metrics": {"latencyMs": int(self.latency_s * 1000)},
+            }
+        )
+
+    async def bedrock_converse_stream(self, request: web.Request) -> web.StreamResponse:
+        await self._read_json(request)
+        prompt_tokens = request["prompt_tokens"]
+        await self._wait(self.latency_s)
+
+        async def _chunks() -> AsyncIterator[bytes]:
+            yield encode_event_stream_frame("messageStart", {"role": "assistant"})
+            async for token in self._tokens():
+                yield encode_event_stream_frame(
+                    "contentBlockDelta",
+                    {"delta": {"text": token}, "contentBlockIndex": 0},
+                )
+            yield encode_event_stream_frame(
+                "contentBlockStop", {"contentBlockIndex": 0}
+            )
+            yield encode_event_stream_frame("messageStop", {"stopReason": "end_turn"})
+            yield encode_event_stream_frame(
+                "metadata",
+                {
+                    "usage": self._bedrock_usage(prompt_tokens),
+                    "metrics": {"latencyMs": int(self.latency_s * 1000)},
+                },
+            )
+
+        return await self._stream(
+            request, "application/vnd.amazon.eventstream", _chunks()
+        )
+
+    async def stats(self, request: web.Request) -> web.Response:
+        return web.json_response({"requests": self.requests})
+
+
+def encode_event_stream_frame(event_type: str, event: dict) -> bytes:
+    """Encode an event as an AWS event stream frame - the Bedrock streaming wire format"""
+    headers = b""
+    for name, value in (
+        (":event-type", event_type),
+        (":content-type", "application/json"),
+        (":message-type", "event"),
+    ):
+        headers += bytes([len(name)]) + name.encode() + bytes([7])
+        headers += struct.pack(">H", len(value)) + value.encode()
+    payload = json.dumps(event).encode()
+    total_length = 12 + len(headers) + len(payload) + 4
+    prelude = struct.pack(">II", total_length, len(headers))
+    message = prelude + struct.pack(">I", zlib.crc32(prelude)) + headers + payload
+    return message + struct.pack(">I", zlib.crc32(message))
+
+
+def create_app(
+    latency_ms: float = 0, tokens: int = 20, token_latency_ms: float = 0
+) -> web.Application:
+    provider = MockProvider(
+        latency_ms=latency_ms, tokens=tokens, token_latency_ms=token_latency_ms
+    )
+    app = web.Application(client_max_size=64 * 1024 * 1024)
+    app.router.add_post("/v1/chat/completions", provider.openai_chat_completions)
+    app.router.add_post("/chat/completions", provider.openai_chat_completions)
+    app.router.add_post("/v1/embeddings", provider.openai_embeddings)
+    app.router.add_post("/embeddings", provider.openai_embeddings)
+    app.router.add_post("/v1/messages", provider.anthropic_messages)
+    app.router.add_post("/model/{model_id}/converse", provider.bedrock_converse)
+    app.router.add_post(
+        "/model/{model_id}/converse-stream", provider.bedrock_converse_stream
+    )
+    app.router.add_get("/stats", provider.stats)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0,
+        help="time to first byte / to the full non-streaming response",
+    )
+    parser.add_argument("--tokens", type=int, default=20, help="completion tokens")
+    parser.add_argument(
+        "--token-latency-ms",
+        type=float,
+        default=0,
+        help="delay between streamed chunks",
+    )
+    args = parser.parse_args()
+
+    web.run_app(
+        create_app(
+            latency_ms=args.latency_ms,
+            tokens=args.tokens,
+            token_latency_ms=args.token_latency_ms,
+        ),
+        host=args.host,
+        port=args.port,
+        access_log=None,
+        print=None,
+    )
+
+
+if __name__ == "__main__":
+    main()
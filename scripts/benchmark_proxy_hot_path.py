@@ -0,0 +1,764 @@
+#!/usr/bin/env python3
+"""
+Benchmark the LiteLLM proxy's own overhead end to end, against a local mock provider.
+
+For each scenario, starts `scripts/benchmark_mock_provider.py` (fixed provider latency) and a proxy with a generated
+config, sends `--requests` requests with `--concurrency` in flight, and reports:
+- RPS
+- p50 / p99 latency added by the proxy - proxy latency minus the latency of the same load sent to the mock directly
+- p50 / p99 of the `x-litellm-overhead-duration-ms` header
+- proxy CPU time per request and proxy RSS (all proxy processes)
+
+Scenarios: auth + pre-call processing + routing (`baseline`), streaming, provider translation (Anthropic, Bedrock),
+many deployments, wildcard routes, caching, logging callbacks, and many virtual keys with rate limits and spend writes
+(`many_keys` - needs `--database-url`).
+
+Results can be written to JSON (`--output`) and compared with a previous run (`--compare`), to track regressions release
+over release. With `--compare`, exits with status 1 if a metric regressed by more than `--max-regression-pct`.
+
+USAGE:
+   python scripts/benchmark_proxy_hot_path.py
+   python scripts/benchmark_proxy_hot_path.py --scenarios baseline streaming --requests 5000 --concurrency 100
+   python scripts/benchmark_proxy_hot_path.py --provider-latency-ms 100 --tokens 200 --token-latency-ms 2
+   python scripts/benchmark_proxy_hot_path.py --output bench/v1.2.0.json
+   python scripts/benchmark_proxy_hot_path.py --compare bench/v1.2.0.json --max-regression-pct 10
+   python scripts/benchmark_proxy_hot_path.py --scenarios many_keys --database-url postgresql://...
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+import yaml
+
+MASTER_KEY = "sk-benchmark-master-key"
+MOCK_PROVIDER_SCRIPT = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "benchmark_mock_provider.py"
+)
+
+# written next to the generated config, for the `logging` scenario
+BENCHMARK_CALLBACK_MODULE = '''
+from litellm.integrations.custom_logger import CustomLogger
+
+
+class BenchmarkLogger(CustomLogger):
+    """Reads the standard logging payload, like a logging integration - without shipping it anywhere"""
+
+    async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
+        payload = kwargs.get("standard_logging_object") or {}
+        self.last_cost = payload.get("response_cost")
+
+
+benchmark_logger = BenchmarkLogger()
+'''
+
+# (model, request body) for the i-th request
+RequestBuilder = Callable[[int], Tuple[str, Dict[str, Any]]]
+
+
+@dataclass
+class Scenario:
+    name: str
+    description: str
+    model_list: Callable[[str], List[dict]]
+    request: RequestBuilder
+    stream: bool = False
+    litellm_settings: Dict[str, Any] = field(default_factory=dict)
+    general_settings: Dict[str, Any] = field(default_factory=dict)
+    requires_database: bool = False
+    # virtual keys to create and send requests with - needs a database
+    num_keys: int = 0
+
+
+def _messages(i: int, unique: bool = True) -> List[dict]:
+    content = f"request {i}: say hello" if unique else "say hello"
+    return [{"role": "user", "content": content}]
+
+
+def _openai_deployment(model_name: str, mock_url: str, model: str = "gpt-4o") -> dict:
+    return {
+        "model_name": model_name,
+        "litellm_params": {
+            "model": f"openai/{model}",
+            "api_base": f"{mock_url}/v1",
+            "api_key": "fake-key",
+        },
+    }
+
+
+def _chat_request(model: str, stream: bool = False, unique: bool = True):
+    def _build(i: int) -> Tuple[str, Dict[str, Any]]:
+        body: Dict[str, Any] = {"model": model, "messages": _messages(i, unique)}
+        if stream:
+            body["stream"] = True
+            body["stream_options"] = {"include_usage": True}
+        return model, body
+
+    return _build
+
+
+def get_scenarios(args: argparse.Namespace) -> Dict[str, Scenario]:
+    bedrock_params = {
+        "model": "bedrock/converse/anthropic.claude-3-5-sonnet-20240620-v1:0",
+        "aws_access_key_id": "fake-access-key",
+        "aws_secret_access_key": "fake-secret-key",
+        "aws_region_name": "us-east-1",
+    }
+
+    def _many_deployments(mock_url: str) -> List[dict]:
+        return [
+            _openai_deployment(f"model-{group}", mock_url, model=f"gpt-4o-{i}")
+            for group in range(args.model_groups)
+            for i in range(args.deployments_per_group)
+        ]
+
+    def _many_deployments_request(i: int) -> Tuple[str, Dict[str, Any]]:
+        model = f"model-{i % args.model_groups}"
+        return model, {"model": model, "messages": _messages(i)}
+
+    def _wildcard_request(i: int) -> Tuple[str, Dict[str, Any]]:
+        model = f"openai/gpt-4o-mini-{i % 50}"
+        return model, {"model": model, "messages": _messages(i)}
+
+    def _cached_request(i: int) -> Tuple[str, Dict[str, Any]]:
+        return "gpt-4o", {
+            "model": "gpt-4o",
+            "messages": _messages(i % args.cache_prompts),
+        }
+
+    scenarios = [
+        Scenario(
+            name="baseline",
+            description="1 deployment, master key - auth, pre-call processing, routing, logging",
+            model_list=lambda mock_url: [_openai_deployment("gpt-4o", mock_url)],
+            request=_chat_request("gpt-4o"),
+        ),
+        Scenario(
+            name="streaming",
+            description="baseline, streamed with usage",
+            model_list=lambda mock_url: [_openai_deployment("gpt-4o", mock_url)],
+            request=_chat_request("gpt-4o", stream=True),
+            stream=True,
+        ),
+        Scenario(
+            name="anthropic",
+            description="OpenAI request translated to Anthropic /v1/messages",
+            model_list=lambda mock_url: [
+                {
+                    "model_name": "claude",
+                    "litellm_params": {
+                        "model": "anthropic/claude-3-5-sonnet-20240620",
+                        "api_base": mock_url,
+                        "api_key": "fake-key",
+                    },
+                }
+            ],
+            request=_chat_request("claude"),
+        ),
+        Scenario(
+            name="anthropic_streaming",
+            description="anthropic, streamed",
+            model_list=lambda mock_url: [
+                {
+                    "model_name": "claude",
+                    "litellm_params": {
+                        "model": "anthropic/claude-3-5-sonnet-20240620",
+                        "api_base": mock_url,
+                        "api_key": "fake-key",
+                    },
+                }
+            ],
+            request=_chat_request("claude", stream=True),
+            stream=True,
+        ),
+        Scenario(
+            name="bedrock",
+            description="OpenAI request translated to Bedrock converse (SigV4 signed)",
+            model_list=lambda mock_url: [
+                {
+                    "model_name": "bedrock-claude",
+                    "litellm_params": {
+                        **bedrock_params,
+                        "aws_bedrock_runtime_endpoint": mock_url,
+                    },
+                }
+            ],
+            request=_chat_request("bedrock-claude"),
+        ),
+        Scenario(
+            name="bedrock_streaming",
+            description="bedrock, streamed (AWS event stream)",
+            model_list=lambda mock_url: [
+                {
+                    "model_name": "bedrock-claude",
+                    "litellm_params": {
+                        **bedrock_params,
+                        "aws_bedrock_runtime_endpoint": mock_url,
+                    },
+                }
+            ],
+            request=_chat_request("bedrock-claude", stream=True),
+            stream=True,
+        ),
+        Scenario(
+            name="many_deployments",
+            description=f"{args.model_groups} model groups x {args.deployments_per_group} deployments",
+            model_list=_many_deployments,
+            request=_many_deployments_request,
+        ),
+        Scenario(
+            name="wildcard",
+            description="openai/* wildcard route, 50 distinct models",
+            model_list=lambda mock_url: [
+                {
+                    "model_name": "openai/*",
+                    "litellm_params": {
+                        "model": "openai/*",
+                        "api_base": f"{mock_url}/v1",
+                        "api_key": "fake-key",
+                    },
+                }
+            ],
+            request=_wildcard_request,
+        ),
+        Scenario(
+            name="caching",
+            description=f"in-memory cache, {args.cache_prompts} distinct prompts",
+            model_list=lambda mock_url: [_openai_deployment("gpt-4o", mock_url)],
+            request=_cached_request,
+            litellm_settings={"cache": True, "cache_params": {"type": "local"}},
+        ),
+        Scenario(
+            name="logging",
+            description="baseline + a custom logging callback",
+            model_list=lambda mock_url: [_openai_deployment("gpt-4o", mock_url)],
+            request=_chat_request("gpt-4o"),
+            litellm_settings={"callbacks": "benchmark_callbacks.benchmark_logger"},
+        ),
+        Scenario(
+            name="many_keys",
+            description=f"{args.keys} virtual keys with rpm / tpm limits, spend writes",
+            model_list=lambda mock_url: [_openai_deployment("gpt-4o", mock_url)],
+            request=_chat_request("gpt-4o"),
+            requires_database=True,
+            num_keys=args.keys,
+        ),
+    ]
+    return {scenario.name: scenario for scenario in scenarios}
+
+
+##### processes #####
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _wait_until_ready(url: str, process: subprocess.Popen, timeout: float):
+    deadline = time.time() + timeout
+    async with aiohttp.ClientSession() as session:
+        while time.time() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"process exited with code {process.returncode}")
+            try:
+                async with session.get(url) as response:
+                    if response.status < 500:
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.25)
+    raise RuntimeError(f"{url} not ready after {timeout}s")
+
+
+def _stop(process: Optional[subprocess.Popen]) -> None:
+    if process is None or process.poll() is not None:
+        return
+    process.terminate()
+    try:
+        process.wait(timeout=15)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+class ProcessTreeStats:
+    """CPU time and RSS of a process and its children - psutil if installed, else /proc (Linux)"""
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        try:
+            import psutil
+
+            self._psutil_process: Any = psutil.Process(pid)
+        except ImportError:
+            self._psutil_process = None
+
+    def _pids(self) -> List[int]:
+        children: Dict[int, List[int]] = {}
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    # the process name can contain spaces - fields after it are space separated
+                    ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+            children.setdefault(ppid, []).append(int(entry))
+        pids, stack = [], [self.pid]
+        while stack:
+            pid = stack.pop()
+            pids.append(pid)
+            stack.extend(children.get(pid, []))
+        return pids
+
+    def cpu_seconds(self) -> Optional[float]:
+        if self._psutil_process is not None:
+            processes = [self._psutil_process] + self._psutil_process.children(
+                recursive=True
+            )
+            total = 0.0
+            for process in processes:
+                cpu_times = process.cpu_times()
+                total += cpu_times.user + cpu_times.system
+            return total
+        if not os.path.isdir("/proc"):
+            return None
+        clock_ticks = os.sysconf("SC_CLK_TCK")
+        total = 0.0
+        for pid in self._pids():
+            try:
+                with open(f"/proc/{pid}/stat") as f:
+                    fields = f.read().rsplit(")", 1)[1].split()
+                # utime, stime
+                total += (int(fields[11]) + int(fields[12])) / clock_ticks
+            except (OSError, IndexError, ValueError):
+                continue
+        return total
+
+    def rss_mb(self) -> Optional[float]:
+        if self._psutil_process is not None:
+            processes = [self._psutil_process] + self._psutil_process.children(
+                recursive=True
+            )
+            return sum(process.memory_info().rss for process in processes) / 2**20
+        if not os.path.isdir("/proc"):
+            return None
+        total_kb = 0
+        for pid in self._pids():
+            try:
+                with open(f"/proc/{pid}/status") as f:
+                    for line in f:
+                        if line.startswith("VmRSS:"):
+                            total_kb += int(line.split()[1])
+                            break
+            except (OSError, IndexError, ValueError):
+                continue
+        return total_kb / 1024
+
+
+##### load #####
+
+
+@dataclass
+class LoadResult:
+    latencies_ms: List[float] = field(default_factory=list)
+    overhead_header_ms: List[float] = field(default_factory=list)
+    errors: int = 0
+    first_error: Optional[str] = None
+    duration_s: float = 0.0
+
+
+async def run_load(
+    url: str,
+    request: RequestBuilder,
+    num_requests: int,
+    concurrency: int,
+    api_keys: List[str],
+    timeout: float,
+) -> LoadResult:
+    result = LoadResult()
+    next_request = 0
+
+    async def _worker(session: aiohttp.ClientSession) -> None:
+        nonlocal next_request
+        while next_request < num_requests:
+            i = next_request
+            next_request += 1
+            _, body = request(i)
+            headers = {"Authorization": f"Bearer {api_keys[i % len(api_keys)]}"}
+            start = time.perf_counter()
+            try:
+                async with session.post(url, json=body, headers=headers) as response:
+                    # read the full (streamed) response
+                    await response.read()
+                    if response.status != 200:
+                        result.errors += 1
+                        result.first_error = result.first_error or (
+                            f"{response.status}: {(await response.text())[:300]}"
+                        )
+                        continue
+                    overhead = response.headers.get("x-litellm-overhead-duration-ms")
+                    if overhead:
+                        result.overhead_header_ms.append(float(overhead))
+            except Exception as e:
+                result.errors += 1
+                result.first_error = result.first_error or repr(e)
+                continue
+            result.latencies_ms.append((time.perf_counter() - start) * 1000)
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=aiohttp.ClientTimeout(total=timeout)
+    ) as session:
+        start = time.perf_counter()
+        await asyncio.gather(*(_worker(session) for _ in range(concurrency)))
+        result.duration_s = time.perf_counter() - start
+    return result
+
+
+def _percentile(values: List[float], percentile: float) -> Optional[float]:
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(int(len(values) * percentile / 100), len(values) - 1)]
+
+
+##### scenarios #####
+
+
+def _write_config(scenario: Scenario, mock_url: str, directory: str) -> str:
+    general_settings = {"master_key": MASTER_KEY, **scenario.general_settings}
+    config = {
+        "model_list": scenario.model_list(mock_url),
+        "litellm_settings": scenario.litellm_settings,
+        "general_settings": general_settings,
+    }
+    with open(os.path.join(directory, "benchmark_callbacks.py"), "w") as f:
+        f.write(BENCHMARK_CALLBACK_MODULE)
+    config_path = os.path.join(directory, f"{scenario.name}.yaml")
+    with open(config_path, "w") as f:
+        yaml.safe_dump(config, f)
+    return config_path
+
+
+async def _create_keys(proxy_url: str, num_keys: int) -> List[str]:
+    keys = []
+    async with aiohttp.ClientSession(
+        headers={"Authorization": f"Bearer {MASTER_KEY}"}
+    ) as session:
+        for _ in range(num_keys):
+            async with session.post(
+                f"{proxy_url}/key/generate",
+                json={"rpm_limit": 1_000_000, "tpm_limit": 1_000_000_000},
+            ) as response:
+                response.raise_for_status()
+                keys.append((await response.json())["key"])
+    return keys
+
+
+async def run_scenario(
+    scenario: Scenario,
+    args: argparse.Namespace,
+    mock_url: str,
+    direct: Dict[bool, LoadResult],
+    directory: str,
+) -> Dict[str, Any]:
+    config_path = _write_config(scenario, mock_url, directory)
+    port = _free_port()
+    env = {**os.environ, "LITELLM_LOG": args.proxy_log_level}
+    if args.database_url:
+        env["DATABASE_URL"] = args.database_url
+    log_path = os.path.join(directory, f"{scenario.name}.log")
+    proxy_process: Optional[subprocess.Popen] = None
+    with open(log_path, "w") as log_file:
+        try:
+            proxy_process = subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "litellm.proxy.proxy_cli",
+                    "--config",
+                    config_path,
+                    "--host",
+                    "127.0.0.1",
+                    "--port",
+                    str(port),
+                    "--num_workers",
+                    str(args.num_workers),
+                ],
+                env=env,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+            )
+            proxy_url = f"http://127.0.0.1:{port}"
+            try:
+                await _wait_until_ready(
+                    f"{proxy_url}/health/liveliness",
+                    proxy_process,
+                    timeout=args.startup_timeout,
+                )
+            except RuntimeError as e:
+                with open(log_path) as f:
+                    log_tail = f.read()[-2000:]
+                raise RuntimeError(f"proxy did not start: {e}\n{log_tail}")
+
+            api_keys = [MASTER_KEY]
+            if scenario.num_keys:
+                api_keys = await _create_keys(proxy_url, scenario.num_keys)
+
+            load_kwargs = dict(
+                url=f"{proxy_url}/chat/completions",
+                request=scenario.request,
+                concurrency=args.concurrency,
+                api_keys=api_keys,
+                timeout=args.request_timeout,
+            )
+            await run_load(num_requests=args.warmup, **load_kwargs)  # type: ignore
+
+            stats = ProcessTreeStats(proxy_process.pid)
+            cpu_before = stats.cpu_seconds()
+            result = await run_load(num_requests=args.requests, **load_kwargs)  # type: ignore
+            cpu_after = stats.cpu_seconds()
+            rss_mb = stats.rss_mb()
+        finally:
+            _stop(proxy_process)
+
+    successful = len(result.latencies_ms)
+    direct_result = direct[scenario.stream]
+
+    def _added(percentile: float) -> Optional[float]:
+        proxy_ms = _percentile(result.latencies_ms, percentile)
+        direct_ms = _percentile(direct_result.latencies_ms, percentile)
+        if proxy_ms is None or direct_ms is None:
+            return None
+        return proxy_ms - direct_ms
+
+    return {
+        "description": scenario.description,
+        "requests": args.requests,
+        "errors": result.errors,
+        "first_error": result.first_error,
+        "rps": successful / result.duration_s if result.duration_s else None,
+        "p50_ms": _percentile(result.latencies_ms, 50),
+        "p99_ms": _percentile(result.latencies_ms, 99),
+        "added_p50_ms": _added(50),
+        "added_p99_ms": _added(99),
+        "overhead_header_p50_ms": _percentile(result.overhead_header_ms, 50),
+        "overhead_header_p99_ms": _percentile(result.overhead_header_ms, 99),
+        "cpu_ms_per_request": (
+            (cpu_after - cpu_before) * 1000 / successful
+            if cpu_before is not None and cpu_after is not None and successful
+            else None
+        ),
+        "rss_mb": rss_mb,
+    }
+
+
+##### reporting #####
+
+# metric -> True if higher is better
+TRACKED_METRICS: Dict[str, bool] = {
+    "rps": True,
+    "added_p50_ms": False,
+    "added_p99_ms": False,
+    "cpu_ms_per_request": False,
+    "rss_mb": False,
+}
+
+
+def _fmt(value: Optional[float], width: int) -> str:
+    return f"{'-':>{width}}" if value is None else f"{value:>{width}.1f}"
+
+
+def print_results(results: Dict[str, Dict[str, Any]]) -> None:
+    print()
+    print(
+        f"{'scenario':<20} {'rps':>8} {'added p50':>10} {'added p99':>10} {'hdr p50':>8} {'hdr p99':>8} "
+        f"{'cpu ms/req':>11} {'rss MB':>8} {'errors':>7}"
+    )
+    for name, result in results.items():
+        print(
+            f"{name:<20} {_fmt(result['rps'], 8)} {_fmt(result['added_p50_ms'], 10)} "
+            f"{_fmt(result['added_p99_ms'], 10)} {_fmt(result['overhead_header_p50_ms'], 8)} "
+            f"{_fmt(result['overhead_header_p99_ms'], 8)} {_fmt(result['cpu_ms_per_request'], 11)} "
+            f"{_fmt(result['rss_mb'], 8)} {result['errors']:>7}"
+        )
+    for name, result in results.items():
+        if result["first_error"]:
+            print(f"\n{name} - first error: {result['first_error']}")
+
+
+def compare_results(
+    results: Dict[str, Dict[str, Any]],
+    previous: Dict[str, Dict[str, Any]],
+    max_regression_pct: float,
+) -> List[str]:
+    """Print the change of the tracked metrics vs. a previous run. Returns the regressions."""
+    regressions = []
+    print(
+        f"\n{'scenario':<20} {'metric':<20} {'previous':>10} {'now':>10} {'change':>8}"
+    )
+    for name, result in results.items():
+        if name not in previous:
+            continue
+        for metric, higher_is_better in TRACKED_METRICS.items():
+            before, now = previous[name].get(metric), result.get(metric)
+            if before is None or now is None or before == 0:
+                continue
+            change_pct = (now - before) / abs(before) * 100
+            regressed = (
+                -change_pct if higher_is_better else change_pct
+            ) > max_regression_pct
+            if regressed:
+                regressions.append(f"{name} {metric}: {before:.1f} -> {now:.1f}")
+            print(
+                f"{name:<20} {metric:<20} {before:>10.1f} {now:>10.1f} {change_pct:>+7.1f}%"
+                + ("  REGRESSION" if regressed else "")
+            )
+    return regressions
+
+
+def _metadata(args: argparse.Namespace) -> Dict[str, Any]:
+    try:
+        from importlib.metadata import version
+
+        litellm_version: Optional[str] = version("litellm")
+    except Exception:
+        litellm_version = None
+    try:
+        git_commit: Optional[str] = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(MOCK_PROVIDER_SCRIPT),
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except Exception:
+        git_commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "litellm_version": litellm_version,
+        "git_commit": git_commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "args": {k: v for k, v in vars(args).items() if k != "database_url"},
+    }
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    scenarios = get_scenarios(args)
+    unknown = set(args.scenarios or []) - set(scenarios)
+    if unknown:
+        print(f"Unknown scenarios: {sorted(unknown)}. Available: {sorted(scenarios)}")
+        return 2
+    selected = [scenarios[name] for name in (args.scenarios or scenarios)]
+
+    mock_port = _free_port()
+    mock_url = f"http://127.0.0.1:{mock_port}"
+    mock_process = subprocess.Popen(
+        [
+            sys.executable,
+            MOCK_PROVIDER_SCRIPT,
+            "--port",
+            str(mock_port),
+            "--latency-ms",
+            str(args.provider_latency_ms),
+            "--tokens",
+            str(args.tokens),
+            "--token-latency-ms",
+            str(args.token_latency_ms),
+        ]
+    )
+    results: Dict[str, Dict[str, Any]] = {}
+    try:
+        await _wait_until_ready(f"{mock_url}/stats", mock_process, timeout=30)
+
+        # the same load, sent to the mock provider directly - subtracted from the proxy latency
+        direct: Dict[bool, LoadResult] = {}
+        for stream in {scenario.stream for scenario in selected}:
+            direct_kwargs = dict(
+                url=f"{mock_url}/v1/chat/completions",
+                request=_chat_request("gpt-4o", stream=stream),
+                concurrency=args.concurrency,
+                api_keys=["fake-key"],
+                timeout=args.request_timeout,
+            )
+            await run_load(num_requests=args.warmup, **direct_kwargs)  # type: ignore
+            direct[stream] = await run_load(num_requests=args.requests, **direct_kwargs)  # type: ignore
+
+        with tempfile.TemporaryDirectory() as directory:
+            for scenario in selected:
+                if scenario.requires_database and not args.database_url:
+                    print(f"Skipping {scenario.name} - needs --database-url")
+                    continue
+                print(f"Running {scenario.name} - {scenario.description}")
+                results[scenario.name] = await run_scenario(
+                    scenario, args, mock_url, direct, directory
+                )
+    finally:
+        _stop(mock_process)
+
+    print_results(results)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump({"metadata": _metadata(args), "scenarios": results}, f, indent=2)
+        print(f"\nWrote {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+        print(
+            f"\nCompared with {args.compare} ({previous['metadata'].get('litellm_version')})"
+        )
+        regressions = compare_results(
+            results, previous["scenarios"], args.max_regression_pct
+        )
+        if regressions:
+            print(f"\n{len(regressions)} regressions > {args.max_regression_pct}%:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scenarios", nargs="+", help="default: all")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--num-workers", type=int, default=1, help="proxy workers")
+    parser.add_argument("--provider-latency-ms", type=float, default=0)
+    parser.add_argument("--tokens", type=int, default=20)
+    parser.add_argument("--token-latency-ms", type=float, default=0)
+    parser.add_argument("--model-groups", type=int, default=50)
+    parser.add_argument("--deployments-per-group", type=int, default=4)
+    parser.add_argument("--cache-prompts", type=int, default=10)
+    parser.add_argument("--keys", type=int, default=100)
+    parser.add_argument("--database-url", help="enables the many_keys scenario")
+    parser.add_argument("--proxy-log-level", default="ERROR")
+    parser.add_argument("--startup-timeout", type=float, default=120)
+    parser.add_argument("--request-timeout", type=float, default=120)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="compare with a previous --output file")
+    parser.add_argument("--max-regression-pct", type=float, default=10)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
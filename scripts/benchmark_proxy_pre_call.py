@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark the proxy pre-call overhead of `add_litellm_data_to_request`, per request.
+
+Compares building the key / team controls (callbacks, tags, guardrails, enforced params) on every request against
+reusing the cached `KeyTeamRequestTemplate` of the key.
+
+USAGE:
+   python scripts/benchmark_proxy_pre_call.py
+   python scripts/benchmark_proxy_pre_call.py --iterations 5000 --models 10 500
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+sys.path.insert(0, ".")
+
+from starlette.requests import Request  # noqa: E402
+
+from litellm.proxy import litellm_pre_call_utils  # noqa: E402
+from litellm.proxy._types import UserAPIKeyAuth  # noqa: E402
+from litellm.proxy.litellm_pre_call_utils import (  # noqa: E402
+    add_litellm_data_to_request,
+    invalidate_key_team_request_templates,
+)
+from litellm.proxy.proxy_server import ProxyConfig  # noqa: E402
+
+
+def _request() -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "POST",
+            "scheme": "http",
+            "server": ("localhost", 4000),
+            "client": ("127.0.0.1", 50000),
+            "root_path": "",
+            "path": "/chat/completions",
+            "query_string": b"",
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"authorization", b"Bearer sk-1234"),
+            ],
+        }
+    )
+
+
+def _proxy_config(num_models: int) -> ProxyConfig:
+    proxy_config = ProxyConfig()
+    proxy_config.update_config_state(
+        config={
+            "model_list": [
+                {
+                    "model_name": f"model-{i}",
+                    "litellm_params": {"model": f"openai/model-{i}"},
+                }
+                for i in range(num_models)
+            ],
+            "litellm_settings": {
+                "default_team_settings": [
+                    {
+                        "team_id": "team-config",
+                        "success_callback": ["langfuse"],
+                        "langfuse_public_key": "pk-team",
+                    }
+                ]
+            },
+        }
+    )
+    return proxy_config
+
+
+def _user_api_key_dict(scenario: str) -> UserAPIKeyAuth:
+    if scenario == "team callbacks in config":
+        return UserAPIKeyAuth(
+            api_key="hashed-key",
+            team_id="team-config",
+            metadata={"tags": ["key-tag"]},
+            team_metadata={"tags": ["team-tag"]},
+        )
+    return UserAPIKeyAuth(
+        api_key="hashed-key",
+        team_id="team-metadata",
+        metadata={
+            "tags": ["key-tag"],
+            "spend_logs_metadata": {"source": "key"},
+            "logging": [
+                {
+                    "callback_name": "langfuse",
+                    "callback_type": "success",
+                    "callback_vars": {
+                        "langfuse_public_key": "pk-key",
+                        "langfuse_secret_key": "sk-key",
+                    },
+                }
+            ],
+        },
+        team_metadata={"tags": ["team-tag"], "spend_logs_metadata": {"team": "a"}},
+    )
+
+
+async def _per_request_us(
+    scenario: str, proxy_config: ProxyConfig, iterations: int
+) -> float:
+    async def _add_litellm_data():
+        await add_litellm_data_to_request(
+            data={
+                "model": "model-0",
+                "messages": [{"role": "user", "content": "hi"}],
+                "metadata": {"tags": ["request-tag"]},
+            },
+            request=_request(),
+            user_api_key_dict=_user_api_key_dict(scenario),
+            proxy_config=proxy_config,
+            general_settings={},
+        )
+
+    await _add_litellm_data()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await _add_litellm_data()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--models", type=int, nargs="+", default=[10, 200])
+    args = parser.parse_args()
+
+    template_cache = litellm_pre_call_utils._key_team_request_template_cache
+    cache_size = template_cache.max_size_in_memory
+    print(
+        f"{'scenario':>26} {'models':>7} {'no template us':>15} {'template us':>12} {'speedup':>8}"
+    )
+    for scenario in ("team callbacks in config", "key logging metadata"):
+        for num_models in args.models:
+            proxy_config = _proxy_config(num_models)
+
+            # max_size_in_memory=0 - templates are rebuilt on every request
+            template_cache.max_size_in_memory = 0
+            invalidate_key_team_request_templates()
+            before_us = await _per_request_us(scenario, proxy_config, args.iterations)
+
+            template_cache.max_size_in_memory = cache_size
+            after_us = await _per_request_us(scenario, proxy_config, args.iterations)
+            print(
+                f"{scenario:>26} {num_models:>7} {before_us:>15.1f} {after_us:>12.1f} {before_us / after_us:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
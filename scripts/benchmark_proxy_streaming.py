@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-chunk proxy overhead of `async_data_generator` (SSE formatting of a chat completion stream).
+
+Compares running the per-chunk `async_post_call_streaming_hook` for every callback (used before) against the
+pure-proxy fast path, used when no callback implements the per-chunk hook.
+
+USAGE:
+   python scripts/benchmark_proxy_streaming.py
+   python scripts/benchmark_proxy_streaming.py --chunks 100 1000 --callbacks 8
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, ".")
+
+import litellm  # noqa: E402
+from litellm.integrations.custom_logger import CustomLogger  # noqa: E402
+from litellm.proxy import proxy_server  # noqa: E402
+from litellm.proxy._types import UserAPIKeyAuth  # noqa: E402
+from litellm.proxy.utils import ProxyLogging  # noqa: E402
+from litellm.types.utils import (  # noqa: E402
+    Delta,
+    ModelResponseStream,
+    StreamingChoices,
+)
+
+
+async def _per_chunk_us(
+    chunks: list, proxy_logging_obj: ProxyLogging, repeat: int
+) -> float:
+    async def _stream():
+        for chunk in chunks:
+            yield chunk
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        async for _ in proxy_server.async_data_generator(
+            _stream(), UserAPIKeyAuth(), {"metadata": {}}
+        ):
+            pass
+    return (time.perf_counter() - start) / (repeat * len(chunks)) * 1e6
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chunks", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--callbacks", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=MagicMock())
+    callbacks = [CustomLogger() for _ in range(args.callbacks)]
+    print(
+        f"{'chunks':>7} {'callbacks':>9} {'per-chunk hooks us':>19} {'fast path us':>13} {'speedup':>8}"
+    )
+    with patch.object(litellm, "callbacks", callbacks), patch.object(
+        proxy_server, "proxy_logging_obj", proxy_logging_obj
+    ):
+        for num_chunks in args.chunks:
+            chunks = [
+                ModelResponseStream(
+                    id="chatcmpl-1",
+                    model="gpt-4o",
+                    choices=[StreamingChoices(index=0, delta=Delta(content="token"))],
+                )
+                for _ in range(num_chunks)
+            ]
+            with patch.object(
+                proxy_logging_obj, "has_post_call_streaming_hooks", return_value=True
+            ):
+                before_us = await _per_chunk_us(chunks, proxy_logging_obj, args.repeat)
+            after_us = await _per_chunk_us(chunks, proxy_logging_obj, args.repeat)
+            print(
+                f"{num_chunks:>7} {args.callbacks:>9} {before_us:>19.1f} {after_us:>13.1f} {before_us / after_us:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark the chunk throughput of `CustomStreamWrapper` (the SDK streaming iterator).
+
+Streams OpenAI `ChatCompletionChunk`s through `CustomStreamWrapper` - the per-chunk work of `litellm.acompletion(...,
+stream=True)` without the network - and reports the per-chunk overhead and chunks / second.
+
+USAGE:
+   python scripts/benchmark_streaming_chunk_throughput.py
+   python scripts/benchmark_streaming_chunk_throughput.py --chunks 100 1000 10000 --repeat 5
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, ".")
+
+from openai.types.chat import ChatCompletionChunk  # noqa: E402
+
+from litellm.litellm_core_utils.litellm_logging import Logging  # noqa: E402
+from litellm.litellm_core_utils.streaming_handler import (  # noqa: E402
+    CustomStreamWrapper,
+)
+from litellm.types.utils import Delta  # noqa: E402
+
+
+def _openai_chunks(num_chunks: int) -> list:
+    return [
+        ChatCompletionChunk(
+            id="chatcmpl-benchmark",
+            object="chat.completion.chunk",
+            created=1700000000,
+            model="gpt-4o",
+            choices=[
+                {
+                    "index": 0,
+                    "delta": {"content": f" token{i}"},
+                    "finish_reason": "stop" if i == num_chunks - 1 else None,
+                }
+            ],
+        )
+        for i in range(num_chunks)
+    ]
+
+
+def _stream_wrapper(chunks: list, sync_stream: bool) -> CustomStreamWrapper:
+    logging_obj = Logging(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "hi"}],
+        stream=True,
+        call_type="completion" if sync_stream else "acompletion",
+        start_time=datetime.now(),
+        litellm_call_id="benchmark",
+        function_id="benchmark",
+    )
+    logging_obj.update_environment_variables(
+        model="gpt-4o",
+        user=None,
+        optional_params={},
+        litellm_params={"litellm_call_id": "benchmark"},
+        custom_llm_provider="openai",
+    )
+
+    async def _async_stream():
+        for chunk in chunks:
+            yield chunk
+
+    return CustomStreamWrapper(
+        completion_stream=iter(chunks) if sync_stream else _async_stream(),
+        model="gpt-4o",
+        custom_llm_provider="openai",
+        logging_obj=logging_obj,
+    )
+
+
+def _sync_per_chunk_us(chunks: list) -> float:
+    stream_wrapper = _stream_wrapper(chunks, sync_stream=True)
+    start = time.perf_counter()
+    for _ in stream_wrapper:
+        pass
+    return (time.perf_counter() - start) / len(chunks) * 1e6
+
+
+async def _async_per_chunk_us(chunks: list) -> float:
+    stream_wrapper = _stream_wrapper(chunks, sync_stream=False)
+    start = time.perf_counter()
+    async for _ in stream_wrapper:
+        pass
+    return (time.perf_counter() - start) / len(chunks) * 1e6
+
+
+def _delta_us(iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        Delta(content="token", role="assistant")
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chunks", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"Delta(...) construction: {_delta_us(10000):.1f} us")
+    print()
+    print(
+        f"{'chunks':>7} {'sync us/chunk':>14} {'sync chunks/s':>14} {'async us/chunk':>15} {'async chunks/s':>15}"
+    )
+    for num_chunks in args.chunks:
+        chunks = _openai_chunks(num_chunks)
+        # best of `repeat` runs
+        sync_us = min(_sync_per_chunk_us(chunks) for _ in range(args.repeat))
+        async_us = min(
+            asyncio.run(_async_per_chunk_us(chunks)) for _ in range(args.repeat)
+        )
+        print(
+            f"{num_chunks:>7} {sync_us:>14.1f} {1e6 / sync_us:>14.0f} {async_us:>15.1f} {1e6 / async_us:>15.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1081,6 +1081,42 @@ def test_increment_deployment_cooled_down(prometheus_logger):
     mock_chain.inc.assert_called_once()
 
 
+def test_set_connection_phase_metrics(prometheus_logger):
+    prometheus_logger.litellm_llm_api_connection_phase_latency_metric = MagicMock()
+    standard_logging_payload = create_standard_logging_payload()
+    standard_logging_payload["connection_timings"] = {
+        "start_time": 1234567890.0,
+        "connection_reused": False,
+        "phases": {
+            "pool_wait": {"start_ms": 0.0, "duration_ms": 250.0},
+            "connect": {"start_ms": 250.0, "duration_ms": 40.0},
+        },
+    }
+
+    prometheus_logger._set_connection_phase_metrics(
+        standard_logging_payload=standard_logging_payload,
+        litellm_model_name="gpt-3.5-turbo",
+    )
+
+    metric = prometheus_logger.litellm_llm_api_connection_phase_latency_metric
+    metric.labels.assert_any_call(
+        litellm_model_name="gpt-3.5-turbo",
+        model_id="model-123",
+        api_base="https://api.openai.com",
+        api_provider="openai",
+        connection_phase="pool_wait",
+    )
+    metric.labels.assert_any_call(
+        litellm_model_name="gpt-3.5-turbo",
+        model_id="model-123",
+        api_base="https://api.openai.com",
+        api_provider="openai",
+        connection_phase="connect",
+    )
+    metric.labels().observe.assert_any_call(0.25)
+    metric.labels().observe.assert_any_call(0.04)
+
+
 @pytest.mark.parametrize("enable_end_user_cost_tracking_prometheus_only", [True, False])
 def test_prometheus_factory(monkeypatch, enable_end_user_cost_tracking_prometheus_only):
     from litellm.integrations.prometheus import prometheus_label_factory
@@ -2606,26 +2606,22 @@ def test_bedrock_error_handling_streaming():
         AWSEventStreamDecoder,
         BedrockError,
     )
-    from unittest.mock import patch, Mock
-
-    event = Mock()
-    event.to_response_dict = Mock(
-        return_value={
-            "status_code": 400,
-            "headers": {
-                ":exception-type": "serviceUnavailableException",
-                ":content-type": "application/json",
-                ":message-type": "exception",
-            },
-            "body": b'{"message":"Bedrock is unable to process your request."}',
-        }
+    from litellm.llms.bedrock.event_stream import AWSEventStreamMessage
+
+    event = AWSEventStreamMessage(
+        headers={
+            ":exception-type": "serviceUnavailableException",
+            ":content-type": "application/json",
+            ":message-type": "exception",
+        },
+        payload=b'{"message":"Bedrock is unable to process your request."}',
     )
 
     decoder = AWSEventStreamDecoder(
         model="bedrock/anthropic.claude-3-sonnet-20240229-v1:0"
     )
     with pytest.raises(Exception) as e:
-        decoder._parse_message_from_event(event)
+        decoder._parse_message_from_event_stream_message(event)
     assert isinstance(e.value, BedrockError)
     assert "Bedrock is unable to process your request." in e.value.message
     assert e.value.status_code == 400
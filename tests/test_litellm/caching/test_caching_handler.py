@@ -16,7 +16,7 @@ sys.path.insert(
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
 
-from litellm.caching.caching_handler import LLMCachingHandler
+from litellm.caching.caching_handler import CachingHandlerResponse, LLMCachingHandler
 
 
 @pytest.mark.asyncio
@@ -52,3 +52,345 @@ async def test_process_async_embedding_cached_response():
 
     print(f"response: {response}")
     assert len(response.data) == 1
+
+
+@pytest.mark.asyncio
+async def test_coalesce_identical_in_flight_requests():
+    """
+    Identical concurrent requests that miss the cache should call the provider once, followers get the leader's response as a cache hit.
+    """
+    import litellm
+    from litellm.caching.caching import Cache
+
+    litellm.cache = Cache(coalesce_requests=True)
+    try:
+        messages = [{"role": "user", "content": f"coalesce {time.time()}"}]
+        responses = await asyncio.gather(
+            *[
+                litellm.acompletion(
+                    model="gpt-3.5-turbo",
+                    messages=messages,
+                    mock_response="hello",
+                    mock_delay=0.2,
+                )
+                for _ in range(5)
+            ]
+        )
+    finally:
+        litellm.cache = None
+
+    cache_hits = [r._hidden_params.get("cache_hit") is True for r in responses]
+    assert cache_hits.count(False) == 1
+    assert cache_hits.count(True) == 4
+    assert all(r.choices[0].message.content == "hello" for r in responses)
+    assert len({r.id for r in responses}) == 1
+
+
+@pytest.mark.asyncio
+async def test_coalesce_leader_failure_releases_followers():
+    from litellm.caching.caching_handler import in_flight_request_coalescer
+
+    llm_caching_handler = LLMCachingHandler(
+        original_function=MagicMock(),
+        request_kwargs={},
+        start_time=datetime.now(),
+    )
+    assert in_flight_request_coalescer.acquire("test-leader-failure") is None
+    llm_caching_handler.in_flight_cache_key = "test-leader-failure"
+
+    follower_future = in_flight_request_coalescer.acquire("test-leader-failure")
+    assert follower_future is not None
+
+    llm_caching_handler._release_in_flight_request()
+    assert await in_flight_request_coalescer.wait_for_leader(follower_future) is None
+    assert "test-leader-failure" not in in_flight_request_coalescer.in_flight_requests
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("failure", ["error", "close"])
+async def test_coalesce_streaming_leader_failure_releases_followers(failure):
+    from litellm.caching.caching_handler import in_flight_request_coalescer
+    from litellm.litellm_core_utils.litellm_logging import Logging
+    from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
+
+    async def provider_stream():
+        if failure == "error":
+            raise httpx.ReadError("connection reset")
+        yield
+
+    cache_key = f"test-streaming-leader-{failure}"
+    llm_caching_handler = LLMCachingHandler(
+        original_function=MagicMock(),
+        request_kwargs={},
+        start_time=datetime.now(),
+    )
+    assert in_flight_request_coalescer.acquire(cache_key) is None
+    llm_caching_handler.in_flight_cache_key = cache_key
+    follower_future = in_flight_request_coalescer.acquire(cache_key)
+    assert follower_future is not None
+
+    logging_obj = Logging(
+        model="gpt-3.5-turbo",
+        messages=[{"role": "user", "content": "Hey"}],
+        stream=True,
+        call_type="acompletion",
+        start_time=time.time(),
+        litellm_call_id="12345",
+        function_id="1245",
+    )
+    logging_obj._llm_caching_handler = llm_caching_handler
+    stream = CustomStreamWrapper(
+        completion_stream=provider_stream(),
+        model="gpt-3.5-turbo",
+        logging_obj=logging_obj,
+        custom_llm_provider="openai",
+    )
+    if failure == "error":
+        with pytest.raises(Exception):
+            async for _ in stream:
+                pass
+    else:
+        await stream.aclose()
+
+    assert await in_flight_request_coalescer.wait_for_leader(follower_future) is None
+    assert cache_key not in in_flight_request_coalescer.in_flight_requests
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate_serves_stale_and_refreshes_once(monkeypatch):
+    import litellm
+    from litellm.caching.caching import Cache
+    from litellm.integrations.custom_logger import CustomLogger
+
+    class ResponseLogger(CustomLogger):
+        def __init__(self):
+            super().__init__()
+            self.logged_contents = []
+
+        async def async_log_success_event(
+            self, kwargs, response_obj, start_time, end_time
+        ):
+            self.logged_contents.append(response_obj.choices[0].message.content)
+
+    response_logger = ResponseLogger()
+    monkeypatch.setattr(litellm, "callbacks", [response_logger])
+    litellm.cache = Cache(ttl=1, stale_while_revalidate=60)
+    try:
+        messages = [{"role": "user", "content": f"swr {time.time()}"}]
+        first = await litellm.acompletion(
+            model="gpt-3.5-turbo", messages=messages, mock_response="v1"
+        )
+        await asyncio.sleep(0.1)  # let the cache write task run
+        assert first._hidden_params.get("cache_hit") is not True
+
+        with patch.object(time, "time", return_value=time.time() + 5):
+            stale_responses = await asyncio.gather(
+                *[
+                    litellm.acompletion(
+                        model="gpt-3.5-turbo",
+                        messages=messages,
+                        mock_response="v2",
+                    )
+                    for _ in range(3)
+                ]
+            )
+            assert all(r._hidden_params.get("cache_hit") is True for r in stale_responses)
+            assert all(r.choices[0].message.content == "v1" for r in stale_responses)
+
+            await asyncio.sleep(0.5)  # let the background refresh complete
+            refreshed = await litellm.acompletion(
+                model="gpt-3.5-turbo", messages=messages, mock_response="v3"
+            )
+    finally:
+        litellm.cache = None
+
+    assert refreshed._hidden_params.get("cache_hit") is True
+    assert refreshed.choices[0].message.content == "v2"
+    # the background refresh is not logged / billed as a new request
+    await asyncio.sleep(0.5)
+    assert "v1" in response_logger.logged_contents
+    assert response_logger.logged_contents.count("v2") == 1  # the cache hit above
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate_refresh_not_logged_for_text_completion(
+    monkeypatch,
+):
+    import litellm
+    from litellm.caching.caching import Cache
+    from litellm.integrations.custom_logger import CustomLogger
+
+    class ResponseLogger(CustomLogger):
+        def __init__(self):
+            super().__init__()
+            self.logged_texts = []
+
+        async def async_log_success_event(
+            self, kwargs, response_obj, start_time, end_time
+        ):
+            self.logged_texts.append(response_obj.choices[0].text)
+
+    response_logger = ResponseLogger()
+    monkeypatch.setattr(litellm, "callbacks", [response_logger])
+    for callback_list in (
+        "input_callback",
+        "success_callback",
+        "failure_callback",
+        "_async_success_callback",
+        "_async_failure_callback",
+    ):
+        # function_setup registers the logger on these - don't leak it into other tests
+        monkeypatch.setattr(litellm, callback_list, [])
+    litellm.cache = Cache(ttl=1, stale_while_revalidate=60)
+    try:
+        prompt = f"swr text {time.time()}"
+        await litellm.atext_completion(
+            model="gpt-3.5-turbo", prompt=prompt, mock_response="v1"
+        )
+        await asyncio.sleep(0.1)  # let the cache write task run
+
+        with patch.object(time, "time", return_value=time.time() + 5):
+            stale = await litellm.atext_completion(
+                model="gpt-3.5-turbo", prompt=prompt, mock_response="v2"
+            )
+            assert stale.choices[0].text == "v1"
+
+            await asyncio.sleep(0.5)  # let the background refresh complete
+            refreshed = await litellm.atext_completion(
+                model="gpt-3.5-turbo", prompt=prompt, mock_response="v3"
+            )
+    finally:
+        litellm.cache = None
+
+    assert refreshed.choices[0].text == "v2"
+    # the background refresh is not logged / billed as a new request
+    await asyncio.sleep(0.5)
+    assert response_logger.logged_texts.count("v2") == 1  # the cache hit above
+
+
+@pytest.mark.asyncio
+async def test_embedding_partial_cache_hit_uses_single_batch_read():
+    """
+    Per-item embedding cache lookups should be one batch read, and only cache misses are sent upstream.
+    """
+    import litellm
+    from litellm.caching.caching import Cache
+    from litellm.types.utils import Embedding, EmbeddingResponse
+
+    litellm.cache = Cache()
+    try:
+        cached_response = EmbeddingResponse(
+            model="text-embedding-3-small",
+            data=[Embedding(embedding=[0.1, 0.2], index=0, object="embedding")],
+        )
+        await litellm.cache.async_add_cache_pipeline(
+            cached_response, model="text-embedding-3-small", input=["cached"]
+        )
+
+        llm_caching_handler = LLMCachingHandler(
+            original_function=MagicMock(__name__="aembedding"),
+            request_kwargs={},
+            start_time=datetime.now(),
+        )
+        with patch.object(
+            litellm.cache.cache,
+            "async_batch_get_cache",
+            wraps=litellm.cache.cache.async_batch_get_cache,
+        ) as mock_batch_get, patch.object(
+            litellm.cache.cache, "async_get_cache"
+        ) as mock_get:
+            cached_result = await llm_caching_handler._retrieve_from_cache(
+                call_type="aembedding",
+                kwargs={
+                    "model": "text-embedding-3-small",
+                    "input": ["miss-1", "cached", "miss-2"],
+                },
+                args=(),
+            )
+        mock_batch_get.assert_called_once()
+        mock_get.assert_not_called()
+        assert cached_result[0] is None and cached_result[2] is None
+        assert cached_result[1]["embedding"] == [0.1, 0.2]
+
+        kwargs = {"model": "text-embedding-3-small", "input": ["miss-1", "cached", "miss-2"]}
+        mock_logging_obj = MagicMock()
+        final_response, all_hit = llm_caching_handler._process_async_embedding_cached_response(
+            final_embedding_cached_response=None,
+            cached_result=cached_result,
+            kwargs=kwargs,
+            logging_obj=mock_logging_obj,
+            start_time=datetime.now(),
+            model="text-embedding-3-small",
+        )
+        assert all_hit is False
+        assert kwargs["input"] == ["miss-1", "miss-2"]
+
+        api_response = EmbeddingResponse(
+            model="text-embedding-3-small",
+            data=[
+                Embedding(embedding=[1.0], index=0, object="embedding"),
+                Embedding(embedding=[2.0], index=1, object="embedding"),
+            ],
+        )
+        combined = llm_caching_handler._combine_cached_embedding_response_with_api_result(
+            _caching_handler_response=CachingHandlerResponse(
+                final_embedding_cached_response=final_response
+            ),
+            embedding_response=api_response,
+            start_time=datetime.now(),
+            end_time=datetime.now(),
+        )
+        assert [d.embedding for d in combined.data] == [[1.0], [0.1, 0.2], [2.0]]
+        assert [d.index for d in combined.data] == [0, 1, 2]
+    finally:
+        litellm.cache = None
+
+
+@pytest.mark.asyncio
+async def test_packed_float32_embedding_cache_round_trip():
+    import litellm
+    from litellm.caching.caching import Cache
+    from litellm.types.utils import Embedding, EmbeddingResponse
+
+    litellm.cache = Cache(pack_cached_embeddings=True)
+    try:
+        vector = [0.5, -0.25, 0.125]
+        cached_embedding = litellm.cache._convert_to_cached_embedding(
+            Embedding(embedding=vector, index=0, object="embedding"),
+            "text-embedding-3-small",
+        )
+        assert isinstance(cached_embedding["embedding"], str)
+        assert cached_embedding["embedding_encoding"] == "float32_base64"
+
+        llm_caching_handler = LLMCachingHandler(
+            original_function=MagicMock(),
+            request_kwargs={},
+            start_time=datetime.now(),
+        )
+        response, all_hit = llm_caching_handler._process_async_embedding_cached_response(
+            final_embedding_cached_response=None,
+            cached_result=[cached_embedding],
+            kwargs={"model": "text-embedding-3-small", "input": ["hello"]},
+            logging_obj=MagicMock(),
+            start_time=datetime.now(),
+            model="text-embedding-3-small",
+        )
+        assert all_hit is True
+        assert response.data[0].embedding == vector
+
+        # base64 requests get the packed vector as-is
+        response, _ = llm_caching_handler._process_async_embedding_cached_response(
+            final_embedding_cached_response=None,
+            cached_result=[cached_embedding],
+            kwargs={
+                "model": "text-embedding-3-small",
+                "input": ["hello"],
+                "encoding_format": "base64",
+            },
+            logging_obj=MagicMock(),
+            start_time=datetime.now(),
+            model="text-embedding-3-small",
+        )
+        assert response.data[0].embedding == cached_embedding["embedding"]
+    finally:
+        litellm.cache = None
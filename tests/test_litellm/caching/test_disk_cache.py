@@ -0,0 +1,103 @@
+import mmap
+import os
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+pytest.importorskip("diskcache")
+
+from litellm.caching.disk_cache import DiskCache
+
+
+@pytest.fixture
+def offloaded_disk_cache(tmp_path):
+    cache = DiskCache(disk_cache_dir=str(tmp_path), disk_cache_offload_io=True)
+    yield cache
+    cache.disk_cache.close()
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_offload_io_round_trip(offloaded_disk_cache):
+    value = {"timestamp": 1.0, "response": '{"id": "chatcmpl-123"}'}
+    await offloaded_disk_cache.async_set_cache("key", value, ttl=60)
+
+    assert await offloaded_disk_cache.async_get_cache("key") == value
+    assert await offloaded_disk_cache.async_get_cache("missing") is None
+    # stored with the binary codec, not pickled
+    assert isinstance(offloaded_disk_cache.disk_cache.get("key"), bytes)
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_offload_io_runs_off_event_loop(offloaded_disk_cache):
+    io_threads = []
+    original_get = offloaded_disk_cache.disk_cache.get
+
+    def _get(*args, **kwargs):
+        io_threads.append(threading.current_thread().name)
+        return original_get(*args, **kwargs)
+
+    with patch.object(offloaded_disk_cache.disk_cache, "get", side_effect=_get):
+        await offloaded_disk_cache.async_get_cache("key")
+
+    assert len(io_threads) == 1
+    assert io_threads[0].startswith("litellm-disk-cache")
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_offload_io_large_value_is_memory_mapped(
+    offloaded_disk_cache,
+):
+    large_value = {"response": "x" * (1024 * 1024)}
+    await offloaded_disk_cache.async_set_cache("large", large_value)
+
+    with patch("litellm.caching.disk_cache.mmap.mmap", wraps=mmap.mmap) as mock_mmap:
+        assert await offloaded_disk_cache.async_get_cache("large") == large_value
+    mock_mmap.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_offload_io_pipeline_and_batch_get(offloaded_disk_cache):
+    await offloaded_disk_cache.async_set_cache_pipeline(
+        [("a", {"embedding": [0.1, 0.2]}), ("b", 2)], ttl=60
+    )
+    assert await offloaded_disk_cache.async_batch_get_cache(["a", "missing", "b"]) == [
+        {"embedding": [0.1, 0.2]},
+        None,
+        2,
+    ]
+    assert await offloaded_disk_cache.async_increment("b", 3) == 5
+
+
+def test_disk_cache_reads_values_written_before_binary_codec(tmp_path):
+    legacy_cache = DiskCache(disk_cache_dir=str(tmp_path))
+    legacy_cache.set_cache("key", {"response": "hello"})
+    legacy_cache.disk_cache.close()
+
+    cache = DiskCache(disk_cache_dir=str(tmp_path), disk_cache_offload_io=True)
+    assert cache.get_cache("key") == {"response": "hello"}
+    cache.disk_cache.close()
+
+
+def test_disk_cache_size_limit_evicts_least_recently_used(tmp_path):
+    cache = DiskCache(
+        disk_cache_dir=str(tmp_path),
+        disk_cache_size_limit=1024 * 1024,
+        disk_cache_offload_io=True,
+    )
+    assert cache.disk_cache.eviction_policy == "least-recently-used"
+
+    payload = "x" * (64 * 1024)
+    for i in range(40):
+        cache.set_cache(f"key-{i}", {"response": payload})
+        cache.get_cache("key-0")  # keep key-0 hot
+
+    assert cache.disk_cache.volume() < 2 * 1024 * 1024
+    assert cache.get_cache("key-0") == {"response": payload}
+    assert cache.get_cache("key-1") is None
+    cache.disk_cache.close()
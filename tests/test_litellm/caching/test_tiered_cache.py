@@ -0,0 +1,136 @@
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../../.."))
+
+from litellm.caching.caching import Cache, LiteLLMCacheType
+from litellm.caching.disk_cache import DiskCache
+from litellm.caching.in_memory_cache import InMemoryCache
+from litellm.caching.tiered_cache import EXPIRES_AT_KEY, CacheTier, TieredCache
+
+
+def _tiered_cache(write_behind: bool = True) -> TieredCache:
+    return TieredCache(
+        tiers=[
+            CacheTier(name="0:local", cache=InMemoryCache(), ttl=10),
+            CacheTier(name="1:local", cache=InMemoryCache()),
+            CacheTier(name="2:local", cache=InMemoryCache()),
+        ],
+        write_behind=write_behind,
+    )
+
+
+async def _drain_background_tasks(cache: TieredCache):
+    await asyncio.gather(*cache._background_tasks)
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_write_behind():
+    cache = _tiered_cache()
+    await cache.async_set_cache("key", {"response": "value"})
+
+    assert cache.tiers[0].cache.get_cache("key") == {"response": "value"}
+    await _drain_background_tasks(cache)
+    assert cache.tiers[1].cache.get_cache("key") == {"response": "value"}
+    assert cache.tiers[2].cache.get_cache("key") == {"response": "value"}
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_promotes_on_hit():
+    cache = _tiered_cache()
+    await cache.tiers[2].cache.async_set_cache("key", "value")
+
+    assert await cache.async_get_cache("key") == "value"
+    # top tier is promoted inline, middle tier in the background
+    assert cache.tiers[0].cache.get_cache("key") == "value"
+    await _drain_background_tasks(cache)
+    assert cache.tiers[1].cache.get_cache("key") == "value"
+
+    stats = cache.get_tier_stats()
+    assert [(s["hits"], s["misses"]) for s in stats] == [(0, 1), (0, 1), (1, 0)]
+
+    assert await cache.async_get_cache("key") == "value"
+    assert cache.get_tier_stats()[0]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_promotion_keeps_remaining_ttl():
+    cache = _tiered_cache(write_behind=False)
+    await cache.async_set_cache("key", "value", ttl=30)
+    # only left in the bottom tier
+    cache.tiers[0].cache.delete_cache("key")
+    cache.tiers[1].cache.delete_cache("key")
+
+    assert await cache.async_get_cache("key") == "value"
+    await _drain_background_tasks(cache)
+
+    # tier 1 has no ttl - the promoted entry still expires with the request ttl
+    for tier in cache.tiers[:2]:
+        assert tier.cache.ttl_dict["key"] <= time.time() + 30
+
+    cache.tiers[0].cache.delete_cache("key")
+    assert cache.get_cache("key") == "value"
+    assert cache.tiers[0].cache.ttl_dict["key"] <= time.time() + 30
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_expired_entry_is_a_miss():
+    cache = _tiered_cache()
+    # e.g. a tier whose backend ignores the ttl
+    await cache.tiers[2].cache.async_set_cache(
+        "key", {EXPIRES_AT_KEY: time.time() - 1, "value": "value"}
+    )
+
+    assert await cache.async_get_cache("key") is None
+    assert cache.get_cache("key") is None
+    assert await cache.async_batch_get_cache(keys=["key"]) == [None]
+    assert cache.tiers[0].cache.get_cache("key") is None
+    assert cache.get_tier_stats()[2]["misses"] == 3
+
+
+def test_tiered_cache_tier_ttl_is_capped_by_request_ttl():
+    tier = CacheTier(name="0:local", cache=InMemoryCache(), ttl=10)
+    assert tier.get_ttl_kwargs()["ttl"] == 10
+    assert tier.get_ttl_kwargs(ttl=5)["ttl"] == 5
+    assert tier.get_ttl_kwargs(ttl=60)["ttl"] == 10
+    assert (
+        "ttl" not in CacheTier(name="1:local", cache=InMemoryCache()).get_ttl_kwargs()
+    )
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_batch_get_only_reads_missing_keys_from_lower_tiers():
+    cache = _tiered_cache(write_behind=False)
+    await cache.tiers[0].cache.async_set_cache("a", "value-a")
+    await cache.tiers[1].cache.async_set_cache("b", "value-b")
+
+    results = await cache.async_batch_get_cache(keys=["a", "b", "c"])
+
+    assert results == ["value-a", "value-b", None]
+    assert cache.tiers[0].cache.get_cache("b") == "value-b"
+    stats = cache.get_tier_stats()
+    assert [(s["hits"], s["misses"]) for s in stats] == [(1, 2), (1, 1), (0, 1)]
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_init_from_cache_tiers(tmp_path):
+    cache = Cache(
+        type=LiteLLMCacheType.TIERED,
+        cache_tiers=[
+            {"type": "local", "ttl": 60, "max_size_in_memory": 10},
+            {"type": "disk", "disk_cache_dir": str(tmp_path)},
+        ],
+    )
+
+    assert isinstance(cache.cache, TieredCache)
+    assert isinstance(cache.cache.tiers[0].cache, InMemoryCache)
+    assert cache.cache.tiers[0].cache.max_size_in_memory == 10
+    assert cache.cache.tiers[0].ttl == 60
+    assert isinstance(cache.cache.tiers[1].cache, DiskCache)
+
+    with pytest.raises(ValueError):
+        Cache(type=LiteLLMCacheType.TIERED)
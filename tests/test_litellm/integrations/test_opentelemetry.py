@@ -171,6 +171,49 @@ class TestOpenTelemetryCostBreakdown(unittest.TestCase):
         assert ("gen_ai.cost.original_cost", 0.004) not in call_args_list
 
 
+class TestOpenTelemetryConnectionPhases(unittest.TestCase):
+    def test_create_connection_phase_spans(self):
+        span_exporter = InMemorySpanExporter()
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+        otel = OpenTelemetry(tracer_provider=tracer_provider)
+        otel.tracer = tracer_provider.get_tracer(__name__)
+
+        kwargs = {
+            "standard_logging_object": {
+                "connection_timings": {
+                    "start_time": 1609459200.0,
+                    "connection_reused": False,
+                    "phases": {
+                        "pool_wait": {"start_ms": 0.0, "duration_ms": 250.0},
+                        "connect": {"start_ms": 250.0, "duration_ms": 40.0},
+                    },
+                }
+            }
+        }
+        parent_span = otel.tracer.start_span("litellm_request")
+        otel._create_connection_phase_spans(kwargs=kwargs, parent_span=parent_span)
+
+        spans = {span.name: span for span in span_exporter.get_finished_spans()}
+        self.assertEqual(
+            set(spans), {"llm_api_connection.pool_wait", "llm_api_connection.connect"}
+        )
+        connect_span = spans["llm_api_connection.connect"]
+        self.assertEqual(connect_span.start_time, 1609459200_250_000_000)
+        self.assertEqual(connect_span.end_time, 1609459200_290_000_000)
+        self.assertEqual(connect_span.parent.span_id, parent_span.context.span_id)
+        self.assertEqual(connect_span.attributes["connection_reused"], False)
+
+    def test_no_connection_phase_spans_without_timings(self):
+        otel = OpenTelemetry()
+        otel.tracer = MagicMock()
+        otel._create_connection_phase_spans(
+            kwargs={"standard_logging_object": {"connection_timings": None}},
+            parent_span=MagicMock(),
+        )
+        otel.tracer.start_span.assert_not_called()
+
+
 class TestOpenTelemetry(unittest.TestCase):
     POLL_INTERVAL = 0.05
     POLL_TIMEOUT = 2.0
@@ -12,7 +12,8 @@ sys.path.insert(
 from litellm.litellm_core_utils.core_helpers import (
     get_litellm_metadata_from_kwargs,
     safe_divide,
-    safe_deep_copy
+    safe_deep_copy,
+    snapshot_messages,
 ) 
 
 
@@ -171,3 +172,50 @@ def test_safe_deep_copy_with_non_pickleables_and_span():
     # Other simple fields unchanged
     assert copied["ok"] is True
     assert copied["metadata"]["x"] == 1
+
+
+def test_snapshot_messages():
+    """
+    snapshot_messages copies the message structure and shares immutable leaves
+    """
+    from litellm.types.utils import Message
+
+    image_url = "data:image/png;base64," + "A" * 1000
+    messages = [
+        {"role": "system", "content": "You are a helpful assistant."},
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "describe this"},
+                {"type": "image_url", "image_url": {"url": image_url}},
+            ],
+        },
+        Message(role="assistant", content="a cat"),
+        {"role": "tool", "tool_call_id": "call_1", "content": ("a", "b")},
+    ]
+
+    snapshot = snapshot_messages(messages)
+    assert snapshot == messages
+    assert snapshot is not messages
+    assert snapshot[1]["content"][1]["image_url"] is not messages[1]["content"][1][
+        "image_url"
+    ]
+    # large strings are shared, not copied
+    assert snapshot[1]["content"][1]["image_url"]["url"] is image_url
+    # other objects are deep-copied
+    assert snapshot[2] is not messages[2]
+
+    # mutating the request messages does not change the snapshot
+    messages[1]["content"][0]["text"] = "changed"
+    messages[1]["content"].append({"type": "text", "text": "more"})
+    assert snapshot[1]["content"][0]["text"] == "describe this"
+    assert len(snapshot[1]["content"]) == 2
+
+    assert snapshot_messages(None) is None
+
+
+def test_snapshot_messages_self_referencing():
+    data: dict = {"role": "user", "content": "hi"}
+    data["self"] = data
+    snapshot = snapshot_messages([data])
+    assert snapshot[0]["content"] == "hi"
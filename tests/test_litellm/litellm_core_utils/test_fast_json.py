@@ -0,0 +1,89 @@
+import json
+import os
+import sys
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+import respx
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+import litellm.litellm_core_utils.fast_json as fast_json
+from litellm.litellm_core_utils.fast_json import (
+    json_dumps_bytes,
+    json_loads,
+    response_json,
+)
+from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
+
+PAYLOAD = {
+    "model": "claude-sonnet-4",
+    "messages": [{"role": "user", "content": 'héllo 👋 \n\t"quoted"'}],
+    "tools": [{"type": "function", "function": {"name": "f", "parameters": {}}}],
+    "temperature": 0.7,
+    "max_tokens": 1024,
+    "stream": False,
+}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def codec(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(fast_json, "orjson", None)
+    return request.param
+
+
+def test_json_dumps_bytes_roundtrip(codec):
+    encoded = json_dumps_bytes(PAYLOAD)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == PAYLOAD
+    assert json_loads(encoded) == PAYLOAD
+    assert json_loads(encoded.decode("utf-8")) == PAYLOAD
+    assert json_loads(memoryview(encoded)) == PAYLOAD
+
+
+def test_json_dumps_bytes_non_str_keys_and_big_ints(codec):
+    assert json.loads(json_dumps_bytes({1: "a"})) == {"1": "a"}
+    assert json.loads(json_dumps_bytes({"seed": 2**70})) == {"seed": 2**70}
+
+
+def test_response_json(codec):
+    response = httpx.Response(200, content=json_dumps_bytes(PAYLOAD))
+    assert response_json(response) == PAYLOAD
+
+    # non-httpx responses (e.g. mocks) fall back to .json()
+    mock_response = MagicMock()
+    mock_response.json.return_value = PAYLOAD
+    assert response_json(mock_response) == PAYLOAD
+
+    with pytest.raises(json.JSONDecodeError):
+        response_json(httpx.Response(200, content=b"not json"))
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_post_json_is_sent_as_bytes(monkeypatch):
+    monkeypatch.setattr(litellm, "disable_aiohttp_transport", True)
+    route = respx.post("https://example.com/v1/messages").mock(
+        return_value=httpx.Response(200, json={"ok": True})
+    )
+
+    await AsyncHTTPHandler().post(url="https://example.com/v1/messages", json=PAYLOAD)
+    HTTPHandler().post(
+        url="https://example.com/v1/messages",
+        json=PAYLOAD,
+        headers={"content-type": "application/json; charset=utf-8"},
+    )
+
+    async_request, sync_request = [call.request for call in route.calls]
+    assert json.loads(async_request.content) == PAYLOAD
+    assert async_request.headers["content-type"] == "application/json"
+    assert sync_request.headers.get_list("content-type") == [
+        "application/json; charset=utf-8"
+    ]
@@ -161,6 +161,39 @@ def test_logging_prevent_double_logging(logging_obj):
     assert logging_obj.should_run_logging(event_type="async_failure") == True
 
 
+def test_cache_refresh_skips_callbacks_for_every_call_type():
+    """
+    A stale cache refresh is flagged from the call kwargs, so callbacks are skipped even when the call type builds its own litellm_params without the flag.
+    """
+    from litellm.integrations.custom_logger import CustomLogger
+
+    callback = CustomLogger()
+    for call_type in ["aembedding", "atext_completion", "arerank", "aimage_generation"]:
+        logging_obj = LitellmLogging(
+            model="gpt-3.5-turbo",
+            messages=None,
+            stream=False,
+            call_type=call_type,
+            start_time=time.time(),
+            litellm_call_id="12345",
+            function_id="1245",
+            kwargs={"litellm_cache_refresh": True},
+        )
+        logging_obj.update_environment_variables(
+            model="gpt-3.5-turbo",
+            optional_params={},
+            litellm_params={"litellm_cache_refresh": None},
+        )
+        assert (
+            logging_obj.should_run_callback(
+                callback=callback,
+                litellm_params=logging_obj.model_call_details["litellm_params"],
+                event_hook="async_success_handler",
+            )
+            is False
+        )
+
+
 @pytest.mark.asyncio
 async def test_logging_result_for_bridge_calls(logging_obj):
     """
@@ -838,3 +871,129 @@ def test_append_system_prompt_messages():
         kwargs=None, messages=messages
     )
     assert result == messages
+
+
+def test_split_callbacks_by_logging_lane(logging_obj):
+    from litellm.integrations.custom_batch_logger import CustomBatchLogger
+    from litellm.integrations.custom_logger import CustomLogger
+
+    class SpendLogger(CustomLogger):
+        logging_lane = "critical"
+
+    default_logger = CustomLogger()
+    best_effort_logger = CustomBatchLogger()
+    spend_logger = SpendLogger()
+
+    # no critical callback - run everything as before
+    callbacks = [best_effort_logger, default_logger]
+    assert logging_obj._split_callbacks_by_logging_lane(callbacks) == (callbacks, [])
+
+    # critical callbacks first, best-effort callbacks split out
+    assert logging_obj._split_callbacks_by_logging_lane(
+        [best_effort_logger, default_logger, "openmeter", spend_logger]
+    ) == ([spend_logger, default_logger, "openmeter"], [best_effort_logger])
+
+
+@pytest.mark.asyncio
+async def test_slow_best_effort_logger_does_not_delay_spend_tracking(monkeypatch):
+    import asyncio
+
+    import litellm
+    from litellm.integrations.custom_batch_logger import CustomBatchLogger
+    from litellm.integrations.custom_logger import CustomLogger
+    from litellm.litellm_core_utils.logging_worker import (
+        GLOBAL_BEST_EFFORT_LOGGING_WORKER,
+    )
+
+    events = []
+
+    class SpendLogger(CustomLogger):
+        logging_lane = "critical"
+
+        async def async_log_success_event(
+            self, kwargs, response_obj, start_time, end_time
+        ):
+            events.append("spend")
+
+    export_started = asyncio.Event()
+
+    class SlowExportLogger(CustomBatchLogger):
+        async def async_log_success_event(
+            self, kwargs, response_obj, start_time, end_time
+        ):
+            export_started.set()
+            await asyncio.sleep(0.5)
+            events.append("export")
+
+    # callbacks registered by other tests are deduplicated by class name
+    monkeypatch.setattr(litellm, "_async_success_callback", [])
+    litellm.callbacks = [SlowExportLogger(), SpendLogger()]
+    try:
+        await litellm.acompletion(
+            model="gpt-4o",
+            messages=[{"role": "user", "content": "hi"}],
+            mock_response="hello",
+        )
+        # spend tracking is logged while the slow export is still running
+        await asyncio.wait_for(export_started.wait(), timeout=10)
+        assert events == ["spend"]
+        await GLOBAL_BEST_EFFORT_LOGGING_WORKER.flush()
+        for _ in range(100):
+            if "export" in events:
+                break
+            await asyncio.sleep(0.05)
+        assert events == ["spend", "export"]
+    finally:
+        litellm.callbacks = []
+
+
+@pytest.mark.asyncio
+async def test_drop_policy_on_full_default_lane_keeps_spend_tracking(monkeypatch):
+    import asyncio
+
+    import litellm
+    from litellm.integrations.custom_logger import CustomLogger
+    from litellm.litellm_core_utils.logging_worker import LoggingWorker
+
+    events = []
+
+    class SpendLogger(CustomLogger):
+        logging_lane = "critical"
+
+        async def async_log_success_event(
+            self, kwargs, response_obj, start_time, end_time
+        ):
+            events.append("spend")
+
+    # default lane with a full queue: 1 task running (holding the only concurrency slot) + 1 queued
+    worker = LoggingWorker(max_queue_size=1, concurrency=1, queue_full_policy="drop")
+    worker.start()
+    unblock = asyncio.Event()
+
+    async def blocked_task():
+        await unblock.wait()
+
+    worker.enqueue(blocked_task())
+    await asyncio.sleep(0.05)
+    worker.enqueue(blocked_task())
+    assert worker._queue.qsize() == 1
+
+    try:
+        with patch(
+            "litellm.litellm_core_utils.logging_worker.GLOBAL_LOGGING_WORKER", worker
+        ):
+            # callbacks registered by other tests are deduplicated by class name
+            monkeypatch.setattr(litellm, "_async_success_callback", [])
+            litellm.callbacks = [SpendLogger()]
+            await litellm.acompletion(
+                model="gpt-4o",
+                messages=[{"role": "user", "content": "hi"}],
+                mock_response="hello",
+            )
+            await asyncio.sleep(0.3)
+            assert events == ["spend"]
+            assert worker.get_metrics()["dropped"] == 0
+    finally:
+        litellm.callbacks = []
+        unblock.set()
+        await worker.stop()
@@ -323,3 +323,91 @@ class TestLoggingWorker:
         await worker.clear_queue()
 
         assert len(processed) >= 4, f"Expected 4+ tasks processed, got {len(processed)}"
+
+    @pytest.mark.asyncio
+    async def test_drop_policy_drops_new_tasks(self):
+        """Test that the drop policy drops tasks when the queue is full, and closes them."""
+        worker = LoggingWorker(timeout=1.0, max_queue_size=2, queue_full_policy="drop")
+        worker._ensure_queue()
+
+        async def task():
+            pass
+
+        coroutines = [task() for _ in range(4)]
+        for coroutine in coroutines:
+            worker.enqueue(coroutine)
+
+        assert worker._queue.qsize() == 2
+        metrics = worker.get_metrics()
+        assert metrics["enqueued"] == 4
+        assert metrics["dropped"] == 2
+        # dropped coroutines are closed - no 'never awaited' warnings
+        assert coroutines[3].cr_frame is None
+        await worker.clear_queue()
+
+    @pytest.mark.asyncio
+    async def test_sample_policy_samples_above_threshold(self):
+        """Test that the sample policy admits `sample_rate` of the tasks once the queue is half full."""
+        worker = LoggingWorker(
+            timeout=1.0, max_queue_size=10, queue_full_policy="sample", sample_rate=0.0
+        )
+        worker._ensure_queue()
+
+        async def task():
+            pass
+
+        for _ in range(8):
+            worker.enqueue(task())
+
+        # LOGGING_WORKER_SAMPLING_QUEUE_PERCENTAGE=50 -> first 5 admitted, rest sampled out
+        assert worker._queue.qsize() == 5
+        assert worker.get_metrics()["dropped"] == 3
+        await worker.clear_queue()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("queue_full_policy", ["drop", "sample"])
+    async def test_non_droppable_tasks_are_never_dropped(self, queue_full_policy):
+        """Test that droppable=False tasks (spend tracking) bypass drop / sample, and are cleared instead."""
+        worker = LoggingWorker(
+            timeout=1.0,
+            max_queue_size=2,
+            queue_full_policy=queue_full_policy,
+            sample_rate=0.0,
+        )
+        worker._ensure_queue()
+        processed = []
+
+        async def task(name):
+            processed.append(name)
+
+        worker.enqueue(task("queued-1"))
+        worker.enqueue(task("queued-2"))
+        worker.enqueue(task("dropped"))
+        worker.enqueue(task("critical"), droppable=False)
+        # drop: the critical task is processed by the aggressive clear, sample: it is queued
+        await asyncio.sleep(0.1)
+        await worker.clear_queue()
+
+        assert "critical" in processed
+        assert "dropped" not in processed
+        assert worker._queue._unfinished_tasks == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_and_latency_metrics(self, logging_worker):
+        """Test that processed tasks are counted, with queue wait and run time."""
+        logging_worker.start()
+
+        async def slow_task():
+            await asyncio.sleep(0.05)
+
+        logging_worker.enqueue(slow_task())
+        await logging_worker.flush()
+        await asyncio.sleep(0.05)
+        await logging_worker.stop()
+
+        metrics = logging_worker.get_metrics()
+        assert metrics["lane"] == "default"
+        assert metrics["queue_depth"] == 0
+        assert metrics["processed"] == 1
+        assert metrics["run_time_ms"]["max"] >= 50
+        assert metrics["queue_wait_ms"]["avg"] >= 0
@@ -0,0 +1,361 @@
+import json
+import os
+import sys
+from datetime import datetime
+from queue import Full
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm.integrations.custom_logger import CustomLogger
+from litellm.litellm_core_utils.litellm_logging import (
+    Logging,
+    create_dummy_standard_logging_payload,
+)
+from litellm.litellm_core_utils.logging_worker_process_pool import (
+    GLOBAL_LOGGING_WORKER_PROCESS_POOL,
+    LoggingWorkerProcessPool,
+    process_logging_event,
+)
+from litellm.litellm_core_utils.serialized_logging_payload import (
+    SerializedStandardLoggingPayload,
+)
+
+
+class PayloadOnlyLogger(CustomLogger):
+    pass
+
+
+class OtherPayloadOnlyLogger(CustomLogger):
+    pass
+
+
+class RecordingLogger(CustomLogger):
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
+        self.events.append(("success", kwargs, response_obj))
+
+    async def async_log_failure_event(self, kwargs, response_obj, start_time, end_time):
+        self.events.append(("failure", kwargs, response_obj))
+
+
+def _logging_obj() -> Logging:
+    logging_obj = Logging(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "hi"}],
+        stream=False,
+        call_type="acompletion",
+        start_time=datetime.now(),
+        litellm_call_id="1234",
+        function_id="1234",
+    )
+    payload = dict(create_dummy_standard_logging_payload())
+    payload["messages"] = [{"role": "user", "content": "hi"}]
+    logging_obj.model_call_details["standard_logging_object"] = (
+        SerializedStandardLoggingPayload(payload)
+    )
+    return logging_obj
+
+
+@pytest.fixture
+def in_memory_loggers(monkeypatch):
+    """Loggers created by `_init_custom_logger_compatible_class` - the ones with default config"""
+    loggers: list = []
+    monkeypatch.setattr(
+        "litellm.litellm_core_utils.litellm_logging._in_memory_loggers", loggers
+    )
+    return loggers
+
+
+@pytest.fixture
+def worker_processes_enabled(monkeypatch, in_memory_loggers):
+    monkeypatch.setattr(litellm, "logging_worker_processes", 1)
+    with patch.object(
+        GLOBAL_LOGGING_WORKER_PROCESS_POOL,
+        "_callback_class_to_name",
+        {PayloadOnlyLogger: "datadog", OtherPayloadOnlyLogger: "s3_v2"},
+    ):
+        yield in_memory_loggers
+
+
+def _default_config_logger(
+    in_memory_loggers: list, logger_class=PayloadOnlyLogger, **kwargs
+) -> CustomLogger:
+    logger = logger_class(**kwargs)
+    in_memory_loggers.append(logger)
+    return logger
+
+
+def test_callbacks_sent_to_worker_processes(worker_processes_enabled):
+    logging_obj = _logging_obj()
+    payload_only_logger = _default_config_logger(worker_processes_enabled)
+    in_process_logger = CustomLogger()
+
+    with patch.object(
+        GLOBAL_LOGGING_WORKER_PROCESS_POOL, "enqueue", return_value=True
+    ) as mock_enqueue:
+        callbacks = logging_obj._send_to_logging_worker_processes(
+            callbacks=[payload_only_logger, in_process_logger, "langfuse"],
+            event_type="success",
+            event_hook="async_success_handler",
+            start_time=datetime.now(),
+            end_time=datetime.now(),
+        )
+
+    assert callbacks == [in_process_logger, "langfuse"]
+    mock_enqueue.assert_called_once()
+    call_kwargs = mock_enqueue.call_args.kwargs
+    assert call_kwargs["event_type"] == "success"
+    assert call_kwargs["callback_names"] == ("datadog",)
+    assert (
+        call_kwargs["payload_json_bytes"]
+        == logging_obj.model_call_details["standard_logging_object"].get_json_bytes()
+    )
+
+
+def test_redacted_payload_sent_for_callbacks_with_message_logging_off(
+    worker_processes_enabled,
+):
+    logging_obj = _logging_obj()
+    with patch.object(
+        GLOBAL_LOGGING_WORKER_PROCESS_POOL, "enqueue", return_value=True
+    ) as mock_enqueue:
+        logging_obj._send_to_logging_worker_processes(
+            callbacks=[
+                _default_config_logger(worker_processes_enabled),
+                _default_config_logger(
+                    worker_processes_enabled, turn_off_message_logging=True
+                ),
+                _default_config_logger(
+                    worker_processes_enabled,
+                    logger_class=OtherPayloadOnlyLogger,
+                    turn_off_message_logging=True,
+                ),
+            ],
+            event_type="success",
+            event_hook="async_success_handler",
+            start_time=datetime.now(),
+            end_time=datetime.now(),
+        )
+
+    # callbacks with message logging turned off share one event
+    assert mock_enqueue.call_count == 2
+    messages = [
+        json.loads(call.kwargs["payload_json_bytes"])["messages"][0]["content"]
+        for call in mock_enqueue.call_args_list
+    ]
+    assert messages == ["hi", "redacted-by-litellm"]
+    assert [call.kwargs["callback_names"] for call in mock_enqueue.call_args_list] == [
+        ("datadog",),
+        ("datadog", "s3_v2"),
+    ]
+
+
+def test_callbacks_logged_in_process_when_queue_full(worker_processes_enabled):
+    logging_obj = _logging_obj()
+    payload_only_logger = _default_config_logger(worker_processes_enabled)
+    with patch.object(
+        GLOBAL_LOGGING_WORKER_PROCESS_POOL, "enqueue", return_value=False
+    ):
+        callbacks = logging_obj._send_to_logging_worker_processes(
+            callbacks=[payload_only_logger],
+            event_type="failure",
+            event_hook="async_failure_handler",
+            start_time=datetime.now(),
+            end_time=datetime.now(),
+        )
+    assert callbacks == [payload_only_logger]
+
+
+def test_disabled_by_default():
+    assert litellm.logging_worker_processes == 0
+    callbacks = [PayloadOnlyLogger()]
+    assert (
+        _logging_obj()._send_to_logging_worker_processes(
+            callbacks=callbacks,
+            event_type="success",
+            event_hook="async_success_handler",
+            start_time=datetime.now(),
+            end_time=datetime.now(),
+        )
+        is callbacks
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_logging_event():
+    logger = RecordingLogger()
+    payload = _logging_obj().model_call_details["standard_logging_object"]
+    payload_json_bytes = payload.get_json_bytes()
+
+    with patch(
+        "litellm.litellm_core_utils.litellm_logging._init_custom_logger_compatible_class",
+        return_value=logger,
+    ) as mock_init:
+        loggers: dict = {}
+        for event_type in ("success", "failure"):
+            await process_logging_event(
+                (
+                    event_type,  # type: ignore
+                    ("datadog",),
+                    datetime.now(),
+                    datetime.now(),
+                    payload_json_bytes,
+                    None,
+                ),
+                loggers,
+            )
+    # logger is initialized once per worker process
+    mock_init.assert_called_once()
+
+    (success, success_kwargs, response_obj), (failure, failure_kwargs, _) = (
+        logger.events
+    )
+    assert (success, failure) == ("success", "failure")
+    assert success_kwargs["standard_logging_object"] == json.loads(payload_json_bytes)
+    assert success_kwargs["litellm_call_id"] == payload["id"]
+    assert response_obj == payload["response"]
+    assert failure_kwargs["exception"] == payload["error_str"]
+
+
+@pytest.mark.asyncio
+async def test_per_team_gcs_bucket_routing_in_worker_process(
+    worker_processes_enabled, monkeypatch
+):
+    """Team / key logging settings (standard_callback_dynamic_params) reach the integrations in the worker process."""
+    from litellm.integrations.gcs_bucket.gcs_bucket import GCSBucketLogger
+
+    monkeypatch.setattr("litellm.proxy.proxy_server.premium_user", True)
+    team_params = {
+        "gcs_bucket_name": "team-a-bucket",
+        "gcs_path_service_account": "/secrets/team-a.json",
+    }
+    logging_obj = _logging_obj()
+    logging_obj.standard_callback_dynamic_params = team_params  # type: ignore
+
+    # request process - the dynamic params are sent with the event
+    with patch.object(
+        GLOBAL_LOGGING_WORKER_PROCESS_POOL, "enqueue", return_value=True
+    ) as mock_enqueue:
+        logging_obj._send_to_logging_worker_processes(
+            callbacks=[_default_config_logger(worker_processes_enabled)],
+            event_type="success",
+            event_hook="async_success_handler",
+            start_time=datetime.now(),
+            end_time=datetime.now(),
+        )
+    event_kwargs = mock_enqueue.call_args.kwargs
+    assert event_kwargs["standard_callback_dynamic_params"] == team_params
+
+    # worker process - the GCS logger resolves the team bucket / service account
+    gcs_logger = GCSBucketLogger(bucket_name="default-bucket")
+    with patch(
+        "litellm.litellm_core_utils.litellm_logging._init_custom_logger_compatible_class",
+        return_value=gcs_logger,
+    ):
+        await process_logging_event(
+            (
+                "success",
+                ("gcs_bucket",),
+                datetime.now(),
+                datetime.now(),
+                event_kwargs["payload_json_bytes"],
+                event_kwargs["standard_callback_dynamic_params"],
+            ),
+            {},
+        )
+    assert len(gcs_logger.log_queue) == 1
+    with patch.object(
+        gcs_logger, "get_or_create_vertex_instance", new_callable=AsyncMock
+    ) as mock_vertex_instance:
+        gcs_logging_config = await gcs_logger.get_gcs_logging_config(
+            gcs_logger.log_queue[0]["kwargs"]
+        )
+    assert gcs_logging_config["bucket_name"] == "team-a-bucket"
+    mock_vertex_instance.assert_called_once_with(credentials="/secrets/team-a.json")
+
+
+def test_legacy_payload_integrations_run_in_process(monkeypatch, in_memory_loggers):
+    from litellm.integrations.datadog.datadog import DataDogLogger
+
+    monkeypatch.setattr(litellm, "datadog_use_v1", True)
+    datadog_logger = DataDogLogger.__new__(DataDogLogger)
+    in_memory_loggers.append(datadog_logger)
+    # v1 payload reads messages / litellm_params from the in-process kwargs
+    assert GLOBAL_LOGGING_WORKER_PROCESS_POOL.get_callback_name(datadog_logger) is None
+
+    monkeypatch.setattr(litellm, "datadog_use_v1", False)
+    assert (
+        GLOBAL_LOGGING_WORKER_PROCESS_POOL.get_callback_name(datadog_logger)
+        == "datadog"
+    )
+
+
+@pytest.mark.asyncio
+async def test_configured_integration_instances_run_in_process(
+    monkeypatch, in_memory_loggers
+):
+    """Instances built with constructor args keep running in-process - the worker processes would lose their config"""
+    from litellm.integrations.generic_api.generic_api_callback import (
+        GenericAPILogger,
+    )
+    from litellm.litellm_core_utils.litellm_logging import (
+        _init_custom_logger_compatible_class,
+    )
+
+    monkeypatch.setenv("GENERIC_LOGGER_ENDPOINT", "https://default.example.com")
+    default_logger = _init_custom_logger_compatible_class(
+        logging_integration="generic_api",
+        internal_usage_cache=None,
+        llm_router=None,
+    )
+    configured_logger = GenericAPILogger(
+        endpoint="https://team.example.com", headers={"x-team": "a"}
+    )
+
+    pool = LoggingWorkerProcessPool()
+    assert pool.get_callback_name(default_logger) == "generic_api"
+    assert pool.get_callback_name(configured_logger) is None
+    assert pool.get_callback_name(PayloadOnlyLogger()) is None
+
+
+def test_worker_process_starts_and_stops(monkeypatch):
+    monkeypatch.setattr(litellm, "logging_worker_processes", 1)
+    pool = LoggingWorkerProcessPool(max_queue_size=10)
+    assert pool.enqueue(
+        event_type="success",
+        callback_names=("not-a-callback",),
+        start_time=datetime.now(),
+        end_time=datetime.now(),
+        payload_json_bytes=b'{"id": "1"}',
+    )
+    processes = list(pool._processes)
+    assert len(processes) == 1
+
+    pool.stop(timeout=60)
+    assert processes[0].exitcode == 0
+    assert pool._queue is None
+
+
+def test_full_queue_returns_false():
+    pool = LoggingWorkerProcessPool(max_queue_size=1)
+    pool._queue = MagicMock()
+    pool._queue.put_nowait.side_effect = Full
+    assert (
+        pool.enqueue(
+            event_type="success",
+            callback_names=("datadog",),
+            start_time=datetime.now(),
+            end_time=datetime.now(),
+            payload_json_bytes=b"{}",
+        )
+        is False
+    )
+    assert pool.dropped_events == 1
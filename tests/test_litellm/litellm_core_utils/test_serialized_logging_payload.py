@@ -0,0 +1,158 @@
+import copy
+import json
+import os
+import pickle
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm.integrations.custom_logger import CustomLogger
+from litellm.litellm_core_utils.litellm_logging import (
+    create_dummy_standard_logging_payload,
+)
+from litellm.litellm_core_utils.serialized_logging_payload import (
+    CONTENT_FIELDS,
+    SerializedStandardLoggingPayload,
+    get_standard_logging_payload_json_bytes,
+    json_array_bytes,
+    ndjson_bytes,
+)
+
+
+def _payload() -> SerializedStandardLoggingPayload:
+    payload = dict(create_dummy_standard_logging_payload())
+    payload["messages"] = [{"role": "user", "content": "hello"}]
+    payload["response"] = {"choices": [{"message": {"content": "hi"}}]}
+    return SerializedStandardLoggingPayload(payload)
+
+
+def test_json_bytes_see_nested_changes():
+    """Encoded bytes are not cached - callbacks can modify nested values in place"""
+    payload = _payload()
+    encoded = payload.get_json_bytes()
+    assert json.loads(encoded) == json.loads(json.dumps(dict(payload), default=str))
+
+    payload["metadata"]["user_api_key_alias"] = "changed"
+    payload["messages"][0]["content"] = "changed"
+    decoded = json.loads(payload.get_json_bytes())
+    assert decoded["metadata"]["user_api_key_alias"] == "changed"
+    assert decoded["messages"][0]["content"] == "changed"
+    assert json.loads(get_standard_logging_payload_json_bytes(payload)) == decoded
+
+
+def test_top_level_write_is_encoded():
+    payload = _payload()
+    payload["error_str"] = "truncated"
+    assert json.loads(payload.get_json_bytes())["error_str"] == "truncated"
+
+    payload.pop("error_str")
+    assert "error_str" not in json.loads(payload.get_json_bytes())
+
+
+def test_projection_and_redacted_variant():
+    payload = _payload()
+
+    projection = json.loads(payload.get_json_bytes(exclude=CONTENT_FIELDS))
+    assert "messages" not in projection and "response" not in projection
+    assert projection["id"] == payload["id"]
+
+    redacted = json.loads(payload.get_json_bytes(redacted=True))
+    assert redacted["messages"][0]["content"] == "redacted-by-litellm"
+    assert (
+        redacted["response"]["choices"][0]["message"]["content"]
+        == "redacted-by-litellm"
+    )
+    # original is not modified
+    assert payload["messages"][0]["content"] == "hello"
+
+
+def test_copies_do_not_share_redacted_payload():
+    payload = _payload()
+    payload.get_json_bytes()
+
+    for payload_copy in (
+        copy.copy(payload),
+        copy.deepcopy(payload),
+        pickle.loads(pickle.dumps(payload)),
+    ):
+        assert isinstance(payload_copy, SerializedStandardLoggingPayload)
+        assert payload_copy == payload
+        payload_copy["messages"] = []
+        assert json.loads(payload_copy.get_json_bytes())["messages"] == []
+    assert json.loads(payload.get_json_bytes())["messages"][0]["content"] == "hello"
+
+
+def test_non_serializable_and_circular_values():
+    payload = _payload()
+    payload["metadata"] = {"span": object()}
+    assert "object object" in json.loads(payload.get_json_bytes())["metadata"]["span"]
+
+    circular: dict = {}
+    circular["self"] = circular
+    payload["hidden_params"] = circular
+    assert json.loads(payload.get_json_bytes())["hidden_params"]["self"] == (
+        "CircularReference Detected"
+    )
+
+
+def test_batch_helpers():
+    items = [b'{"a":1}', b'{"b":2}']
+    assert json.loads(json_array_bytes(items)) == [{"a": 1}, {"b": 2}]
+    assert json_array_bytes([]) == b"[]"
+    assert ndjson_bytes(items) == b'{"a":1}\n{"b":2}\n'
+
+
+def test_redacted_payload_shared_by_loggers():
+    payload = _payload()
+    model_call_details = {"standard_logging_object": payload}
+
+    redacted_payloads = []
+    for _ in range(2):
+        logger = CustomLogger(turn_off_message_logging=True)
+        redacted_payloads.append(
+            logger.redact_standard_logging_payload_from_model_call_details(
+                model_call_details
+            )["standard_logging_object"]
+        )
+    # redacted once, each logger gets its own shallow copy
+    assert redacted_payloads[0] is not redacted_payloads[1]
+    assert redacted_payloads[0]["messages"] is redacted_payloads[1]["messages"]
+    assert redacted_payloads[0]["messages"][0]["content"] == "redacted-by-litellm"
+    assert payload["messages"][0]["content"] == "hello"
+
+    redacted_payloads[0]["metadata"] = {"changed": True}
+    assert redacted_payloads[1]["metadata"] != {"changed": True}
+    assert payload.get_redacted_payload()["metadata"] != {"changed": True}
+    assert b"changed" not in payload.get_json_bytes(redacted=True)
+
+
+@pytest.mark.asyncio
+async def test_completion_standard_logging_object_is_serialized_payload():
+    class PayloadLogger(CustomLogger):
+        payload = None
+
+        async def async_log_success_event(
+            self, kwargs, response_obj, start_time, end_time
+        ):
+            self.payload = kwargs["standard_logging_object"]
+
+    logger = PayloadLogger()
+    litellm.callbacks = [logger]
+    try:
+        await litellm.acompletion(
+            model="gpt-4o",
+            messages=[{"role": "user", "content": "hi"}],
+            mock_response="hello",
+        )
+        import asyncio
+
+        await asyncio.sleep(1)
+    finally:
+        litellm.callbacks = []
+
+    assert isinstance(logger.payload, SerializedStandardLoggingPayload)
+    assert json.loads(logger.payload.get_json_bytes())["model"] == "gpt-4o"
@@ -0,0 +1,127 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.litellm_core_utils.sse_decoder import (
+    SSEDecoder,
+    aiter_sse_chunks,
+    iter_sse_chunks,
+)
+from litellm.llms.anthropic.chat.handler import ModelResponseIterator
+from litellm.llms.databricks.streaming_utils import (
+    ModelResponseIterator as DatabricksModelResponseIterator,
+)
+from litellm.llms.openai.chat.gpt_transformation import (
+    OpenAIChatCompletionStreamingHandler,
+)
+
+SSE_STREAM = (
+    b"event: message_start\r\n"
+    b'data: {"type": "message_start", "text": "h\xc3\xa9llo \xf0\x9f\x91\x8b"}\r\n'
+    b"\r\n"
+    b": keep-alive\n"
+    b"id: 1\n"
+    b"retry: 100\n"
+    b'data:{"type":"ping"}\n'
+    b"\n"
+    b'data: {"partial": \n'
+    b"data: [DONE]\n"
+    b'{"ndjson": true}'
+)
+
+EXPECTED_CHUNKS = [
+    {"type": "message_start", "text": "héllo 👋"},
+    {"type": "ping"},
+    'data: {"partial": ',
+    "data: [DONE]",
+    '{"ndjson": true}',
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, len(SSE_STREAM)])
+def test_sse_decoder_chunk_boundaries(chunk_size):
+    chunks = [
+        SSE_STREAM[i : i + chunk_size] for i in range(0, len(SSE_STREAM), chunk_size)
+    ]
+    assert list(iter_sse_chunks(chunks)) == EXPECTED_CHUNKS
+
+
+def test_sse_decoder_incremental():
+    decoder = SSEDecoder()
+    assert decoder.decode(b'data: {"a"') == []
+    assert decoder.decode(b": 1}\ndata: ") == [{"a": 1}]
+    assert decoder.decode(b'{"b": 2}') == []
+    assert decoder.flush() == [{"b": 2}]
+    assert decoder.flush() == []
+
+
+@pytest.mark.asyncio
+async def test_aiter_sse_chunks():
+    async def byte_iterator():
+        for i in range(0, len(SSE_STREAM), 5):
+            yield SSE_STREAM[i : i + 5]
+
+    assert [chunk async for chunk in aiter_sse_chunks(byte_iterator())] == (
+        EXPECTED_CHUNKS
+    )
+
+
+@pytest.mark.asyncio
+async def test_openai_streaming_handler_with_sse_decoder():
+    stream = (
+        b'data: {"id": "chatcmpl-1", "created": 1, "model": "gpt-4o", "choices": [{"index": 0, "delta": {"content": "Hi"}}]}\n\n'
+        b"data: [DONE]\n\n"
+    )
+
+    async def byte_iterator():
+        yield stream[:40]
+        yield stream[40:]
+
+    iterator = OpenAIChatCompletionStreamingHandler(
+        streaming_response=aiter_sse_chunks(byte_iterator()), sync_stream=False
+    )
+    chunks = [chunk async for chunk in iterator]
+    assert chunks[0].choices[0].delta.content == "Hi"
+    assert chunks[1]["is_finished"] is True
+
+
+def test_anthropic_iterator_with_sse_decoder():
+    stream = (
+        b"event: content_block_delta\n"
+        b'data: {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "Hello"}}\n\n'
+        b"event: message_delta\n"
+        b'data: {"type": "message_delta", "delta": {"stop_reason": "end_turn"}, "usage": {"output_tokens": 5}}\n\n'
+    )
+    iterator = ModelResponseIterator(
+        streaming_response=iter_sse_chunks([stream[:50], stream[50:]]),
+        sync_stream=True,
+    )
+    chunks = list(iterator)
+    assert len(chunks) == 2
+    assert chunks[0].choices[0].delta.content == "Hello"
+    assert chunks[1].choices[0].finish_reason == "stop"
+
+
+@pytest.mark.asyncio
+async def test_databricks_iterator_with_sse_decoder():
+    stream = (
+        b'data: {"id": "chatcmpl-1", "created": 1, "model": "dbrx", "choices": [{"index": 0, "delta": {"content": "Hi"}}]}\n\n'
+        b"data: [DONE]\n\n"
+        b'data: {"id": "chatcmpl-1", "created": 1, "model": "dbrx", "choices": [{"index": 0, "delta": {"content": "ignored"}}]}\n\n'
+    )
+
+    async def byte_iterator():
+        yield stream
+
+    iterator = DatabricksModelResponseIterator(
+        streaming_response=aiter_sse_chunks(byte_iterator()), sync_stream=False
+    )
+    chunks = [chunk async for chunk in iterator]
+    # dict chunks go through the shared base iterator, the stream stops at [DONE]
+    assert len(chunks) == 1
+    assert chunks[0]["text"] == "Hi"
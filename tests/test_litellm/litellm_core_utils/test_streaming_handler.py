@@ -1162,3 +1162,42 @@ def test_is_chunk_non_empty_with_valid_tool_calls(
         )
         is True
     )
+
+
+def _content_chunk(content: Optional[str]) -> ModelResponseStream:
+    return ModelResponseStream(
+        choices=[StreamingChoices(index=0, delta=Delta(content=content))]
+    )
+
+
+def test_safety_checker_repeated_chunks(
+    initialized_custom_stream_wrapper: CustomStreamWrapper,
+):
+    for _ in range(litellm.REPEATED_STREAMING_CHUNK_LIMIT - 1):
+        initialized_custom_stream_wrapper._append_chunk(_content_chunk("hello"))
+        initialized_custom_stream_wrapper.safety_checker()
+
+    initialized_custom_stream_wrapper._append_chunk(_content_chunk("hello"))
+    with pytest.raises(litellm.InternalServerError):
+        initialized_custom_stream_wrapper.safety_checker()
+
+
+def test_safety_checker_varying_and_empty_chunks(
+    initialized_custom_stream_wrapper: CustomStreamWrapper,
+):
+    # a different chunk resets the count
+    limit = litellm.REPEATED_STREAMING_CHUNK_LIMIT
+    for content in ["hello"] * (limit - 1) + ["bye"] + ["hello"] * (limit - 1):
+        initialized_custom_stream_wrapper._append_chunk(_content_chunk(content))
+        initialized_custom_stream_wrapper.safety_checker()
+
+    # repeated empty content is ignored
+    stream_wrapper = CustomStreamWrapper(
+        completion_stream=None,
+        model=None,
+        logging_obj=MagicMock(),
+        custom_llm_provider=None,
+    )
+    for _ in range(limit * 2):
+        stream_wrapper._append_chunk(_content_chunk(""))
+        stream_wrapper.safety_checker()
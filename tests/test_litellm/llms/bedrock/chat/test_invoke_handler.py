@@ -200,3 +200,54 @@ def test_bedrock_converse_streaming_consistent_id():
         assert (
             response.id == expected_id
         ), "All chunk IDs must match the one captured from the messageStart event"
+
+
+def test_converse_stream_many_tool_call_blocks():
+    """
+    A long tool-use stream keeps producing the right tool-call deltas and indices, block after block.
+    """
+    decoder = AWSEventStreamDecoder(model="test")
+    for block_index in range(50):
+        start_chunk = decoder.converse_chunk_parser(
+            {
+                "start": {
+                    "toolUse": {
+                        "toolUseId": f"tooluse_{block_index}",
+                        "name": f"Tool_{block_index}",
+                    }
+                },
+                "contentBlockIndex": block_index,
+            }
+        )
+        start_tool_call = start_chunk.choices[0].delta.tool_calls[0]
+        assert start_tool_call.id == f"tooluse_{block_index}"
+        assert start_tool_call.function.name == f"Tool_{block_index}"
+        assert start_tool_call.index == block_index
+
+        if block_index % 2 == 0:
+            # tool call without arguments
+            decoder.converse_chunk_parser(
+                {"delta": {"toolUse": {"input": ""}}, "contentBlockIndex": block_index}
+            )
+            stop_chunk = decoder.converse_chunk_parser(
+                {"contentBlockIndex": block_index}
+            )
+            stop_tool_call = stop_chunk.choices[0].delta.tool_calls[0]
+            assert stop_tool_call.function.arguments == "{}"
+            assert stop_tool_call.index == block_index
+            continue
+
+        arguments = ""
+        for _ in range(100):
+            delta_chunk = decoder.converse_chunk_parser(
+                {
+                    "delta": {"toolUse": {"input": '{"a": 1'}},
+                    "contentBlockIndex": block_index,
+                }
+            )
+            delta_tool_call = delta_chunk.choices[0].delta.tool_calls[0]
+            assert delta_tool_call.index == block_index
+            arguments += delta_tool_call.function.arguments
+        assert arguments == '{"a": 1' * 100
+        stop_chunk = decoder.converse_chunk_parser({"contentBlockIndex": block_index})
+        assert stop_chunk.choices[0].delta.tool_calls is None
@@ -23,6 +23,7 @@ from litellm.llms.bedrock.base_aws_llm import (
     Boto3CredentialsInfo,
 )
 from litellm.caching.caching import DualCache
+from litellm.litellm_core_utils.fast_json import json_dumps_bytes
 
 # Global variable for the base_aws_llm.py file path
 
@@ -205,7 +206,7 @@ def test_sign_request_with_env_var_bearer_token():
         assert result_headers["Authorization"] == "Bearer test_token"
         assert result_headers["Content-Type"] == "application/json"
         assert result_headers["Custom-Header"] == "test"
-        assert result_body == json.dumps(request_data).encode()
+        assert result_body == json_dumps_bytes(request_data)
 
 
 def test_sign_request_with_sigv4():
@@ -232,9 +233,11 @@ def test_sign_request_with_sigv4():
     request_data = {"prompt": "test"}
     api_base = "https://api.example.com"
 
-    # Mock the necessary components
+    # Mock the necessary components - requests the sigv4 fast path does not handle are signed by botocore
     with patch("botocore.auth.SigV4Auth", return_value=mock_sigv4), patch(
         "botocore.awsrequest.AWSRequest", return_value=mock_request
+    ), patch(
+        "litellm.llms.bedrock.base_aws_llm.sign_request_headers", return_value=None
     ), patch.object(
         llm, "get_credentials", return_value=mock_credentials
     ), patch.object(
@@ -283,7 +286,7 @@ def test_sign_request_with_api_key_bearer_token():
     assert result_headers["Authorization"] == f"Bearer {api_key}"
     assert result_headers["Content-Type"] == "application/json"
     assert result_headers["Custom-Header"] == "test"
-    assert result_body == json.dumps(request_data).encode()
+    assert result_body == json_dumps_bytes(request_data)
 
 
 def test_get_request_headers_with_env_var_bearer_token():
@@ -334,11 +337,13 @@ def test_get_request_headers_with_sigv4():
 
     mock_sigv4 = MagicMock()
 
-    # Test without bearer token (should use SigV4)
+    # Test without bearer token (should use SigV4) - requests the sigv4 fast path does not handle are signed by botocore
     with patch.dict(os.environ, {}, clear=True), patch(
         "botocore.auth.SigV4Auth", return_value=mock_sigv4
     ) as mock_sigv4_class, patch(
         "botocore.awsrequest.AWSRequest", return_value=mock_request
+    ), patch(
+        "litellm.llms.bedrock.base_aws_llm.sign_request_headers", return_value=None
     ):
         result = llm.get_request_headers(
             credentials=credentials,
@@ -1191,3 +1196,89 @@ def test_converse_handler_external_id_extraction():
                             assert hasattr(mock_get_credentials, 'called_kwargs')
                             assert "aws_external_id" in mock_get_credentials.called_kwargs
                             assert mock_get_credentials.called_kwargs["aws_external_id"] == "TestExternalID123"
+
+
+def test_get_credentials_single_flight_and_background_refresh():
+    """
+    Concurrent cache misses share one role assumption, and the credentials are re-assumed in the background before they expire.
+
+    Instances share the credentials and their refresh - per-request instances do not add refresh entries.
+    """
+    import threading
+    import time
+
+    from litellm.litellm_core_utils.credential_refresh_manager import (
+        credential_refresh_manager,
+    )
+
+    BaseAWSLLM.iam_cache.flush_cache()
+    issued_credentials = []
+
+    def mock_auth_with_aws_role(**kwargs):
+        time.sleep(0.2)
+        credentials = Credentials(
+            access_key=f"access-key-{len(issued_credentials)}",
+            secret_key="secret-key",
+            token="session-token",
+        )
+        issued_credentials.append(credentials)
+        return credentials, 3540
+
+    results = []
+    with patch.object(
+        BaseAWSLLM, "_auth_with_aws_role", side_effect=mock_auth_with_aws_role
+    ):
+        # e.g. one config object per request
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    BaseAWSLLM().get_credentials(
+                        aws_role_name="arn:aws:iam::123456789012:role/ExampleRole",
+                        aws_session_name="test-session",
+                    )
+                )
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(issued_credentials) == 1
+        assert all(credentials is issued_credentials[0] for credentials in results)
+
+        cache_key = BaseAWSLLM().get_cache_key(
+            {
+                "aws_access_key_id": None,
+                "aws_secret_access_key": None,
+                "aws_session_token": None,
+                "aws_region_name": None,
+                "aws_session_name": "test-session",
+                "aws_profile_name": None,
+                "aws_role_name": "arn:aws:iam::123456789012:role/ExampleRole",
+                "aws_web_identity_token": None,
+                "aws_sts_endpoint": None,
+                "aws_external_id": None,
+            }
+        )
+        assert cache_key in credential_refresh_manager._scheduled
+        assert not any(
+            isinstance(key, tuple) and key[-1] == cache_key
+            for key in credential_refresh_manager._scheduled
+        )
+        scheduled_refresh = credential_refresh_manager._scheduled[cache_key]
+        assert scheduled_refresh.expires_at == pytest.approx(time.time() + 3540, abs=5)
+
+        # what the scheduler runs CREDENTIAL_REFRESH_AHEAD_SECONDS before expiry
+        scheduled_refresh.refresh_fn()
+
+        assert len(issued_credentials) == 2
+        assert (
+            BaseAWSLLM().get_credentials(
+                aws_role_name="arn:aws:iam::123456789012:role/ExampleRole",
+                aws_session_name="test-session",
+            ).access_key
+            == "access-key-1"
+        )
+    credential_refresh_manager.cancel(cache_key)
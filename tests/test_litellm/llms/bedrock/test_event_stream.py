@@ -0,0 +1,135 @@
+import base64
+import json
+import os
+import struct
+import sys
+import zlib
+
+import pytest
+from botocore.eventstream import EventStreamBuffer
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.llms.bedrock.chat.invoke_handler import AWSEventStreamDecoder
+from litellm.llms.bedrock.common_utils import BedrockError
+from litellm.llms.bedrock.event_stream import AWSEventStreamBuffer, AWSEventStreamError
+
+
+def _encode_frame(headers: dict, payload: bytes) -> bytes:
+    encoded_headers = b""
+    for name, value in headers.items():
+        encoded_name = name.encode()
+        encoded_headers += bytes([len(encoded_name)]) + encoded_name
+        if isinstance(value, bool):
+            encoded_headers += bytes([0 if value else 1])
+        elif isinstance(value, int):
+            encoded_headers += bytes([4]) + struct.pack(">i", value)
+        elif isinstance(value, bytes):
+            encoded_headers += bytes([6]) + struct.pack(">H", len(value)) + value
+        else:
+            encoded_value = value.encode()
+            encoded_headers += (
+                bytes([7]) + struct.pack(">H", len(encoded_value)) + encoded_value
+            )
+    total_length = 12 + len(encoded_headers) + len(payload) + 4
+    prelude = struct.pack(">II", total_length, len(encoded_headers))
+    message = prelude + struct.pack(">I", zlib.crc32(prelude)) + encoded_headers
+    message += payload
+    return message + struct.pack(">I", zlib.crc32(message))
+
+
+def _invoke_chunk_frame(chunk: dict) -> bytes:
+    return _encode_frame(
+        {
+            ":event-type": "chunk",
+            ":content-type": "application/json",
+            ":message-type": "event",
+        },
+        json.dumps(
+            {"bytes": base64.b64encode(json.dumps(chunk).encode()).decode()}
+        ).encode(),
+    )
+
+
+def _converse_frame(event_type: str, event: dict) -> bytes:
+    return _encode_frame(
+        {":event-type": event_type, ":message-type": "event", "count": -3, "ok": True},
+        json.dumps(event).encode(),
+    )
+
+
+STREAM = b"".join(
+    [
+        _converse_frame("messageStart", {"role": "assistant"}),
+        *[
+            _converse_frame(
+                "contentBlockDelta",
+                {"delta": {"text": f"token {i} ☃"}, "contentBlockIndex": 0},
+            )
+            for i in range(20)
+        ],
+        _invoke_chunk_frame({"outputText": "hello"}),
+    ]
+)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 13, 1024, len(STREAM)])
+def test_event_stream_buffer_matches_botocore(chunk_size):
+    botocore_buffer = EventStreamBuffer()
+    botocore_buffer.add_data(STREAM)
+    expected = [(event.headers, event.payload) for event in botocore_buffer]
+
+    event_stream_buffer = AWSEventStreamBuffer()
+    messages = []
+    for i in range(0, len(STREAM), chunk_size):
+        messages.extend(event_stream_buffer.decode(STREAM[i : i + chunk_size]))
+
+    assert [(message.headers, message.payload) for message in messages] == expected
+    assert messages[-1].get_chunk_bytes() == b'{"outputText": "hello"}'
+    assert json.loads(messages[1].get_chunk_bytes())["delta"]["text"] == "token 0 ☃"
+
+
+def test_event_stream_buffer_checksum_mismatch():
+    frame = bytearray(_invoke_chunk_frame({"outputText": "hello"}))
+    frame[-5] ^= 0xFF
+    with pytest.raises(AWSEventStreamError):
+        AWSEventStreamBuffer().decode(bytes(frame))
+
+
+def test_decoder_iter_bytes():
+    decoder = AWSEventStreamDecoder(model="amazon.titan-text-express-v1")
+    chunks = list(decoder.iter_bytes(iter([STREAM[:100], STREAM[100:]])))
+    assert chunks[-1]["text"] == "hello"
+
+
+@pytest.mark.asyncio
+async def test_decoder_aiter_bytes_exception_event():
+    error_frame = _encode_frame(
+        {":exception-type": "throttlingException", ":message-type": "exception"},
+        b'{"message": "Too many requests"}',
+    )
+
+    async def byte_iterator():
+        yield STREAM
+        yield error_frame
+
+    decoder = AWSEventStreamDecoder(model="amazon.titan-text-express-v1")
+    with pytest.raises(BedrockError) as exc_info:
+        async for _ in decoder.aiter_bytes(byte_iterator()):
+            pass
+    assert exc_info.value.status_code == 400
+    assert "throttlingException" in exc_info.value.message
+
+
+def test_decoder_exception_type_bytes_header():
+    error_frame = _encode_frame(
+        {":exception-type": b"throttlingException", ":message-type": "exception"},
+        b'{"message": "Too many requests"}',
+    )
+
+    decoder = AWSEventStreamDecoder(model="amazon.titan-text-express-v1")
+    with pytest.raises(BedrockError) as exc_info:
+        list(decoder.iter_bytes(iter([error_frame])))
+    assert exc_info.value.message.startswith("throttlingException ")
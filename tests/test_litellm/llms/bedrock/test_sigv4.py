@@ -0,0 +1,213 @@
+import os
+import sys
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
+from botocore.credentials import Credentials
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.llms.bedrock.base_aws_llm import BaseAWSLLM
+from litellm.llms.bedrock.sigv4 import _get_signing_key, sign_request_headers
+
+TIMESTAMP = "20250102T030405Z"
+BODY = '{"messages": [{"role": "user", "content": [{"text": "héllo 👋"}]}]}'
+
+
+def _botocore_sign(credentials, service_name, region_name, url, headers, body):
+    request = AWSRequest(method="POST", url=url, data=body, headers=headers)
+    # freeze botocore's clock - older botocore reads `datetime.utcnow()`, newer `datetime.now(timezone.utc)`
+    with patch("botocore.auth.datetime") as mock_datetime:
+        mock_datetime.datetime.utcnow.return_value = datetime(2025, 1, 2, 3, 4, 5)
+        mock_datetime.datetime.now.return_value = datetime(
+            2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc
+        )
+        SigV4Auth(credentials, service_name, region_name).add_auth(request)
+    return dict(request.headers)
+
+
+@pytest.mark.parametrize(
+    "credentials",
+    [
+        Credentials("AKIDEXAMPLE", "wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY"),
+        Credentials("ASIAEXAMPLE", "secret", "session-token  with   spaces"),
+    ],
+    ids=["static", "session-token"],
+)
+@pytest.mark.parametrize(
+    "service_name, region_name, url",
+    [
+        (
+            "bedrock",
+            "us-east-1",
+            "https://bedrock-runtime.us-east-1.amazonaws.com/model/anthropic.claude-3-5-sonnet-20240620-v1%3A0/converse-stream",
+        ),
+        (
+            "bedrock",
+            "eu-west-1",
+            "https://bedrock-runtime.eu-west-1.amazonaws.com/model/arn:aws:bedrock:eu-west-1:123456789012:inference-profile/eu.anthropic.claude-3-haiku/invoke",
+        ),
+        (
+            "sagemaker",
+            "us-west-2",
+            "https://runtime.sagemaker.us-west-2.amazonaws.com/endpoints/my-endpoint/invocations",
+        ),
+        (
+            "bedrock-agentcore",
+            "us-west-2",
+            "https://bedrock-agentcore.us-west-2.amazonaws.com:443/runtimes/arn%3Aaws/invocations?qualifier=DEFAULT&b=2&a=1",
+        ),
+        ("bedrock", "us-east-1", "http://localhost:8080//model/./x/../y/invoke"),
+        ("bedrock", "us-east-1", "https://bedrock-runtime.us-east-1.amazonaws.com"),
+    ],
+)
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"Content-Type": "application/json"},
+        {
+            "Content-Type": "application/json",
+            "X-Amzn-Bedrock-Trace": "ENABLED",
+            "x-amz-date": "stale",
+            "Authorization": "stale",
+            "User-Agent": "litellm",
+            "X-Amzn-Trace-Id": "Root=1-abc",
+            "X-Amz-Content-SHA256": "UNSIGNED-PAYLOAD",
+            "Accept": "application/vnd.amazon.eventstream",
+        },
+    ],
+    ids=["minimal", "forwarded-headers"],
+)
+@pytest.mark.parametrize(
+    "body", [BODY, BODY.encode("utf-8"), b""], ids=["str", "bytes", "empty"]
+)
+def test_signature_matches_botocore(
+    credentials, service_name, region_name, url, headers, body
+):
+    expected = _botocore_sign(
+        credentials, service_name, region_name, url, headers.copy(), body
+    )
+    signed_headers = sign_request_headers(
+        credentials=credentials,
+        service_name=service_name,
+        region_name=region_name,
+        url=url,
+        headers=headers,
+        body=body,
+        timestamp=TIMESTAMP,
+    )
+    assert signed_headers == expected
+
+
+@pytest.mark.parametrize(
+    "url, headers, body",
+    [
+        ("https://[::1]:8080/model/x/invoke", {}, b"{}"),
+        ("https://bedrock-runtime.us-east-1.amazonaws.com/x", {"Date": "now"}, b"{}"),
+        (
+            "https://bedrock-runtime.us-east-1.amazonaws.com/x",
+            {"content-type": "a", "Content-Type": "b"},
+            b"{}",
+        ),
+        (
+            "https://bedrock-runtime.us-east-1.amazonaws.com/x",
+            {"X-Amz-Security-Token": "caller-token"},
+            b"{}",
+        ),
+        ("https://bedrock-runtime.us-east-1.amazonaws.com/x", {}, iter([b"{}"])),
+    ],
+    ids=["ipv6", "date-header", "repeated-header", "caller-token", "streaming-body"],
+)
+def test_unsupported_requests_fall_back_to_botocore(url, headers, body):
+    assert (
+        sign_request_headers(
+            credentials=Credentials("AKIDEXAMPLE", "secret"),
+            service_name="bedrock",
+            region_name="us-east-1",
+            url=url,
+            headers=headers,
+            body=body,
+        )
+        is None
+    )
+
+
+def test_signing_key_is_cached():
+    _get_signing_key.cache_clear()
+    for _ in range(3):
+        sign_request_headers(
+            credentials=Credentials("AKIDEXAMPLE", "secret"),
+            service_name="bedrock",
+            region_name="us-east-1",
+            url="https://bedrock-runtime.us-east-1.amazonaws.com/model/x/invoke",
+            headers={"Content-Type": "application/json"},
+            body=b"{}",
+            timestamp=TIMESTAMP,
+        )
+    cache_info = _get_signing_key.cache_info()
+    assert (cache_info.misses, cache_info.hits) == (1, 2)
+
+
+def _sign_with_frozen_time(fn, **kwargs):
+    with patch("litellm.llms.bedrock.sigv4.time.strftime", return_value=TIMESTAMP):
+        fast_path_result = fn(**kwargs)
+    with patch(
+        "litellm.llms.bedrock.base_aws_llm.sign_request_headers", return_value=None
+    ), patch("botocore.auth.datetime") as mock_datetime:
+        mock_datetime.datetime.utcnow.return_value = datetime(2025, 1, 2, 3, 4, 5)
+        botocore_result = fn(**kwargs)
+    return fast_path_result, botocore_result
+
+
+def test_sign_request_matches_botocore_path():
+    llm = BaseAWSLLM()
+    credentials = Credentials("ASIAEXAMPLE", "secret", "session-token")
+    with patch.object(llm, "get_credentials", return_value=credentials), patch.dict(
+        os.environ, {}, clear=True
+    ):
+        (fast_headers, fast_body), (botocore_headers, botocore_body) = (
+            _sign_with_frozen_time(
+                llm._sign_request,
+                service_name="sagemaker",
+                headers={"X-Amzn-SageMaker-Custom-Attributes": "a=b"},
+                optional_params={"aws_region_name": "us-west-2"},
+                request_data={"inputs": "héllo"},
+                api_base="https://runtime.sagemaker.us-west-2.amazonaws.com/endpoints/e/invocations",
+            )
+        )
+    assert fast_headers == botocore_headers
+    assert fast_body == botocore_body
+
+
+@pytest.mark.parametrize(
+    "extra_headers",
+    [None, {"Authorization": "Bearer custom"}],
+    ids=["sigv4", "custom-auth"],
+)
+def test_get_request_headers_matches_botocore_path(extra_headers):
+    llm = BaseAWSLLM()
+    with patch.dict(os.environ, {}, clear=True):
+        fast_prepped, botocore_prepped = _sign_with_frozen_time(
+            llm.get_request_headers,
+            credentials=Credentials("ASIAEXAMPLE", "secret", "session-token"),
+            aws_region_name="us-east-1",
+            extra_headers=extra_headers,
+            endpoint_url="https://bedrock-runtime.us-east-1.amazonaws.com/model/m/converse",
+            data=BODY,
+            headers={
+                "Content-Type": "application/json",
+                "X-Forwarded-For": "1.2.3.4",
+                "X-Amzn-Bedrock-GuardrailIdentifier": "g",
+            },
+        )
+    assert dict(fast_prepped.headers) == dict(botocore_prepped.headers)
+    if extra_headers is not None:
+        assert fast_prepped.headers["Authorization"] == "Bearer custom"
+    assert fast_prepped.url == botocore_prepped.url
+    assert fast_prepped.body == botocore_prepped.body
+    assert fast_prepped.method == botocore_prepped.method
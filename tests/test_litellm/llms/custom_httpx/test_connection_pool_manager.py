@@ -0,0 +1,129 @@
+import os
+import sys
+
+import pytest
+from aiohttp import web
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm.llms.custom_httpx.connection_pool_manager import (
+    UpstreamConnectionPoolManager,
+    UpstreamPoolTransport,
+)
+from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
+
+
+@pytest.fixture
+async def upstream_server():
+    async def handler(request):
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+@pytest.fixture
+def pool_manager(monkeypatch):
+    manager = UpstreamConnectionPoolManager()
+    monkeypatch.setattr(litellm, "upstream_connection_pool", True)
+    monkeypatch.setattr(
+        "litellm.llms.custom_httpx.connection_pool_manager.upstream_connection_pool_manager",
+        manager,
+    )
+    return manager
+
+
+def test_get_origin():
+    get_origin = UpstreamConnectionPoolManager.get_origin
+    assert get_origin("https://api.openai.com/v1/chat/completions") == (
+        "https://api.openai.com:443"
+    )
+    assert get_origin("https://api.openai.com:443/v1") == "https://api.openai.com:443"
+    assert get_origin("http://localhost:4000/v1") == "http://localhost:4000"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("disable_aiohttp_transport", [False, True])
+async def test_clients_share_origin_pool(
+    upstream_server, pool_manager, monkeypatch, disable_aiohttp_transport
+):
+    """
+    Clients with different params share one pool, which outlives the clients.
+    """
+    monkeypatch.setattr(litellm, "disable_aiohttp_transport", disable_aiohttp_transport)
+
+    client_1 = AsyncHTTPHandler(timeout=10)
+    client_2 = AsyncHTTPHandler(timeout=30)
+    assert isinstance(client_1.client._transport, UpstreamPoolTransport)
+
+    response = await client_1.post(f"{upstream_server}/v1/chat/completions", json={})
+    assert response.json() == {"ok": True}
+    await client_1.close()
+    await client_2.post(f"{upstream_server}/v1/embeddings", json={})
+    await client_2.close()
+
+    stats = pool_manager.get_stats()
+    assert list(stats.keys()) == [upstream_server]
+    assert stats[upstream_server]["num_requests"] == 2
+    assert stats[upstream_server]["num_handshakes"] == 1
+    assert stats[upstream_server]["idle_connections"] == 1
+    assert stats[upstream_server]["active_connections"] == 0
+    await pool_manager.close()
+
+
+@pytest.mark.asyncio
+async def test_prewarm(upstream_server, pool_manager):
+    await pool_manager.prewarm(
+        api_bases=[f"{upstream_server}/v1", upstream_server], num_connections=2
+    )
+
+    stats = pool_manager.get_stats()[upstream_server]
+    assert stats["num_handshakes"] == 2
+    assert stats["idle_connections"] == 2
+
+    client = AsyncHTTPHandler()
+    await client.post(f"{upstream_server}/v1/chat/completions", json={})
+    assert pool_manager.get_stats()[upstream_server]["num_handshakes"] == 2
+    await pool_manager.close()
+
+
+def test_http2_origin_falls_back_without_h2(monkeypatch):
+    monkeypatch.setattr(
+        litellm, "upstream_http2_origins", ["https://api.openai.com/v1"]
+    )
+    monkeypatch.setitem(sys.modules, "h2", None)
+
+    manager = UpstreamConnectionPoolManager()
+    assert manager.get_pool("https://api.openai.com/v1/chat/completions").http2 is False
+    assert manager.get_pool("https://api.anthropic.com/v1/messages").http2 is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("pool_limit", [0, 10])
+async def test_origin_pool_limit(monkeypatch, pool_limit):
+    """
+    All traffic to an origin shares one pool - it has its own limit, unbounded by default.
+    """
+    monkeypatch.setattr(
+        "litellm.llms.custom_httpx.connection_pool_manager.UPSTREAM_CONNECTION_POOL_LIMIT",
+        pool_limit,
+    )
+    pool = UpstreamConnectionPoolManager().get_pool("https://api.openai.com/v1")
+
+    session = pool._create_aiohttp_session()
+    assert session.connector.limit == pool_limit
+    assert session.connector.limit_per_host == 0
+    await session.close()
+
+    transport = pool._create_httpx_transport()
+    assert transport._pool._max_connections == (pool_limit or sys.maxsize)
+    await transport.aclose()
@@ -0,0 +1,149 @@
+import os
+import sys
+
+import pytest
+from aiohttp import web
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm.litellm_core_utils.litellm_logging import StandardLoggingPayloadSetup
+from litellm.llms.custom_httpx.connection_pool_manager import (
+    UpstreamConnectionPoolManager,
+    UpstreamPoolTransport,
+)
+from litellm.llms.custom_httpx.connection_timings import ConnectionPhaseTimings
+from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
+
+
+class LoggingObj:
+    connection_timings = None
+
+
+@pytest.fixture
+async def upstream_server():
+    async def handler(request):
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "disable_aiohttp_transport", [False, True], ids=["aiohttp", "httpx"]
+)
+async def test_post_records_connection_timings(
+    upstream_server, monkeypatch, disable_aiohttp_transport
+):
+    monkeypatch.setattr(litellm, "disable_aiohttp_transport", disable_aiohttp_transport)
+    client = AsyncHTTPHandler()
+    try:
+        logging_objs = [LoggingObj(), LoggingObj()]
+        for logging_obj in logging_objs:
+            response = await client.post(
+                upstream_server, json={"a": 1}, logging_obj=logging_obj
+            )
+            assert response.json() == {"ok": True}
+
+        new_connection = logging_objs[0].connection_timings.to_standard_logging_object()
+        assert new_connection["connection_reused"] is False
+        assert list(new_connection["phases"]) == [
+            "pool_wait",
+            "connect",
+            "time_to_first_byte",
+            "body_transfer",
+        ]
+
+        reused_connection = logging_objs[
+            1
+        ].connection_timings.to_standard_logging_object()
+        assert reused_connection["connection_reused"] is True
+        assert list(reused_connection["phases"]) == [
+            "pool_wait",
+            "time_to_first_byte",
+            "body_transfer",
+        ]
+        # phases are sequential
+        phases = list(reused_connection["phases"].values())
+        for phase, next_phase in zip(phases, phases[1:]):
+            assert (
+                phase["start_ms"] + phase["duration_ms"]
+                <= next_phase["start_ms"] + 0.01
+            )
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "disable_aiohttp_transport", [False, True], ids=["aiohttp", "httpx"]
+)
+async def test_streaming_body_transfer_ends_with_stream(
+    upstream_server, monkeypatch, disable_aiohttp_transport
+):
+    monkeypatch.setattr(litellm, "disable_aiohttp_transport", disable_aiohttp_transport)
+    client = AsyncHTTPHandler()
+    try:
+        logging_obj = LoggingObj()
+        response = await client.post(
+            upstream_server, json={"a": 1}, logging_obj=logging_obj, stream=True
+        )
+        phases = logging_obj.connection_timings.get_phases()
+        assert "time_to_first_byte" in phases
+        assert "body_transfer" not in phases
+
+        async for _ in response.aiter_bytes():
+            pass
+        assert "body_transfer" in logging_obj.connection_timings.get_phases()
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_trace_calls_request_trace(upstream_server):
+    """
+    The upstream pool's handshake trace also records the request's connection timings.
+    """
+    manager = UpstreamConnectionPoolManager()
+    pool = manager.get_pool(upstream_server)
+    pool._transport = pool._create_httpx_transport()
+    client = AsyncHTTPHandler()
+    client.client._transport = UpstreamPoolTransport(manager=manager)
+    try:
+        logging_obj = LoggingObj()
+        await client.post(upstream_server, json={"a": 1}, logging_obj=logging_obj)
+    finally:
+        await client.close()
+        await manager.close()
+
+    assert pool.handshake_stats.num_handshakes == 1
+    assert "connect" in logging_obj.connection_timings.get_phases()
+
+
+def test_connection_timings_in_standard_logging_payload():
+    logging_obj = LoggingObj()
+    assert (
+        StandardLoggingPayloadSetup.get_connection_timings(logging_obj=logging_obj)
+        is None
+    )
+
+    timings = ConnectionPhaseTimings()
+    timings.mark("connection_acquired")
+    timings.mark("request_sent")
+    timings.mark("response_headers")
+    logging_obj.connection_timings = timings
+    connection_timings = StandardLoggingPayloadSetup.get_connection_timings(
+        logging_obj=logging_obj
+    )
+    assert connection_timings is not None
+    assert connection_timings["start_time"] == timings.start_time
+    assert list(connection_timings["phases"]) == ["pool_wait", "time_to_first_byte"]
@@ -271,7 +271,7 @@ class TestPGVectorStoreConfig:
             # Validate request body - it should be in 'data' parameter as JSON string
             json_data_str = call_kwargs.get('data', '{}')
             import json
-            json_data = json.loads(json_data_str) if isinstance(json_data_str, str) else json_data_str
+            json_data = json.loads(json_data_str) if isinstance(json_data_str, (str, bytes)) else json_data_str
             assert json_data.get("query") == query
             
             print("✅ PG Vector search request validation passed:")
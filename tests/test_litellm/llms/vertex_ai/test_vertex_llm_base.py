@@ -131,9 +131,10 @@ class TestVertexBase:
         mock_creds.project_id = "project-1"
         mock_creds.quota_project_id = "project-1"
 
+        # the background refresh does not hold on to the instance
         with patch.object(
             vertex_base, "load_auth", return_value=(mock_creds, "project-1")
-        ), patch.object(vertex_base, "refresh_auth") as mock_refresh:
+        ), patch.object(VertexBase, "refresh_auth") as mock_refresh:
 
             def mock_refresh_impl(creds):
                 creds.token = "refreshed-token"
@@ -158,6 +159,82 @@ class TestVertexBase:
             assert token == "refreshed-token"
             assert not mock_creds.expired
 
+    @pytest.mark.asyncio
+    async def test_background_credential_refresh(self):
+        from datetime import datetime, timedelta, timezone
+
+        from litellm.litellm_core_utils.credential_refresh_manager import (
+            credential_refresh_manager,
+        )
+
+        vertex_base = VertexBase()
+
+        mock_creds = MagicMock()
+        mock_creds.token = "my-token"
+        mock_creds.expired = False
+        # google-auth stores expiry as a naive UTC datetime
+        expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1)
+        mock_creds.expiry = expiry
+
+        # the background refresh does not hold on to the instance
+        with patch.object(
+            vertex_base, "load_auth", return_value=(mock_creds, "project-1")
+        ), patch.object(VertexBase, "refresh_auth") as mock_refresh:
+
+            def mock_refresh_impl(creds):
+                creds.token = "refreshed-token"
+                creds.expiry = expiry + timedelta(hours=1)
+
+            mock_refresh.side_effect = mock_refresh_impl
+
+            token, project = await vertex_base._ensure_access_token_async(
+                credentials={"type": "service_account"},
+                project_id="project-1",
+                custom_llm_provider="vertex_ai",
+            )
+            assert (token, project) == ("my-token", "project-1")
+
+            refresh_key = VertexBase._get_credentials_refresh_key(
+                ('{"type": "service_account"}', "project-1"), mock_creds
+            )
+            # the raw credentials are not part of the key
+            assert "service_account" not in repr(refresh_key)
+            scheduled_refresh = credential_refresh_manager._scheduled[refresh_key]
+            assert scheduled_refresh.expires_at == pytest.approx(
+                expiry.replace(tzinfo=timezone.utc).timestamp()
+            )
+
+            # cached token is served without leaving the event loop
+            with patch(
+                "litellm.llms.vertex_ai.vertex_llm_base.asyncify"
+            ) as mock_asyncify:
+                token, _ = await vertex_base._ensure_access_token_async(
+                    credentials={"type": "service_account"},
+                    project_id="project-1",
+                    custom_llm_provider="vertex_ai",
+                )
+            assert token == "my-token"
+            mock_asyncify.assert_not_called()
+            assert scheduled_refresh.used is True
+
+            # what the scheduler runs CREDENTIAL_REFRESH_AHEAD_SECONDS before expiry
+            assert vertex_base not in scheduled_refresh.refresh_fn.keywords.values()
+            scheduled_refresh.refresh_fn()
+
+            mock_refresh.assert_called_once_with(mock_creds)
+            assert credential_refresh_manager._scheduled[
+                refresh_key
+            ].expires_at == pytest.approx(
+                (expiry + timedelta(hours=1)).replace(tzinfo=timezone.utc).timestamp()
+            )
+            token, _ = vertex_base._ensure_access_token(
+                credentials={"type": "service_account"},
+                project_id="project-1",
+                custom_llm_provider="vertex_ai",
+            )
+            assert token == "refreshed-token"
+        credential_refresh_manager.cancel(refresh_key)
+
     @pytest.mark.parametrize("is_async", [True, False], ids=["async", "sync"])
     @pytest.mark.asyncio
     async def test_gemini_credentials(self, is_async):
@@ -489,9 +566,10 @@ class TestVertexBase:
 
         credentials = {"type": "service_account", "project_id": "project-1"}
 
+        # the background refresh does not hold on to the instance
         with patch.object(
             vertex_base, "load_auth", return_value=(mock_creds, "project-1")
-        ), patch.object(vertex_base, "refresh_auth") as mock_refresh:
+        ), patch.object(VertexBase, "refresh_auth") as mock_refresh:
 
             def mock_refresh_impl(creds):
                 creds.token = "refreshed-token"
@@ -16,6 +16,8 @@ sys.path.insert(
 import litellm
 from litellm.proxy._types import ProxyException
 from litellm.proxy.common_utils.http_parsing_utils import (
+    ProxyRequestBody,
+    _get_proxy_request_body,
     _read_request_body,
     _safe_get_request_headers,
     _safe_get_request_parsed_body,
@@ -295,6 +297,37 @@ async def test_form_data_with_none_metadata():
     assert result["model"] == "whisper-1"
 
 
+@pytest.mark.asyncio
+async def test_proxy_request_body_shared_across_stages():
+    """
+    Test that the raw body is read and parsed once per request, and shared by all stages.
+    """
+    raw_body = orjson.dumps({"model": "gpt-4o", "messages": []})
+    mock_request = MagicMock()
+    mock_request.body = AsyncMock(return_value=raw_body)
+    mock_request.headers = {"content-type": "application/json"}
+    mock_request.scope = {}
+
+    # e.g. the request size check in auth
+    request_body = await _get_proxy_request_body(mock_request)
+    assert isinstance(request_body, ProxyRequestBody)
+    assert request_body.raw_body is raw_body
+    assert request_body.size == len(raw_body)
+
+    with patch(
+        "litellm.proxy.common_utils.http_parsing_utils.orjson.loads",
+        wraps=orjson.loads,
+    ) as mock_loads:
+        result = await _read_request_body(mock_request)
+        assert result == {"model": "gpt-4o", "messages": []}
+        # shared, not a copy
+        assert request_body.json() is result
+        assert await _get_proxy_request_body(mock_request) is request_body
+        mock_loads.assert_called_once()
+
+    mock_request.body.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_empty_request_body():
     """
@@ -0,0 +1,152 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+from litellm.proxy._types import LitellmUserRoles, UserAPIKeyAuth
+from litellm.proxy.common_utils.debug_utils import (
+    get_sampling_profiler_flamegraph,
+    start_sampling_profiler,
+)
+from litellm.proxy.common_utils.sampling_profiler import (
+    EventLoopLagHistogram,
+    SamplingProfiler,
+)
+
+
+def _busy_background_work(stop_event: threading.Event):
+    while not stop_event.is_set():
+        sum(range(1000))
+
+
+@pytest.mark.asyncio
+async def test_sampling_profiler_collects_folded_stacks_and_event_loop_lag():
+    profiler = SamplingProfiler()
+    stop_event = threading.Event()
+    worker = threading.Thread(
+        target=_busy_background_work, args=(stop_event,), name="busy-worker"
+    )
+    worker.start()
+    try:
+        profiler.start(interval_ms=2, duration_s=30)
+        assert profiler.running
+        await asyncio.sleep(0.1)
+        # block the event loop, so the lag monitor sees it
+        time.sleep(0.05)
+        await asyncio.sleep(0.05)
+        profiler.stop()
+    finally:
+        stop_event.set()
+        worker.join()
+
+    assert not profiler.running
+    assert profiler.samples > 0
+
+    folded_stacks = profiler.get_folded_stacks().splitlines()
+    assert folded_stacks
+    for line in folded_stacks:
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+    # background thread, outermost frame first
+    assert any(
+        line.startswith("busy-worker;") and "_busy_background_work" in line
+        for line in folded_stacks
+    )
+    # event loop samples are labelled with the running task
+    assert any(
+        "task:test_sampling_profiler_collects_folded_stacks_and_event_loop_lag" in line
+        for line in folded_stacks
+    )
+    # the sampler does not sample itself
+    assert not any(
+        line.startswith("litellm-sampling-profiler;") for line in folded_stacks
+    )
+
+    status = profiler.get_status(top_n=3)
+    assert status["pid"] == os.getpid()
+    assert len(status["top_stacks"]) <= 3
+    assert status["event_loop_lag"]["count"] > 0
+    assert status["event_loop_lag"]["max_ms"] >= 40
+
+
+def test_sampling_profiler_max_stacks():
+    profiler = SamplingProfiler(max_stacks=1)
+    stop_event = threading.Event()
+    workers = [
+        threading.Thread(
+            target=_busy_background_work, args=(stop_event,), name=f"worker-{i}"
+        )
+        for i in range(3)
+    ]
+    for worker in workers:
+        worker.start()
+    try:
+        profiler._sample(own_thread_id=-1)
+    finally:
+        stop_event.set()
+        for worker in workers:
+            worker.join()
+
+    status = profiler.get_status()
+    # 1 kept stack + the truncated bucket
+    assert status["distinct_stacks"] == 2
+    assert any(
+        stack["stack"].startswith("[truncated") for stack in status["top_stacks"]
+    )
+
+
+def test_sampling_profiler_stops_after_duration():
+    profiler = SamplingProfiler()
+    # sampling faster than every 1ms would starve the other threads
+    with pytest.raises(ValueError):
+        profiler.start(interval_ms=0.01)
+    assert not profiler.running
+
+    # not on an event loop - no task labels or lag
+    profiler.start(interval_ms=1, duration_s=0.05)
+    with pytest.raises(ValueError):
+        profiler.start()
+
+    deadline = time.monotonic() + 10
+    while profiler.running and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not profiler.running
+
+    status = profiler.get_status()
+    assert status["stopped_at"] is not None
+    assert status["event_loop_lag"]["count"] == 0
+
+
+def test_event_loop_lag_histogram():
+    histogram = EventLoopLagHistogram()
+    for lag_ms in [0.5, 3, 3, 120, 10000]:
+        histogram.observe(lag_ms)
+
+    result = histogram.to_dict()
+    assert result["buckets_ms"]["1"] == 1
+    assert result["buckets_ms"]["5"] == 2
+    assert result["buckets_ms"]["250"] == 1
+    assert result["buckets_ms"]["+Inf"] == 1
+    assert result["count"] == 5
+    assert result["max_ms"] == 10000
+
+
+@pytest.mark.asyncio
+async def test_sampling_profiler_endpoints_are_admin_only():
+    internal_user = UserAPIKeyAuth(user_role=LitellmUserRoles.INTERNAL_USER)
+    with pytest.raises(HTTPException) as exc_info:
+        await start_sampling_profiler(
+            user_api_key_dict=internal_user, interval_ms=10, duration_s=1
+        )
+    assert exc_info.value.status_code == 403
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_sampling_profiler_flamegraph(user_api_key_dict=internal_user)
+    assert exc_info.value.status_code == 403
@@ -0,0 +1,258 @@
+import asyncio
+import json
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+from litellm.proxy._types import UserAPIKeyAuth
+from litellm.proxy.common_utils.stream_coalescing import (
+    coalesce_stream,
+    get_stream_coalescing_settings,
+)
+from litellm.types.utils import (
+    ChatCompletionDeltaToolCall,
+    Delta,
+    Function,
+    ModelResponseStream,
+    StreamingChoices,
+)
+
+
+def _chunk(content=None, finish_reason=None, tool_calls=None, **delta_params):
+    return ModelResponseStream(
+        id="chatcmpl-123",
+        model="gpt-4o",
+        choices=[
+            StreamingChoices(
+                index=0,
+                delta=Delta(content=content, tool_calls=tool_calls, **delta_params),
+                finish_reason=finish_reason,
+            )
+        ],
+    )
+
+
+async def _stream(chunks, delay: float = 0):
+    for chunk in chunks:
+        if delay:
+            await asyncio.sleep(delay)
+        yield chunk
+
+
+async def _collect(stream):
+    return [chunk async for chunk in stream]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_text_deltas():
+    chunks = [_chunk(content=str(i)) for i in range(5)] + [_chunk(finish_reason="stop")]
+    coalesced = await _collect(coalesce_stream(_stream(chunks), max_delay_ms=10_000))
+
+    # first chunk sent as-is, text deltas merged, finish reason sent as-is
+    assert len(coalesced) == 3
+    assert coalesced[0] is chunks[0]
+    assert coalesced[1].choices[0].delta.content == "1234"
+    assert coalesced[1].id == "chatcmpl-123"
+    assert coalesced[2] is chunks[-1]
+    # source chunks are not modified
+    assert chunks[1].choices[0].delta.content == "1"
+
+
+@pytest.mark.asyncio
+async def test_coalesce_sends_first_token_after_empty_role_chunk_immediately():
+    """
+    OpenAI streams start with an empty `{"role": "assistant", "content": ""}` chunk - the first text chunk after it
+    is the time-to-first-token chunk, and is not buffered.
+    """
+
+    async def openai_stream():
+        yield _chunk(content="", role="assistant")
+        await asyncio.sleep(0.1)
+        yield _chunk(content="Hello")
+        yield _chunk(content=" wor")
+        yield _chunk(content="ld")
+
+    received = []
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    async for chunk in coalesce_stream(openai_stream(), max_delay_ms=500):
+        received.append((chunk.choices[0].delta.content, loop.time() - start))
+
+    assert [content for content, _ in received] == ["", "Hello", " world"]
+    # "Hello" was sent as soon as it arrived, not after max_delay_ms
+    assert received[1][1] < 0.4
+
+
+@pytest.mark.asyncio
+async def test_coalesce_flushes_at_max_bytes():
+    chunks = [_chunk(content="ab") for _ in range(7)]
+    coalesced = await _collect(
+        coalesce_stream(_stream(chunks), max_delay_ms=10_000, max_bytes=4)
+    )
+    assert [c.choices[0].delta.content for c in coalesced] == [
+        "ab",
+        "abab",
+        "abab",
+        "abab",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_flushes_after_max_delay_when_upstream_stalls():
+    async def stalled_stream():
+        yield _chunk(content="first")
+        yield _chunk(content="a")
+        yield _chunk(content="b")
+        await asyncio.sleep(0.5)
+        yield _chunk(content="c")
+
+    received = []
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    async for chunk in coalesce_stream(stalled_stream(), max_delay_ms=20):
+        received.append((chunk.choices[0].delta.content, loop.time() - start))
+
+    assert [content for content, _ in received] == ["first", "ab", "c"]
+    # "ab" was flushed by the timer, not by the next chunk
+    assert received[1][1] < 0.4
+
+
+@pytest.mark.asyncio
+async def test_coalesce_does_not_merge_other_chunks():
+    tool_call_chunk = _chunk(
+        tool_calls=[
+            ChatCompletionDeltaToolCall(
+                id="call_1",
+                index=0,
+                type="function",
+                function=Function(name="get_weather", arguments=""),
+            )
+        ]
+    )
+    chunks = [
+        _chunk(content="first"),
+        _chunk(reasoning_content="think"),
+        _chunk(reasoning_content="ing"),
+        _chunk(content="a"),
+        _chunk(content="b"),
+        tool_call_chunk,
+        "data: error",
+    ]
+    coalesced = await _collect(coalesce_stream(_stream(chunks), max_delay_ms=10_000))
+
+    assert len(coalesced) == 5
+    assert coalesced[1].choices[0].delta.reasoning_content == "thinking"
+    assert coalesced[2].choices[0].delta.content == "ab"
+    assert coalesced[3] is tool_call_chunk
+    assert coalesced[4] == "data: error"
+
+
+@pytest.mark.asyncio
+async def test_coalesce_flushes_buffer_before_error():
+    async def failing_stream():
+        yield _chunk(content="first")
+        yield _chunk(content="a")
+        raise ValueError("upstream error")
+
+    received = []
+    with pytest.raises(ValueError, match="upstream error"):
+        async for chunk in coalesce_stream(failing_stream(), max_delay_ms=10_000):
+            received.append(chunk.choices[0].delta.content)
+    assert received == ["first", "a"]
+
+
+@pytest.mark.parametrize(
+    "key_metadata, team_metadata, model_info, general_settings, expected",
+    [
+        ({}, {}, {}, {}, None),
+        (
+            {},
+            {},
+            {},
+            {"stream_coalescing": {"max_delay_ms": 20}},
+            {"max_delay_ms": 20, "max_bytes": 1024},
+        ),
+        (
+            {},
+            {},
+            {"stream_coalescing": {"max_bytes": 100}},
+            {"stream_coalescing": {"max_delay_ms": 20}},
+            {"max_delay_ms": 50, "max_bytes": 100},
+        ),
+        (
+            {"stream_coalescing": True},
+            {"stream_coalescing": {"max_delay_ms": 20}},
+            {},
+            {},
+            {"max_delay_ms": 50, "max_bytes": 1024},
+        ),
+        (
+            {"stream_coalescing": False},
+            {},
+            {},
+            {"stream_coalescing": {"max_delay_ms": 20}},
+            None,
+        ),
+    ],
+    ids=["off", "general-settings", "model", "key", "disabled-for-key"],
+)
+def test_get_stream_coalescing_settings(
+    key_metadata, team_metadata, model_info, general_settings, expected
+):
+    settings = get_stream_coalescing_settings(
+        user_api_key_dict=UserAPIKeyAuth(
+            metadata=key_metadata, team_metadata=team_metadata
+        ),
+        request_data={"metadata": {"model_info": model_info}},
+        general_settings=general_settings,
+    )
+    assert settings == expected
+
+
+@pytest.mark.asyncio
+async def test_async_data_generator_coalesces_chunks():
+    from litellm.proxy.proxy_server import async_data_generator
+    from litellm.proxy.utils import ProxyLogging
+
+    chunks = [_chunk(content="Hello"), _chunk(content=" wor"), _chunk(content="ld")]
+
+    async def mock_streaming_iterator(*args, **kwargs):
+        for chunk in chunks:
+            yield chunk
+
+    async def mock_streaming_hook(*args, **kwargs):
+        return kwargs["response"]
+
+    mock_proxy_logging_obj = MagicMock(spec=ProxyLogging)
+    mock_proxy_logging_obj.async_post_call_streaming_iterator_hook = (
+        mock_streaming_iterator
+    )
+    mock_proxy_logging_obj.async_post_call_streaming_hook = AsyncMock(
+        side_effect=mock_streaming_hook
+    )
+
+    with patch(
+        "litellm.proxy.proxy_server.proxy_logging_obj", mock_proxy_logging_obj
+    ), patch(
+        "litellm.proxy.proxy_server.general_settings",
+        {"stream_coalescing": {"max_delay_ms": 10_000}},
+    ):
+        events = [
+            event
+            async for event in async_data_generator(
+                MagicMock(), UserAPIKeyAuth(), {"metadata": {}}
+            )
+        ]
+
+    assert events[-1] == "data: [DONE]\n\n"
+    contents = [
+        json.loads(event[len("data: ") :])["choices"][0]["delta"]["content"]
+        for event in events[:-1]
+    ]
+    assert contents == ["Hello", " world"]
+    assert mock_proxy_logging_obj.async_post_call_streaming_hook.call_count == 2
@@ -0,0 +1,245 @@
+import asyncio
+import json
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm.integrations.custom_logger import CustomLogger
+from litellm.proxy import proxy_server
+from litellm.proxy._types import UserAPIKeyAuth
+from litellm.proxy.common_utils.stream_passthrough import (
+    _SSEChunkPatcher,
+    get_sse_passthrough_events,
+    is_stream_passthrough_enabled,
+)
+from litellm.proxy.utils import ProxyLogging
+
+
+def _chunk(**params):
+    chunk = {
+        "id": "chatcmpl-upstream",
+        "object": "chat.completion.chunk",
+        "created": 1,
+        "model": "gpt-4o-2024-08-06",
+        "choices": [],
+    }
+    chunk.update(params)
+    return chunk
+
+
+UPSTREAM_CHUNKS = [
+    _chunk(
+        choices=[
+            {
+                "index": 0,
+                "delta": {"role": "assistant", "content": ""},
+                "finish_reason": None,
+            }
+        ]
+    ),
+    _chunk(
+        choices=[{"index": 0, "delta": {"content": "Hello"}, "finish_reason": None}]
+    ),
+    _chunk(choices=[{"index": 0, "delta": {}, "finish_reason": "stop"}]),
+    _chunk(usage={"prompt_tokens": 5, "completion_tokens": 1, "total_tokens": 6}),
+]
+
+
+async def _get_stream(upstream_chunks, **completion_kwargs):
+    body = "".join(
+        "data: {}\n\n".format(json.dumps(chunk, separators=(",", ":")))
+        for chunk in upstream_chunks
+    )
+    body += "data: [DONE]\n\n"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            content=body.encode(),
+            headers={"content-type": "text/event-stream"},
+        )
+
+    client = AsyncOpenAI(
+        api_key="sk-1234",
+        base_url="http://upstream/v1",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    return await litellm.acompletion(
+        model="openai/gpt-4o",
+        messages=[{"role": "user", "content": "hi"}],
+        stream=True,
+        client=client,
+        api_base="http://upstream/v1",
+        **completion_kwargs,
+    )
+
+
+async def _collect_events(response, general_settings: dict):
+    with patch.object(
+        proxy_server,
+        "proxy_logging_obj",
+        ProxyLogging(user_api_key_cache=MagicMock()),
+    ), patch.object(proxy_server, "general_settings", general_settings):
+        return [
+            event
+            async for event in proxy_server.async_data_generator(
+                response, UserAPIKeyAuth(), {"metadata": {}}
+            )
+        ]
+
+
+class _SuccessLogger(CustomLogger):
+    def __init__(self):
+        super().__init__()
+        self.kwargs = None
+        self.response_obj = None
+
+    async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
+        self.kwargs = kwargs
+        self.response_obj = response_obj
+
+
+@pytest.mark.asyncio
+async def test_passthrough_forwards_upstream_events():
+    logger = _SuccessLogger()
+    with patch.object(litellm, "callbacks", [logger]):
+        response = await _get_stream(UPSTREAM_CHUNKS)
+        with patch(
+            "litellm.proxy.common_utils.stream_passthrough.ModelResponseStream"
+        ) as mock_model_response_stream:
+            mock_model_response_stream.side_effect = (
+                litellm.types.utils.ModelResponseStream
+            )
+            events = await _collect_events(
+                response, general_settings={"stream_passthrough": True}
+            )
+            # chunks are only parsed for logging, after the stream is done
+            assert mock_model_response_stream.call_count == 0
+            await asyncio.sleep(1)
+            assert mock_model_response_stream.call_count == len(UPSTREAM_CHUNKS)
+
+    # id / model patched, usage dropped - the client didn't ask for it
+    expected_chunks = [dict(chunk, model="gpt-4o") for chunk in UPSTREAM_CHUNKS[:-1]]
+    assert events == [
+        "data: {}\n\n".format(json.dumps(chunk, separators=(",", ":")))
+        for chunk in expected_chunks
+    ] + ["data: [DONE]\n\n"]
+
+    # usage / cost are logged for the complete response
+    assert logger.response_obj is not None
+    assert logger.response_obj.choices[0].message.content == "Hello"
+    assert logger.response_obj.usage.prompt_tokens == 5
+    assert logger.response_obj.usage.completion_tokens == 1
+    assert logger.kwargs["response_cost"] > 0
+
+
+@pytest.mark.asyncio
+async def test_passthrough_forwards_usage_if_requested():
+    response = await _get_stream(UPSTREAM_CHUNKS, stream_options={"include_usage": True})
+    events = await _collect_events(
+        response, general_settings={"stream_passthrough": True}
+    )
+
+    usage_chunk = json.loads(events[-2][len("data: ") :])
+    assert usage_chunk["usage"] == UPSTREAM_CHUNKS[-1]["usage"]
+    assert usage_chunk["model"] == "gpt-4o"
+
+
+@pytest.mark.asyncio
+async def test_passthrough_raises_on_upstream_error():
+    response = await _get_stream(
+        UPSTREAM_CHUNKS[:2] + [{"error": {"message": "upstream overloaded"}}]
+    )
+    events = await _collect_events(
+        response, general_settings={"stream_passthrough": True}
+    )
+
+    assert len(events) == 3
+    assert "upstream overloaded" in events[-1]
+    assert json.loads(events[-1][len("data: ") :])["error"]
+
+
+@pytest.mark.asyncio
+async def test_passthrough_off_by_default():
+    response = await _get_stream(UPSTREAM_CHUNKS)
+    events = await _collect_events(response, general_settings={})
+
+    # regular path - the empty role chunk isn't sent
+    assert len(events) == 3
+    assert json.loads(events[0][len("data: ") :])["choices"][0]["delta"] == {
+        "content": "Hello",
+        "role": "assistant",
+    }
+
+
+@pytest.mark.asyncio
+async def test_passthrough_not_used_with_streaming_hooks():
+    class StreamingHook(CustomLogger):
+        async def async_post_call_streaming_hook(
+            self, user_api_key_dict, response, data=None
+        ):
+            return response
+
+    with patch.object(litellm, "callbacks", [StreamingHook()]):
+        response = await _get_stream(UPSTREAM_CHUNKS)
+        events = await _collect_events(
+            response, general_settings={"stream_passthrough": True}
+        )
+
+    assert len(events) == 3
+
+
+@pytest.mark.asyncio
+async def test_get_sse_passthrough_events_skips_read_streams():
+    response = await _get_stream(UPSTREAM_CHUNKS)
+    await response.__anext__()
+
+    assert get_sse_passthrough_events(response) is None
+    assert get_sse_passthrough_events(MagicMock()) is None
+
+
+def test_sse_chunk_patcher():
+    patcher = _SSEChunkPatcher(model="gpt-4o")
+
+    first = json.dumps(_chunk(), separators=(",", ":"))
+    assert json.loads(patcher.patch(first))["model"] == "gpt-4o"
+    assert patcher.response_id == "chatcmpl-upstream"
+
+    # patched in the string
+    with patch("json.loads") as mock_loads:
+        assert patcher.patch(first) == first.replace(
+            '"model":"gpt-4o-2024-08-06"', '"model":"gpt-4o"'
+        )
+    mock_loads.assert_not_called()
+
+    # other ids are set to the first id
+    other_id = json.dumps(_chunk(id="chatcmpl-other"), separators=(",", ":"))
+    assert json.loads(patcher.patch(other_id))["id"] == "chatcmpl-upstream"
+
+
+@pytest.mark.parametrize(
+    "key_metadata, general_settings, expected",
+    [
+        ({}, {}, False),
+        ({}, {"stream_passthrough": True}, True),
+        ({"stream_passthrough": False}, {"stream_passthrough": True}, False),
+        ({"stream_passthrough": True}, {}, True),
+    ],
+)
+def test_is_stream_passthrough_enabled(key_metadata, general_settings, expected):
+    assert (
+        is_stream_passthrough_enabled(
+            user_api_key_dict=UserAPIKeyAuth(metadata=key_metadata),
+            request_data={"metadata": {}},
+            general_settings=general_settings,
+        )
+        is expected
+    )
@@ -192,3 +192,60 @@ async def test_streaming_hook_propagates_callback_errors():
         with pytest.raises(RuntimeError, match="Callback failed!"):
             async for _ in result:
                 pass
+
+
+@pytest.mark.asyncio
+async def test_streaming_hook_skips_callbacks_without_hook():
+    """Callbacks with the default (pass-through) hook don't wrap the stream."""
+    proxy_logging = ProxyLogging(user_api_key_cache=MagicMock())
+    default_callback = CustomLogger()
+    streaming_callback = MockStreamingCallback()
+
+    with patch.object(
+        litellm, "callbacks", [default_callback, streaming_callback]
+    ), patch.object(
+        CustomLogger,
+        "async_post_call_streaming_iterator_hook",
+        side_effect=AssertionError("default hook should be skipped"),
+    ):
+        chunks = [
+            chunk
+            async for chunk in proxy_logging.async_post_call_streaming_iterator_hook(
+                response=mock_streaming_response(),
+                user_api_key_dict=UserAPIKeyAuth(api_key="test_key"),
+                request_data={},
+            )
+        ]
+
+    assert len(chunks) == 4
+    assert streaming_callback.chunks_processed == 4
+
+
+def test_has_post_call_streaming_hooks():
+    class ChunkHookCallback(CustomLogger):
+        async def async_post_call_streaming_hook(self, user_api_key_dict, response):
+            return None
+
+    proxy_logging = ProxyLogging(user_api_key_cache=MagicMock())
+    with patch.object(
+        litellm, "callbacks", [CustomLogger(), MockStreamingCallback()]
+    ):
+        assert proxy_logging.has_post_call_streaming_hooks() is False
+    with patch.object(litellm, "callbacks", [CustomLogger(), ChunkHookCallback()]):
+        assert proxy_logging.has_post_call_streaming_hooks() is True
+
+
+def test_has_post_call_streaming_iterator_hooks():
+    proxy_logging = ProxyLogging(user_api_key_cache=MagicMock())
+    with patch.object(litellm, "callbacks", [CustomLogger()]):
+        assert (
+            proxy_logging.has_post_call_streaming_iterator_hooks(request_data={})
+            is False
+        )
+    with patch.object(
+        litellm, "callbacks", [CustomLogger(), MockStreamingCallback()]
+    ):
+        assert (
+            proxy_logging.has_post_call_streaming_iterator_hooks(request_data={})
+            is True
+        )
@@ -1342,7 +1342,9 @@ class TestLLMPassthroughFactoryProxyRoute:
 
         mock_request = MagicMock(spec=Request)
         mock_request.method = "POST"
-        mock_request.json = AsyncMock(return_value={"stream": False})
+        mock_request.headers = {"content-type": "application/json"}
+        mock_request.body = AsyncMock(return_value=b'{"stream": false}')
+        mock_request.scope = {}
         mock_fastapi_response = MagicMock(spec=Response)
         mock_user_api_key_dict = MagicMock()
 
@@ -1297,3 +1297,144 @@ def test_update_model_if_key_alias_exists():
     original_model = data["model"]
     _update_model_if_key_alias_exists(data=data, user_api_key_dict=user_api_key_dict)
     assert data["model"] == original_model  # Should remain unchanged
+
+
+def _mock_chat_completions_request() -> MagicMock:
+    request_mock = MagicMock(spec=Request)
+    request_mock.url = MagicMock()
+    request_mock.url.path = "/chat/completions"
+    request_mock.url.__str__.return_value = "http://localhost/chat/completions"
+    request_mock.method = "POST"
+    request_mock.query_params = {}
+    request_mock.headers = {"Content-Type": "application/json"}
+    request_mock.client = MagicMock()
+    request_mock.client.host = "127.0.0.1"
+    return request_mock
+
+
+@pytest.mark.asyncio
+async def test_key_team_request_template_reused_across_requests():
+    """
+    Key / team controls are computed once per key, and requests don't share mutable values
+    """
+    from litellm.proxy import litellm_pre_call_utils
+    from litellm.proxy.litellm_pre_call_utils import (
+        invalidate_key_team_request_templates,
+    )
+
+    invalidate_key_team_request_templates()
+    proxy_config = MagicMock()
+
+    def _user_api_key_dict() -> UserAPIKeyAuth:
+        # auth builds a new UserAPIKeyAuth per request
+        return UserAPIKeyAuth(
+            api_key="hashed-key",
+            team_id="team-1",
+            metadata={
+                "tags": ["key-tag"],
+                "spend_logs_metadata": {"source": "key", "key_only": True},
+                "logging": [
+                    {
+                        "callback_name": "langfuse",
+                        "callback_type": "success",
+                        "callback_vars": {"langfuse_public_key": "pk-1"},
+                    }
+                ],
+            },
+            team_metadata={
+                "tags": ["team-tag", "key-tag"],
+                "spend_logs_metadata": {"source": "team", "team_only": True},
+                "team_field": "team-value",
+            },
+        )
+
+    with patch.object(
+        litellm_pre_call_utils,
+        "_get_dynamic_logging_metadata",
+        wraps=litellm_pre_call_utils._get_dynamic_logging_metadata,
+    ) as mock_get_dynamic_logging_metadata:
+        responses = []
+        for request_metadata in (
+            {"tags": ["request-tag"], "spend_logs_metadata": {"source": "request"}},
+            {},
+        ):
+            data = await add_litellm_data_to_request(
+                data={"model": "gpt-4o", "metadata": request_metadata},
+                request=_mock_chat_completions_request(),
+                user_api_key_dict=_user_api_key_dict(),
+                proxy_config=proxy_config,
+                general_settings={},
+            )
+            responses.append(data)
+            data["metadata"]["tags"].append("modified")
+            data["metadata"]["spend_logs_metadata"]["modified"] = True
+            data["success_callback"].append("modified")
+
+    mock_get_dynamic_logging_metadata.assert_called_once()
+
+    first, second = responses
+    assert first["metadata"]["tags"][:3] == ["request-tag", "key-tag", "team-tag"]
+    assert first["metadata"]["spend_logs_metadata"] == {
+        "source": "request",
+        "key_only": True,
+        "team_only": True,
+        "modified": True,
+    }
+    assert second["metadata"]["tags"] == ["key-tag", "team-tag", "modified"]
+    assert second["metadata"]["spend_logs_metadata"] == {
+        "source": "key",
+        "key_only": True,
+        "team_only": True,
+        "modified": True,
+    }
+    assert second["success_callback"] == ["langfuse", "modified"]
+    assert second["langfuse_public_key"] == "pk-1"
+    assert (
+        second["metadata"]["user_api_key_auth_metadata"]["team_field"] == "team-value"
+    )
+
+
+def test_key_team_request_templates_invalidated_on_config_update():
+    from litellm.proxy.litellm_pre_call_utils import (
+        _key_team_request_template_cache,
+        get_key_team_request_template,
+    )
+    from litellm.proxy.proxy_server import ProxyConfig
+
+    proxy_config = ProxyConfig()
+    user_api_key_dict = UserAPIKeyAuth(api_key="hashed-key", team_id="team-1")
+    template = get_key_team_request_template(
+        user_api_key_dict=user_api_key_dict,
+        proxy_config=proxy_config,
+        general_settings={"enforced_params": ["user"]},
+        premium_user=True,
+    )
+    assert template.enforced_params == ["user"]
+    assert (
+        get_key_team_request_template(
+            user_api_key_dict=user_api_key_dict,
+            proxy_config=proxy_config,
+            general_settings={"enforced_params": ["user"]},
+            premium_user=True,
+        )
+        is template
+    )
+
+    proxy_config.update_config_state(config={})
+    assert len(_key_team_request_template_cache.cache_dict) == 0
+
+
+def test_get_enforced_params_does_not_modify_general_settings():
+    general_settings = {
+        "enforced_params": ["user"],
+        "service_account_settings": {"enforced_params": ["metadata.service"]},
+    }
+    service_account_token = UserAPIKeyAuth(
+        api_key="test-key", metadata={"service_account_id": "test-service-account"}
+    )
+    for _ in range(2):
+        assert _get_enforced_params(general_settings, service_account_token) == [
+            "user",
+            "metadata.service",
+        ]
+    assert general_settings["enforced_params"] == ["user"]
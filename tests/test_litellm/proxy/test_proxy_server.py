@@ -1294,6 +1294,50 @@ async def test_async_data_generator_midstream_error():
     mock_proxy_logging_obj.post_call_failure_hook.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_async_data_generator_without_streaming_hooks():
+    """
+    If no callback implements `async_post_call_streaming_hook`, chunks are streamed without running the per-chunk hooks
+    """
+    from litellm.integrations.custom_logger import CustomLogger
+    from litellm.proxy._types import UserAPIKeyAuth
+    from litellm.proxy.proxy_server import async_data_generator
+    from litellm.proxy.utils import ProxyLogging
+    from litellm.types.utils import Delta, ModelResponseStream, StreamingChoices
+
+    chunks = [
+        ModelResponseStream(
+            id="chatcmpl-1",
+            model="gpt-4o",
+            choices=[StreamingChoices(index=0, delta=Delta(content=content))],
+        )
+        for content in ("Hello", " world")
+    ]
+
+    async def mock_response():
+        for chunk in chunks:
+            yield chunk
+
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=MagicMock())
+    with patch(
+        "litellm.proxy.proxy_server.proxy_logging_obj", proxy_logging_obj
+    ), patch.object(litellm, "callbacks", [CustomLogger()]), patch.object(
+        proxy_logging_obj, "async_post_call_streaming_hook", new_callable=AsyncMock
+    ) as mock_streaming_hook:
+        events = [
+            event
+            async for event in async_data_generator(
+                mock_response(), UserAPIKeyAuth(), {"metadata": {}}
+            )
+        ]
+
+    mock_streaming_hook.assert_not_called()
+    assert events == [
+        f"data: {chunk.model_dump_json(exclude_none=True, exclude_unset=True)}\n\n"
+        for chunk in chunks
+    ] + ["data: [DONE]\n\n"]
+
+
 def _has_nested_none_values(obj, path="root"):
     """
     Recursively check if an object contains nested None values.
@@ -0,0 +1,223 @@
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../../../.."))
+
+import litellm
+from litellm import Router
+from litellm.router_utils.cooldown_handlers import _async_get_cooldown_deployments
+from litellm.router_utils.pre_call_checks.adaptive_concurrency_check import (
+    AdaptiveConcurrencyCheck,
+    _get_latency_sample,
+)
+from litellm.types.router import RouterRateLimitError
+from litellm.types.utils import ModelResponse, Usage
+
+
+def _deployment(model_id: str, max_parallel_requests=None) -> dict:
+    litellm_params = {"model": "openai/gpt-4o"}
+    if max_parallel_requests is not None:
+        litellm_params["max_parallel_requests"] = max_parallel_requests
+    return {
+        "model_name": "gpt-4o",
+        "litellm_params": litellm_params,
+        "model_info": {"id": model_id},
+    }
+
+
+def _kwargs(model_id: str, exception=None) -> dict:
+    kwargs: dict = {"litellm_params": {"model_info": {"id": model_id}}}
+    if exception is not None:
+        kwargs["exception"] = exception
+    return kwargs
+
+
+def _response(completion_tokens: int) -> ModelResponse:
+    return ModelResponse(
+        usage=Usage(
+            prompt_tokens=10,
+            completion_tokens=completion_tokens,
+            total_tokens=10 + completion_tokens,
+        )
+    )
+
+
+def _log_success(check: AdaptiveConcurrencyCheck, model_id: str, seconds: float):
+    start_time = datetime.now()
+    check.log_success_event(
+        kwargs=_kwargs(model_id),
+        response_obj=_response(completion_tokens=10),
+        start_time=start_time,
+        end_time=start_time + timedelta(seconds=seconds),
+    )
+
+
+@pytest.mark.asyncio
+async def test_filter_deployments_at_limit():
+    check = AdaptiveConcurrencyCheck(initial_limit=2)
+    deployments = [_deployment("a"), _deployment("b")]
+    for _ in range(2):
+        await check.async_pre_call_check(deployments[0], parent_otel_span=None)
+
+    available = await check.async_filter_deployments(
+        model="gpt-4o", healthy_deployments=deployments, messages=None
+    )
+    assert [d["model_info"]["id"] for d in available] == ["b"]
+
+    # a finished request frees its slot
+    _log_success(check, "a", seconds=1)
+    available = await check.async_filter_deployments(
+        model="gpt-4o", healthy_deployments=deployments, messages=None
+    )
+    assert len(available) == 2
+
+
+def test_max_parallel_requests_caps_limit():
+    check = AdaptiveConcurrencyCheck(initial_limit=20)
+    check.pre_call_check(_deployment("a", max_parallel_requests=5))
+    assert check.get_deployment_limit("a") == 5
+    assert check.get_deployment_limit("b") is None
+
+
+@pytest.mark.parametrize(
+    "exception, expected_limit",
+    [
+        (litellm.RateLimitError("rate limited", "openai", "gpt-4o"), 9),
+        (litellm.Timeout("timeout", "gpt-4o", "openai"), 9),
+        (litellm.BadRequestError("bad request", "gpt-4o", "openai"), 10),
+    ],
+    ids=["rate-limit", "timeout", "bad-request"],
+)
+def test_limit_backs_off_on_rate_limit_errors(exception, expected_limit):
+    check = AdaptiveConcurrencyCheck(initial_limit=10, backoff_ratio=0.9)
+    check.pre_call_check(_deployment("a"))
+
+    check.log_failure_event(
+        kwargs=_kwargs("a", exception=exception),
+        response_obj=None,
+        start_time=datetime.now(),
+        end_time=datetime.now(),
+    )
+    assert check.get_deployment_limit("a") == expected_limit
+    assert check.deployments["a"].get_in_flight() == 0
+
+
+def test_failure_event_does_not_raise():
+    check = AdaptiveConcurrencyCheck()
+    check.log_failure_event(
+        kwargs={"litellm_params": {"model_info": None}},
+        response_obj=None,
+        start_time=datetime.now(),
+        end_time=datetime.now(),
+    )
+
+
+def test_latency_sample_with_float_and_datetime_timestamps():
+    start_time = datetime.now()
+    assert _get_latency_sample(
+        kwargs={"completion_start_time": start_time + timedelta(seconds=2)},
+        response_obj=None,
+        start_time=start_time.timestamp(),
+        end_time=start_time.timestamp() + 5,
+        stream=True,
+    ) == pytest.approx(2)
+    assert _get_latency_sample(
+        kwargs={},
+        response_obj=_response(completion_tokens=10),
+        start_time=start_time,
+        end_time=start_time.timestamp() + 5,
+        stream=False,
+    ) == pytest.approx(0.5)
+
+
+def test_limit_follows_latency():
+    check = AdaptiveConcurrencyCheck(initial_limit=10, max_limit=100)
+    deployment = _deployment("a")
+
+    def _run(seconds: float, num_requests: int):
+        for _ in range(num_requests):
+            for _ in range(int(check.deployments["a"].limit)):
+                check.pre_call_check(deployment)
+            _log_success(check, "a", seconds=seconds)
+            # finish the other in-flight requests, without a latency sample
+            check.deployments["a"].in_flight.clear()
+
+    check.pre_call_check(deployment)
+    _log_success(check, "a", seconds=1)
+
+    _run(seconds=1, num_requests=20)
+    grown_limit = check.get_deployment_limit("a")
+    assert grown_limit is not None and grown_limit > 10
+
+    _run(seconds=4, num_requests=5)
+    shrunk_limit = check.get_deployment_limit("a")
+    assert shrunk_limit is not None and shrunk_limit < grown_limit
+
+
+def test_limit_does_not_grow_when_unused():
+    check = AdaptiveConcurrencyCheck(initial_limit=10)
+    deployment = _deployment("a")
+    for _ in range(20):
+        check.pre_call_check(deployment)
+        _log_success(check, "a", seconds=1)
+    assert check.get_deployment_limit("a") == 10
+
+
+def test_in_flight_requests_expire():
+    check = AdaptiveConcurrencyCheck()
+    check.pre_call_check(_deployment("a"))
+    assert check.deployments["a"].get_in_flight() == 1
+
+    with patch(
+        "litellm.router_utils.pre_call_checks.adaptive_concurrency_check.ADAPTIVE_CONCURRENCY_IN_FLIGHT_TTL_SECONDS",
+        -1,
+    ):
+        assert check.deployments["a"].get_in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_router_adaptive_concurrency():
+    router = Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {
+                    "model": "openai/gpt-4o",
+                    "api_key": "fake-key",
+                    "mock_response": "hello",
+                },
+                "model_info": {"id": "a"},
+            }
+        ],
+        optional_pre_call_checks=["adaptive_concurrency"],
+    )
+    check = next(
+        cb for cb in litellm.callbacks if isinstance(cb, AdaptiveConcurrencyCheck)
+    )
+    try:
+        await router.acompletion(
+            model="gpt-4o", messages=[{"role": "user", "content": "hi"}]
+        )
+        await asyncio.sleep(0.5)
+        assert check.deployments["a"].get_in_flight() == 0
+
+        # deployment at its limit - filtered out, without a cooldown
+        check.deployments["a"].limit = 1
+        check.pre_call_check(router.get_deployment(model_id="a").model_dump())
+        with pytest.raises(RouterRateLimitError, match="No deployments available"):
+            await router.acompletion(
+                model="gpt-4o", messages=[{"role": "user", "content": "hi"}]
+            )
+        assert (
+            await _async_get_cooldown_deployments(
+                litellm_router_instance=router, parent_otel_span=None
+            )
+            == []
+        )
+    finally:
+        litellm.callbacks.remove(check)
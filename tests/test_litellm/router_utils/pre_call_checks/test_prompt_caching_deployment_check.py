@@ -0,0 +1,209 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../../../.."))
+
+from litellm.caching.dual_cache import DualCache
+from litellm.router_utils.pre_call_checks.prompt_caching_deployment_check import (
+    PromptCachingDeploymentCheck,
+)
+from litellm.router_utils.prompt_caching_cache import PromptCachingCache
+
+
+@pytest.fixture(autouse=True)
+def no_minimum_prompt_cache_token_count(monkeypatch):
+    """The test conversations are short - index every message boundary"""
+    monkeypatch.setattr(
+        "litellm.router_utils.prompt_caching_cache.MINIMUM_PROMPT_CACHE_TOKEN_COUNT", 0
+    )
+
+
+def _conversation(num_turns: int) -> list:
+    messages = [{"role": "system", "content": "You are a helpful assistant."}]
+    for i in range(num_turns):
+        messages.append({"role": "user", "content": f"question {i}"})
+        messages.append({"role": "assistant", "content": f"answer {i}"})
+    return messages
+
+
+def _deployments():
+    return [
+        {"model_name": "gpt-4o", "model_info": {"id": f"deployment-{i}"}}
+        for i in range(1, 4)
+    ]
+
+
+def test_get_prompt_token_counts_matches_token_counter():
+    from litellm.utils import token_counter
+
+    messages = _conversation(2)
+    prompt_token_counts = PromptCachingCache.get_prompt_token_counts(
+        messages=messages, tools=None, model="gpt-4o"
+    )
+    assert len(prompt_token_counts) == len(messages)
+    for msg_idx in range(len(messages)):
+        assert prompt_token_counts[msg_idx] == token_counter(
+            model="gpt-4o", messages=messages[: msg_idx + 1]
+        )
+
+
+@pytest.mark.asyncio
+async def test_filter_deployments_tokenizes_each_message_once():
+    """
+    The validity check and the prefix lookup share one token count of the prompt.
+    """
+    from litellm.utils import token_counter
+
+    messages = _conversation(3)
+    check = PromptCachingDeploymentCheck(cache=DualCache())
+    with patch("litellm.utils.token_counter", wraps=token_counter) as mock_token_counter:
+        await check.async_filter_deployments(
+            model="gpt-4o", healthy_deployments=_deployments(), messages=messages
+        )
+    # one call per message + one for the reply priming / tool definitions
+    assert mock_token_counter.call_count == len(messages) + 1
+
+
+def test_get_prefix_cache_keys_is_rolling():
+    """
+    Extending a conversation keeps the keys of all earlier message boundaries.
+    """
+    short_keys = PromptCachingCache.get_prefix_cache_keys(_conversation(1), None)
+    long_keys = PromptCachingCache.get_prefix_cache_keys(_conversation(3), None)
+
+    assert len(short_keys) == 3
+    assert len(long_keys) == 7
+    assert long_keys[: len(short_keys)] == short_keys
+    assert len(set(long_keys)) == len(long_keys)
+
+
+def test_get_prefix_cache_keys_includes_tools():
+    tools = [{"type": "function", "function": {"name": "get_weather"}}]
+    assert PromptCachingCache.get_prefix_cache_keys(
+        _conversation(1), tools
+    ) != PromptCachingCache.get_prefix_cache_keys(_conversation(1), None)
+
+
+def test_get_prefix_cache_keys_max_boundaries():
+    with patch(
+        "litellm.router_utils.prompt_caching_cache.PROMPT_CACHING_PREFIX_INDEX_MAX_BOUNDARIES",
+        2,
+    ):
+        keys = PromptCachingCache.get_prefix_cache_keys(_conversation(3), None)
+
+    all_keys = PromptCachingCache.get_prefix_cache_keys(_conversation(3), None)
+    assert keys == all_keys[-2:]
+
+
+@pytest.mark.asyncio
+async def test_async_get_longest_prefix_model_ids():
+    cache = PromptCachingCache(cache=DualCache())
+    await cache.async_add_model_id_to_prefix_index(
+        model_id="deployment-1", messages=_conversation(1), tools=None
+    )
+    await cache.async_add_model_id_to_prefix_index(
+        model_id="deployment-2", messages=_conversation(2), tools=None
+    )
+
+    model_ids = await cache.async_get_longest_prefix_model_ids(
+        messages=_conversation(3), tools=None
+    )
+    assert model_ids == ["deployment-2"]
+
+    branched_conversation = _conversation(1) + [
+        {"role": "user", "content": "a different question"}
+    ]
+    model_ids = await cache.async_get_longest_prefix_model_ids(
+        messages=branched_conversation, tools=None
+    )
+    assert model_ids == ["deployment-2"]
+
+    model_ids = await cache.async_get_longest_prefix_model_ids(
+        messages=[{"role": "user", "content": "unrelated"}], tools=None
+    )
+    assert model_ids == []
+
+
+@pytest.mark.asyncio
+async def test_filter_deployments_routes_to_longest_cached_prefix():
+    """
+    A multi-turn conversation without cache_control is routed to the deployment that served its previous turn.
+    """
+    dual_cache = DualCache()
+    check = PromptCachingDeploymentCheck(cache=dual_cache)
+    await PromptCachingCache(cache=dual_cache).async_add_model_id_to_prefix_index(
+        model_id="deployment-3", messages=_conversation(2), tools=None
+    )
+
+    filtered = await check.async_filter_deployments(
+        model="gpt-4o",
+        healthy_deployments=_deployments(),
+        messages=_conversation(3),
+    )
+
+    assert [d["model_info"]["id"] for d in filtered] == ["deployment-3"]
+
+
+@pytest.mark.asyncio
+async def test_filter_deployments_skips_unhealthy_prefix_holder():
+    dual_cache = DualCache()
+    check = PromptCachingDeploymentCheck(cache=dual_cache)
+    prompt_cache = PromptCachingCache(cache=dual_cache)
+    await prompt_cache.async_add_model_id_to_prefix_index(
+        model_id="deployment-removed", messages=_conversation(2), tools=None
+    )
+    await prompt_cache.async_add_model_id_to_prefix_index(
+        model_id="deployment-1", messages=_conversation(1), tools=None
+    )
+
+    filtered = await check.async_filter_deployments(
+        model="gpt-4o",
+        healthy_deployments=_deployments(),
+        messages=_conversation(3),
+    )
+
+    # deployment-removed holds the longest prefix but is no longer healthy
+    assert [d["model_info"]["id"] for d in filtered] == ["deployment-1"]
+
+
+@pytest.mark.asyncio
+async def test_short_shared_prefix_is_not_indexed(monkeypatch):
+    """
+    A short system prompt shared by many users does not pin their conversations to one deployment.
+    """
+    monkeypatch.setattr(
+        "litellm.router_utils.prompt_caching_cache.MINIMUM_PROMPT_CACHE_TOKEN_COUNT",
+        100,
+    )
+    long_question = {"role": "user", "content": "tell me about the weather " * 20}
+    messages = _conversation(0) + [long_question]
+
+    # only the boundary with >= 100 tokens is indexed
+    keys = PromptCachingCache.get_prefix_cache_keys(messages, None)
+    assert len(keys) == 1
+
+    cache = PromptCachingCache(cache=DualCache())
+    await cache.async_add_model_id_to_prefix_index(
+        model_id="deployment-1", messages=messages, tools=None
+    )
+    # another user, same system prompt
+    model_ids = await cache.async_get_longest_prefix_model_ids(
+        messages=_conversation(0)
+        + [{"role": "user", "content": "what is the capital of France? " * 20}],
+        tools=None,
+    )
+    assert model_ids == []
+
+    # the same conversation, next turn
+    model_ids = await cache.async_get_longest_prefix_model_ids(
+        messages=messages
+        + [
+            {"role": "assistant", "content": "sunny"},
+            {"role": "user", "content": "and tomorrow?"},
+        ],
+        tools=None,
+    )
+    assert model_ids == ["deployment-1"]
@@ -0,0 +1,189 @@
+"""
+Unit tests for Router request hedging
+"""
+
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../../.."))
+
+from litellm import Router
+from litellm.caching.dual_cache import DualCache
+from litellm.router_strategy.lowest_latency import LowestLatencyLoggingHandler
+
+
+def _get_router(hedging_policy: dict, slow_delay: float = 2) -> Router:
+    return Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {
+                    "model": "openai/gpt-4o",
+                    "api_key": "fake-key",
+                    "mock_response": "slow",
+                    "mock_delay": slow_delay,
+                },
+                "model_info": {"id": "slow"},
+            },
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {
+                    "model": "openai/gpt-4o",
+                    "api_key": "fake-key",
+                    "mock_response": "fast",
+                },
+                "model_info": {"id": "fast"},
+            },
+        ],
+        hedging_policy=hedging_policy,
+    )
+
+
+def _pick_slow_deployment(router: Router):
+    return patch.object(
+        router,
+        "async_get_available_deployment",
+        return_value=router.get_deployment(model_id="slow").model_dump(
+            exclude_none=True
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged():
+    router = _get_router(
+        hedging_policy={"default_hedge_delay": 0.1, "max_hedge_ratio": 1}
+    )
+    start = time.time()
+    with _pick_slow_deployment(router):
+        response = await router.acompletion(
+            model="gpt-4o", messages=[{"role": "user", "content": "hi"}]
+        )
+
+    assert response.choices[0].message.content == "fast"
+    assert time.time() - start < 1.5
+    assert response._hidden_params["hedged_request"] is True
+    assert response._hidden_params["hedge_response"] is True
+    assert router.request_hedging.hedge_stats["hedge_won"] == 1
+
+
+@pytest.mark.asyncio
+async def test_streaming_request_is_hedged():
+    router = _get_router(
+        hedging_policy={"default_hedge_delay": 0.1, "max_hedge_ratio": 1}
+    )
+    with _pick_slow_deployment(router):
+        response = await router.acompletion(
+            model="gpt-4o",
+            messages=[{"role": "user", "content": "hi"}],
+            stream=True,
+        )
+        content = ""
+        async for chunk in response:
+            content += chunk.choices[0].delta.content or ""
+
+    assert content == "fast"
+    assert router.request_hedging.hedge_stats["hedge_won"] == 1
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_without_budget():
+    router = _get_router(
+        hedging_policy={"default_hedge_delay": 0.05, "max_hedge_ratio": 0},
+        slow_delay=0.3,
+    )
+    with _pick_slow_deployment(router):
+        response = await router.acompletion(
+            model="gpt-4o", messages=[{"role": "user", "content": "hi"}]
+        )
+
+    assert response.choices[0].message.content == "slow"
+    assert "hedged_request" not in response._hidden_params
+    assert router.request_hedging.hedge_stats["budget_exhausted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_without_latency_samples():
+    router = _get_router(hedging_policy={"max_hedge_ratio": 1}, slow_delay=0.3)
+    with _pick_slow_deployment(router):
+        response = await router.acompletion(
+            model="gpt-4o", messages=[{"role": "user", "content": "hi"}]
+        )
+
+    assert response.choices[0].message.content == "slow"
+    assert router.request_hedging.hedge_stats["hedge_won"] == 0
+
+
+@pytest.mark.asyncio
+async def test_each_router_tracks_its_own_hedging_latency():
+    """
+    A second router (e.g. after a proxy config reload) gets latency samples for its hedger too.
+    """
+    import asyncio
+
+    _get_router(hedging_policy={"percentile": 90})
+    router = _get_router(hedging_policy={"percentile": 90})
+    with patch.object(
+        router,
+        "async_get_available_deployment",
+        return_value=router.get_deployment(model_id="fast").model_dump(
+            exclude_none=True
+        ),
+    ):
+        await router.acompletion(
+            model="gpt-4o", messages=[{"role": "user", "content": "hi"}]
+        )
+
+    response_time = None
+    for _ in range(50):  # success callbacks run in the background
+        response_time = await router.request_hedging.latency_handler.async_get_response_time_percentile(
+            model_group="gpt-4o", deployment_id="fast", percentile=90
+        )
+        if response_time is not None:
+            break
+        await asyncio.sleep(0.05)
+    assert response_time is not None
+
+
+@pytest.mark.asyncio
+async def test_response_time_percentile():
+    latency_handler = LowestLatencyLoggingHandler(router_cache=DualCache())
+    start_time = datetime.now()
+    for response_seconds in range(1, 21):
+        await latency_handler.async_log_success_event(
+            kwargs={
+                "litellm_params": {
+                    "metadata": {"model_group": "gpt-4o"},
+                    "model_info": {"id": "1"},
+                },
+                "stream": True,
+                "completion_start_time": start_time + timedelta(seconds=0.5),
+            },
+            response_obj=None,
+            start_time=start_time,
+            end_time=start_time + timedelta(seconds=response_seconds),
+        )
+
+    assert (
+        await latency_handler.async_get_response_time_percentile(
+            model_group="gpt-4o", deployment_id="1", percentile=95
+        )
+        == 19
+    )
+    assert (
+        await latency_handler.async_get_response_time_percentile(
+            model_group="gpt-4o", deployment_id="1", percentile=50, stream=True
+        )
+        == 0.5
+    )
+    assert (
+        await latency_handler.async_get_response_time_percentile(
+            model_group="gpt-4o", deployment_id="1", percentile=95, min_samples=21
+        )
+        is None
+    )
@@ -10,6 +10,7 @@ sys.path.insert(0, os.path.abspath("../.."))
 import pytest
 
 from litellm.secret_managers.get_azure_ad_token_provider import (
+    ProactiveRefreshTokenProvider,
     get_azure_ad_token_provider,
 )
 
@@ -243,3 +244,47 @@ class TestGetAzureAdTokenProvider:
         # Test that the returned callable works
         token = result()
         assert token == "mock-default-token"
+
+
+def _make_jwt(exp: float) -> str:
+    import base64
+
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode()
+    return f"header.{payload.rstrip('=')}.signature"
+
+
+def test_proactive_refresh_token_provider_caches_and_refreshes_jwt():
+    import time
+
+    from litellm.litellm_core_utils.credential_refresh_manager import (
+        credential_refresh_manager,
+    )
+
+    tokens = [_make_jwt(time.time() + 3600), _make_jwt(time.time() + 7200)]
+    inner_provider = MagicMock(side_effect=tokens)
+    cache_key = "test-proactive-refresh-token-provider"
+
+    # a new provider is created per request - the token is shared through the cache key
+    assert ProactiveRefreshTokenProvider(inner_provider, cache_key)() == tokens[0]
+    assert ProactiveRefreshTokenProvider(inner_provider, cache_key)() == tokens[0]
+    assert inner_provider.call_count == 1
+
+    scheduled_refresh = credential_refresh_manager._scheduled[cache_key]
+    assert scheduled_refresh.used is True
+
+    # what the scheduler runs CREDENTIAL_REFRESH_AHEAD_SECONDS before expiry
+    scheduled_refresh.refresh_fn()
+
+    assert ProactiveRefreshTokenProvider(inner_provider, cache_key)() == tokens[1]
+    assert inner_provider.call_count == 2
+    credential_refresh_manager.cancel(cache_key)
+
+
+def test_proactive_refresh_token_provider_does_not_cache_opaque_tokens():
+    inner_provider = MagicMock(side_effect=["opaque-token-1", "opaque-token-2"])
+    token_provider = ProactiveRefreshTokenProvider(
+        inner_provider, "test-proactive-refresh-opaque-token"
+    )
+
+    assert token_provider() == "opaque-token-1"
+    assert token_provider() == "opaque-token-2"
@@ -35,6 +35,14 @@ class MockResponse:
     async def aiter_lines(self):
         """Mock aiter_lines method for asynchronous streaming."""
         yield self.test_content
+
+    def iter_bytes(self):
+        """Mock iter_bytes method for synchronous streaming."""
+        yield self.test_content.encode("utf-8")
+
+    async def aiter_bytes(self):
+        """Mock aiter_bytes method for asynchronous streaming."""
+        yield self.test_content.encode("utf-8")
         
     def json(self):
         return {"choices": [{"delta": {"content": "test"}}]}
@@ -127,3 +127,70 @@ def test_usage_completion_tokens_details_text_tokens():
     # Verify round-trip serialization works
     new_usage = Usage(**dump_result)
     assert new_usage.completion_tokens_details.text_tokens == 12
+
+
+def test_delta_unset_optional_fields():
+    from litellm.types.utils import Delta
+
+    delta = Delta(content="hi")
+    assert not hasattr(delta, "reasoning_content")
+    assert not hasattr(delta, "thinking_blocks")
+    assert "annotations" not in delta.model_fields_set
+    assert json.loads(delta.model_dump_json(exclude_unset=True)) == {
+        "content": "hi",
+        "role": None,
+        "function_call": None,
+        "tool_calls": None,
+        "audio": None,
+    }
+
+    delta = Delta(
+        content="hi",
+        reasoning_content="thinking",
+        tool_calls=[{"id": "call_1", "function": {"name": "f", "arguments": "{}"}}],
+        images=[],
+    )
+    assert delta.reasoning_content == "thinking"
+    assert delta.tool_calls[0].function.name == "f"
+    assert not hasattr(delta, "images")
+
+
+@pytest.mark.parametrize(
+    "delta, expected",
+    [
+        ({"audio": {"id": "audio_1", "transcript": "Hel"}}, {"audio": {"id": "audio_1", "transcript": "Hel"}}),
+        ({"audio": {"data": "AAAA"}}, {"audio": {"data": "AAAA"}}),
+        ({"content": [{"type": "text", "text": "x"}]}, {"content": [{"type": "text", "text": "x"}]}),
+        (
+            {"thinking_blocks": [{"type": "redacted_thinking", "data": {}}]},
+            {"thinking_blocks": [{"type": "redacted_thinking", "data": {}}]},
+        ),
+        (
+            {
+                "annotations": [
+                    {
+                        "url_citation": {"url": "u", "title": "t", "start_index": 0, "end_index": 1},
+                        "type": "url_citation",
+                    }
+                ]
+            },
+            {
+                "annotations": [
+                    {
+                        "url_citation": {"url": "u", "title": "t", "start_index": 0, "end_index": 1},
+                        "type": "url_citation",
+                    }
+                ]
+            },
+        ),
+    ],
+)
+def test_model_response_stream_partial_deltas(delta, expected):
+    """Partial streaming deltas are stored as given, not validated against the full response types"""
+    from litellm.types.utils import ModelResponseStream
+
+    chunk = ModelResponseStream(choices=[{"index": 0, "delta": delta}])
+    dumped = chunk.choices[0].delta.model_dump()
+    for key, value in expected.items():
+        # compare the serialized form so key order is checked too
+        assert json.dumps(dumped[key]) == json.dumps(value)